@@ -21,6 +21,7 @@ HTTP API (デフォルト: http://localhost:8765):
 - GET /trigger/historical   - 蓄積系のみ強制更新
 - GET /trigger/realtime     - 速報系のみ強制更新
 - GET /status               - 現在の状態取得
+- GET /metrics              - パイプラインメトリクス (Prometheus形式)
 
 使用例:
     python scripts/background_updater.py
@@ -36,7 +37,6 @@ import os
 import re
 import signal
 import socketserver
-import sqlite3
 import subprocess
 import sys
 import threading
@@ -71,9 +71,12 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 # ログ設定: コンソールにはERROR以上のみ表示、それ以外はファイルに出力
-from src.utils.logger import setup_logging, get_logger
+from src.database.maintenance import SQLiteMaintenanceScheduler
+from src.database.readers import reader_pool
+from src.utils.logger import flush_throttled_logs, setup_logging, get_logger
 from src.utils.lock_manager import ProcessLock, ProcessLockError
-setup_logging(level="DEBUG", console_level="ERROR", log_to_file=True, log_to_console=True)
+from src.utils.metrics import DEFAULT_SNAPSHOT_PATH, METRICS_EXPORT_ENV, REGISTRY
+setup_logging(level="DEBUG", console_level="ERROR", log_to_file=True, log_to_console=True, use_queue=True)
 
 logger = get_logger(__name__)
 
@@ -352,6 +355,7 @@ class TriggerAPIHandler(BaseHTTPRequestHandler):
                     "/trigger/historical": "蓄積系のみ強制更新",
                     "/trigger/realtime": "速報系のみ強制更新",
                     "/status": "現在の状態取得",
+                    "/metrics": "パイプラインメトリクス (Prometheus形式)",
                 }
             })
 
@@ -367,6 +371,9 @@ class TriggerAPIHandler(BaseHTTPRequestHandler):
         elif path == "/status":
             self._handle_status()
 
+        elif path == "/metrics":
+            self._handle_metrics()
+
         else:
             self._send_json_response(404, {
                 "error": "Not Found",
@@ -441,6 +448,15 @@ class TriggerAPIHandler(BaseHTTPRequestHandler):
                 "error": "Failed to send trigger"
             })
 
+    def _handle_metrics(self):
+        """Prometheus形式でメトリクスを返す"""
+        body = REGISTRY.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def _handle_status(self):
         """ステータスリクエストを処理"""
         if not self.updater:
@@ -729,6 +745,7 @@ class TriggerAPIServer:
         """サーバーを停止"""
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
             logger.info("API server stopped")
 
@@ -749,9 +766,8 @@ class RaceScheduleManager:
                 logger.warning(f"Database not found: {self.db_path}")
                 return False
 
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            # スレッドごとの読み取り専用接続（WALで書き込み側をブロックしない）
+            cursor = reader_pool(self.db_path).connection().cursor()
 
             today = datetime.now().strftime("%Y%m%d")
 
@@ -779,7 +795,7 @@ class RaceScheduleManager:
             """, (today,))
 
             rows = cursor.fetchall()
-            conn.close()
+            cursor.close()
 
             self._today_race_count = len(rows)  # 全レース数（発走時刻不明含む）
             self._today_races = []
@@ -948,6 +964,7 @@ class BackgroundUpdater:
         rate_limit_short_term: int = 5,
         rate_limit_long_term: int = 30,
         silent_mode: bool = False,
+        enable_maintenance: bool = True,
     ):
         """初期化
 
@@ -961,6 +978,7 @@ class BackgroundUpdater:
             rate_limit_short_term: 短期制限（回/分）
             rate_limit_long_term: 長期制限（回/時）
             silent_mode: サイレントモード（画面出力を抑制）
+            enable_maintenance: 更新の合間にWALチェックポイント・統計更新を行うか
         """
         self.update_historical = update_historical
         self.monitor_realtime = monitor_realtime
@@ -979,6 +997,11 @@ class BackgroundUpdater:
         # レーススケジュール管理
         self.schedule_manager = RaceScheduleManager(self.db_path)
 
+        # DBメンテナンス（WALチェックポイント、深夜・非開催日の最適化）
+        self._maintenance: Optional[SQLiteMaintenanceScheduler] = (
+            SQLiteMaintenanceScheduler(self.db_path) if enable_maintenance else None
+        )
+
         # APIサーバー
         self._api_server: Optional[TriggerAPIServer] = None
 
@@ -1219,6 +1242,8 @@ class BackgroundUpdater:
         # スレッド終了待ち
         for thread in self._threads:
             thread.join(timeout=5)
+        # 間引きで保留中の棄却件数を停止時に出力する
+        flush_throttled_logs()
 
         if not self.silent_mode:
             if RICH_AVAILABLE:
@@ -1316,6 +1341,7 @@ class BackgroundUpdater:
 
             # 蓄積系データ更新を実行
             self._run_historical_update()
+            self._run_maintenance()
 
         logger.info("Historical update loop ended")
 
@@ -1334,6 +1360,7 @@ class BackgroundUpdater:
             if interval == 0:
                 # 非開催日は5分毎にチェックのみ
                 logger.debug("Non-race day, skipping realtime update")
+                self._run_maintenance()
                 if self._stop_event.wait(timeout=300):
                     break
                 continue
@@ -1348,6 +1375,8 @@ class BackgroundUpdater:
                 self._stats["last_realtime_update"] = datetime.now()
                 logger.exception(f"Realtime polling cycle failed: {e}")
 
+            self._run_maintenance()
+
             # 次の更新まで待機
             if self._stop_event.wait(timeout=interval):
                 break
@@ -1463,6 +1492,10 @@ class BackgroundUpdater:
                     break
 
                 process = None
+                # 子プロセスの JVRead/パース/書き込みメトリクスを終了時に受け取り /metrics に合算する
+                metrics_export = (
+                    self.project_root / DEFAULT_SNAPSHOT_PATH
+                ).with_name(f"metrics-fetch-{spec}.json")
                 try:
                     # subprocess.Popenを使用（タイムアウト時にプロセスをkillできるように）
                     process = subprocess.Popen(
@@ -1475,6 +1508,7 @@ class BackgroundUpdater:
                             "--option", "2",
                         ],
                         cwd=self.project_root,
+                        env={**os.environ, METRICS_EXPORT_ENV: str(metrics_export)},
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True,
@@ -1514,6 +1548,9 @@ class BackgroundUpdater:
                     if process and process.poll() is None:
                         process.kill()
                         process.wait()
+                finally:
+                    # タイムアウトで kill した子プロセスはファイルを書かないため、その回の計測は失われる
+                    REGISTRY.merge_state_file(metrics_export)
 
             self._stats["historical_updates"] += 1
             self._stats["historical_errors"] += error_count
@@ -1535,6 +1572,7 @@ class BackgroundUpdater:
         finally:
             self._historical_updating.clear()
             self._jvlink_lock.release()
+            self._write_metrics_snapshot()
 
     def _run_realtime_update(self, reason: str):
         """速報系データの更新を実行"""
@@ -1548,6 +1586,7 @@ class BackgroundUpdater:
             logger.warning("JV-Link is busy (locked by another operation), skipping realtime update")
             return
 
+        cycle_started = time.perf_counter()
         try:
             self._realtime_updating.set()
             self._ensure_realtime_schema()
@@ -1637,6 +1676,41 @@ class BackgroundUpdater:
         finally:
             self._realtime_updating.clear()
             self._jvlink_lock.release()
+            from src.realtime.updater import REALTIME_CYCLE_SECONDS
+
+            REALTIME_CYCLE_SECONDS.observe(time.perf_counter() - cycle_started)
+            self._write_metrics_snapshot()
+
+    def _run_maintenance(self):
+        """更新の合間に期限の来たDBメンテナンスを実行
+
+        WALが肥大化すると読み取りが遅くなるため、一定時間ごとにPASSIVE、
+        WALが大きくなればTRUNCATEでチェックポイントする。深夜・非開催日には
+        インクリメンタルVACUUMと統計更新（PRAGMA optimize）も行う。
+        """
+        maintenance = getattr(self, "_maintenance", None)
+        if maintenance is None:
+            return
+
+        # 更新中（JV-Link使用中）は書き込みと競合するので次の機会に回す
+        if not self._jvlink_lock.acquire(blocking=False):
+            return
+
+        try:
+            tasks = maintenance.run_due(race_day=self.schedule_manager.is_race_day())
+            if tasks:
+                logger.info("Database maintenance completed", tasks=tasks)
+        except Exception as e:
+            logger.warning(f"Database maintenance failed: {e}")
+        finally:
+            self._jvlink_lock.release()
+
+    def _write_metrics_snapshot(self):
+        """`jltsql status --json` 用にメトリクスのスナップショットを保存"""
+        try:
+            REGISTRY.write_snapshot(project_root / DEFAULT_SNAPSHOT_PATH)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics snapshot: {e}")
 
     def _ensure_realtime_schema(self) -> None:
         """Prepare realtime tables once for the lifetime of this updater."""
@@ -1758,6 +1832,7 @@ def main():
   開催日・それ以外: 5分毎
   非開催日: 速報系更新なし
   蓄積系: 60分毎（開催日/非開催日とも）
+  DBメンテナンス: 更新の合間にWALチェックポイント、深夜・非開催日に最適化
 
 HTTP API エンドポイント (デフォルト: http://localhost:8765):
   GET /trigger              全データ強制更新
@@ -1799,6 +1874,10 @@ HTTP API エンドポイント (デフォルト: http://localhost:8765):
         "--no-api", action="store_true",
         help="HTTP APIサーバーを無効化"
     )
+    parser.add_argument(
+        "--no-maintenance", action="store_true",
+        help="WALチェックポイント・VACUUM・統計更新の自動実行を無効化"
+    )
     parser.add_argument(
         "--no-rate-limit", action="store_true",
         help=argparse.SUPPRESS  # 隠しオプション（開発者用）
@@ -1878,6 +1957,8 @@ HTTP API エンドポイント (デフォルト: http://localhost:8765):
             forward_args.extend(["--api-port", str(args.api_port)])
         if args.no_api:
             forward_args.append("--no-api")
+        if args.no_maintenance:
+            forward_args.append("--no-maintenance")
         if args.no_rate_limit:
             forward_args.append("--no-rate-limit")
         if args.rate_limit_short != 5:
@@ -1907,6 +1988,7 @@ HTTP API エンドポイント (デフォルト: http://localhost:8765):
                     rate_limit_short_term=args.rate_limit_short,
                     rate_limit_long_term=args.rate_limit_long,
                     silent_mode=is_daemon,  # デーモンモードでは画面出力を抑制
+                    enable_maintenance=not args.no_maintenance,
                 )
                 updater.start()
             finally:
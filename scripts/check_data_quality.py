@@ -10,14 +10,35 @@ This tool checks data quality in the JRA-VAN database by:
 5. Checking referential integrity (e.g., KettoNum references)
 6. Verifying record consistency (e.g., races have corresponding results)
 
+Record count, date, code and NULL checks of a table are computed together
+in one aggregate query, so every table is scanned once.
+
+With --incremental, a watermark per table is kept in a state file and later
+runs only check rows added or changed since the previous run: the SQLite
+rowid (INSERT OR REPLACE assigns a new rowid) or, on PostgreSQL, MakeDate.
+PostgreSQL rows imported with an older MakeDate (e.g. a history backfill) are
+only covered by a full run. Tables the importer updates in place (the
+standard odds and vote headers, written with ON CONFLICT DO UPDATE, and
+NL_CK) keep their rowid on update, so they have no watermark and are always
+checked in full; they hold one row per race or horse.
+
+With --sample, tables estimated above --sample-min-rows are checked on a
+sample of their rows (TABLESAMPLE SYSTEM on PostgreSQL, every n-th rowid on
+SQLite). Duplicate checks are skipped and watermarks are not advanced.
+
 Usage:
     python scripts/check_data_quality.py --db-path data/keiba.db
     python scripts/check_data_quality.py --db-path data/keiba.db --output report.json --verbose
+    python scripts/check_data_quality.py --db postgresql --incremental
+    python scripts/check_data_quality.py --db postgresql --sample 1
 """
 
 import argparse
 import json
+import os
+import re
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -26,12 +47,30 @@ from typing import Any, Dict, List, Optional, Tuple
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.database.base import BaseDatabase
 from src.database.sqlite_handler import SQLiteDatabase
 from src.database.schema import SCHEMAS
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_STATE_FILE = "data/quality_state.json"
+SAMPLE_MIN_ROWS = 1_000_000
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# Tables whose rows the importer updates in place; a rowid or MakeDate
+# watermark would miss those updates (see src/importer/importer.py).
+IN_PLACE_UPDATE_TABLES = frozenset({
+    'ODDS_TANPUKUWAKU_HEAD',
+    'ODDS_UMAREN_HEAD',
+    'ODDS_WIDE_HEAD',
+    'ODDS_UMATAN_HEAD',
+    'ODDS_SANREN_HEAD',
+    'ODDS_SANRENTAN_HEAD',
+    'HYOSU',
+    'HYOSU2',
+    'NL_CK',
+})
+
 
 # Valid ranges for code fields
 VALID_RANGES = {
@@ -77,22 +116,145 @@ VALID_RANGES = {
     },
 }
 
+# Important fields that should not be NULL
+IMPORTANT_FIELDS = {
+    'NL_RA': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'RaceName'],
+    'RT_RA': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'RaceName'],
+    'NL_SE': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'Umaban', 'KettoNum'],
+    'RT_SE': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'Umaban', 'KettoNum'],
+    'NL_UM': ['KettoNum', 'Bamei'],
+    'NL_KS': ['KisyuCode', 'KisyuName'],
+    'NL_CH': ['ChokyosiCode', 'ChokyosiName'],
+}
+
+# Primary key columns for the duplicate check
+PK_DEFINITIONS = {
+    'NL_RA': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum'],
+    'RT_RA': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum'],
+    'NL_SE': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum', 'Umaban'],
+    'RT_SE': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum', 'Umaban'],
+    'NL_UM': ['KettoNum'],
+    'NL_KS': ['KisyuCode'],
+    'NL_CH': ['ChokyosiCode'],
+    'NL_BN': ['BanusiCode'],
+    'NL_BR': ['BreederCode'],
+}
+
+_RACE_KEY = ('Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum')
+
+
+def _is_text_type(column_type: str) -> bool:
+    column_type = column_type.upper()
+    return any(token in column_type for token in ('CHAR', 'TEXT', 'CLOB'))
+
+
+def _out_of_range(column: str, column_type: str, min_val: int, max_val: int) -> str:
+    """SQL condition for a value outside ``min_val..max_val``.
+
+    Text codes are compared as zero-padded strings ('05' is not below 1),
+    which also keeps PostgreSQL from failing on a non-numeric cast.
+    """
+    if not _is_text_type(column_type):
+        return f"({column} < {min_val} OR {column} > {max_val})"
+    width = len(str(max_val))
+    return (
+        f"(LENGTH({column}) != {width} "
+        f"OR {column} < '{min_val:0{width}d}' OR {column} > '{max_val:0{width}d}')"
+    )
+
+
+def _invalid_monthday(column_type: str) -> str:
+    """SQL condition for a NULL or non-MMDD MonthDay (stored as 101 for 0101)."""
+    if _is_text_type(column_type):
+        return (
+            "(MonthDay IS NULL OR LENGTH(MonthDay) != 4 "
+            "OR SUBSTR(MonthDay, 1, 2) NOT BETWEEN '01' AND '12' "
+            "OR SUBSTR(MonthDay, 3, 2) NOT BETWEEN '01' AND '31')"
+        )
+    return (
+        "(MonthDay IS NULL OR MonthDay / 100 < 1 OR MonthDay / 100 > 12 "
+        "OR MonthDay % 100 < 1 OR MonthDay % 100 > 31)"
+    )
+
+
+class QualityState:
+    """Per-table watermarks of incremental quality runs, stored as JSON."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        try:
+            self._data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self._data = {}
+        self._data.setdefault('databases', {})
+
+    def watermarks(self, database_key: str) -> Dict[str, Dict[str, Any]]:
+        """Return the mutable watermark mapping of one database."""
+        return self._data['databases'].setdefault(database_key, {})
+
+    def save(self) -> None:
+        """Write the state atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_name, self.path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
 
 class DataQualityChecker:
     """Data quality checker for JRA-VAN database"""
 
-    def __init__(self, db_path: str, verbose: bool = False):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        verbose: bool = False,
+        *,
+        database: Optional[BaseDatabase] = None,
+        state_file: Optional[str] = None,
+        sample_percent: Optional[float] = None,
+        sample_min_rows: int = SAMPLE_MIN_ROWS,
+    ):
         """Initialize data quality checker
 
         Args:
             db_path: Path to SQLite database file
             verbose: Enable verbose output
+            database: Database handler to check instead of ``db_path``
+                (e.g. PostgreSQL)
+            state_file: Watermark state file; enables incremental checks
+            sample_percent: Check tables above ``sample_min_rows`` on a
+                sample of this many percent of their rows
+            sample_min_rows: Estimated row count from which to sample
         """
-        self.db_path = Path(db_path)
+        if database is None and db_path is None:
+            raise ValueError("db_path or database is required")
+        self.db = (
+            database
+            if database is not None
+            else SQLiteDatabase({'path': str(db_path), 'read_only': True})
+        )
+        self.db_path = Path(db_path) if db_path is not None else None
         self.verbose = verbose
-        self.db = SQLiteDatabase({'path': str(self.db_path)})
+        self.is_postgresql = self.db.get_db_type() == 'postgresql'
+        self.state = QualityState(state_file) if state_file else None
+        self.sample_percent = sample_percent
+        self.sample_min_rows = sample_min_rows
         self.issues: List[Dict[str, Any]] = []
         self.table_stats: Dict[str, Dict[str, Any]] = {}
+        self._watermarks: Dict[str, Dict[str, Any]] = {}
+        self._scopes: Dict[str, Tuple[str, tuple]] = {}
+
+    @property
+    def database_label(self) -> str:
+        """Identify the checked database in reports and the state file."""
+        if self.db_path is not None:
+            return str(self.db_path.resolve())
+        config = self.db.config
+        return f"postgresql://{config.get('host', 'localhost')}:{config.get('port', 5432)}/{config.get('database', 'keiba')}"
 
     def check_all(self) -> Dict[str, Any]:
         """Run all data quality checks
@@ -102,10 +264,13 @@ class DataQualityChecker:
         """
         self.db.connect()
         try:
+            if self.state is not None:
+                self._watermarks = self.state.watermarks(self.database_label)
+
             print("=" * 80)
             print("Data Quality Report")
             print("=" * 80)
-            print(f"Database: {self.db_path}")
+            print(f"Database: {self.db_path or self.database_label}")
             print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print()
 
@@ -147,9 +312,12 @@ class DataQualityChecker:
                     message = issue.get('message', '')
                     print(f"  {i}. [{severity}] {table}: {message}")
 
+            if self.state is not None:
+                self.state.save()
+
             # Generate report
             report = {
-                'database': str(self.db_path),
+                'database': str(self.db_path or self.database_label),
                 'generated_at': datetime.now().isoformat(),
                 'total_tables': len(tables),
                 'total_issues': len(self.issues),
@@ -168,256 +336,292 @@ class DataQualityChecker:
         Returns:
             List of table names
         """
-        result = self.db.fetch_all(
-            "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
-        )
-        return [row['name'] for row in result]
+        if self.is_postgresql:
+            result = self.db.fetch_all(
+                "SELECT table_name AS name FROM information_schema.tables "
+                "WHERE table_schema = current_schema() AND table_type = 'BASE TABLE'"
+            )
+            # PostgreSQL folds the unquoted schema names to lower case.
+            canonical = {name.lower(): name for name in SCHEMAS}
+            names = [canonical.get(row['name'], row['name'].upper()) for row in result]
+        else:
+            result = self.db.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+            )
+            names = [row['name'] for row in result]
+        return [name for name in names if _IDENTIFIER.match(name)]
+
+    def _get_columns(self, table_name: str) -> Dict[str, str]:
+        """Return column types keyed by the canonical column name."""
+        if self.is_postgresql:
+            rows = self.db.fetch_all(
+                "SELECT column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = ?",
+                (table_name.lower(),),
+            )
+            found = {row['column_name'].lower(): row['data_type'] for row in rows}
+            # Match the mixed-case names used in the checks.
+            names = {
+                name.lower(): name
+                for fields in (IMPORTANT_FIELDS.values(), PK_DEFINITIONS.values())
+                for field_list in fields
+                for name in field_list
+            }
+            names.update({name.lower(): name for name in VALID_RANGES})
+            names.update({'makedate': 'MakeDate'})
+            return {names.get(name, name): column_type for name, column_type in found.items()}
+        rows = self.db.fetch_all(f"PRAGMA table_info({table_name})")
+        return {row['name']: row['type'] for row in rows}
+
+    def _estimate_rows(self, table_name: str) -> int:
+        """Cheap row-count estimate used to decide on sampling."""
+        if self.is_postgresql:
+            row = self.db.fetch_one(
+                "SELECT reltuples::bigint AS n FROM pg_class WHERE oid = to_regclass(?)",
+                (table_name.lower(),),
+            )
+        else:
+            row = self.db.fetch_one(f"SELECT MAX(rowid) AS n FROM {table_name}")
+        return int(row['n'] or 0) if row else 0
+
+    def _watermark_column(self, table_name: str, columns: Dict[str, str]) -> Optional[str]:
+        if table_name.upper() in IN_PLACE_UPDATE_TABLES:
+            return None
+        if not self.is_postgresql:
+            return 'rowid'
+        return 'MakeDate' if 'MakeDate' in columns else None
+
+    def _plan_scope(self, table_name: str, columns: Dict[str, str]) -> Dict[str, Any]:
+        """Decide how much of a table this run checks.
+
+        Returns:
+            ``mode`` (full/incremental/sampled), the FROM/WHERE SQL pieces and
+            the watermark column to advance, if any
+        """
+        scope: Dict[str, Any] = {
+            'mode': 'full',
+            'sample': '',
+            'where': '',
+            'params': (),
+            'watermark_column': None,
+            'label': '',
+        }
+        if self.sample_percent and self._estimate_rows(table_name) >= self.sample_min_rows:
+            scope['mode'] = 'sampled'
+            scope['label'] = f" ({self.sample_percent:g}% sample)"
+            if self.is_postgresql:
+                scope['sample'] = f" TABLESAMPLE SYSTEM ({float(self.sample_percent)})"
+            else:
+                step = max(1, round(100 / self.sample_percent))
+                scope['where'] = f"rowid % {step} = 0"
+
+        if self.state is None:
+            return scope
+        column = self._watermark_column(table_name, columns)
+        if column is None:
+            return scope
+        if scope['mode'] != 'sampled':
+            # A sample does not verify every row, so it never advances a watermark.
+            scope['watermark_column'] = column
+        previous = self._watermarks.get(table_name)
+        if previous and previous.get('column') == column:
+            operator = '>' if column == 'rowid' else '>='
+            condition = f"{column} {operator} ?"
+            scope['where'] = f"{scope['where']} AND {condition}" if scope['where'] else condition
+            scope['params'] = (previous['value'],)
+            if scope['mode'] == 'full':
+                scope['mode'] = 'incremental'
+                scope['label'] = ' (new/changed rows)'
+            scope['since'] = f"{column} {operator} {previous['value']}"
+        return scope
 
     def _check_table(self, table_name: str):
-        """Check data quality for a single table
+        """Check data quality for a single table in one aggregate query
 
         Args:
             table_name: Name of table to check
         """
         print(f"\n[{table_name}]")
 
-        # Get record count
-        count_result = self.db.fetch_one(f"SELECT COUNT(*) as count FROM `{table_name}`")
-        record_count = count_result['count'] if count_result else 0
-
-        if record_count == 0:
-            print(f"  Records: 0 (EMPTY)")
-            self.table_stats[table_name] = {
-                'record_count': 0,
-                'quality': 'EMPTY',
-            }
-            return
+        columns = self._get_columns(table_name)
+        scope = self._plan_scope(table_name, columns)
+        where = f" WHERE {scope['where']}" if scope['where'] else ''
+        self._scopes[table_name] = (scope['where'], scope['params'])
+
+        select = ["COUNT(*) AS record_count"]
+        has_dates = 'Year' in columns and 'MonthDay' in columns
+        if has_dates:
+            select += [
+                "MIN(Year) AS min_year",
+                "MAX(Year) AS max_year",
+                "SUM(CASE WHEN Year IS NULL OR "
+                f"{_out_of_range('Year', columns['Year'], 1900, 2100)} "
+                "THEN 1 ELSE 0 END) AS invalid_year",
+                f"SUM(CASE WHEN {_invalid_monthday(columns['MonthDay'])} "
+                "THEN 1 ELSE 0 END) AS invalid_monthday",
+            ]
+        code_fields = [field for field in VALID_RANGES if field in columns]
+        for field in code_fields:
+            range_info = VALID_RANGES[field]
+            condition = _out_of_range(field, columns[field], range_info['min'], range_info['max'])
+            blank = f" AND TRIM({field}) != ''" if _is_text_type(columns[field]) else ''
+            select.append(
+                f"SUM(CASE WHEN {field} IS NOT NULL{blank} AND {condition} "
+                f"THEN 1 ELSE 0 END) AS invalid_{field.lower()}"
+            )
+        null_fields = [field for field in IMPORTANT_FIELDS.get(table_name, []) if field in columns]
+        for field in null_fields:
+            select.append(
+                f"SUM(CASE WHEN {field} IS NULL OR TRIM(CAST({field} AS TEXT)) = '' "
+                f"THEN 1 ELSE 0 END) AS null_{field.lower()}"
+            )
+        if scope['watermark_column']:
+            select.append(f"MAX({scope['watermark_column']}) AS watermark")
 
-        print(f"  Records: {record_count:,}")
+        row = self.db.fetch_one(
+            f"SELECT {', '.join(select)} FROM {table_name}{scope['sample']}{where}",
+            scope['params'] or None,
+        ) or {}
+        record_count = int(row.get('record_count') or 0)
+        self._advance_watermark(table_name, scope, row.get('watermark'))
 
-        # Initialize stats
-        stats = {
+        stats: Dict[str, Any] = {
             'record_count': record_count,
             'quality': 'GOOD',
+            'mode': scope['mode'],
             'checks': {},
         }
+        if record_count == 0:
+            if scope['mode'] == 'full':
+                print(f"  Records: 0 (EMPTY)")
+                self.table_stats[table_name] = {
+                    'record_count': 0,
+                    'quality': 'EMPTY',
+                }
+            else:
+                print(f"  Records: 0 {'sampled' if scope['mode'] == 'sampled' else 'new/changed'}")
+                self.table_stats[table_name] = {
+                    'record_count': 0,
+                    'quality': 'UNCHANGED',
+                    'mode': scope['mode'],
+                }
+            return
 
-        # Get table schema
-        schema_info = self.db.get_table_info(table_name)
-        columns = {col['name']: col['type'] for col in schema_info}
-
-        # Check date fields
-        if 'Year' in columns and 'MonthDay' in columns:
-            self._check_date_fields(table_name, record_count, stats)
-
-        # Check code fields
-        for code_field in ['JyoCD', 'Kaiji', 'Nichiji', 'RaceNum', 'Umaban', 'TrackCD']:
-            if code_field in columns:
-                self._check_code_field(table_name, code_field, record_count, stats)
-
-        # Check important fields for NULL values
-        self._check_null_values(table_name, columns, record_count, stats)
-
-        # Check for duplicate primary keys (should not happen with PRIMARY KEY constraint)
-        self._check_duplicates(table_name, stats)
-
-        # Print quality assessment
-        quality = stats.get('quality', 'UNKNOWN')
-        print(f"  Quality: {quality}")
-
-        self.table_stats[table_name] = stats
-
-    def _check_date_fields(self, table_name: str, total_records: int, stats: Dict[str, Any]):
-        """Check validity of date fields (Year, MonthDay)
-
-        Args:
-            table_name: Name of table
-            total_records: Total number of records
-            stats: Stats dictionary to update
-        """
-        # Check Year range (should be reasonable, e.g., 1900-2100)
-        year_check = self.db.fetch_one(f"""
-            SELECT
-                MIN(Year) as min_year,
-                MAX(Year) as max_year,
-                COUNT(CASE WHEN Year IS NULL OR Year < 1900 OR Year > 2100 THEN 1 END) as invalid_count
-            FROM `{table_name}`
-        """)
-
-        if year_check:
-            min_year = year_check['min_year']
-            max_year = year_check['max_year']
-            invalid_count = year_check['invalid_count']
-
-            if min_year and max_year:
-                print(f"  Date Range: {min_year}-01-01 ~ {max_year}-12-31")
-
-            if invalid_count > 0:
-                pct = (invalid_count / total_records) * 100
+        if scope['mode'] == 'incremental':
+            print(f"  Records: {record_count:,} new/changed since {scope['since']}")
+        elif scope['mode'] == 'sampled':
+            print(f"  Records: {record_count:,} sampled ({self.sample_percent:g}%)")
+        else:
+            print(f"  Records: {record_count:,}")
+
+        def report(count_key: str, message: str, severity: str = 'WARNING') -> int:
+            count = int(row.get(count_key) or 0)
+            if count > 0:
+                pct = (count / record_count) * 100
                 self._add_issue(
                     table_name,
-                    f"{invalid_count:,} records ({pct:.1f}%) with invalid Year",
-                    'WARNING'
+                    f"{count:,} records ({pct:.1f}%) {message}{scope['label']}",
+                    severity,
                 )
                 stats['quality'] = 'WARNING'
-
-        # Check MonthDay format (should be 4 digits MMDD)
-        monthday_check = self.db.fetch_one(f"""
-            SELECT
-                COUNT(CASE WHEN
-                    MonthDay IS NULL
-                    OR LENGTH(CAST(MonthDay AS TEXT)) != 4
-                    OR CAST(SUBSTR(CAST(MonthDay AS TEXT), 1, 2) AS INTEGER) > 12
-                    OR CAST(SUBSTR(CAST(MonthDay AS TEXT), 1, 2) AS INTEGER) < 1
-                    OR CAST(SUBSTR(CAST(MonthDay AS TEXT), 3, 2) AS INTEGER) > 31
-                    OR CAST(SUBSTR(CAST(MonthDay AS TEXT), 3, 2) AS INTEGER) < 1
-                THEN 1 END) as invalid_count
-            FROM `{table_name}`
-        """)
-
-        if monthday_check and monthday_check['invalid_count'] > 0:
-            invalid_count = monthday_check['invalid_count']
-            pct = (invalid_count / total_records) * 100
-            self._add_issue(
-                table_name,
-                f"{invalid_count:,} records ({pct:.1f}%) with invalid MonthDay format",
-                'WARNING'
+            return count
+
+        if has_dates:
+            if row.get('min_year') and row.get('max_year'):
+                print(f"  Date Range: {row['min_year']}-01-01 ~ {row['max_year']}-12-31")
+            report('invalid_year', 'with invalid Year')
+            report('invalid_monthday', 'with invalid MonthDay format')
+            stats['checks']['date_fields'] = 'CHECKED'
+
+        for field in code_fields:
+            report(
+                f"invalid_{field.lower()}",
+                f"with invalid {field} ({VALID_RANGES[field]['description']})",
             )
-            stats['quality'] = 'WARNING'
-
-        stats['checks']['date_fields'] = 'CHECKED'
-
-    def _check_code_field(self, table_name: str, field_name: str, total_records: int, stats: Dict[str, Any]):
-        """Check validity of code fields
-
-        Args:
-            table_name: Name of table
-            field_name: Name of code field
-            total_records: Total number of records
-            stats: Stats dictionary to update
-        """
-        if field_name not in VALID_RANGES:
-            return
-
-        range_info = VALID_RANGES[field_name]
-        min_val = range_info['min']
-        max_val = range_info['max']
-
-        # Check for values outside valid range
-        invalid_check = self.db.fetch_one(f"""
-            SELECT COUNT(*) as invalid_count
-            FROM `{table_name}`
-            WHERE {field_name} IS NOT NULL
-            AND ({field_name} < {min_val} OR {field_name} > {max_val})
-        """)
-
-        if invalid_check and invalid_check['invalid_count'] > 0:
-            invalid_count = invalid_check['invalid_count']
-            pct = (invalid_count / total_records) * 100
-            self._add_issue(
-                table_name,
-                f"{invalid_count:,} records ({pct:.1f}%) with invalid {field_name} ({range_info['description']})",
-                'WARNING'
-            )
-            stats['quality'] = 'WARNING'
-
-        stats['checks'][f'code_{field_name}'] = 'CHECKED'
-
-    def _check_null_values(self, table_name: str, columns: Dict[str, str], total_records: int, stats: Dict[str, Any]):
-        """Check NULL values in important columns
-
-        Args:
-            table_name: Name of table
-            columns: Dictionary of column names and types
-            total_records: Total number of records
-            stats: Stats dictionary to update
-        """
-        # Define important fields that should not be NULL
-        important_fields = {
-            'NL_RA': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'RaceName'],
-            'RT_RA': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'RaceName'],
-            'NL_SE': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'Umaban', 'KettoNum'],
-            'RT_SE': ['Year', 'MonthDay', 'JyoCD', 'RaceNum', 'Umaban', 'KettoNum'],
-            'NL_UM': ['KettoNum', 'Bamei'],
-            'NL_KS': ['KisyuCode', 'KisyuName'],
-            'NL_CH': ['ChokyosiCode', 'ChokyosiName'],
-        }
+            stats['checks'][f'code_{field}'] = 'CHECKED'
 
-        fields_to_check = important_fields.get(table_name, [])
         null_stats = []
-
-        for field in fields_to_check:
-            if field not in columns:
-                continue
-
-            null_check = self.db.fetch_one(f"""
-                SELECT COUNT(*) as null_count
-                FROM `{table_name}`
-                WHERE {field} IS NULL OR TRIM(CAST({field} AS TEXT)) = ''
-            """)
-
-            if null_check and null_check['null_count'] > 0:
-                null_count = null_check['null_count']
-                pct = (null_count / total_records) * 100
+        for field in null_fields:
+            null_count = int(row.get(f"null_{field.lower()}") or 0)
+            if null_count > 0:
+                pct = (null_count / record_count) * 100
                 null_stats.append(f"{field}={pct:.1f}%")
-
                 if pct > 10:  # More than 10% NULL is concerning
                     self._add_issue(
                         table_name,
-                        f"{null_count:,} records ({pct:.1f}%) with NULL {field}",
+                        f"{null_count:,} records ({pct:.1f}%) with NULL {field}{scope['label']}",
                         'WARNING'
                     )
                     stats['quality'] = 'WARNING'
-
         if null_stats and self.verbose:
             print(f"  NULL ratio: {', '.join(null_stats)}")
-
         stats['checks']['null_values'] = 'CHECKED'
 
-    def _check_duplicates(self, table_name: str, stats: Dict[str, Any]):
+        # Check for duplicate primary keys (should not happen with PRIMARY KEY constraint)
+        if scope['mode'] == 'sampled':
+            stats['checks']['duplicates'] = 'SKIPPED (sampled)'
+        else:
+            self._check_duplicates(table_name, columns, scope, stats)
+
+        # Print quality assessment
+        quality = stats.get('quality', 'UNKNOWN')
+        print(f"  Quality: {quality}")
+
+        self.table_stats[table_name] = stats
+
+    def _advance_watermark(self, table_name: str, scope: Dict[str, Any], value: Any) -> None:
+        column = scope['watermark_column']
+        if column is None:
+            return
+        if value is None:
+            # Nothing new: keep the previous watermark, or start one on an empty table.
+            if table_name not in self._watermarks and column == 'rowid':
+                self._watermarks[table_name] = {'column': column, 'value': 0}
+            return
+        self._watermarks[table_name] = {
+            'column': column,
+            'value': value,
+            'checked_at': datetime.now().isoformat(),
+        }
+
+    def _check_duplicates(
+        self,
+        table_name: str,
+        columns: Dict[str, str],
+        scope: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
         """Check for duplicate records
 
+        Incremental runs only look at keys that occur in the new or changed
+        rows.
+
         Args:
             table_name: Name of table
+            columns: Column types of the table
+            scope: Scope planned by :meth:`_plan_scope`
             stats: Stats dictionary to update
         """
-        # Define primary key columns for each table type
-        pk_definitions = {
-            'NL_RA': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum'],
-            'RT_RA': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum'],
-            'NL_SE': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum', 'Umaban'],
-            'RT_SE': ['Year', 'MonthDay', 'JyoCD', 'Kaiji', 'Nichiji', 'RaceNum', 'Umaban'],
-            'NL_UM': ['KettoNum'],
-            'NL_KS': ['KisyuCode'],
-            'NL_CH': ['ChokyosiCode'],
-            'NL_BN': ['BanusiCode'],
-            'NL_BR': ['BreederCode'],
-        }
-
-        pk_cols = pk_definitions.get(table_name)
+        pk_cols = [col for col in PK_DEFINITIONS.get(table_name, []) if col in columns]
         if not pk_cols:
             return
 
-        # Get table schema to check if columns exist
-        schema_info = self.db.get_table_info(table_name)
-        available_cols = {col['name'] for col in schema_info}
-
-        # Filter to only existing columns
-        pk_cols = [col for col in pk_cols if col in available_cols]
-        if not pk_cols:
-            return
-
-        # Check for duplicates
         pk_str = ', '.join(pk_cols)
-        dup_check = self.db.fetch_one(f"""
+        where = ''
+        if scope['where']:
+            where = f" WHERE ({pk_str}) IN (SELECT {pk_str} FROM {table_name} WHERE {scope['where']})"
+        dup_check = self.db.fetch_one(
+            f"""
             SELECT COUNT(*) as dup_count
             FROM (
-                SELECT {pk_str}, COUNT(*) as cnt
-                FROM `{table_name}`
+                SELECT {pk_str}
+                FROM {table_name}{where}
                 GROUP BY {pk_str}
-                HAVING cnt > 1
-            )
-        """)
+                HAVING COUNT(*) > 1
+            ) duplicates
+            """,
+            scope['params'] or None,
+        )
 
         if dup_check and dup_check['dup_count'] > 0:
             dup_count = dup_check['dup_count']
@@ -430,97 +634,104 @@ class DataQualityChecker:
 
         stats['checks']['duplicates'] = 'CHECKED'
 
+    def _scoped(self, table_name: str, alias: str, condition: str = '') -> Tuple[str, tuple]:
+        """WHERE clause restricting ``alias`` to the rows checked for its table."""
+        scope_where, params = self._scopes.get(table_name, ('', ()))
+        conditions = [condition] if condition else []
+        if scope_where:
+            conditions.append(re.sub(r'\b(rowid|MakeDate)\b', rf'{alias}.\1', scope_where))
+        return (f" WHERE {' AND '.join(conditions)}" if conditions else ''), params
+
+    def _linked_ratio(
+        self, label: str, join_sql: str, orphan_condition: str, where: str, params: tuple
+    ) -> Tuple[int, int]:
+        """Count checked rows and orphans of a LEFT JOIN in one pass."""
+        row = self.db.fetch_one(
+            f"""
+            SELECT COUNT(*) AS total_count,
+                   SUM(CASE WHEN {orphan_condition} THEN 1 ELSE 0 END) AS orphan_count
+            FROM {join_sql}{where}
+            """,
+            params or None,
+        ) or {}
+        total_count = int(row.get('total_count') or 0)
+        orphan_count = int(row.get('orphan_count') or 0)
+        if total_count > 0:
+            pct_linked = 100 - (orphan_count / total_count) * 100
+            print(f"  {label}: {pct_linked:.1f}% linked ({total_count - orphan_count:,}/{total_count:,})")
+        return total_count, orphan_count
+
     def _check_referential_integrity(self):
-        """Check referential integrity between tables"""
+        """Check referential integrity between tables
+
+        Incremental and sampled runs only check the NL_SE rows that were
+        checked for NL_SE itself.
+        """
 
         self._check_ch_normalized_results()
 
+        scope_label = ''
+        se_stats = self.table_stats.get('NL_SE', {})
+        if se_stats.get('mode') == 'incremental':
+            scope_label = ' (new/changed rows)'
+        elif se_stats.get('mode') == 'sampled':
+            scope_label = f" ({self.sample_percent:g}% sample)"
+
         # Check if NL_SE records reference existing NL_RA records
         if self.db.table_exists('NL_SE') and self.db.table_exists('NL_RA'):
-            orphan_check = self.db.fetch_one("""
-                SELECT COUNT(*) as orphan_count
-                FROM NL_SE se
-                LEFT JOIN NL_RA ra
-                    ON se.Year = ra.Year
-                    AND se.MonthDay = ra.MonthDay
-                    AND se.JyoCD = ra.JyoCD
-                    AND se.Kaiji = ra.Kaiji
-                    AND se.Nichiji = ra.Nichiji
-                    AND se.RaceNum = ra.RaceNum
-                WHERE ra.Year IS NULL
-            """)
-
-            if orphan_check and orphan_check['orphan_count'] > 0:
-                orphan_count = orphan_check['orphan_count']
-
-                # Get total NL_SE count for percentage
-                total_se = self.db.fetch_one("SELECT COUNT(*) as cnt FROM NL_SE")
-                total_count = total_se['cnt'] if total_se else 1
+            join = ' AND '.join(f"se.{column} = ra.{column}" for column in _RACE_KEY)
+            where, params = self._scoped('NL_SE', 'se')
+            print()
+            total_count, orphan_count = self._linked_ratio(
+                'NL_SE → NL_RA',
+                f"NL_SE se LEFT JOIN NL_RA ra ON {join}",
+                'ra.Year IS NULL',
+                where,
+                params,
+            )
+            if orphan_count > 0:
                 pct = (orphan_count / total_count) * 100
-
-                print(f"\n  NL_SE → NL_RA: {pct:.1f}% linked ({total_count - orphan_count:,}/{total_count:,})")
-
                 if pct > 1:  # More than 1% orphaned is concerning
                     self._add_issue(
                         'NL_SE',
-                        f"{orphan_count:,} records ({pct:.1f}%) do not have corresponding NL_RA records",
+                        f"{orphan_count:,} records ({pct:.1f}%) do not have corresponding NL_RA records{scope_label}",
                         'WARNING'
                     )
-            else:
-                # All linked
-                total_se = self.db.fetch_one("SELECT COUNT(*) as cnt FROM NL_SE")
-                total_count = total_se['cnt'] if total_se else 0
-                if total_count > 0:
-                    print(f"\n  NL_SE → NL_RA: 100.0% linked ({total_count:,}/{total_count:,})")
 
         # Check if NL_SE records reference valid horses in NL_UM
         if self.db.table_exists('NL_SE') and self.db.table_exists('NL_UM'):
-            orphan_horses = self.db.fetch_one("""
-                SELECT COUNT(*) as orphan_count
-                FROM NL_SE se
-                LEFT JOIN NL_UM um ON se.KettoNum = um.KettoNum
-                WHERE um.KettoNum IS NULL AND se.KettoNum IS NOT NULL
-            """)
-
-            if orphan_horses and orphan_horses['orphan_count'] > 0:
-                orphan_count = orphan_horses['orphan_count']
-
-                total_se = self.db.fetch_one("SELECT COUNT(*) as cnt FROM NL_SE WHERE KettoNum IS NOT NULL")
-                total_count = total_se['cnt'] if total_se else 1
+            where, params = self._scoped('NL_SE', 'se', 'se.KettoNum IS NOT NULL')
+            total_count, orphan_count = self._linked_ratio(
+                'NL_SE → NL_UM',
+                'NL_SE se LEFT JOIN NL_UM um ON se.KettoNum = um.KettoNum',
+                'um.KettoNum IS NULL',
+                where,
+                params,
+            )
+            if orphan_count > 0:
                 pct = (orphan_count / total_count) * 100
-
-                print(f"  NL_SE → NL_UM: {100-pct:.1f}% linked ({total_count - orphan_count:,}/{total_count:,})")
-
                 if pct > 5:  # More than 5% is concerning
                     self._add_issue(
                         'NL_SE',
-                        f"{orphan_count:,} records ({pct:.1f}%) reference non-existent horses (KettoNum)",
+                        f"{orphan_count:,} records ({pct:.1f}%) reference non-existent horses (KettoNum){scope_label}",
                         'WARNING'
                     )
-            else:
-                total_se = self.db.fetch_one("SELECT COUNT(*) as cnt FROM NL_SE WHERE KettoNum IS NOT NULL")
-                total_count = total_se['cnt'] if total_se else 0
-                if total_count > 0:
-                    print(f"  NL_SE → NL_UM: 100.0% linked ({total_count:,}/{total_count:,})")
-
-        # Check race-to-results ratio
-        if self.db.table_exists('NL_RA') and self.db.table_exists('NL_SE'):
-            race_count = self.db.fetch_one("SELECT COUNT(*) as cnt FROM NL_RA")
-            result_count = self.db.fetch_one("SELECT COUNT(*) as cnt FROM NL_SE")
-
-            if race_count and result_count:
-                races = race_count['cnt']
-                results = result_count['cnt']
-                if races > 0:
-                    ratio = results / races
-                    print(f"  Race to Results Ratio: {ratio:.1f} results per race")
-
-                    if ratio < 5:  # Less than 5 results per race is unusual
-                        self._add_issue(
-                            'NL_RA/NL_SE',
-                            f"Unusually low results per race: {ratio:.1f} (expected ~8-18)",
-                            'INFO'
-                        )
+
+        # Check race-to-results ratio; only meaningful over whole tables
+        ra_stats = self.table_stats.get('NL_RA', {})
+        if ra_stats.get('mode') == 'full' and se_stats.get('mode') == 'full':
+            races = ra_stats['record_count']
+            results = se_stats['record_count']
+            if races > 0:
+                ratio = results / races
+                print(f"  Race to Results Ratio: {ratio:.1f} results per race")
+
+                if ratio < 5:  # Less than 5 results per race is unusual
+                    self._add_issue(
+                        'NL_RA/NL_SE',
+                        f"Unusually low results per race: {ratio:.1f} (expected ~8-18)",
+                        'INFO'
+                    )
 
     def _check_ch_normalized_results(self):
         """Require one complete Num=1,2,3 result group per trainer."""
@@ -587,12 +798,13 @@ class DataQualityChecker:
                   ON ch.ChokyosiCode = result.ChokyosiCode
                 WHERE ch.ChokyosiCode IS NULL
             """)
-            revision_result = self.db.fetch_one("""
+            distinct = 'IS DISTINCT FROM' if self.is_postgresql else 'IS NOT'
+            revision_result = self.db.fetch_one(f"""
                 SELECT COUNT(*) AS revision_mismatch_count
                 FROM NL_CH_SEISEKI result
                 JOIN NL_CH ch
                   ON ch.ChokyosiCode = result.ChokyosiCode
-                WHERE result.MakeDate IS NOT ch.MakeDate
+                WHERE result.MakeDate {distinct} ch.MakeDate
             """)
             if not incomplete_result or not orphan_result or not revision_result:
                 raise ValueError("normalized CH completeness query returned no result")
@@ -667,9 +879,22 @@ Examples:
 
     # Check test database
     python scripts/check_data_quality.py --db-path data/test_simple.db
+
+    # PostgreSQL from config.yaml, only rows added since the previous run
+    python scripts/check_data_quality.py --db postgresql --incremental
+
+    # Check tables above 1,000,000 rows on a 1% sample
+    python scripts/check_data_quality.py --db postgresql --sample 1
         """
     )
 
+    parser.add_argument(
+        '--db',
+        choices=['sqlite', 'postgresql'],
+        default='sqlite',
+        help='Database type (default: sqlite)'
+    )
+
     parser.add_argument(
         '--db-path',
         type=str,
@@ -677,6 +902,12 @@ Examples:
         help='Path to SQLite database file (default: data/keiba.db)'
     )
 
+    parser.add_argument(
+        '--config',
+        type=str,
+        help='Configuration file for --db postgresql (default: config/config.yaml)'
+    )
+
     parser.add_argument(
         '--output',
         type=str,
@@ -689,17 +920,76 @@ Examples:
         help='Enable verbose output'
     )
 
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only check rows added or changed since the previous incremental run'
+    )
+
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='With --incremental: check every row and reset the watermarks'
+    )
+
+    parser.add_argument(
+        '--state-file',
+        type=str,
+        default=DEFAULT_STATE_FILE,
+        help=f'Watermark state file for --incremental (default: {DEFAULT_STATE_FILE})'
+    )
+
+    parser.add_argument(
+        '--sample',
+        type=float,
+        metavar='PERCENT',
+        help='Check large tables on a sample of PERCENT %% of their rows'
+    )
+
+    parser.add_argument(
+        '--sample-min-rows',
+        type=int,
+        default=SAMPLE_MIN_ROWS,
+        help=f'Estimated row count from which --sample applies (default: {SAMPLE_MIN_ROWS:,})'
+    )
+
     args = parser.parse_args()
 
-    # Check if database exists
-    db_path = Path(args.db_path)
-    if not db_path.exists():
-        print(f"Error: Database file not found: {db_path}")
-        sys.exit(1)
+    if args.sample is not None and not 0 < args.sample <= 100:
+        parser.error('--sample must be between 0 and 100')
+
+    database = None
+    db_path: Optional[Path] = None
+    if args.db == 'postgresql':
+        from src.database.postgresql_handler import PostgreSQLDatabase
+        from src.utils.config import load_config
+
+        config = load_config(args.config or str(project_root / 'config' / 'config.yaml'))
+        database = PostgreSQLDatabase(config.get('databases.postgresql') or {})
+    else:
+        # Check if database exists
+        db_path = Path(args.db_path)
+        if not db_path.exists():
+            print(f"Error: Database file not found: {db_path}")
+            sys.exit(1)
+
+    state_file = None
+    if args.incremental:
+        state_file = args.state_file
+        if args.full:
+            # A full run re-establishes every watermark from scratch.
+            Path(state_file).unlink(missing_ok=True)
 
     try:
         # Run quality check
-        checker = DataQualityChecker(str(db_path), verbose=args.verbose)
+        checker = DataQualityChecker(
+            str(db_path) if db_path is not None else None,
+            verbose=args.verbose,
+            database=database,
+            state_file=state_file,
+            sample_percent=args.sample,
+            sample_min_rows=args.sample_min_rows,
+        )
         report = checker.check_all()
 
         # Save JSON report if requested
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Generate src/parser/official_layouts.py from the official layout manifest.
+
+Each root record a parser reads through a compiled extractor
+(``GENERATED_RECORD_TYPES``) is flattened into byte spans: nested
+structures are inlined, date and time structures (YMD, HM, HMS, MDHM) stay
+one field, repeated fields get a one-based index suffix (``LapTime1``), and
+long runs of flat entries (odds, votes, horse lists) become repeated groups
+read with a fixed-stride region. Field names follow the hand-written
+parsers; a name that would occur twice in one record is qualified with its
+parent fields (``CCInfoAfterKyori``).
+
+Usage:
+    python scripts/generate_official_layouts.py
+    python scripts/generate_official_layouts.py --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterator
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.official_jvdata_oracle import load_manifest, validate_manifest  # noqa: E402
+
+DEFAULT_MANIFEST = (
+    project_root / "tests" / "fixtures" / "official_layout" / "jvdata_sdk500_manifest.json"
+)
+DEFAULT_OUTPUT = project_root / "src" / "parser" / "official_layouts.py"
+
+# Record types whose parsers read src.parser.layout_compiler.official_layout();
+# the other parsers keep their own field tables, so their layouts are not
+# generated. Add a type here when its parser moves to a compiled extractor.
+GENERATED_RECORD_TYPES = ("RA", "SE", "HR", "O1", "O2", "O3", "O4", "O5", "O6")
+# Date and time structures are stored as one column, e.g. MakeDate=YYYYMMDD.
+VALUE_STRUCTURES = frozenset({"YMD", "HMS", "HM", "MDHM"})
+# Repeats of flat entries at least this long are not unrolled.
+REGION_MIN_COUNT = 10
+LINE_WIDTH = 100
+
+
+def _is_flat(structures: dict[str, Any], structure_name: str) -> bool:
+    fields = structures[structure_name]["fields"]
+    return len(fields) >= 2 and all(
+        field["kind"] == "scalar"
+        or (field["kind"] == "nested" and field["struct"] in VALUE_STRUCTURES)
+        for field in fields
+    )
+
+
+def _items(
+    structures: dict[str, Any],
+    structure_name: str,
+    base: int,
+    suffix: str = "",
+    qualifier: str = "",
+) -> Iterator[tuple]:
+    """Yield ``("field", name, qualified, start, width)`` and region items."""
+
+    for field in structures[structure_name]["fields"]:
+        start = base + field["start"] - 1
+        name = field["name"]
+        if field["kind"] == "scalar" or (
+            field["kind"] == "nested" and field["struct"] in VALUE_STRUCTURES
+        ):
+            yield ("field", name + suffix, qualifier + name + suffix, start, field["width"])
+        elif field["kind"] == "nested":
+            yield from _items(structures, field["struct"], start, suffix, qualifier + name)
+        elif (
+            field["element_kind"] == "nested"
+            and not suffix
+            and field["count"] >= REGION_MIN_COUNT
+            and _is_flat(structures, field["struct"])
+        ):
+            entry = tuple(
+                (element["name"], element["width"])
+                for element in structures[field["struct"]]["fields"]
+            )
+            yield ("region", name, qualifier + name, start, field["count"], entry)
+        else:
+            for index in range(field["count"]):
+                position = start + index * field["stride"]
+                number = f"{suffix}{index + 1}"
+                if field["element_kind"] == "scalar" or field["struct"] in VALUE_STRUCTURES:
+                    yield (
+                        "field",
+                        name + number,
+                        qualifier + name + number,
+                        position,
+                        field["width"],
+                    )
+                else:
+                    yield from _items(
+                        structures,
+                        field["struct"],
+                        position,
+                        number,
+                        f"{qualifier}{name}{index + 1}",
+                    )
+
+
+def flatten_record(manifest: dict[str, Any], record_type: str) -> dict[str, Any]:
+    """Flatten one root record into fields and repeated groups.
+
+    Returns:
+        ``{"length": int, "fields": [(name, start, width)], "regions":
+        [(name, start, count, ((name, width), ...))]}``
+    """
+
+    structures = manifest["structures"]
+    contract = manifest["root_records"][record_type]
+    items = list(_items(structures, contract["struct"], 0))
+    counts = Counter(item[1] for item in items)
+    fields = []
+    regions = []
+    for item in items:
+        name = item[1] if counts[item[1]] == 1 else item[2]
+        if item[0] == "field":
+            fields.append((name, item[3], item[4]))
+        else:
+            regions.append((name, item[3], item[4], item[5]))
+    names = [name for name, _, _ in fields] + [name for name, *_ in regions]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{record_type}: field names are still ambiguous")
+    return {"length": contract["length"], "fields": fields, "regions": regions}
+
+
+def _wrap(items: list[str], indent: str) -> list[str]:
+    lines: list[str] = []
+    line = indent
+    for item in items:
+        if line != indent and len(line) + len(item) + 1 > LINE_WIDTH:
+            lines.append(line.rstrip())
+            line = indent
+        line += item + " "
+    if line != indent:
+        lines.append(line.rstrip())
+    return lines
+
+
+def render_module(manifest: dict[str, Any]) -> str:
+    """Return the source of ``src/parser/official_layouts.py``."""
+
+    source = manifest["source"]
+    lines = [
+        '"""',
+        "JV-Data公式レイアウト（コンパイル済み抽出関数で読むレコード種別）",
+        "",
+        "このファイルは自動生成されました。編集しないでください。",
+        f"Source: {source['artifact']} (JV-Data {source['jvdata_version']})",
+        f"Source SHA-256: {source['sha256']}",
+        "Generated by: scripts/generate_official_layouts.py",
+        '"""',
+        "",
+        "from typing import Dict",
+        "",
+        "from src.parser.layout_compiler import RecordLayout, RegionLayout",
+        "",
+        "OFFICIAL_LAYOUTS: Dict[str, RecordLayout] = {",
+    ]
+    for record_type in GENERATED_RECORD_TYPES:
+        layout = flatten_record(manifest, record_type)
+        lines.append(f'    "{record_type}": RecordLayout(')
+        lines.append(f"        length={layout['length']},")
+        lines.append("        fields=(")
+        lines.extend(
+            _wrap(
+                [f'("{name}", {start}, {width}),' for name, start, width in layout["fields"]],
+                " " * 12,
+            )
+        )
+        lines.append("        ),")
+        if layout["regions"]:
+            lines.append("        regions=(")
+            for name, start, count, entry in layout["regions"]:
+                lines.append(f'            RegionLayout("{name}", {start}, {count}, (')
+                lines.extend(_wrap([f'("{field}", {width}),' for field, width in entry], " " * 16))
+                lines.append("            )),")
+            lines.append("        ),")
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the output is not up to date instead of writing it",
+    )
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    errors = validate_manifest(manifest)
+    if errors:
+        for error in errors:
+            print(f"OFFICIAL LAYOUTS FAIL: {error}")
+        return 1
+    source = render_module(manifest)
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != source:
+            print(f"OFFICIAL LAYOUTS OUT OF DATE: {args.output}")
+            return 1
+        print("OFFICIAL LAYOUTS UP TO DATE")
+        return 0
+    args.output.write_text(source, encoding="utf-8")
+    print(
+        "OFFICIAL LAYOUTS GENERATED: "
+        f"{len(GENERATED_RECORD_TYPES)} records -> {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,6 +32,13 @@ Usage:
     python scripts/raceday_verify.py --phase final      # 最終検証 (払戻込み)
     python scripts/raceday_verify.py --phase quickstart # quickstart.bat検証
     python scripts/raceday_verify.py --phase all        # 全phaseまとめて実行
+    python scripts/raceday_verify.py --db-type postgresql --phase auto
+
+Per-race checks (venues, odds, results, payouts, duplicates, NL_/RT_
+consistency) share one grouped query through src.database.raceday.
+Figures are kept per race in data/raceday_state_YYYYMMDD.json, and later
+runs only re-read tables written since the previous run (--full ignores
+the state).
 
 Exits with code 0 if checks pass, 1 if issues found, 2 if fatal error.
 """
@@ -46,6 +53,13 @@ import time
 from datetime import datetime, date
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.base import BaseDatabase, DatabaseError
+from src.database.raceday import RACE_TABLES, RaceDayVerifier
+from src.database.sqlite_handler import SQLiteDatabase
+
 # Windows CP932 console can't encode em dash and other Unicode chars
 if sys.stdout.encoding and sys.stdout.encoding.lower() in ("cp932", "cp936", "cp950"):
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -83,6 +97,12 @@ def auto_detect_phase() -> str:
 # ---------------------------------------------------------------------------
 
 def q(con, sql, params=()):
+    if isinstance(con, BaseDatabase):
+        try:
+            row = con.fetch_one(sql, params or None)
+        except DatabaseError:
+            return None  # table/column missing
+        return next(iter(row.values())) if row else 0
     try:
         row = con.execute(sql, params).fetchone()
         return row[0] if row else 0
@@ -91,13 +111,24 @@ def q(con, sql, params=()):
 
 
 def q_rows(con, sql, params=()):
+    if isinstance(con, BaseDatabase):
+        try:
+            return [tuple(row.values()) for row in con.fetch_all(sql, params or None)]
+        except DatabaseError:
+            return None
     try:
         return con.execute(sql, params).fetchall()
     except sqlite3.OperationalError:
         return None
 
 
+def is_sqlite(con):
+    return not isinstance(con, BaseDatabase) or con.get_db_type() == "sqlite"
+
+
 def table_exists(con, name):
+    if isinstance(con, BaseDatabase):
+        return con.table_exists(name)
     row = con.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (name,)
     ).fetchone()
@@ -105,10 +136,11 @@ def table_exists(con, name):
 
 
 def index_exists(con, name):
-    row = con.execute(
-        "SELECT name FROM sqlite_master WHERE type='index' AND name=?", (name,)
-    ).fetchone()
-    return row is not None
+    if is_sqlite(con):
+        rows = q_rows(con, "SELECT name FROM sqlite_master WHERE type='index' AND name=?", (name,))
+    else:
+        rows = q_rows(con, "SELECT indexname FROM pg_indexes WHERE indexname = ?", (name.lower(),))
+    return bool(rows)
 
 
 def run_fetch(spec, from_date, to_date, option, db):
@@ -172,19 +204,22 @@ def check_schema(con, issues):
 def check_db_integrity(con, issues):
     """SQLite integrity_check and quick_check."""
     print("\n--- [2] DB Integrity ---")
+    if not is_sqlite(con):
+        print("  [INFO] integrity_check is SQLite only")
+        return
     try:
-        result = con.execute("PRAGMA integrity_check").fetchone()
-        if result and result[0] == "ok":
+        result = q(con, "PRAGMA integrity_check")
+        if result == "ok":
             print("  [OK]  PRAGMA integrity_check: ok")
         else:
-            msg = result[0] if result else "unknown"
+            msg = result or "unknown"
             print(f"  [FAIL] integrity_check: {msg}")
             issues.append(f"DB integrity_check failed: {msg}")
 
         # Check page count / free pages
-        page_count = con.execute("PRAGMA page_count").fetchone()[0]
-        page_size  = con.execute("PRAGMA page_size").fetchone()[0]
-        free_pages = con.execute("PRAGMA freelist_count").fetchone()[0]
+        page_count = q(con, "PRAGMA page_count")
+        page_size  = q(con, "PRAGMA page_size")
+        free_pages = q(con, "PRAGMA freelist_count")
         db_size_mb = (page_count * page_size) / (1024 * 1024)
         print(f"  [OK]  DB size: {db_size_mb:.1f} MB  (free pages: {free_pages})")
     except Exception as e:
@@ -200,7 +235,10 @@ def check_index_health(con, issues):
         "idx_rt_ra_date",
         "idx_rt_se_date",
     ]
-    rows = q_rows(con, "SELECT name FROM sqlite_master WHERE type='index' ORDER BY name")
+    if is_sqlite(con):
+        rows = q_rows(con, "SELECT name FROM sqlite_master WHERE type='index' ORDER BY name")
+    else:
+        rows = q_rows(con, "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()")
     existing = {r[0] for r in rows} if rows else set()
 
     missing = [idx for idx in key_indexes if idx not in existing]
@@ -214,26 +252,41 @@ def check_index_health(con, issues):
     print(f"  [INFO] Total indexes: {total_indexes}")
 
 
-def check_nl_today(con, year, monthday, issues, label="NL_ 蓄積系"):
+def _day_count(con, races, table, year, monthday, figure="rows"):
+    """Today's row count of ``table``, from load_races() figures when given."""
+    if races is not None and table in RACE_TABLES:
+        return None if table in races.missing_tables else races.count(table, figure)
+    return q(con, f"SELECT COUNT(*) FROM {table} WHERE Year=? AND MonthDay=?", (year, monthday))
+
+
+def check_nl_today(con, year, monthday, issues, label="NL_ 蓄積系", races=None):
     """Check NL_ tables for today's race data."""
     print(f"\n--- [4] {label} ---")
     y, m = year, monthday
 
+    def day_count(table):
+        return _day_count(con, races, table, y, m)
+
+    winners = (
+        _day_count(con, races, "NL_SE", y, m, "winners") if races is not None
+        else q(con, "SELECT COUNT(*) FROM NL_SE WHERE Year=? AND MonthDay=? AND KakuteiJyuni=1", (y, m))
+    )
+
     checks = {
-        "NL_RA  (race header) ": q(con, "SELECT COUNT(*) FROM NL_RA WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_SE  (starters)    ": q(con, "SELECT COUNT(*) FROM NL_SE WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_SE  (確定着順)    ": q(con, "SELECT COUNT(*) FROM NL_SE WHERE Year=? AND MonthDay=? AND KakuteiJyuni='01'", (y, m)),
-        "NL_H1  (payouts)     ": q(con, "SELECT COUNT(*) FROM NL_H1 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_H6  (3連単)       ": q(con, "SELECT COUNT(*) FROM NL_H6 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_O1  (単勝odds)    ": q(con, "SELECT COUNT(*) FROM NL_O1 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_O2  (複勝odds)    ": q(con, "SELECT COUNT(*) FROM NL_O2 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_O3  (枠連odds)    ": q(con, "SELECT COUNT(*) FROM NL_O3 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_O4  (馬連odds)    ": q(con, "SELECT COUNT(*) FROM NL_O4 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_O5  (3連複odds)   ": q(con, "SELECT COUNT(*) FROM NL_O5 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_O6  (3連単odds)   ": q(con, "SELECT COUNT(*) FROM NL_O6 WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_WH  (track cond)  ": q(con, "SELECT COUNT(*) FROM NL_WH WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_TK_RACE (special) ": q(con, "SELECT COUNT(*) FROM NL_TK_RACE WHERE Year=? AND MonthDay=?", (y, m)),
-        "NL_TK  (registrants) ": q(con, "SELECT COUNT(*) FROM NL_TK WHERE Year=? AND MonthDay=?", (y, m)),
+        "NL_RA  (race header) ": day_count("NL_RA"),
+        "NL_SE  (starters)    ": day_count("NL_SE"),
+        "NL_SE  (確定着順)    ": winners,
+        "NL_H1  (payouts)     ": day_count("NL_H1"),
+        "NL_H6  (3連単)       ": day_count("NL_H6"),
+        "NL_O1  (単勝odds)    ": day_count("NL_O1"),
+        "NL_O2  (複勝odds)    ": day_count("NL_O2"),
+        "NL_O3  (枠連odds)    ": day_count("NL_O3"),
+        "NL_O4  (馬連odds)    ": day_count("NL_O4"),
+        "NL_O5  (3連複odds)   ": day_count("NL_O5"),
+        "NL_O6  (3連単odds)   ": day_count("NL_O6"),
+        "NL_WH  (track cond)  ": day_count("NL_WH"),
+        "NL_TK_RACE (special) ": day_count("NL_TK_RACE"),
+        "NL_TK  (registrants) ": day_count("NL_TK"),
     }
 
     for name, count in checks.items():
@@ -248,7 +301,10 @@ def check_nl_today(con, year, monthday, issues, label="NL_ 蓄積系"):
         issues.append("NL_RA: no race headers for today")
 
     # Venue/race count breakdown
-    rows = q_rows(con, "SELECT JyoCD, COUNT(*) FROM NL_RA WHERE Year=? AND MonthDay=? GROUP BY JyoCD ORDER BY JyoCD", (y, m))
+    if races is not None:
+        rows = list(races.venues("NL_RA").items())
+    else:
+        rows = q_rows(con, "SELECT JyoCD, COUNT(*) FROM NL_RA WHERE Year=? AND MonthDay=? GROUP BY JyoCD ORDER BY JyoCD", (y, m))
     if rows:
         venue_str = "  ".join(f"場{r[0]}:{r[1]}R" for r in rows)
         print(f"  [INFO] NL_RA 競馬場別: {venue_str}")
@@ -256,25 +312,28 @@ def check_nl_today(con, year, monthday, issues, label="NL_ 蓄積系"):
     return checks
 
 
-def check_rt_today(con, year, monthday, issues, label="RT_ 速報系"):
+def check_rt_today(con, year, monthday, issues, label="RT_ 速報系", races=None):
     """Check RT_ tables for today's realtime data."""
     print(f"\n--- [5] {label} ---")
     y, m = year, monthday
 
+    def day_count(table):
+        return _day_count(con, races, table, y, m)
+
     checks = {
-        "RT_RA  (race 速報)   ": q(con, "SELECT COUNT(*) FROM RT_RA WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_SE  (着順 速報)   ": q(con, "SELECT COUNT(*) FROM RT_SE WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_H1  (払戻 速報)   ": q(con, "SELECT COUNT(*) FROM RT_H1 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_H6  (3連単速報)   ": q(con, "SELECT COUNT(*) FROM RT_H6 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_O1  (単勝 速報)   ": q(con, "SELECT COUNT(*) FROM RT_O1 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_O2  (複勝 速報)   ": q(con, "SELECT COUNT(*) FROM RT_O2 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_O3  (枠連 速報)   ": q(con, "SELECT COUNT(*) FROM RT_O3 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_O4  (馬連 速報)   ": q(con, "SELECT COUNT(*) FROM RT_O4 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_O5  (3連複速報)   ": q(con, "SELECT COUNT(*) FROM RT_O5 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_O6  (3連単速報)   ": q(con, "SELECT COUNT(*) FROM RT_O6 WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_WH  (馬場 速報)   ": q(con, "SELECT COUNT(*) FROM RT_WH WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_CC  (取消 速報)   ": q(con, "SELECT COUNT(*) FROM RT_CC WHERE Year=? AND MonthDay=?", (y, m)),
-        "RT_JC  (重勝 速報)   ": q(con, "SELECT COUNT(*) FROM RT_JC WHERE Year=? AND MonthDay=?", (y, m)),
+        "RT_RA  (race 速報)   ": day_count("RT_RA"),
+        "RT_SE  (着順 速報)   ": day_count("RT_SE"),
+        "RT_H1  (払戻 速報)   ": day_count("RT_H1"),
+        "RT_H6  (3連単速報)   ": day_count("RT_H6"),
+        "RT_O1  (単勝 速報)   ": day_count("RT_O1"),
+        "RT_O2  (複勝 速報)   ": day_count("RT_O2"),
+        "RT_O3  (枠連 速報)   ": day_count("RT_O3"),
+        "RT_O4  (馬連 速報)   ": day_count("RT_O4"),
+        "RT_O5  (3連複速報)   ": day_count("RT_O5"),
+        "RT_O6  (3連単速報)   ": day_count("RT_O6"),
+        "RT_WH  (馬場 速報)   ": day_count("RT_WH"),
+        "RT_CC  (取消 速報)   ": day_count("RT_CC"),
+        "RT_JC  (重勝 速報)   ": day_count("RT_JC"),
     }
 
     for name, count in checks.items():
@@ -336,10 +395,10 @@ def check_rt_data_freshness(con, year, monthday, issues, stale_minutes=15):
 
     # Use DB file mtime as proxy if no timestamp column
     db_path = None
-    try:
-        db_path = Path(con.execute("PRAGMA database_list").fetchone()[2])
-    except Exception:
-        pass
+    if is_sqlite(con):
+        rows = q_rows(con, "PRAGMA database_list")
+        if rows:
+            db_path = Path(rows[0][2])
 
     # Check RT_RA row count progression (compare with report files)
     rt_ra_now = q(con, "SELECT COUNT(*) FROM RT_RA WHERE Year=? AND MonthDay=?", (y, m)) or 0
@@ -394,38 +453,98 @@ def _find_latest_report(race_date):
         return None
 
 
-def check_race_count_by_venue(con, year, monthday, issues):
-    """Verify each venue has a plausible number of races (typically 12R)."""
-    print("\n--- [8] Race Count by Venue ---")
-    y, m = year, monthday
+def load_races(con, race_date, state_path=None):
+    """Collect today's per-race figures with one grouped query.
 
-    rows = q_rows(
-        con,
-        "SELECT JyoCD, COUNT(DISTINCT RaceNum) FROM NL_RA WHERE Year=? AND MonthDay=? GROUP BY JyoCD ORDER BY JyoCD",
-        (y, m)
-    )
-    rt_rows = q_rows(
-        con,
-        "SELECT JyoCD, COUNT(DISTINCT RaceNum) FROM RT_RA WHERE Year=? AND MonthDay=? GROUP BY JyoCD ORDER BY JyoCD",
-        (y, m)
+    Only tables written since the run that saved ``state_path`` are read;
+    see :mod:`src.database.raceday`.
+    """
+    if not isinstance(con, BaseDatabase):
+        return None
+    try:
+        return RaceDayVerifier(con, race_date, state_path=state_path).run()
+    except DatabaseError as e:
+        print(f"  [WARN] per-race figures unavailable: {e}")
+        return None
+
+
+# Sections of check_races(), in print order.
+RACE_SECTIONS = ("venues", "odds", "ts", "results", "payouts", "duplicates", "consistency")
+
+_NL_ODDS = [
+    ("NL_O1", "単勝"), ("NL_O2", "複勝"), ("NL_O3", "枠連"),
+    ("NL_O4", "馬連"), ("NL_O5", "3連複"), ("NL_O6", "3連単"),
+]
+_TS_ODDS = [
+    ("TS_SOKUHO_O1", "単複枠"),
+    ("TS_SOKUHO_O2", "馬連"),
+    ("TS_SOKUHO_O3", "ワイド"),
+    ("TS_SOKUHO_O4", "馬単"),
+    ("TS_SOKUHO_O5", "3連複"),
+    ("TS_SOKUHO_O6", "3連単"),
+]
+
+
+def check_races(races, issues, sections=RACE_SECTIONS):
+    """Per-race checks over the figures from load_races().
+
+    Sections: ``venues`` (race count by venue), ``odds`` (NL_/RT_ odds
+    coverage), ``ts`` (TS_SOKUHO_O* snapshots), ``results`` (confirmed
+    winners), ``payouts`` (H1/H6 completeness), ``duplicates`` (race keys)
+    and ``consistency`` (NL_ vs RT_).
+    """
+    print("\n--- [8] Per-race Checks ---")
+    if races is None:
+        print("  [--]  per-race figures unavailable")
+        return
+    print(
+        f"  [INFO] races today: {len(races.races)}  changed since last run: {len(races.changed)}"
+        f"  (tables read: {len(races.queried_tables)})"
     )
+    for race_id in races.changed:
+        race = races.races[race_id]
+        tables = race["tables"]
+        se = tables.get("NL_SE") or tables.get("RT_SE") or {}
+        missing_odds = [name for tbl, name in _NL_ODDS if tbl not in tables]
+        snapshots = sum(tables.get(tbl, {}).get("snapshots", 0) for tbl, _ in _TS_ODDS)
+        print(
+            f"  [CHG] 場{race['JyoCD']} {race['RaceNum']:2}R  "
+            f"NL_RA={'Y' if 'NL_RA' in tables else '-'} RT_RA={'Y' if 'RT_RA' in tables else '-'}  "
+            f"SE={se.get('rows', 0):2}  winner={'Y' if se.get('winners') else '-'}  "
+            f"H1={'Y' if 'NL_H1' in tables or 'RT_H1' in tables else '-'}  "
+            f"odds missing={','.join(missing_odds) or '-'}  snapshots={snapshots}"
+        )
+    for table in races.missing_tables:
+        print(f"  [--]  {table} TABLE MISSING")
+
+    if "venues" in sections:
+        check_race_count_by_venue(races, issues)
+    if "odds" in sections:
+        check_odds_coverage(races, issues)
+    if "ts" in sections:
+        check_ts_odds(races, issues)
+    if "results" in sections:
+        check_se_results(races, issues)
+    if "payouts" in sections:
+        check_payout_completeness(races, issues)
+    if "duplicates" in sections:
+        check_duplicate_race_ids(races, issues)
+    if "consistency" in sections:
+        check_nl_rt_consistency(races, issues)
+
+
+def check_race_count_by_venue(races, issues):
+    """Verify each venue has a plausible number of races (typically 12R)."""
+    print("\n--- [8a] Race Count by Venue ---")
+    nl_venues = races.venues("NL_RA")
+    rt_venues = races.venues("RT_RA")
 
-    if not rows and not rt_rows:
+    if not nl_venues and not rt_venues:
         print(f"  [!]   No race data for today in NL_RA or RT_RA")
         return
 
-    venue_map = {}
-    if rows:
-        for jyo, cnt in rows:
-            venue_map[jyo] = {"nl": cnt, "rt": 0}
-    if rt_rows:
-        for jyo, cnt in rt_rows:
-            if jyo not in venue_map:
-                venue_map[jyo] = {"nl": 0, "rt": 0}
-            venue_map[jyo]["rt"] = cnt
-
-    for jyo, counts in sorted(venue_map.items()):
-        nl_c, rt_c = counts["nl"], counts["rt"]
+    for jyo in sorted(set(nl_venues) | set(rt_venues)):
+        nl_c, rt_c = nl_venues.get(jyo, 0), rt_venues.get(jyo, 0)
         max_r = max(nl_c, rt_c)
         marker = "[OK] " if max_r >= 8 else "[!]  "  # at least 8R expected
         print(f"  {marker} 場{jyo}:  NL_={nl_c:2}R  RT_={rt_c:2}R")
@@ -433,7 +552,7 @@ def check_race_count_by_venue(con, year, monthday, issues):
             issues.append(f"場{jyo}: only {max_r}R recorded (expected ~12R)")
 
 
-def check_odds_coverage(con, year, monthday, issues):
+def check_odds_coverage(races, issues):
     """Check that all 6 odds types have data for active races.
 
     Note: real-time odds (0B30-0B36) go to TS_SOKUHO_O* tables
@@ -441,30 +560,22 @@ def check_odds_coverage(con, year, monthday, issues):
     during live monitoring. Use check_ts_odds() to verify capture.
     """
     print("\n--- [9] Odds Coverage (NL_ final + RT_ speed-report) ---")
-    y, m = year, monthday
-
-    nl_tables = [
-        ("NL_O1", "単勝"), ("NL_O2", "複勝"), ("NL_O3", "枠連"),
-        ("NL_O4", "馬連"), ("NL_O5", "3連複"), ("NL_O6", "3連単"),
-    ]
-    for tbl, name in nl_tables:
-        cnt = q(con, f"SELECT COUNT(*) FROM {tbl} WHERE Year=? AND MonthDay=?", (y, m))
-        if cnt is None:
+    race_count = races.races_with("NL_RA")
+    for tbl, name in _NL_ODDS:
+        cnt = races.count(tbl)
+        if tbl in races.missing_tables:
             print(f"  [--]  {tbl:8} ({name:5}) TABLE MISSING")
         elif cnt == 0:
             print(f"  [!]   {tbl:8} ({name:5})       0")
         else:
-            print(f"  [OK]  {tbl:8} ({name:5})  {cnt:>6}")
+            print(f"  [OK]  {tbl:8} ({name:5})  {cnt:>6}  races={races.races_with(tbl)}/{race_count}")
 
     # RT_O* are intentionally empty — realtime odds route to TS_SOKUHO_O*.
-    rt_o_total = sum(
-        q(con, f"SELECT COUNT(*) FROM RT_O{i} WHERE Year=? AND MonthDay=?", (y, m)) or 0
-        for i in range(1, 7)
-    )
+    rt_o_total = sum(races.count(f"RT_O{i}") for i in range(1, 7))
     print(f"  [INFO] RT_O1-O6 total: {rt_o_total} (expected 0 -- odds go to TS_SOKUHO_O* timeseries)")
 
 
-def check_ts_odds(con, year, monthday, issues):
+def check_ts_odds(races, issues):
     """Check TS_SOKUHO_O* odds tables — HassoTime-keyed snapshots for ML.
 
     Real-time odds (0B30-0B36) are stored here with HassoTime as part of the
@@ -472,34 +583,21 @@ def check_ts_odds(con, year, monthday, issues):
     This is the primary source for ML odds-movement features.
     """
     print("\n--- [9b] TS_SOKUHO_O* Timeseries Odds (ML用スナップショット) ---")
-    y, m = year, monthday
-
-    ts_tables = [
-        ("TS_SOKUHO_O1", "単複枠"),
-        ("TS_SOKUHO_O2", "馬連"),
-        ("TS_SOKUHO_O3", "ワイド"),
-        ("TS_SOKUHO_O4", "馬単"),
-        ("TS_SOKUHO_O5", "3連複"),
-        ("TS_SOKUHO_O6", "3連単"),
-    ]
-
     any_data = False
     latest_hasso = None
-    for tbl, name in ts_tables:
-        cnt = q(con, f"SELECT COUNT(*) FROM {tbl} WHERE Year=? AND MonthDay=?", (y, m))
-        if cnt is None:
+    for tbl, name in _TS_ODDS:
+        if tbl in races.missing_tables:
             print(f"  [--]  {tbl} ({name}) TABLE MISSING")
             issues.append(f"TS_SOKUHO_O* table missing: {tbl}")
             continue
-        snaps = q(con,
-            f"SELECT COUNT(DISTINCT HassoTime) FROM {tbl} WHERE Year=? AND MonthDay=?",
-            (y, m)) or 0
+        cnt = races.count(tbl)
+        snaps = races.count(tbl, "snapshots")
         marker = "[OK] " if cnt > 0 else "[!]  "
         print(f"  {marker} {tbl} ({name:5})  rows={cnt:>6}  snapshots={snaps}")
         if cnt > 0:
             any_data = True
-            h = q(con, f"SELECT MAX(HassoTime) FROM {tbl} WHERE Year=? AND MonthDay=?", (y, m))
-            if h and (latest_hasso is None or str(h) > str(latest_hasso)):
+            h = races.latest(tbl)
+            if h and (latest_hasso is None or h > latest_hasso):
                 latest_hasso = h
 
     if latest_hasso:
@@ -514,14 +612,18 @@ def check_ts_odds(con, year, monthday, issues):
             print("  [INFO] TS_SOKUHO_O* empty (pre-race -- normal before 10:05)")
 
 
-def check_se_results(con, year, monthday, issues):
-    """Check race result completion — confirmed finishers (KakuteiJyuni='01' = winner)."""
+def check_se_results(races, issues):
+    """Check race result completion — races with a confirmed winner (KakuteiJyuni=1)."""
     print("\n--- [10] Race Result Completion ---")
-    y, m = year, monthday
-
-    nl_ra_count = q(con, "SELECT COUNT(DISTINCT RaceNum||JyoCD) FROM NL_RA WHERE Year=? AND MonthDay=?", (y, m)) or 0
-    nl_winner   = q(con, "SELECT COUNT(*) FROM NL_SE WHERE Year=? AND MonthDay=? AND KakuteiJyuni='01'", (y, m)) or 0
-    rt_winner   = q(con, "SELECT COUNT(*) FROM RT_SE WHERE Year=? AND MonthDay=? AND KakuteiJyuni='01'", (y, m)) or 0
+    nl_ra_count = races.races_with("NL_RA")
+    nl_winner = sum(
+        1 for race in races.races.values()
+        if race["tables"].get("NL_SE", {}).get("winners")
+    )
+    rt_winner = sum(
+        1 for race in races.races.values()
+        if race["tables"].get("RT_SE", {}).get("winners")
+    )
 
     print(f"  [INFO] NL_RA distinct races today: {nl_ra_count}")
     print(f"  [INFO] NL_SE confirmed winners:    {nl_winner}")
@@ -539,16 +641,14 @@ def check_se_results(con, year, monthday, issues):
             issues.append(f"Race results only {completion:.0f}% complete after 17:00 -- fetch RACE")
 
 
-def check_payout_completeness(con, year, monthday, issues):
-    """Verify H1 (payout) record count matches RA race count."""
+def check_payout_completeness(races, issues):
+    """Verify every race has H1 (payout) records."""
     print("\n--- [11] Payout Completeness ---")
-    y, m = year, monthday
-
-    ra_count = q(con, "SELECT COUNT(DISTINCT RaceNum||JyoCD) FROM NL_RA WHERE Year=? AND MonthDay=?", (y, m)) or 0
-    nl_h1    = q(con, "SELECT COUNT(*) FROM NL_H1 WHERE Year=? AND MonthDay=?", (y, m)) or 0
-    nl_h6    = q(con, "SELECT COUNT(*) FROM NL_H6 WHERE Year=? AND MonthDay=?", (y, m)) or 0
-    rt_h1    = q(con, "SELECT COUNT(*) FROM RT_H1 WHERE Year=? AND MonthDay=?", (y, m)) or 0
-    rt_h6    = q(con, "SELECT COUNT(*) FROM RT_H6 WHERE Year=? AND MonthDay=?", (y, m)) or 0
+    ra_count = races.races_with("NL_RA")
+    nl_h1 = races.races_with("NL_H1")
+    nl_h6 = races.races_with("NL_H6")
+    rt_h1 = races.races_with("RT_H1")
+    rt_h6 = races.races_with("RT_H6")
 
     print(f"  [INFO] NL_RA races: {ra_count}   NL_H1: {nl_h1}   NL_H6: {nl_h6}")
     print(f"  [INFO] RT_H1: {rt_h1}   RT_H6: {rt_h6}")
@@ -566,22 +666,15 @@ def check_payout_completeness(con, year, monthday, issues):
             print(f"  [OK]  Payout data looks complete")
 
 
-def check_duplicate_race_ids(con, year, monthday, issues):
-    """Check for duplicate primary keys in NL_RA and RT_RA."""
+def check_duplicate_race_ids(races, issues):
+    """Check for races stored under more than one key in NL_RA and RT_RA."""
     print("\n--- [12] Duplicate Race ID Check ---")
-    y, m = year, monthday
-
     for tbl in ["NL_RA", "RT_RA"]:
-        if not table_exists(con, tbl):
+        if tbl in races.missing_tables:
             print(f"  [--]  {tbl} TABLE MISSING")
             continue
-        # Detect duplicate (Year, MonthDay, JyoCD, RaceNum)
-        dupes = q(
-            con,
-            f"SELECT COUNT(*) FROM (SELECT Year,MonthDay,JyoCD,RaceNum FROM {tbl} "
-            f"WHERE Year=? AND MonthDay=? GROUP BY Year,MonthDay,JyoCD,RaceNum HAVING COUNT(*)>1)",
-            (y, m)
-        ) or 0
+        # Same venue and race number under a different Kaiji/Nichiji
+        dupes = races.duplicate_race_keys(tbl)
         if dupes > 0:
             print(f"  [!]   {tbl}: {dupes} duplicate race keys found")
             issues.append(f"{tbl} has {dupes} duplicate race keys for today")
@@ -589,26 +682,24 @@ def check_duplicate_race_ids(con, year, monthday, issues):
             print(f"  [OK]  {tbl}: no duplicate race IDs")
 
 
-def check_nl_rt_consistency(con, year, monthday, issues):
+def check_nl_rt_consistency(races, issues):
     """Compare NL_ vs RT_ counts to detect sync issues."""
     print("\n--- [13] NL_ vs RT_ Consistency ---")
-    y, m = year, monthday
-
     pairs = [
         ("NL_RA", "RT_RA", "race headers"),
         ("NL_SE", "RT_SE", "race entries"),
         ("NL_H1", "RT_H1", "payouts"),
     ]
     for nl_tbl, rt_tbl, label in pairs:
-        nl_c = q(con, f"SELECT COUNT(*) FROM {nl_tbl} WHERE Year=? AND MonthDay=?", (y, m)) or 0
-        rt_c = q(con, f"SELECT COUNT(*) FROM {rt_tbl} WHERE Year=? AND MonthDay=?", (y, m)) or 0
+        nl_c = races.count(nl_tbl)
+        rt_c = races.count(rt_tbl)
         total = nl_c + rt_c
         marker = "[OK] " if total > 0 else "[!]  "
         print(f"  {marker} {label:15}  NL_={nl_c:5}  RT_={rt_c:5}")
 
     # Warn if RT_ has data but NL_ is significantly behind
-    nl_ra = q(con, "SELECT COUNT(*) FROM NL_RA WHERE Year=? AND MonthDay=?", (y, m)) or 0
-    rt_ra = q(con, "SELECT COUNT(*) FROM RT_RA WHERE Year=? AND MonthDay=?", (y, m)) or 0
+    nl_ra = races.count("NL_RA")
+    rt_ra = races.count("RT_RA")
     if nl_ra > 0 and rt_ra == 0:
         issues.append("RT_RA=0 but NL_RA has data -- realtime monitoring may not be running")
     if nl_ra == 0 and rt_ra == 0:
@@ -875,8 +966,13 @@ def test_quickstart(db, issues):
         print(f"  [!]   DB not found: {db}")
 
 
-def _collect_ts_counts(con, year, monthday):
+def _collect_ts_counts(con, year, monthday, races=None):
     """Return TS_SOKUHO_O* row/snapshot counts for the report JSON."""
+    if races is not None:
+        return {
+            f"{tbl} ({name})": {"rows": races.count(tbl), "snapshots": races.count(tbl, "snapshots")}
+            for tbl, name in _TS_ODDS
+        }
     if con is None:
         return {}
     y, m = year, monthday
@@ -889,7 +985,7 @@ def _collect_ts_counts(con, year, monthday):
     return out
 
 
-def write_report(phase, race_date, nl_checks, rt_checks, issues, report_path, con=None):
+def write_report(phase, race_date, nl_checks, rt_checks, issues, report_path, con=None, races=None):
     """Write JSON report for this checkpoint."""
     year, monthday = race_date[:4], race_date[4:6] + race_date[6:8]
     report = {
@@ -900,8 +996,10 @@ def write_report(phase, race_date, nl_checks, rt_checks, issues, report_path, co
         "issues": issues,
         "nl": {k.strip(): v for k, v in (nl_checks or {}).items()},
         "rt": {k.strip(): v for k, v in (rt_checks or {}).items()},
-        "ts": _collect_ts_counts(con, year, monthday),
+        "ts": _collect_ts_counts(con, year, monthday, races),
     }
+    if races is not None:
+        report["races"] = races.races
     Path(report_path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"\n  Report: {report_path}")
 
@@ -910,13 +1008,18 @@ def write_report(phase, race_date, nl_checks, rt_checks, issues, report_path, co
 # Phase runners
 # ---------------------------------------------------------------------------
 
+def _load_today(con, args, year, monthday):
+    return load_races(con, f"{year}{monthday}", getattr(args, "state_file", None))
+
+
 def run_phase_pre(con, args, year, monthday, issues, nl_checks, rt_checks):
+    races = _load_today(con, args, year, monthday)
     check_schema(con, issues)
     check_db_integrity(con, issues)
     check_index_health(con, issues)
     check_master_data(con, issues)
-    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (pre-race)") or {})
-    check_duplicate_race_ids(con, year, monthday, issues)
+    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (pre-race)", races=races) or {})
+    check_races(races, issues, sections=("duplicates",))
 
     if nl_checks.get("NL_RA  (race header) ") == 0 and args.fetch:
         print(f"\n[AUTO-FETCH] Fetching today's RACE entries (option=2)...")
@@ -929,16 +1032,13 @@ def run_phase_pre(con, args, year, monthday, issues, nl_checks, rt_checks):
 
 
 def run_phase_rt_check(con, args, year, monthday, issues, nl_checks, rt_checks):
-    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (during races)") or {})
-    nl_checks.update(check_nl_today(con, year, monthday, [], "NL_ 蓄積系") or {})
+    races = _load_today(con, args, year, monthday)
+    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (during races)", races=races) or {})
+    nl_checks.update(check_nl_today(con, year, monthday, [], "NL_ 蓄積系", races=races) or {})
     check_master_data(con, issues)
     check_rt_process_running(issues, race_date_str=args.date)
     check_rt_data_freshness(con, year, monthday, issues)
-    check_odds_coverage(con, year, monthday, issues)
-    check_ts_odds(con, year, monthday, issues)
-    check_race_count_by_venue(con, year, monthday, issues)
-    check_nl_rt_consistency(con, year, monthday, issues)
-    check_duplicate_race_ids(con, year, monthday, issues)
+    check_races(races, issues, sections=("venues", "odds", "ts", "duplicates", "consistency"))
 
     if rt_checks.get("RT_RA  (race 速報)   ") == 0:
         print("\n  [WARNING] RT_RA=0: realtime monitoring may not be running.")
@@ -947,17 +1047,14 @@ def run_phase_rt_check(con, args, year, monthday, issues, nl_checks, rt_checks):
 
 
 def run_phase_nl_mid(con, args, year, monthday, issues, nl_checks, rt_checks):
+    races = _load_today(con, args, year, monthday)
     check_schema(con, issues)
-    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (mid-race)") or {})
-    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (mid-race)") or {})
+    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (mid-race)", races=races) or {})
+    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (mid-race)", races=races) or {})
     check_master_data(con, issues)
     check_rt_process_running(issues, race_date_str=args.date)
     check_rt_data_freshness(con, year, monthday, issues)
-    check_odds_coverage(con, year, monthday, issues)
-    check_ts_odds(con, year, monthday, issues)
-    check_race_count_by_venue(con, year, monthday, issues)
-    check_se_results(con, year, monthday, issues)
-    check_nl_rt_consistency(con, year, monthday, issues)
+    check_races(races, issues, sections=("venues", "odds", "ts", "results", "consistency"))
 
     if nl_checks.get("NL_RA  (race header) ") == 0 and args.fetch:
         print(f"\n[AUTO-FETCH] Fetching RACE data (option=1)...")
@@ -967,16 +1064,13 @@ def run_phase_nl_mid(con, args, year, monthday, issues, nl_checks, rt_checks):
 
 
 def run_phase_post(con, args, year, monthday, issues, nl_checks, rt_checks):
+    races = _load_today(con, args, year, monthday)
     check_schema(con, issues)
-    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (post-race)") or {})
-    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (post-race)") or {})
+    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (post-race)", races=races) or {})
+    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (post-race)", races=races) or {})
     check_rt_data_freshness(con, year, monthday, issues, stale_minutes=60)
-    check_race_count_by_venue(con, year, monthday, issues)
-    check_se_results(con, year, monthday, issues)
-    check_payout_completeness(con, year, monthday, issues)
-    check_nl_rt_consistency(con, year, monthday, issues)
+    check_races(races, issues, sections=("venues", "results", "payouts", "duplicates", "consistency"))
     check_master_data(con, issues)
-    check_duplicate_race_ids(con, year, monthday, issues)
 
     race_date = args.date or date.today().strftime("%Y%m%d")
     if args.fetch:
@@ -989,18 +1083,13 @@ def run_phase_post(con, args, year, monthday, issues, nl_checks, rt_checks):
 
 
 def run_phase_final(con, args, year, monthday, issues, nl_checks, rt_checks):
+    races = _load_today(con, args, year, monthday)
     check_schema(con, issues)
     check_db_integrity(con, issues)
-    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (final)") or {})
-    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (final)") or {})
-    check_odds_coverage(con, year, monthday, issues)
-    check_ts_odds(con, year, monthday, issues)
-    check_race_count_by_venue(con, year, monthday, issues)
-    check_se_results(con, year, monthday, issues)
-    check_payout_completeness(con, year, monthday, issues)
-    check_nl_rt_consistency(con, year, monthday, issues)
+    nl_checks.update(check_nl_today(con, year, monthday, issues, "NL_ 蓄積系 (final)", races=races) or {})
+    rt_checks.update(check_rt_today(con, year, monthday, issues, "RT_ 速報系 (final)", races=races) or {})
+    check_races(races, issues)
     check_master_data(con, issues)
-    check_duplicate_race_ids(con, year, monthday, issues)
     check_cache_status(issues)
 
     # Hard requirements for final phase
@@ -1033,6 +1122,15 @@ def run_phase_quickstart(con, args, year, monthday, issues, nl_checks, rt_checks
 def main():
     parser = argparse.ArgumentParser(description="Race day comprehensive verification")
     parser.add_argument("--db", default=DB_PATH_DEFAULT)
+    parser.add_argument(
+        "--db-type", default="sqlite", choices=["sqlite", "postgresql"],
+        help="sqlite reads --db; postgresql reads databases.postgresql from --config"
+    )
+    parser.add_argument("--config", default=None, help="Config file (default: config/config.yaml)")
+    parser.add_argument(
+        "--full", action="store_true",
+        help="Re-read every race table instead of only tables written since the last run"
+    )
     parser.add_argument("--date", default=None, help="YYYYMMDD (default: today)")
     parser.add_argument("--fetch", action="store_true", help="Auto-fetch missing NL_ data")
     parser.add_argument(
@@ -1064,17 +1162,41 @@ def main():
     print(f"\n{'='*65}")
     print(f"  Race Day Verification  [{now_str}]")
     print(f"  Phase: {args.phase:12s}  Date: {race_date}")
-    print(f"  DB:    {Path(args.db).resolve()}")
+    print(f"  DB:    {Path(args.db).resolve() if args.db_type == 'sqlite' else 'postgresql'}")
     print(f"{'='*65}\n")
 
+    state_path = Path("data") / f"raceday_state_{race_date}.json"
+    if args.db_type == "postgresql":
+        # Keep the PostgreSQL figures apart from those of the SQLite file.
+        state_path = state_path.with_name(f"raceday_state_{race_date}_postgresql.json")
+    if args.full:
+        state_path.unlink(missing_ok=True)
+    args.state_file = str(state_path)
+
     # DB connection
-    if not Path(args.db).exists():
+    con = None
+    if args.db_type == "postgresql":
+        from src.database.postgresql_handler import PostgreSQLDatabase
+        from src.utils.config import load_config
+
+        config = load_config(args.config or str(Path(__file__).resolve().parent.parent / "config" / "config.yaml"))
+        con = PostgreSQLDatabase(config.get("databases.postgresql") or {})
+    elif not Path(args.db).exists():
         if args.phase not in ("quickstart", "all"):
             print(f"[ERROR] DB not found: {Path(args.db).resolve()}")
             print("  Run: python -m src.cli.main create-tables")
             sys.exit(2)
         print(f"[INFO] DB not found (OK for quickstart phase)")
-    con = sqlite3.connect(args.db) if Path(args.db).exists() else None
+    else:
+        # Read-only: verifying during a race day must not contend with the
+        # realtime writer for the database lock.
+        con = SQLiteDatabase({"path": args.db, "read_only": True})
+    if con is not None:
+        try:
+            con.connect()
+        except DatabaseError as e:
+            print(f"[ERROR] DB connection failed: {e}")
+            sys.exit(2)
 
     all_issues   = []
     nl_checks    = {}
@@ -1103,10 +1225,13 @@ def main():
         report_dir = Path("data")
         report_dir.mkdir(exist_ok=True)
         report_path = report_dir / f"raceday_report_{race_date}_{args.phase}.json"
-        write_report(args.phase, race_date, nl_checks, rt_checks, all_issues, str(report_path), con=con)
+        write_report(
+            args.phase, race_date, nl_checks, rt_checks, all_issues, str(report_path),
+            con=con, races=load_races(con, race_date, args.state_file),
+        )
     finally:
         if con:
-            con.close()
+            con.disconnect()
 
     # Summary
     print(f"\n{'='*65}")
@@ -108,6 +108,11 @@ class CacheManager:
             d += timedelta(days=1)
         return True
 
+    def has_nl_records(self, spec: str, date_str: str) -> bool:
+        """Return True if the NL cache file for this spec+date holds records."""
+        path = self._nl_path(spec, date_str)
+        return path.exists() and path.stat().st_size > 0
+
     def _nl_entry_is_complete(self, entry: object) -> bool:
         return (
             isinstance(entry, dict)
@@ -2,26 +2,44 @@
 
 import os
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 import click
-from rich.console import Console
 
 from src import __version__
 from src.utils.config import ConfigError, get_default_config, load_config
 from src.utils.logger import get_logger, setup_logging_from_config
-from src.utils.updater import (
-    auto_update_check_notice,
-    check_for_updates,
-    get_current_commit,
-    get_current_version,
-    perform_update,
-)
+
+
+class _LazyConsole:
+    """rich Console created on first use.
+
+    Importing rich costs more than ``jltsql --help`` itself, so the console
+    is only built once a command actually prints through it.
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._console = None
+
+    def resolve(self):
+        """Return the underlying Console, e.g. for ``Progress(console=...)``."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return self._console
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
 
 
 # Console for rich output (Windows cp932-safe)
-console = Console(legacy_windows=True)
-err_console = Console(stderr=True, legacy_windows=True)
+console = _LazyConsole(legacy_windows=True)
+err_console = _LazyConsole(stderr=True, legacy_windows=True)
 logger = get_logger(__name__)
 
 
@@ -95,6 +113,88 @@ def _print_fetch_guardrail_notes(jv_option: int) -> None:
     err_console.print(f"[yellow]Note:[/yellow] {FETCH_NOTE_DATE_FIELDS}")
 
 
+def _profile_options(command):
+    """Attach the shared ``--profile`` options to an import command."""
+    command = click.option(
+        "--profile-sample-ms",
+        type=click.FloatRange(min=0),
+        default=0,
+        show_default=True,
+        help="With --profile, also sample Python stacks every N ms (0 = stage timers only)",
+    )(command)
+    command = click.option(
+        "--profile-output",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Profile file prefix; writes <prefix>.json and <prefix>.folded "
+             "(default: data/profile/<command>-<timestamp>)",
+    )(command)
+    return click.option(
+        "--profile",
+        is_flag=True,
+        default=False,
+        help="Time fetch/parse/validate/convert/flush stages and write a profile report",
+    )(command)
+
+
+def _new_profiler(profile: bool, sample_ms: float):
+    """Return a StageProfiler for ``--profile``, or None."""
+    if not profile:
+        return None
+    from src.utils.profiler import StageProfiler
+
+    return StageProfiler(sample_interval=sample_ms / 1000 if sample_ms else None)
+
+
+def _export_metrics_on_close(ctx) -> None:
+    """Write this process's metrics to ``JLTSQL_METRICS_EXPORT`` when ``ctx`` closes.
+
+    The background updater runs historical updates as ``jltsql fetch``
+    subprocesses and merges the file into its own ``/metrics``.
+    """
+    from src.utils.metrics import METRICS_EXPORT_ENV, REGISTRY
+
+    path = os.environ.get(METRICS_EXPORT_ENV)
+    if not path:
+        return
+
+    def export():
+        try:
+            REGISTRY.write_state(path)
+        except OSError as exc:
+            logger.warning("Failed to export metrics", path=path, error=str(exc))
+
+    ctx.call_on_close(export)
+
+
+def _report_profile(profiler, command_name: str, output) -> None:
+    """Write the profile files and print the per-stage breakdown."""
+    if profiler is None:
+        return
+    from datetime import datetime
+
+    from src.utils.profiler import DEFAULT_PROFILE_DIR
+
+    prefix = output or DEFAULT_PROFILE_DIR / f"{command_name}-{datetime.now():%Y%m%d-%H%M%S}"
+    json_path, folded_path = profiler.write(prefix)
+    report = profiler.report()
+
+    console.print()
+    console.print(f"[bold]Profile ({report['wall_seconds']:.2f}s wall):[/bold]")
+    for row in report["stages"]:
+        count = f"{row['count']:>10,}" if row["count"] is not None else " " * 10
+        percent = f"{row['percent']:5.1f}%" if row["percent"] is not None else "     -"
+        console.print(f"  {row['stage']:9s} {row['seconds']:10.3f}s {percent} {count}")
+    console.print("[bold]Slowest record types / tables:[/bold]")
+    for row in report["by_key"][:10]:
+        console.print(
+            f"  {row['stage']:9s} {row['key']:20s} {row['seconds']:10.3f}s "
+            f"{row['count']:>10,}  {row['mean_us'] or 0:8.1f}us/op"
+        )
+    console.print(f"  Report:      {json_path}")
+    console.print(f"  Flamegraph:  {folded_path}")
+
+
 @click.group()
 @click.option(
     "--config",
@@ -163,6 +263,10 @@ def cli(ctx, config, verbose):
             cfg = load_config(str(config_path))
             ctx.obj["config"] = cfg
 
+            from src.jvlink.replay import configure_jvlink
+
+            configure_jvlink(cfg.get("jvlink", {}))
+
             # Setup logging from config. Invalid leaf types are rejected by
             # load_config; filesystem failures are still rendered as a
             # controlled configuration error rather than a traceback.
@@ -179,7 +283,7 @@ def cli(ctx, config, verbose):
 
                 setup_logging(level="DEBUG")
 
-            logger.info("Configuration loaded", config_path=str(config_path))
+            logger.debug("Configuration loaded", config_path=str(config_path))
 
             # Auto-update check (if enabled in config)
             auto_check = cfg.get("auto_update_check", True)
@@ -189,6 +293,8 @@ def cli(ctx, config, verbose):
                 "update",
                 "version",
             ):
+                from src.utils.updater import auto_update_check_notice
+
                 notice = auto_update_check_notice()
                 if notice:
                     console.print(f"[dim yellow]{notice}[/dim yellow]")
@@ -276,24 +382,72 @@ def init(ctx, force):
 
 
 @cli.command()
-def status():
+@click.option("--json", "as_json", is_flag=True, help="Print status and the latest metrics snapshot as JSON")
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Metrics snapshot written by the background updater (default: data/metrics.json)",
+)
+def status(as_json, metrics_file):
     """Show JLTSQL status.
 
+    \b
+    Pipeline metrics (JVRead latency, parse time, rows per table, flush and
+    commit time, realtime cycle and lag) come from the snapshot the
+    background updater writes after each update cycle.
+
     \b
     Examples:
       jltsql status
+      jltsql status --json
     """
+    import json
+
+    from src.jvlink import is_jvlink_available
+    from src.utils.metrics import DEFAULT_SNAPSHOT_PATH, load_snapshot
+
+    jvlink_available = is_jvlink_available()
+    snapshot = load_snapshot(metrics_file or DEFAULT_SNAPSHOT_PATH)
+
+    if as_json:
+        click.echo(
+            json.dumps(
+                {
+                    "version": __version__,
+                    "jvlink_available": jvlink_available,
+                    "metrics": snapshot,
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+        return
+
     console.print("[bold cyan]JLTSQL Status[/bold cyan]")
     console.print(f"Version: {__version__}")
     console.print()
     console.print("[bold]JRA-VAN DataLab:[/bold]")
-    from src.jvlink import is_jvlink_available
 
-    if is_jvlink_available():
+    if jvlink_available:
         console.print("  JV-Link transport: [green]利用可能[/green]")
     else:
         console.print("  JV-Link transport: [red]利用不可[/red]")
     console.print("  利用登録状態: 未確認 (JVInit/JVOpen で判定)")
+    if snapshot:
+        console.print()
+        console.print("[bold]Metrics:[/bold]")
+        for name, metric in snapshot.get("metrics", {}).items():
+            for sample in metric["samples"]:
+                labels = ",".join(f"{k}={v}" for k, v in sample["labels"].items())
+                label_str = f"{{{labels}}}" if labels else ""
+                if metric["type"] == "histogram":
+                    console.print(
+                        f"  {name}{label_str}: count={sample['count']} "
+                        f"mean={sample['mean']} p95<={sample['p95']}"
+                    )
+                else:
+                    console.print(f"  {name}{label_str}: {sample['value']:g}")
     console.print("Status: [green]Ready[/green]")
 
 
@@ -301,6 +455,8 @@ def status():
 @click.option("--check", is_flag=True, help="最新版の確認")
 def version(check):
     """Show version information and check for updates."""
+    from src.utils.updater import check_for_updates, get_current_commit, get_current_version
+
     current = get_current_version()
     commit = get_current_commit()
     commit_str = f" ({commit})" if commit else ""
@@ -352,6 +508,8 @@ def update(ctx, force):
       jltsql update          # Update to latest version
       jltsql update --force  # Force reinstall dependencies
     """
+    from src.utils.updater import check_for_updates, get_current_version, perform_update
+
     current = get_current_version()
     console.print(f"[bold cyan]JLTSQL Update[/bold cyan]")
     console.print(f"Current version: {current}")
@@ -425,9 +583,18 @@ def update(ctx, force):
 @click.option("--db", type=click.Choice(["sqlite", "postgresql"]), default=None, help="Database type (default: from config)")
 @click.option("--batch-size", default=1000, help="Batch size for imports (default: 1000)")
 @click.option("--progress/--no-progress", default=True, help="Show progress display (default: enabled)")
+@click.option(
+    "--progress-format",
+    type=click.Choice(["rich", "jsonl", "none"]),
+    default=None,
+    help="Progress display: rich, jsonl (JSON events on stderr or JLTSQL_PROGRESS_FILE) or none "
+    "(default: JLTSQL_PROGRESS, then rich)",
+)
 @click.option("--use-cache/--no-cache", default=True, show_default=True, help="Use local cache if available")
+@_profile_options
 @click.pass_context
-def fetch(ctx, date_from, date_to, data_spec, jv_option, db, batch_size, progress, use_cache):
+def fetch(ctx, date_from, date_to, data_spec, jv_option, db, batch_size, progress, progress_format,
+          use_cache, profile, profile_output, profile_sample_ms):
     """Fetch historical data from JRA-VAN DataLab.
 
     JVOpen option meanings:
@@ -440,12 +607,14 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, batch_size, progres
     Examples:
       jltsql fetch --from 20240101 --to 20241231 --spec RACE
       jltsql fetch --from 20240101 --to 20241231 --spec DIFN --option 3
+      jltsql fetch --from 20240101 --to 20240131 --spec RACE --profile
     """
     from src.database import create_database_from_config, DatabaseError
     from src.database.schema import create_all_tables
     from src.fetcher.historical import validate_date_range
     from src.importer.batch import BatchProcessor
 
+    _export_metrics_on_close(ctx)
     config = ctx.obj.get("config")
     if not config and not db:
         console.print("[red]Error:[/red] No configuration found. Run 'jltsql init' first or use --db option.")
@@ -518,16 +687,19 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, batch_size, progres
                 batch_size=batch_size,
                 show_progress=progress,
                 cache_manager=cache_mgr,
+                progress_mode=progress_format,
             )
 
             if not progress:
                 console.print("[bold]Processing data...[/bold]")
 
+            profiler = _new_profiler(profile, profile_sample_ms)
             result = processor.process_date_range(
                 data_spec=data_spec,
                 from_date=date_from,
                 to_date=date_to,
-                option=jv_option
+                option=jv_option,
+                profiler=profiler,
             )
 
             # Show results
@@ -540,6 +712,7 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, batch_size, progres
             console.print(f"  Imported: {result['records_imported']}")
             console.print(f"  Failed:   {result['records_failed']}")
             console.print(f"  Batches:  {result.get('batches_processed', 0)}")
+            _report_profile(profiler, "fetch", profile_output)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
@@ -567,6 +740,7 @@ def cache(ctx):
     Examples:
       jltsql cache info
       jltsql cache build --spec RACE --from 20260101 --to 20260328
+      jltsql cache import --spec RACE --from 20260101 --to 20260328 --workers 4
       jltsql cache clear --spec RACE
     """
     pass
@@ -621,8 +795,10 @@ def cache_info(ctx, cache_dir):
               help="Also import records into DB (default: cache only)")
 @click.option("--db", type=click.Choice(["sqlite", "postgresql"]), default=None)
 @click.option("--cache-dir", default="data/cache", show_default=True)
+@_profile_options
 @click.pass_context
-def cache_build(ctx, data_spec, date_from, date_to, jv_option, also_import, db, cache_dir):
+def cache_build(ctx, data_spec, date_from, date_to, jv_option, also_import, db, cache_dir,
+                profile, profile_output, profile_sample_ms):
     """Fetch from JV-Link and save to local cache.
 
     By default only saves to cache (no DB write). Use --also-import to
@@ -631,6 +807,7 @@ def cache_build(ctx, data_spec, date_from, date_to, jv_option, also_import, db,
     Examples:
       jltsql cache build --spec RACE --from 20260101 --to 20260328
       jltsql cache build --spec DIFN --from 20260101 --to 20260328 --also-import
+      jltsql cache build --spec RACE --from 20260101 --to 20260328 --profile
     """
     from src.cache import CacheManager
     from src.fetcher.historical import HistoricalFetcher, validate_date_range
@@ -664,6 +841,7 @@ def cache_build(ctx, data_spec, date_from, date_to, jv_option, also_import, db,
 
     fetcher = HistoricalFetcher(sid="UNKNOWN", show_progress=True)
     fetcher.cache_manager = mgr
+    profiler = _new_profiler(profile, profile_sample_ms)
 
     if also_import:
         # Use BatchProcessor with cache
@@ -687,13 +865,16 @@ def cache_build(ctx, data_spec, date_from, date_to, jv_option, also_import, db,
                 show_progress=True,
                 cache_manager=mgr,
             )
-            stats = processor.process_date_range(data_spec, date_from, date_to, jv_option)
+            stats = processor.process_date_range(
+                data_spec, date_from, date_to, jv_option, profiler=profiler
+            )
             click.echo(f"\nImported: {stats.get('records_imported', 0):,} records")
     else:
         # Cache-only: fetch but don't import to DB
         count = 0
-        for record in fetcher.fetch(data_spec, date_from, date_to, jv_option):
-            count += 1
+        with profiler.activate() if profiler is not None else nullcontext():
+            for record in fetcher.fetch(data_spec, date_from, date_to, jv_option):
+                count += 1
         fetcher.cache_manager = None
         click.echo(f"\nCached: {count:,} records for {data_spec} {date_from}..{date_to}")
 
@@ -702,6 +883,7 @@ def cache_build(ctx, data_spec, date_from, date_to, jv_option, also_import, db,
     nl_info = info["nl"].get(data_spec.upper(), {})
     click.echo(f"Cache: {nl_info.get('complete_dates', 0)} dates, "
                f"{nl_info.get('size_bytes', 0)/1024:.0f} KB")
+    _report_profile(profiler, "cache-build", profile_output)
 
 
 @cache.command("clear")
@@ -778,6 +960,70 @@ def cache_rebuild(ctx, data_spec, date_from, date_to, jv_option, cache_dir):
                db=None, cache_dir=cache_dir)
 
 
+@cache.command("import")
+@click.option("--spec", "specs", required=True, multiple=True,
+              help="Cached data spec to import (repeatable: --spec RACE --spec DIFN)")
+@click.option("--from", "date_from", required=True, help="Start date YYYYMMDD")
+@click.option("--to", "date_to", required=True, help="End date YYYYMMDD")
+@click.option("--workers", type=click.IntRange(min=1), default=None,
+              help="Worker processes (default: CPU count)")
+@click.option("--db", type=click.Choice(["sqlite", "postgresql"]), default=None,
+              help="Database type (default: from config)")
+@click.option("--batch-size", default=1000, show_default=True, help="Batch size for imports")
+@click.option("--cache-dir", default="data/cache", show_default=True)
+@click.pass_context
+def cache_import(ctx, specs, date_from, date_to, workers, db, batch_size, cache_dir):
+    """Import a completely cached range into the database without JV-Link.
+
+    The range is split into one shard per spec and cached date, and the
+    shards are parsed by worker processes. With PostgreSQL every worker
+    writes its shards on its own connection; with SQLite the workers only
+    parse and a single writer applies the shards in date order. Each shard
+    is committed on its own; failed shards are listed and can be re-run.
+
+    \b
+    Examples:
+      jltsql cache import --spec RACE --from 20160101 --to 20251231 --workers 8
+      jltsql cache import --spec RACE --spec DIFN --from 20260101 --to 20260328 --db sqlite
+    """
+    from src.cache import CacheManager
+    from src.database import DatabaseError
+    from src.importer.parallel import ParallelCacheImporter
+
+    config = ctx.obj.get("config") if ctx.obj else None
+    if db:
+        db_type = db
+    else:
+        db_type = config.get("database.type", "sqlite") if config else "sqlite"
+
+    importer = ParallelCacheImporter(
+        config,
+        CacheManager(Path(cache_dir)),
+        db_type=db_type,
+        workers=workers,
+        batch_size=batch_size,
+    )
+    specs = [spec.upper() for spec in specs]
+    click.echo(
+        f"Importing cache: {','.join(specs)} {date_from}..{date_to} "
+        f"({db_type}, {importer.workers} worker(s))"
+    )
+    try:
+        stats = importer.run(specs, date_from, date_to)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+    except DatabaseError as exc:
+        click.echo(f"Error: {exc}")
+        sys.exit(1)
+
+    click.echo(
+        f"Imported: {stats['records_imported']:,} records from {stats['shards']:,} shard(s)"
+    )
+    if stats["failed_shards"]:
+        click.echo(f"Failed shards ({stats['shards_failed']}): {', '.join(stats['failed_shards'])}")
+        sys.exit(1)
+
+
 # ---------------------------------------------------------------------------
 # cache s3-setup: configure encrypted S3 credentials
 # ---------------------------------------------------------------------------
@@ -1089,7 +1335,7 @@ def create_tables(ctx, db, create_all, nl_only, rt_only):
 
             with Progress(
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=console.resolve(),
             ) as progress:
                 task = progress.add_task(f"[cyan]Creating {len(tables_to_create)} tables...", total=len(tables_to_create))
 
@@ -1225,6 +1471,374 @@ def create_indexes(ctx, db, table):
         sys.exit(1)
 
 
+@cli.command("refresh-summaries")
+@click.option("--db", type=click.Choice(["sqlite", "postgresql"]), default=None, help="Database type (default: from config)")
+@click.pass_context
+def refresh_summaries(ctx, db):
+    """Rebuild the MV_RACE_SUMMARY and MV_HORSE_FORM summary tables.
+
+    \b
+    With materialized_views.enabled the tables are kept up to date
+    incrementally during imports; run this once to populate them from
+    existing data, or after bulk changes made outside jltsql.
+
+    \b
+    Examples:
+      jltsql refresh-summaries
+      jltsql refresh-summaries --db postgresql
+    """
+    from src.database import create_database_from_config, DatabaseError
+    from src.database.materialized import MaterializedViewManager
+
+    config = ctx.obj.get("config")
+    if not config and not db:
+        console.print("[red]Error:[/red] No configuration found. Run 'jltsql init' first or use --db option.")
+        sys.exit(1)
+
+    if db:
+        db_type = db
+    else:
+        db_type = config.get("database.type", "sqlite")
+
+    try:
+        try:
+            database = create_database_from_config(config, db_type_override=db_type)
+        except (ValueError, DatabaseError) as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+
+        with database:
+            counts = MaterializedViewManager(database).rebuild()
+
+        for table_name, rows in counts.items():
+            console.print(f"[green][OK][/green] {table_name}: {rows:,} rows")
+
+    except Exception as e:
+        console.print(f"\n[red]Error:[/red] {e}", style="bold")
+        logger.error("Failed to refresh summaries", error=str(e), exc_info=True)
+        sys.exit(1)
+
+
+@cli.group()
+def indexes():
+    """Index maintenance commands.
+
+    \b
+    Examples:
+      jltsql indexes advise --workload queries.sql
+      jltsql indexes advise --workload queries.sql --apply
+    """
+    pass
+
+
+@indexes.command("advise")
+@click.option(
+    "--workload",
+    "-w",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, readable=True),
+    help="SQL file with the analytics queries to optimize (';'-separated)",
+)
+@click.option("--db", type=click.Choice(["sqlite", "postgresql"]), default=None, help="Database type (default: from config)")
+@click.option("--apply", "apply_advice", is_flag=True, help="Create the recommended missing indexes")
+@click.option("--drop-unused", is_flag=True, help="With --apply, also drop unused indexes")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON")
+@click.pass_context
+def indexes_advise(ctx, workload, db, apply_advice, drop_unused, as_json):
+    """Recommend missing and unused indexes for a query workload.
+
+    \b
+    Captures query plans (EXPLAIN QUERY PLAN on SQLite, EXPLAIN on
+    PostgreSQL) for every SELECT in the workload file without executing it.
+    Unused indexes are reported only for tables the workload reads.
+
+    \b
+    Examples:
+      jltsql indexes advise --workload queries.sql
+      jltsql indexes advise --workload queries.sql --json
+      jltsql indexes advise --workload queries.sql --apply --drop-unused
+    """
+    import json
+
+    from src.database import create_database_from_config, DatabaseError
+    from src.database.index_advisor import IndexAdvisor
+    from src.database.indexes import IndexManager
+
+    config = ctx.obj.get("config")
+    if not config and not db:
+        console.print("[red]Error:[/red] No configuration found. Run 'jltsql init' first or use --db option.")
+        sys.exit(1)
+
+    if drop_unused and not apply_advice:
+        raise click.UsageError("--drop-unused requires --apply")
+
+    # Determine database type
+    if db:
+        db_type = db
+    else:
+        db_type = config.get("database.type", "sqlite")
+
+    statements = IndexAdvisor.load_workload(workload)
+
+    try:
+        try:
+            database = create_database_from_config(config, db_type_override=db_type)
+        except (ValueError, DatabaseError) as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+
+        with database:
+            advisor = IndexAdvisor(database)
+            advice = advisor.advise(statements)
+
+            applied = None
+            if apply_advice:
+                applied = advisor.apply(advice, IndexManager(database), drop_unused=drop_unused)
+
+            if as_json:
+                report = advice.to_dict()
+                if applied is not None:
+                    report["applied"] = applied
+                click.echo(json.dumps(report, ensure_ascii=False, indent=2))
+                return
+
+            console.print(f"[bold cyan]Index advice ({db_type})[/bold cyan]\n")
+            console.print(f"  Statements analyzed: {advice.statements_analyzed}")
+            for error in advice.errors:
+                console.print(f"  [yellow]Skipped:[/yellow] {error}")
+            console.print()
+
+            console.print(f"[bold]Missing indexes ({len(advice.missing)}):[/bold]")
+            for index in advice.missing:
+                console.print(
+                    f"  {index.create_sql}\n"
+                    f"    [dim]{index.reason}, {index.occurrences} plan step(s), "
+                    f"estimated benefit {index.estimated_benefit:,.0f}[/dim]"
+                )
+            console.print()
+
+            console.print(f"[bold]Unused indexes ({len(advice.unused)}):[/bold]")
+            for index in advice.unused:
+                scans = (
+                    f", {index.server_scans} server scan(s)"
+                    if index.server_scans is not None
+                    else ""
+                )
+                console.print(
+                    f"  {index.name} ON {index.table}({', '.join(index.columns)}){scans}"
+                )
+
+            if applied is not None:
+                console.print()
+                console.print(
+                    f"[green][OK][/green] Created {applied['created']} index(es), "
+                    f"dropped {applied['dropped']} index(es)"
+                )
+
+    except Exception as e:
+        console.print(f"\n[red]Error:[/red] {e}", style="bold")
+        logger.error("Failed to advise indexes", error=str(e), exc_info=True)
+        sys.exit(1)
+
+
+@cli.group()
+def changes():
+    """Change data capture commands.
+
+    \b
+    Requires change_log.enabled: true in config.yaml.
+
+    \b
+    Examples:
+      jltsql changes tail
+      jltsql changes tail --since 12000 --follow --json
+    """
+    pass
+
+
+@changes.command("tail")
+@click.option("--since", "since_lsn", type=int, default=None, help="Print changes after this LSN (default: the last --lines entries)")
+@click.option("--lines", "-n", type=int, default=20, show_default=True, help="Number of recent entries to print when --since is omitted")
+@click.option("--table", "tables", multiple=True, help="Only print changes to this table (repeatable)")
+@click.option("--follow", "-f", is_flag=True, help="Keep polling for new changes")
+@click.option("--interval", type=float, default=1.0, show_default=True, help="Polling interval in seconds for --follow")
+@click.option("--json", "as_json", is_flag=True, help="Print one JSON object per line")
+@click.option("--db", type=click.Choice(["sqlite", "postgresql"]), default=None, help="Database type (default: from config)")
+@click.pass_context
+def changes_tail(ctx, since_lsn, lines, tables, follow, interval, as_json, db):
+    """Print entries of the change log (JLTSQL_CHANGE_LOG).
+
+    \b
+    Each entry has an LSN, the table, the operation (upsert/update/delete)
+    and the primary key of the affected row. Consumers remember the last
+    LSN they processed and resume with --since.
+
+    \b
+    Examples:
+      jltsql changes tail -n 50
+      jltsql changes tail --since 0 --table NL_SE --json
+      jltsql changes tail --follow
+    """
+    import json
+    import time
+
+    from src.database import create_database_from_config, DatabaseError
+    from src.database.changelog import CHANGE_LOG_TABLE, ChangeLog
+
+    config = ctx.obj.get("config")
+    if not config and not db:
+        console.print("[red]Error:[/red] No configuration found. Run 'jltsql init' first or use --db option.")
+        sys.exit(1)
+
+    if db:
+        db_type = db
+    else:
+        db_type = config.get("database.type", "sqlite")
+
+    try:
+        try:
+            database = create_database_from_config(config, db_type_override=db_type)
+        except (ValueError, DatabaseError) as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+
+        with database:
+            if not database.table_exists(CHANGE_LOG_TABLE):
+                console.print(
+                    f"[yellow]{CHANGE_LOG_TABLE} does not exist.[/yellow] "
+                    "Set change_log.enabled: true in config.yaml and run an import."
+                )
+                sys.exit(1)
+
+            change_log = ChangeLog(database)
+            if since_lsn is None:
+                since_lsn = max(0, change_log.head_lsn() - max(0, lines))
+
+            while True:
+                for change in change_log.iter_changes(since_lsn, tables or None):
+                    if as_json:
+                        click.echo(json.dumps(change.to_dict(), ensure_ascii=False, default=str))
+                    else:
+                        key = ", ".join(f"{name}={value}" for name, value in change.key.items())
+                        click.echo(
+                            f"{change.lsn}\t{change.created_at}\t{change.op}\t"
+                            f"{change.table_name}\t{key}"
+                        )
+                    since_lsn = change.lsn
+                if not follow:
+                    break
+                # End the read transaction so the next poll sees new commits.
+                database.commit()
+                time.sleep(interval)
+
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        console.print(f"\n[red]Error:[/red] {e}", style="bold")
+        logger.error("Failed to tail change log", error=str(e), exc_info=True)
+        sys.exit(1)
+
+
+@cli.group()
+def partitions():
+    """PostgreSQL partition maintenance commands.
+
+    \b
+    Examples:
+      jltsql partitions list
+      jltsql partitions prune --keep-years 5
+    """
+    pass
+
+
+@partitions.command("list")
+@click.pass_context
+def partitions_list(ctx):
+    """List the year partitions of the partitioned PostgreSQL tables."""
+    from src.database import create_database_from_config, DatabaseError
+    from src.database.partitioning import PARTITIONED_TABLES, PartitionManager
+
+    config = ctx.obj.get("config")
+    if not config:
+        console.print("[red]Error:[/red] No configuration found. Run 'jltsql init' first.")
+        sys.exit(1)
+
+    try:
+        try:
+            database = create_database_from_config(config, db_type_override="postgresql")
+        except (ValueError, DatabaseError) as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+
+        with database:
+            manager = PartitionManager(database)
+            found = False
+            for table_name in sorted(PARTITIONED_TABLES):
+                if not manager.is_partitioned(table_name):
+                    continue
+                found = True
+                years = [str(p["year_from"]) for p in manager.list_partitions(table_name)]
+                console.print(f"  {table_name:<14} {', '.join(years) or '-'}")
+            if not found:
+                console.print("No partitioned tables. Enable databases.postgresql.partitioning before create-tables.")
+
+    except Exception as e:
+        console.print(f"\n[red]Error:[/red] {e}", style="bold")
+        logger.error("Failed to list partitions", error=str(e), exc_info=True)
+        sys.exit(1)
+
+
+@partitions.command("prune")
+@click.option("--keep-years", type=click.IntRange(min=1), default=None, help="Years to keep including the current one (default: databases.postgresql.partitioning.retention_years)")
+@click.pass_context
+def partitions_prune(ctx, keep_years):
+    """Drop year partitions older than the retention window.
+
+    \b
+    Dropping a partition removes its rows and indexes at once, without the
+    DELETE + VACUUM cost of row-wise retention.
+
+    \b
+    Examples:
+      jltsql partitions prune --keep-years 5
+    """
+    from src.database import create_database_from_config, DatabaseError
+    from src.database.partitioning import PartitionManager
+
+    config = ctx.obj.get("config")
+    if not config:
+        console.print("[red]Error:[/red] No configuration found. Run 'jltsql init' first.")
+        sys.exit(1)
+
+    if keep_years is None:
+        keep_years = config.get("databases.postgresql.partitioning.retention_years")
+    if not keep_years:
+        raise click.UsageError(
+            "--keep-years is required when databases.postgresql.partitioning.retention_years is not set"
+        )
+
+    try:
+        try:
+            database = create_database_from_config(config, db_type_override="postgresql")
+        except (ValueError, DatabaseError) as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+
+        with database:
+            dropped = PartitionManager(database).apply_retention(keep_years)
+
+        total = sum(len(names) for names in dropped.values())
+        for table_name, names in dropped.items():
+            for name in names:
+                console.print(f"  Dropped {table_name}: {name}")
+        console.print(f"[green][OK][/green] Dropped {total} partition(s)")
+
+    except Exception as e:
+        console.print(f"\n[red]Error:[/red] {e}", style="bold")
+        logger.error("Failed to prune partitions", error=str(e), exc_info=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.option("--table", required=True, help="Table name to export")
 @click.option("--format", "output_format", type=click.Choice(["csv", "json", "parquet"]), default="csv", help="Output format (default: csv)")
@@ -1273,7 +1887,9 @@ def export(ctx, table, output_format, output, where, db):
     try:
         # Initialize database
         try:
-            database = create_database_from_config(config, db_type_override=db_type)
+            database = create_database_from_config(
+                config, db_type_override=db_type, read_only=True
+            )
         except (ValueError, DatabaseError) as exc:
             console.print(f"[red]Error:[/red] {exc}")
             sys.exit(1)
@@ -1307,7 +1923,7 @@ def export(ctx, table, output_format, output, where, db):
             from rich.progress import Progress, TextColumn
             with Progress(
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=console.resolve(),
             ) as progress:
                 task = progress.add_task("[cyan]Fetching data...", total=None)
                 rows = database.fetch_all(sql)
@@ -1690,8 +2306,21 @@ def realtime_stop(ctx):
     default=None,
     help="SQLite database path (overrides config)",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Skip race keys finished by earlier runs (checkpoints in JLTSQL_TS_CHECKPOINT)",
+)
+@click.option(
+    "--no-data-cooldown",
+    type=click.FloatRange(min=0),
+    default=24.0,
+    show_default=True,
+    help="With --resume, hours before a key without data is tried again",
+)
 @click.pass_context
-def timeseries(ctx, spec, from_date, to_date, db, db_path):
+def timeseries(ctx, spec, from_date, to_date, db, db_path, resume, no_data_cooldown):
     """Fetch time series odds data from JV-Link.
 
     Fetches odds time-series data for races already in the database.
@@ -1709,10 +2338,12 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
       jltsql realtime timeseries
       jltsql realtime timeseries --spec 0B41,0B42 --from-date 20250426
       jltsql realtime timeseries --spec 0B30 --from-date 20260418
+      jltsql realtime timeseries --spec 0B41 --from-date 20250426 --resume
     """
     from datetime import datetime, timedelta
     from src.database import create_database_from_config, DatabaseError
     from src.database.sqlite_handler import SQLiteDatabase
+    from src.fetcher.checkpoint import TimeSeriesCheckpoint
     from src.fetcher.realtime import RealtimeFetcher
     from src.realtime.updater import RealtimeUpdater
 
@@ -1750,6 +2381,8 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
     console.print(f"  Data specs:    {', '.join(specs_list)}")
     console.print(f"  Database:      {database_path if db_type == 'sqlite' else 'PostgreSQL'} ({db_type})")
     console.print(f"  Date range:    {from_date} - {to_date}")
+    if resume:
+        console.print(f"  Resume:        yes (no-data keys retried after {no_data_cooldown:g}h)")
     console.print()
 
     try:
@@ -1800,6 +2433,13 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
                         database.create_table(table_name, schema_registry[table_name])
                         console.print(f"  [green][OK][/green] Table {table_name} ready")
 
+            checkpoint = None
+            if resume:
+                checkpoint = TimeSeriesCheckpoint(
+                    database, no_data_cooldown=timedelta(hours=no_data_cooldown)
+                )
+                checkpoint.ensure_schema()
+
             # PostgreSQL DDL starts a physical transaction. Close the setup
             # boundary so every persistence batch owns and commits only its
             # own rows instead of borrowing one command-wide implicit tx.
@@ -1816,17 +2456,28 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
             default_save_batch_size = 100 if db_type in ("postgresql", "dual") else 5000
             save_batch_size = int(os.getenv("JRVLTSQL_TS_SAVE_BATCH_SIZE", str(default_save_batch_size)))
 
-            def flush_batch(records_batch):
-                nonlocal total_success, total_errors
-                if not records_batch:
+            # Key outcomes reported by the fetcher. They are checkpointed
+            # only after the batch holding the key's last record committed.
+            finished_keys = []
+
+            def save_checkpoints(spec_code):
+                if checkpoint is None or not finished_keys:
                     return
-                result = updater.process_parsed_records_batch(records_batch, timeseries=True)
-                total_success += int(result.get("inserted", 0))
-                total_errors += int(result.get("errors", 0))
-                if not result.get("success") or int(result.get("errors", 0)):
-                    raise RuntimeError(
-                        "time-series persistence batch failed; stop and rerun safely"
-                    )
+                checkpoint.record_many(spec_code, finished_keys)
+                database.commit()
+                finished_keys.clear()
+
+            def flush_batch(records_batch, spec_code):
+                nonlocal total_success, total_errors
+                if records_batch:
+                    result = updater.process_parsed_records_batch(records_batch, timeseries=True)
+                    total_success += int(result.get("inserted", 0))
+                    total_errors += int(result.get("errors", 0))
+                    if not result.get("success") or int(result.get("errors", 0)):
+                        raise RuntimeError(
+                            "time-series persistence batch failed; stop and rerun safely"
+                        )
+                save_checkpoints(spec_code)
 
             for spec_code in specs_list:
                 console.print(f"\n[bold]Processing {spec_code}...[/bold]")
@@ -1840,11 +2491,16 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
                         "success_keys": 0,
                         "no_data_keys": 0,
                         "error_keys": 0,
+                        "skipped_keys": 0,
                         "total_records": 0,
                     }
 
                     def report_key_progress(progress):
                         key_progress.update(progress)
+                        if checkpoint is not None and progress.get("key") and progress.get("status") != "skipped":
+                            finished_keys.append(
+                                (progress["key"], str(progress.get("status", "")), int(progress.get("records_for_key", 0)))
+                            )
                         processed = int(progress.get("processed_keys", 0))
                         total = int(progress.get("total_keys", 0))
                         status = str(progress.get("status", ""))
@@ -1861,6 +2517,7 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
                             f"ok={progress.get('success_keys', 0):,} "
                             f"no_data={progress.get('no_data_keys', 0):,} "
                             f"errors={progress.get('error_keys', 0):,} "
+                            f"skipped={progress.get('skipped_keys', 0):,} "
                             f"records={progress.get('total_records', 0):,} "
                             f"last={progress.get('key') or '-'}:{status}",
                             end="",
@@ -1878,6 +2535,7 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
                         to_date=to_date,
                         pg_config=pg_config,
                         progress_callback=report_key_progress,
+                        checkpoint=checkpoint,
                     ):
                         # The fetcher already expands O1-O6 arrays into row
                         # dictionaries. Save parsed rows directly to avoid
@@ -1888,14 +2546,14 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
                         record_count += 1
                         total_records += 1
                         if len(records_batch) >= save_batch_size:
-                            flush_batch(records_batch)
+                            flush_batch(records_batch, spec_code)
                             records_batch = []
 
                         # Progress indicator
                         if record_count % 100 == 0:
                             console.print(f"\r  Processed: {record_count:,} records", end="")
 
-                    flush_batch(records_batch)
+                    flush_batch(records_batch, spec_code)
                     if key_progress["processed_keys"]:
                         console.print(
                             "\r  Keys: "
@@ -1903,6 +2561,7 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
                             f"ok={key_progress['success_keys']:,} "
                             f"no_data={key_progress['no_data_keys']:,} "
                             f"errors={key_progress['error_keys']:,} "
+                            f"skipped={key_progress['skipped_keys']:,} "
                             f"records={key_progress['total_records']:,}"
                         )
                     console.print(f"  [green][OK][/green] {spec_code}: {record_count:,} records processed")
@@ -1953,8 +2612,21 @@ def timeseries(ctx, spec, from_date, to_date, db, db_path):
     default=None,
     help="SQLite database path (overrides config)",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Skip race keys finished by earlier runs (checkpoints in JLTSQL_TS_CHECKPOINT)",
+)
+@click.option(
+    "--no-data-cooldown",
+    type=click.FloatRange(min=0),
+    default=24.0,
+    show_default=True,
+    help="With --resume, hours before a key without data is tried again",
+)
 @click.pass_context
-def odds_timeseries(ctx, from_date, to_date, db, db_path):
+def odds_timeseries(ctx, from_date, to_date, db, db_path, resume, no_data_cooldown):
     """Fetch official one-year JRA-VAN historical odds time-series.
 
     Official historical time-series odds are available for single/place/bracket
@@ -1967,6 +2639,8 @@ def odds_timeseries(ctx, from_date, to_date, db, db_path):
         to_date=to_date,
         db=db,
         db_path=db_path,
+        resume=resume,
+        no_data_cooldown=no_data_cooldown,
     )
 
 
@@ -8,6 +8,16 @@ values:
 - ``postgresql``  → :class:`PostgreSQLDatabase`
 - ``dual``        → :class:`DualDatabase` wrapping SQLite (primary) + PostgreSQL (secondary)
 
+Setting ``change_log.enabled`` wraps the handler in
+:class:`~src.database.changelog.ChangeCaptureDatabase`, which records every
+row write in ``JLTSQL_CHANGE_LOG`` for :func:`~src.database.changelog.iter_changes`.
+``materialized_views.enabled`` uses the same wrapper to keep the ``MV_``
+summary tables of :mod:`src.database.materialized` up to date.
+
+Pass ``read_only=True`` for commands that only query: SQLite is then opened
+through a ``mode=ro`` reader (:mod:`src.database.readers`) that does not
+contend with the realtime writer, and no write wrapper is applied.
+
 Production collectors should use ``postgresql`` so records are written
 directly to PostgreSQL at collection time. ``dual`` remains a compatibility
 mode for local migration checks where SQLite must stay primary; it is not the
@@ -24,6 +34,7 @@ SUPPORTED_DB_TYPES = ("sqlite", "postgresql", "dual")
 def create_database_from_config(
     config: Any,
     db_type_override: Optional[str] = None,
+    read_only: bool = False,
 ) -> BaseDatabase:
     """Build a :class:`BaseDatabase` from config.
 
@@ -32,6 +43,7 @@ def create_database_from_config(
             method (see :mod:`src.utils.config`).
         db_type_override: Optional explicit type (``sqlite`` / ``postgresql``
             / ``dual``). If ``None``, uses ``database.type`` from the config.
+        read_only: Open SQLite read-only; the file must already exist.
 
     Returns:
         Concrete BaseDatabase instance (not yet connected).
@@ -40,6 +52,26 @@ def create_database_from_config(
         ValueError: If the resolved db_type is not supported.
         DatabaseError: If PostgreSQL is requested without matching config.
     """
+    database = _create_database(config, db_type_override, read_only)
+    if config is None or read_only:
+        return database
+    record_log = bool(config.get("change_log.enabled", False))
+    materialize = bool(config.get("materialized_views.enabled", False))
+    if record_log or materialize:
+        from .changelog import ChangeCaptureDatabase
+
+        listeners = []
+        if materialize:
+            from .materialized import MaterializedViewManager
+
+            listeners.append(MaterializedViewManager(database))
+        return ChangeCaptureDatabase(database, record_log=record_log, listeners=listeners)
+    return database
+
+
+def _create_database(
+    config: Any, db_type_override: Optional[str], read_only: bool = False
+) -> BaseDatabase:
     if db_type_override:
         db_type = db_type_override
     elif config is not None:
@@ -55,6 +87,8 @@ def create_database_from_config(
         sqlite_config = (
             config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
         )
+        if read_only:
+            sqlite_config = {**(sqlite_config or {}), "read_only": True}
         return SQLiteDatabase(sqlite_config)
 
     if db_type == "postgresql":
@@ -83,9 +117,16 @@ def create_database_from_config(
             raise DatabaseError(
                 "Dual-write requires databases.postgresql to be configured"
             )
+        dual_config = config.get("database.dual") or {}
         primary = SQLiteDatabase(sqlite_config)
         secondary = PostgreSQLDatabase(pg_config)
-        return DualDatabase(primary=primary, secondary=secondary)
+        return DualDatabase(
+            primary=primary,
+            secondary=secondary,
+            mirror=dual_config.get("mirror", "sync"),
+            batch_size=dual_config.get("batch_size", 1000),
+            poll_interval=dual_config.get("poll_interval", 1.0),
+        )
 
     raise ValueError(
         f"Unsupported database type: {db_type!r}. "
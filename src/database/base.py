@@ -3,13 +3,19 @@
 This module provides the abstract base class for database operations.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from src.utils.logger import get_logger
+from src.utils.metrics import histogram
 
 logger = get_logger(__name__)
 
+COMMIT_SECONDS = histogram(
+    "jltsql_commit_seconds", "Transaction commit latency", ["backend"]
+)
+
 
 class DatabaseError(Exception):
     """Database operation error."""
@@ -246,16 +252,49 @@ class BaseDatabase(ABC):
         if not data_list:
             raise DatabaseError("No data provided for insert")
 
-        # Use the union of all row keys.  Expanded JV-Data records such as O1
-        # intentionally produce heterogeneous rows (horse odds vs bracket odds).
-        # Using only the first row would silently drop columns that appear later.
+        columns = self._batch_columns(data_list)
+        return self._insert_rows(
+            table_name, columns, self._batch_values(data_list, columns), use_replace
+        )
+
+    @staticmethod
+    def _batch_columns(data_list: Sequence[Mapping[str, Any]]) -> Tuple[str, ...]:
+        """Return the union of row keys of a batch in first-seen order.
+
+        Expanded JV-Data records such as O1 intentionally produce heterogeneous
+        rows (horse odds vs bracket odds). Using only the first row would
+        silently drop columns that appear later.
+        """
         columns: List[str] = []
         seen_columns = set()
         for row in data_list:
-            for column in row.keys():
+            if seen_columns.issuperset(row):
+                continue
+            for column in row:
                 if column not in seen_columns:
                     columns.append(column)
                     seen_columns.add(column)
+        return tuple(columns)
+
+    @staticmethod
+    def _batch_values(
+        data_list: Sequence[Mapping[str, Any]], columns: Sequence[str]
+    ) -> List[tuple]:
+        """Return one value tuple per row in ``columns`` order."""
+        return [tuple(map(row.get, columns)) for row in data_list]
+
+    def _insert_rows(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: List[tuple],
+        use_replace: bool = True,
+    ) -> int:
+        """Insert value tuples given in ``columns`` order.
+
+        Backend-specific part of :meth:`insert_many`; wrappers such as
+        DualDatabase only intercept ``insert_many``.
+        """
         placeholders = ", ".join(["?" for _ in columns])
         # Quote column names using database-specific method
         quoted_columns = [self._quote_identifier(col) for col in columns]
@@ -266,10 +305,7 @@ class BaseDatabase(ABC):
         insert_clause = "INSERT OR REPLACE INTO" if use_replace else "INSERT INTO"
         sql = f"{insert_clause} {table_name} ({', '.join(quoted_columns)}) VALUES ({placeholders})"
 
-        # Extract values in correct order for each row
-        parameters_list = [tuple(row.get(col) for col in columns) for row in data_list]
-
-        return self.executemany(sql, parameters_list)
+        return self.executemany(sql, rows)
 
     def commit(self) -> None:
         """Commit current transaction.
@@ -279,7 +315,9 @@ class BaseDatabase(ABC):
         """
         if self._connection:
             try:
+                started = time.perf_counter()
                 self._connection.commit()
+                COMMIT_SECONDS.labels(self.get_db_type() or "unknown").observe(time.perf_counter() - started)
                 self._transaction_active = False
                 logger.debug("Transaction committed")
             except Exception as e:
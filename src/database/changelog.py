@@ -0,0 +1,531 @@
+"""Change-data-capture log for jltsql tables.
+
+:class:`ChangeCaptureDatabase` wraps a :class:`BaseDatabase` the same way
+:class:`~src.database.dual_handler.DualDatabase` does and appends one compact
+entry per written row to ``JLTSQL_CHANGE_LOG`` in the same database and the
+same transaction as the write itself. Every importer and the realtime updater
+write through the handler returned by
+:func:`~src.database.create_database_from_config`, so enabling
+``change_log.enabled`` captures all of them without touching their code.
+
+Entries carry the primary-key values of the affected row, not the row itself;
+consumers read the current row by key. LSNs increase monotonically.
+
+On SQLite an LSN is assigned under the database write lock, which is held
+until commit, so LSN order is commit order and ``iter_changes(since_lsn)``
+never skips an entry. On PostgreSQL a ``BIGSERIAL`` value is assigned when the
+row is inserted, not when it commits: with concurrent writers (``cache import
+--workers``) a lower LSN can become visible after a higher one, and a consumer
+resuming from the highest LSN it has seen may skip it. Such consumers should
+re-read a trailing window (``since_lsn - overlap``) and drop LSNs they have
+already processed; with a single writer LSN order is commit order there too.
+
+Example:
+    >>> from src.database.changelog import iter_changes
+    >>> for change in iter_changes(database, since_lsn=last_seen):
+    ...     refresh_feature(change.table_name, change.key)
+    ...     last_seen = change.lsn
+"""
+
+import json
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.utils.logger import get_logger
+
+from .base import BaseDatabase
+
+logger = get_logger(__name__)
+
+CHANGE_LOG_TABLE = "JLTSQL_CHANGE_LOG"
+
+OP_UPSERT = "upsert"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+_UNCAPTURED_PREFIXES = ("JLTSQL_", "MV_")
+
+_SQLITE_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CHANGE_LOG_TABLE} (
+    lsn INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    op TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_POSTGRESQL_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CHANGE_LOG_TABLE} (
+    lsn BIGSERIAL PRIMARY KEY,
+    table_name TEXT NOT NULL,
+    op TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_DELETE_RE = re.compile(
+    r"^\s*DELETE\s+FROM\s+([\w.\"]+)(?:\s+WHERE\s+(.*?))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_UPDATE_RE = re.compile(
+    r"^\s*UPDATE\s+([\w.\"]+)\s+SET\s+(.*?)(?:\s+WHERE\s+(.*?))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_INSERT_RE = re.compile(
+    r"^\s*INSERT\s+(?:OR\s+\w+\s+)?INTO\s+([\w.\"]+)\s*\(([^)]*)\)\s*VALUES\s*\(([^)]*)\)",
+    re.IGNORECASE | re.DOTALL,
+)
+_AND_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_EQUALS_PARAM_RE = re.compile(r"^\(?\s*\"?(\w+)\"?\s*=\s*\?\s*\)?$")
+
+
+@dataclass(frozen=True)
+class ChangeRecord:
+    """One captured row change.
+
+    Attributes:
+        lsn: Log sequence number, strictly increasing
+        table_name: Table the row belongs to
+        op: ``upsert``, ``update`` or ``delete``
+        key: Primary-key values of the row. Statements that cannot be reduced
+            to key equality carry ``{"_where": ..., "_params": [...]}``
+            (or only ``_params`` for an INSERT) instead; an empty mapping
+            means the whole table was affected.
+        created_at: Local time the change was written
+    """
+
+    lsn: int
+    table_name: str
+    op: str
+    key: Dict[str, Any]
+    created_at: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _primary_key_columns(table_name: str) -> List[str]:
+    from .schema_types import get_table_primary_key_columns
+    from .table_mappings import JRAVAN_TO_JLTSQL
+
+    columns = get_table_primary_key_columns(table_name)
+    if not columns:
+        columns = get_table_primary_key_columns(JRAVAN_TO_JLTSQL.get(table_name, table_name))
+    return columns
+
+
+def _row_key(table_name: str, row: Dict[str, Any]) -> Dict[str, Any]:
+    columns = _primary_key_columns(table_name)
+    if not columns:
+        return dict(row)
+    return {column: row.get(column) for column in columns}
+
+
+def _where_key(where: Optional[str], parameters: Sequence[Any]) -> Dict[str, Any]:
+    """Reduce ``a = ? AND b = ?`` to a key mapping, else keep the predicate."""
+    if not where:
+        return {}
+    conditions = _AND_RE.split(where.strip())
+    columns = []
+    for condition in conditions:
+        match = _EQUALS_PARAM_RE.match(condition.strip())
+        if not match:
+            break
+        columns.append(match.group(1))
+    else:
+        if len(columns) == len(parameters):
+            return dict(zip(columns, parameters))
+    return {"_where": where.strip(), "_params": list(parameters)}
+
+
+def _statement_changes(
+    sql: str, parameters: Optional[Sequence[Any]]
+) -> List[tuple]:
+    """Return ``(table, op, key)`` for a raw DML statement, if recognised."""
+    params = list(parameters or ())
+    match = _DELETE_RE.match(sql)
+    if match:
+        return [(match.group(1).strip('"'), OP_DELETE, _where_key(match.group(2), params))]
+    match = _UPDATE_RE.match(sql)
+    if match:
+        where_params = params[match.group(2).count("?"):]
+        return [(match.group(1).strip('"'), OP_UPDATE, _where_key(match.group(3), where_params))]
+    match = _INSERT_RE.match(sql)
+    if match:
+        table_name = match.group(1).strip('"')
+        columns = [column.strip().strip('"') for column in match.group(2).split(",")]
+        values = [value.strip() for value in match.group(3).split(",")]
+        if len(columns) == len(values) and all(value == "?" for value in values):
+            row = dict(zip(columns, params))
+            return [(table_name, OP_UPSERT, _row_key(table_name, row))]
+        return [(table_name, OP_UPSERT, {"_params": params})]
+    return []
+
+
+class ChangeLog:
+    """Append and read ``JLTSQL_CHANGE_LOG`` through a database handler.
+
+    Args:
+        database: Connected handler holding the change log table
+    """
+
+    def __init__(self, database: BaseDatabase):
+        self.database = database
+
+    def ensure_schema(self) -> None:
+        """Create the change log table if it does not exist."""
+        if self.database.get_db_type() == "postgresql":
+            self.database.execute(_POSTGRESQL_SCHEMA)
+        else:
+            self.database.execute(_SQLITE_SCHEMA)
+
+    def append(self, changes: Iterable[tuple]) -> int:
+        """Append ``(table_name, op, key)`` tuples in the current transaction.
+
+        Returns:
+            Number of entries written
+        """
+        created_at = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (
+                table_name,
+                op,
+                json.dumps(key, ensure_ascii=False, default=str, sort_keys=True),
+                created_at,
+            )
+            for table_name, op, key in changes
+        ]
+        if rows:
+            self.database.executemany(
+                f"INSERT INTO {CHANGE_LOG_TABLE} (table_name, op, row_key, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def head_lsn(self) -> int:
+        """Return the highest committed LSN, 0 if the log is empty."""
+        row = self.database.fetch_one(f"SELECT MAX(lsn) AS lsn FROM {CHANGE_LOG_TABLE}")
+        return int((row or {}).get("lsn") or 0)
+
+    def read(
+        self,
+        since_lsn: int = 0,
+        limit: int = 1000,
+        tables: Optional[Sequence[str]] = None,
+    ) -> List[ChangeRecord]:
+        """Return up to ``limit`` entries with an LSN greater than ``since_lsn``."""
+        sql = (
+            f"SELECT lsn, table_name, op, row_key, created_at FROM {CHANGE_LOG_TABLE} "
+            "WHERE lsn > ?"
+        )
+        parameters: List[Any] = [since_lsn]
+        if tables:
+            sql += f" AND table_name IN ({', '.join('?' for _ in tables)})"
+            parameters.extend(tables)
+        sql += " ORDER BY lsn LIMIT ?"
+        parameters.append(limit)
+        return [
+            ChangeRecord(
+                lsn=int(row["lsn"]),
+                table_name=row["table_name"],
+                op=row["op"],
+                key=json.loads(row["row_key"]),
+                created_at=row["created_at"],
+            )
+            for row in self.database.fetch_all(sql, tuple(parameters))
+        ]
+
+    def iter_changes(
+        self,
+        since_lsn: int = 0,
+        tables: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[ChangeRecord]:
+        """Yield committed changes after ``since_lsn`` in LSN order.
+
+        Reads the log in batches of ``batch_size`` and stops at the current
+        end of the log; call again with the last seen LSN to continue.
+        """
+        last_lsn = since_lsn
+        while True:
+            batch = self.read(last_lsn, batch_size, tables)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            last_lsn = batch[-1].lsn
+
+    def prune(self, up_to_lsn: int) -> int:
+        """Delete entries with an LSN up to and including ``up_to_lsn``."""
+        return self.database.execute(
+            f"DELETE FROM {CHANGE_LOG_TABLE} WHERE lsn <= ?", (up_to_lsn,)
+        )
+
+
+def iter_changes(
+    database: BaseDatabase,
+    since_lsn: int = 0,
+    tables: Optional[Sequence[str]] = None,
+    batch_size: int = 1000,
+) -> Iterator[ChangeRecord]:
+    """Yield committed changes recorded in ``database`` after ``since_lsn``.
+
+    Args:
+        database: Connected handler of the captured database
+        since_lsn: Last LSN the consumer has processed (0 for everything)
+        tables: Optional table names to filter on
+        batch_size: Entries fetched per query
+    """
+    return ChangeLog(database).iter_changes(since_lsn, tables, batch_size)
+
+
+def unwrap_database(database: Any) -> Any:
+    """Return the concrete handler behind any :class:`ChangeCaptureDatabase`."""
+    while isinstance(database, ChangeCaptureDatabase):
+        database = database.wrapped
+    return database
+
+
+class ChangeListener:
+    """In-process observer of the writes seen by :class:`ChangeCaptureDatabase`.
+
+    Listeners run in the writer's transaction: ``before_commit`` may issue
+    further writes through the wrapped handler and they commit atomically
+    with the captured rows. All hooks are no-ops by default.
+    """
+
+    def on_connect(self) -> None:
+        """Called after the wrapped handler has connected."""
+
+    def before_change(self, table_name: str, op: str, key: Dict[str, Any]) -> None:
+        """Called before a raw UPDATE / DELETE is executed."""
+
+    def on_changes(self, changes: Sequence[tuple]) -> None:
+        """Called with ``(table_name, op, key)`` tuples after each write."""
+
+    def before_commit(self) -> None:
+        """Called before the wrapped handler commits."""
+
+    def on_rollback(self) -> None:
+        """Called after the wrapped handler rolled back."""
+
+
+class ChangeCaptureDatabase(BaseDatabase):
+    """BaseDatabase wrapper that records every row write in the change log.
+
+    Reads, transactions and backend identity are delegated unchanged to the
+    wrapped handler, and so is every attribute this class does not define
+    (``bulk_load``, ``checkpoint``, ``optimize``, ...); use
+    :func:`unwrap_database` for type checks on the concrete handler. A
+    backend ``insert_many_optimized`` is captured like ``insert_many``.
+    Writes to the change log itself, to other ``JLTSQL_`` bookkeeping
+    tables and to derived ``MV_`` summary tables are not captured.
+
+    Args:
+        database: Handler whose writes are captured
+        record_log: Append captured changes to ``JLTSQL_CHANGE_LOG``
+        listeners: :class:`ChangeListener` instances notified of each write
+    """
+
+    def __init__(
+        self,
+        database: BaseDatabase,
+        record_log: bool = True,
+        listeners: Sequence[ChangeListener] = (),
+    ):
+        # NOTE: like DualDatabase we skip ``super().__init__``; the wrapped
+        # handler owns the configuration and connection state.
+        self.config = database.config
+        self._connection = None
+        self._cursor = None
+        self._database = database
+        self._transaction_active = False
+        self._transaction_generation = 0
+        self._context_exit_invalidated = False
+        self._change_log = ChangeLog(database) if record_log else None
+        self._listeners = list(listeners)
+
+    @property
+    def wrapped(self) -> BaseDatabase:
+        """The handler whose writes are captured."""
+        return self._database
+
+    @property
+    def change_log(self) -> Optional[ChangeLog]:
+        return self._change_log
+
+    @property
+    def listeners(self) -> List[ChangeListener]:
+        return self._listeners
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined here; private names are
+        # not forwarded so a half-initialised wrapper cannot recurse.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attribute = getattr(self._database, name)
+        if name == "insert_many_optimized":
+            return self._captured_insert_many(attribute)
+        return attribute
+
+    def _captured_insert_many(self, insert_many: Any) -> Any:
+        def insert_many_captured(table_name: str, data_list: List[Dict[str, Any]], *args, **kw):
+            rows = insert_many(table_name, data_list, *args, **kw)
+            self._capture(
+                (table_name, OP_UPSERT, _row_key(table_name, data)) for data in data_list
+            )
+            return rows
+
+        return insert_many_captured
+
+    def _capture(self, changes: Iterable[tuple]) -> None:
+        captured = [
+            change for change in changes if not change[0].upper().startswith(_UNCAPTURED_PREFIXES)
+        ]
+        if not captured:
+            return
+        if self._change_log is not None:
+            self._change_log.append(captured)
+        for listener in self._listeners:
+            listener.on_changes(captured)
+
+    def _before_statement(self, changes: Sequence[tuple]) -> None:
+        for table_name, op, key in changes:
+            if op == OP_UPSERT:
+                continue
+            for listener in self._listeners:
+                listener.before_change(table_name, op, key)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def connect(self) -> None:
+        """Connect the wrapped handler and create the change log table."""
+        self._database.connect()
+        self._connection = getattr(self._database, "_connection", None)
+        if self._change_log is not None:
+            self._change_log.ensure_schema()
+        for listener in self._listeners:
+            listener.on_connect()
+        self._database.commit()
+
+    def disconnect(self) -> None:
+        try:
+            self._database.disconnect()
+        finally:
+            self._connection = None
+
+    def is_connected(self) -> bool:
+        return self._database.is_connected()
+
+    def get_db_type(self) -> str:
+        return self._database.get_db_type()
+
+    def get_migration_targets(self) -> tuple[BaseDatabase, ...]:
+        """Return the wrapped handler's schema-migration targets."""
+        getter = getattr(self._database, "get_migration_targets", None)
+        if callable(getter):
+            return tuple(getter())
+        return (self._database,)
+
+    # ------------------------------------------------------------------
+    # Transactions: delegated
+    # ------------------------------------------------------------------
+
+    def begin_transaction(self) -> None:
+        self._database.begin_transaction()
+
+    def is_transaction_active(self) -> bool:
+        return self._database.is_transaction_active()
+
+    def has_pending_transaction(self) -> bool:
+        return self._database.has_pending_transaction()
+
+    def get_transaction_generation(self) -> Optional[int]:
+        return self._database.get_transaction_generation()
+
+    def commit(self) -> None:
+        for listener in self._listeners:
+            listener.before_commit()
+        self._database.commit()
+
+    def rollback(self) -> None:
+        try:
+            self._database.rollback()
+        finally:
+            for listener in self._listeners:
+                listener.on_rollback()
+
+    # ------------------------------------------------------------------
+    # Reads: delegated
+    # ------------------------------------------------------------------
+
+    def fetch_one(
+        self, sql: str, parameters: Optional[tuple] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self._database.fetch_one(sql, parameters)
+
+    def fetch_all(
+        self, sql: str, parameters: Optional[tuple] = None
+    ) -> List[Dict[str, Any]]:
+        return self._database.fetch_all(sql, parameters)
+
+    def table_exists(self, table_name: str) -> bool:
+        return self._database.table_exists(table_name)
+
+    def table_exists_strict(self, table_name: str) -> bool:
+        return self._database.table_exists_strict(table_name)
+
+    # ------------------------------------------------------------------
+    # Writes: captured
+    # ------------------------------------------------------------------
+
+    def execute(self, sql: str, parameters: Optional[tuple] = None) -> Any:
+        """Execute SQL and capture recognised INSERT / UPDATE / DELETE."""
+        changes = _statement_changes(sql, parameters)
+        self._before_statement(changes)
+        result = self._database.execute(sql, parameters)
+        self._capture(changes)
+        return result
+
+    def executemany(self, sql: str, parameters_list: List[tuple]) -> Any:
+        changes: List[tuple] = []
+        for parameters in parameters_list:
+            changes.extend(_statement_changes(sql, parameters))
+        self._before_statement(changes)
+        result = self._database.executemany(sql, parameters_list)
+        self._capture(changes)
+        return result
+
+    def create_table(self, table_name: str, schema: str) -> None:
+        self._database.create_table(table_name, schema)
+
+    def insert(
+        self,
+        table_name: str,
+        data: Dict[str, Any],
+        use_replace: bool = True,
+    ) -> int:
+        rows = self._database.insert(table_name, data, use_replace)
+        self._capture([(table_name, OP_UPSERT, _row_key(table_name, data))])
+        return rows
+
+    def insert_many(
+        self,
+        table_name: str,
+        data_list: List[Dict[str, Any]],
+        use_replace: bool = True,
+    ) -> int:
+        rows = self._database.insert_many(table_name, data_list, use_replace)
+        self._capture(
+            (table_name, OP_UPSERT, _row_key(table_name, data)) for data in data_list
+        )
+        return rows
+
+    def __repr__(self) -> str:
+        return f"ChangeCaptureDatabase({self._database!r})"
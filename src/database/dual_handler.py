@@ -14,14 +14,27 @@ one distributed transaction. If the secondary commit fails after the primary
 commit, the primary remains authoritative and ``secondary_in_sync`` becomes
 false. Production collectors should use PostgreSQL directly; dual mode exists
 only as a best-effort migration aid.
+
+Mirror modes
+------------
+``sync`` (default) issues every mirrored write against the secondary from the
+caller's thread, as described above. ``async`` appends mirrored writes to a
+durable change log in the primary database instead; a background worker
+replays the log to the secondary in large batches (see
+:mod:`src.database.mirror`). A slow or unavailable secondary then only
+increases replication lag, and ``secondary_in_sync`` is derived from the log
+position.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 
 from src.utils.logger import get_logger
 
 from .base import BaseDatabase, DatabaseError
+from .mirror import AsyncMirrorWorker, MirrorLog
 
 logger = get_logger(__name__)
 
@@ -72,6 +85,9 @@ def _is_dml(sql: str) -> bool:
     return bool(_DML_RE.match(sql))
 
 
+MIRROR_MODES = ("sync", "async")
+
+
 class DualDatabase(BaseDatabase):
     """BaseDatabase implementation that forwards writes to two backends.
 
@@ -81,13 +97,27 @@ class DualDatabase(BaseDatabase):
     BaseDatabase interface itself is the abstraction boundary.
     """
 
-    def __init__(self, primary: BaseDatabase, secondary: BaseDatabase):
+    def __init__(
+        self,
+        primary: BaseDatabase,
+        secondary: BaseDatabase,
+        mirror: str = "sync",
+        batch_size: int = 1000,
+        poll_interval: float = 1.0,
+    ):
         # NOTE: we intentionally skip ``super().__init__`` because our
         # configuration is the pair of backends themselves. The ABC requires
         # the abstract methods to be implemented (they are, below).
+        if mirror not in MIRROR_MODES:
+            raise ValueError(
+                f"Unsupported mirror mode: {mirror!r}. Supported: {', '.join(MIRROR_MODES)}"
+            )
+        if mirror == "async" and primary.get_db_type() != "sqlite":
+            raise DatabaseError("DualDatabase: async mirror requires a SQLite primary")
         self.config = {
             "primary_type": primary.get_db_type(),
             "secondary_type": secondary.get_db_type(),
+            "mirror": mirror,
         }
         self._connection = None  # BaseDatabase.is_connected() reads this
         self._cursor = None
@@ -98,9 +128,27 @@ class DualDatabase(BaseDatabase):
         self._transaction_active = False
         self._transaction_generation = 0
         self._context_exit_invalidated = False
+        self._mirror_mode = mirror
+        self._mirror_log: Optional[MirrorLog] = None
+        self._mirror_reader: Optional[BaseDatabase] = None
+        self._mirror_reader_lock = threading.Lock()
+        self._mirror_worker: Optional[AsyncMirrorWorker] = None
+        if mirror == "async":
+            # The worker gets its own connections so replay never shares a
+            # cursor or transaction with the writer thread. Lag is read
+            # through a third, read-only connection so the writer's
+            # uncommitted log entries are not reported as lag.
+            self._mirror_log = MirrorLog(primary)
+            self._mirror_reader = type(primary)({**primary.config, "read_only": True})
+            self._mirror_worker = AsyncMirrorWorker(
+                log_reader=type(primary)(primary.config),
+                secondary=type(secondary)(secondary.config),
+                batch_size=batch_size,
+                poll_interval=poll_interval,
+            )
         logger.info(
             f"DualDatabase initialized: primary={primary.get_db_type()}, "
-            f"secondary={secondary.get_db_type()}"
+            f"secondary={secondary.get_db_type()}, mirror={mirror}"
         )
 
     # ------------------------------------------------------------------
@@ -108,11 +156,20 @@ class DualDatabase(BaseDatabase):
     # ------------------------------------------------------------------
 
     def connect(self) -> None:
-        """Connect both backends. Secondary failure is logged, not raised."""
+        """Connect both backends. Secondary failure is logged, not raised.
+
+        In async mode the mirror log tables are created in the primary and
+        the replay worker is started. The caller-side secondary connection is
+        still attempted because schema migrations address it directly.
+        """
         self._transaction_active = False
         self._primary.connect()
         # Surface primary's connection so BaseDatabase.is_connected() works.
         self._connection = getattr(self._primary, "_connection", None)
+        if self._mirror_worker is not None:
+            self._mirror_log.ensure_schema()
+            self._primary.commit()
+            self._mirror_worker.start()
         try:
             self._secondary.connect()
         except Exception as e:
@@ -123,7 +180,12 @@ class DualDatabase(BaseDatabase):
             self._secondary_in_sync = False
 
     def disconnect(self) -> None:
-        """Disconnect both backends."""
+        """Disconnect both backends and stop the async mirror worker."""
+        if self._mirror_worker is not None:
+            self._mirror_worker.stop()
+            with self._mirror_reader_lock:
+                if self._mirror_reader.is_connected():
+                    self._mirror_reader.disconnect()
         try:
             self._primary.disconnect()
         finally:
@@ -153,7 +215,7 @@ class DualDatabase(BaseDatabase):
         """Return whether either connected backend has pending work."""
         if self._transaction_active or self._primary.has_pending_transaction():
             return True
-        if not self._secondary.is_connected():
+        if self._mirror_worker is not None or not self._secondary.is_connected():
             return False
         return self._secondary.has_pending_transaction()
 
@@ -190,7 +252,13 @@ class DualDatabase(BaseDatabase):
         """
         result = self._primary.execute(sql, parameters)
         mirrored_write = _is_ddl(sql) or _is_dml(sql)
-        if mirrored_write:
+        if mirrored_write and self._mirror_log is not None:
+            self._mirror_log.append(
+                "execute",
+                None,
+                {"sql": sql, "parameters": list(parameters) if parameters else None},
+            )
+        elif mirrored_write:
             try:
                 self._secondary.execute(sql, parameters)
             except Exception as e:
@@ -208,7 +276,13 @@ class DualDatabase(BaseDatabase):
 
     def executemany(self, sql: str, parameters_list: List[tuple]) -> Any:
         result = self._primary.executemany(sql, parameters_list)
-        if _is_dml(sql):
+        if _is_dml(sql) and self._mirror_log is not None:
+            self._mirror_log.append(
+                "executemany",
+                None,
+                {"sql": sql, "parameters": [list(params) for params in parameters_list]},
+            )
+        elif _is_dml(sql):
             try:
                 self._secondary.executemany(sql, parameters_list)
             except Exception as e:
@@ -249,6 +323,9 @@ class DualDatabase(BaseDatabase):
         if self._transaction_active:
             return
         self._primary.begin_transaction()
+        if self._mirror_worker is not None:
+            self._mark_transaction_started()
+            return
         try:
             self._secondary.begin_transaction()
         except Exception as e:
@@ -269,6 +346,9 @@ class DualDatabase(BaseDatabase):
         the same schema string works on each side.
         """
         self._primary.create_table(table_name, schema)
+        if self._mirror_log is not None:
+            self._mirror_log.append("create_table", table_name, {"schema": schema})
+            return
         try:
             self._secondary.create_table(table_name, schema)
         except Exception as e:
@@ -285,6 +365,11 @@ class DualDatabase(BaseDatabase):
         use_replace: bool = True,
     ) -> int:
         rows = self._primary.insert(table_name, data, use_replace)
+        if self._mirror_log is not None:
+            self._mirror_log.append(
+                "insert", table_name, {"data": data, "use_replace": use_replace}
+            )
+            return rows
         try:
             self._secondary.insert(table_name, data, use_replace)
         except Exception as e:
@@ -306,6 +391,17 @@ class DualDatabase(BaseDatabase):
         use_replace: bool = True,
     ) -> int:
         rows = self._primary.insert_many(table_name, data_list, use_replace)
+        if self._mirror_log is not None:
+            if data_list:
+                self._mirror_log.append(
+                    "insert_many",
+                    table_name,
+                    {
+                        "rows": [row if isinstance(row, dict) else dict(row) for row in data_list],
+                        "use_replace": use_replace,
+                    },
+                )
+            return rows
         try:
             self._secondary.insert_many(table_name, data_list, use_replace)
         except Exception as e:
@@ -328,8 +424,15 @@ class DualDatabase(BaseDatabase):
         secondary commit subsequently fails. In that case the primary remains
         authoritative and callers can detect the required mirror rebuild via
         :attr:`secondary_in_sync`.
+
+        In async mode only the primary is committed; the commit publishes the
+        logged writes and wakes the replay worker.
         """
         self._primary.commit()
+        if self._mirror_worker is not None:
+            self._transaction_active = False
+            self._mirror_worker.notify()
+            return
         try:
             self._secondary.commit()
             self._transaction_active = False
@@ -347,7 +450,8 @@ class DualDatabase(BaseDatabase):
         except Exception as e:
             errors.append(f"primary: {e}")
         try:
-            self._secondary.rollback()
+            if self._mirror_worker is None:
+                self._secondary.rollback()
         except Exception as e:
             self._secondary_errors += 1
             self._secondary_in_sync = False
@@ -360,19 +464,95 @@ class DualDatabase(BaseDatabase):
     # Diagnostics
     # ------------------------------------------------------------------
 
+    @property
+    def mirror_mode(self) -> str:
+        """Configured mirror mode (``sync`` or ``async``)."""
+        return self._mirror_mode
+
     @property
     def secondary_error_count(self) -> int:
         """Number of secondary-side failures since startup (read-only)."""
+        if self._mirror_worker is not None:
+            return self._secondary_errors + self._mirror_worker.error_count
         return self._secondary_errors
 
+    def _committed_log(self, read: Callable[[MirrorLog], Any]) -> Any:
+        """Run ``read`` against the committed mirror log (read-only connection)."""
+        with self._mirror_reader_lock:
+            if not self._mirror_reader.is_connected():
+                self._mirror_reader.connect()
+            return read(MirrorLog(self._mirror_reader))
+
     @property
     def secondary_in_sync(self) -> bool:
-        """Whether every secondary operation has succeeded since startup."""
+        """Whether the secondary has every write the primary has.
+
+        Sync mode reports whether every secondary operation has succeeded
+        since startup. Async mode compares the replayed LSN with the head of
+        the committed mirror log; an open primary transaction also counts as
+        out of sync, since its writes are not replayable yet.
+        """
+        if self._mirror_worker is not None:
+            if not self._primary.is_connected() or self._primary.has_pending_transaction():
+                return False
+            head = self._committed_log(MirrorLog.head_lsn)
+            return self._mirror_worker.applied_lsn >= head
         return self._secondary_in_sync
 
+    def mirror_status(self) -> Dict[str, Any]:
+        """Return replication lag diagnostics for the async mirror.
+
+        Returns:
+            Dictionary with ``mode``, ``head_lsn``, ``applied_lsn``,
+            ``lag_entries``, ``lag_seconds``, ``errors`` and ``last_error``.
+            Sync mode only reports ``mode``, ``errors`` and ``in_sync``.
+        """
+        if self._mirror_worker is None:
+            return {
+                "mode": self._mirror_mode,
+                "errors": self._secondary_errors,
+                "in_sync": self._secondary_in_sync,
+            }
+        worker = self._mirror_worker
+        applied = worker.applied_lsn
+        head = applied
+        if self._primary.is_connected():
+            head = self._committed_log(MirrorLog.head_lsn)
+        lag_seconds = None
+        if head > applied:
+            oldest = self._committed_log(lambda log: log.oldest_pending_at(applied))
+            if oldest:
+                lag_seconds = max(
+                    0.0, (datetime.now() - datetime.fromisoformat(oldest)).total_seconds()
+                )
+        return {
+            "mode": self._mirror_mode,
+            "running": worker.is_running(),
+            "head_lsn": head,
+            "applied_lsn": applied,
+            "lag_entries": max(0, head - applied),
+            "lag_seconds": lag_seconds,
+            "last_replay_at": worker.last_replay_at,
+            "errors": self.secondary_error_count,
+            "last_error": worker.last_error,
+            "in_sync": head <= applied,
+        }
+
+    def wait_for_mirror(self, timeout: float = 30.0) -> bool:
+        """Block until the async mirror has replayed every committed write.
+
+        Returns:
+            True when the secondary caught up within ``timeout`` seconds.
+            Always True in sync mode.
+        """
+        if self._mirror_worker is None:
+            return True
+        return self._mirror_worker.wait_until(self._committed_log(MirrorLog.head_lsn), timeout)
+
     def __repr__(self) -> str:
         return (
             f"DualDatabase(primary={self._primary!r}, "
             f"secondary={self._secondary!r}, "
+            f"mirror={self._mirror_mode}, "
             f"secondary_errors={self._secondary_errors})"
         )
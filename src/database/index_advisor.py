@@ -0,0 +1,704 @@
+"""Query-workload-driven index advisor for JLTSQL.
+
+The static :data:`src.database.indexes.INDEXES` map is a reasonable default,
+but the indexes that actually pay off depend on the queries analysts run.
+This module replays a SQL workload through the database planner and reports:
+
+- missing indexes: tables the planner scans in full, searches with only a
+  prefix of the available equality predicates, or indexes transiently on
+  every execution (SQLite ``AUTOMATIC INDEX``);
+- unused indexes: secondary indexes on workload tables that no plan touched.
+  They only cost write throughput during imports.
+
+Plans are captured with ``EXPLAIN QUERY PLAN`` on SQLite and
+``EXPLAIN (FORMAT JSON)`` on PostgreSQL; statements are never executed.
+Recommendations can be applied through :class:`IndexManager`.
+
+Examples:
+    >>> from src.database.index_advisor import IndexAdvisor
+    >>> advisor = IndexAdvisor(db)
+    >>> advice = advisor.advise(IndexAdvisor.load_workload("queries.sql"))
+    >>> for index in advice.missing:
+    ...     print(index.create_sql, index.estimated_benefit)
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.database.base import BaseDatabase, DatabaseError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+_SQL_KEYWORDS = frozenset(
+    {
+        "where", "on", "join", "left", "right", "inner", "outer", "cross",
+        "full", "natural", "group", "order", "limit", "union", "using",
+        "having", "as", "select", "set", "values", "window", "offset",
+    }
+)
+
+_TABLE_REF_RE = re.compile(
+    r"\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?"
+    r"|,\s*([A-Za-z_]\w*)(?:\s+(?:AS\s+)?([A-Za-z_]\w*))?",
+    re.IGNORECASE,
+)
+
+# Comparison against a column, e.g. ``s.KettoNum = ?`` or ``Year BETWEEN``.
+_PREDICATE_RE = re.compile(
+    r"(?:([A-Za-z_]\w*)\.)?([A-Za-z_]\w*)\s*"
+    r"(=|==|<>|!=|<=|>=|<|>|\bIN\b|\bBETWEEN\b|\bLIKE\b)",
+    re.IGNORECASE,
+)
+
+# Right-hand side of a join equality, e.g. ``= r.Year``.
+_JOIN_RHS_RE = re.compile(r"=\s*([A-Za-z_]\w*)\.([A-Za-z_]\w*)")
+
+_SQLITE_PLAN_RE = re.compile(
+    r"^(?P<op>SCAN|SEARCH)\s+(?:TABLE\s+)?(?P<alias>\w+)"
+    r"(?:\s+AS\s+\w+)?"
+    r"(?:\s+USING\s+(?P<using>.*?))?"
+    r"(?:\s+\((?P<cons>[^()]*)\))?\s*$",
+)
+
+_EQUALITY_OPS = ("=", "==", "IN")
+
+
+@dataclass
+class MissingIndex:
+    """A recommended index that the workload would benefit from.
+
+    Attributes:
+        table: Table name as defined in the schema
+        columns: Index columns, equality predicates first
+        reason: Plan evidence (``full_scan``, ``partial_search``,
+            ``automatic_index``)
+        occurrences: Number of plan steps across the workload that hit it
+        estimated_benefit: Estimated rows examined per workload pass that the
+            index would avoid (SQLite) or planner cost units (PostgreSQL)
+    """
+
+    table: str
+    columns: Tuple[str, ...]
+    reason: str
+    occurrences: int = 0
+    estimated_benefit: float = 0.0
+
+    @property
+    def name(self) -> str:
+        """Deterministic index name following the ``idx_<table>_...`` scheme."""
+        suffix = "_".join(column.lower() for column in self.columns)
+        return f"idx_{self.table.lower()}_{suffix}"
+
+    @property
+    def create_sql(self) -> str:
+        """CREATE INDEX statement usable on SQLite and PostgreSQL."""
+        return (
+            f"CREATE INDEX IF NOT EXISTS {self.name} "
+            f"ON {self.table}({', '.join(self.columns)})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "table": self.table,
+            "columns": list(self.columns),
+            "name": self.name,
+            "reason": self.reason,
+            "occurrences": self.occurrences,
+            "estimated_benefit": self.estimated_benefit,
+            "create_sql": self.create_sql,
+        }
+
+
+@dataclass
+class UnusedIndex:
+    """A secondary index that no workload plan used.
+
+    Attributes:
+        table: Table name as defined in the schema
+        name: Index name
+        columns: Indexed columns
+        server_scans: PostgreSQL ``pg_stat_user_indexes.idx_scan`` since the
+            last statistics reset, or ``None`` when unavailable
+    """
+
+    table: str
+    name: str
+    columns: Tuple[str, ...]
+    server_scans: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "table": self.table,
+            "name": self.name,
+            "columns": list(self.columns),
+            "server_scans": self.server_scans,
+        }
+
+
+@dataclass
+class IndexAdvice:
+    """Result of analysing one workload."""
+
+    db_type: str
+    statements_analyzed: int = 0
+    missing: List[MissingIndex] = field(default_factory=list)
+    unused: List[UnusedIndex] = field(default_factory=list)
+    used_indexes: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "db_type": self.db_type,
+            "statements_analyzed": self.statements_analyzed,
+            "missing": [index.to_dict() for index in self.missing],
+            "unused": [index.to_dict() for index in self.unused],
+            "used_indexes": dict(self.used_indexes),
+            "errors": list(self.errors),
+        }
+
+
+@dataclass
+class _ExistingIndex:
+    table: str
+    name: str
+    columns: Tuple[str, ...]
+    secondary: bool
+
+
+@dataclass
+class _PlanStep:
+    table: str
+    full_scan: bool
+    index_name: Optional[str] = None
+    automatic: bool = False
+    equality_columns: Tuple[str, ...] = ()
+    cost: Optional[float] = None
+
+
+@dataclass
+class _Predicates:
+    """Columns one table is compared on, in order of first appearance."""
+
+    equality: List[str] = field(default_factory=list)
+    join: List[str] = field(default_factory=list)
+    range: List[str] = field(default_factory=list)
+
+    def add(self, column: str, kind: str) -> None:
+        if column in self.equality:
+            return
+        if kind == "equality":
+            for other in (self.join, self.range):
+                if column in other:
+                    other.remove(column)
+            self.equality.append(column)
+        elif kind == "join":
+            if column in self.range:
+                self.range.remove(column)
+            if column not in self.join:
+                self.join.append(column)
+        elif column not in self.join and column not in self.range:
+            self.range.append(column)
+
+    def lookup_columns(self, joined: bool) -> Tuple[str, ...]:
+        """Index columns: equality (and join keys when driven), then one range."""
+        leading = self.equality + (self.join if joined else [])
+        return tuple(leading) + tuple(self.range[:1])
+
+
+class IndexAdvisor:
+    """Recommend index changes from the query plans of a SQL workload.
+
+    Only SELECT statements are analysed; other statements in the workload
+    file are skipped and reported in :attr:`IndexAdvice.errors`.
+
+    Examples:
+        >>> advisor = IndexAdvisor(db)
+        >>> advice = advisor.advise(["SELECT * FROM NL_SE WHERE KettoNum = '1'"])
+        >>> advisor.apply(advice, IndexManager(db))
+    """
+
+    def __init__(self, database: BaseDatabase):
+        """Initialize index advisor.
+
+        Args:
+            database: Connected database handler instance
+        """
+        self.database = database
+        self.db_type = database.get_db_type()
+        self._columns_cache: Dict[str, Dict[str, str]] = {}
+        self._table_names: Optional[Dict[str, str]] = None
+        self._row_estimates: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Workload loading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def split_statements(text: str) -> List[str]:
+        """Split a SQL script into statements, ignoring comments.
+
+        Semicolons inside single-quoted literals do not terminate a statement.
+        """
+        statements: List[str] = []
+        current: List[str] = []
+        in_literal = False
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if not in_literal and text.startswith("--", i):
+                newline = text.find("\n", i)
+                i = len(text) if newline < 0 else newline
+                continue
+            if char == "'":
+                in_literal = not in_literal
+            if char == ";" and not in_literal:
+                statement = "".join(current).strip()
+                if statement:
+                    statements.append(statement)
+                current = []
+            else:
+                current.append(char)
+            i += 1
+        statement = "".join(current).strip()
+        if statement:
+            statements.append(statement)
+        return statements
+
+    @classmethod
+    def load_workload(cls, path: Path | str) -> List[str]:
+        """Read a workload file and return its statements."""
+        return cls.split_statements(Path(path).read_text(encoding="utf-8"))
+
+    # ------------------------------------------------------------------
+    # Analysis
+    # ------------------------------------------------------------------
+
+    def advise(self, statements: Iterable[str]) -> IndexAdvice:
+        """Analyse a workload and return missing and unused indexes.
+
+        Args:
+            statements: SQL statements representative of the query workload
+
+        Returns:
+            IndexAdvice with recommendations ordered by estimated benefit
+        """
+        advice = IndexAdvice(db_type=self.db_type)
+        candidates: Dict[Tuple[str, Tuple[str, ...]], MissingIndex] = {}
+        workload_tables: Set[str] = set()
+
+        for statement in statements:
+            if not re.match(r"^\s*(WITH|SELECT)\b", statement, re.IGNORECASE):
+                advice.errors.append(f"skipped non-SELECT statement: {statement[:60]!r}")
+                continue
+            try:
+                steps = self._plan(statement)
+            except DatabaseError as e:
+                advice.errors.append(f"{statement[:60]!r}: {e}")
+                continue
+
+            advice.statements_analyzed += 1
+            aliases = self._table_aliases(statement)
+            workload_tables.update(aliases.values())
+            predicates = self._predicate_columns(statement, aliases)
+
+            for position, step in enumerate(steps):
+                table = aliases.get(step.table.lower()) or self._resolve_table(step.table)
+                if table is None:
+                    continue
+                workload_tables.add(table)
+                if step.index_name:
+                    advice.used_indexes[step.index_name] = (
+                        advice.used_indexes.get(step.index_name, 0) + 1
+                    )
+                # The outermost loop cannot look rows up by join keys; only
+                # tables visited later in the plan are driven by them.
+                self._collect_candidate(
+                    candidates, table, step, predicates.get(table), joined=position > 0
+                )
+
+        existing = self._existing_indexes()
+        advice.missing = self._finalize_candidates(candidates, existing)
+        used = {name.lower() for name in advice.used_indexes}
+        server_scans = self._server_index_scans()
+        for index in existing:
+            if not index.secondary or index.table not in workload_tables:
+                continue
+            if index.name.lower() in used:
+                continue
+            advice.unused.append(
+                UnusedIndex(
+                    table=index.table,
+                    name=index.name,
+                    columns=index.columns,
+                    server_scans=server_scans.get(index.name.lower()),
+                )
+            )
+        advice.unused.sort(key=lambda index: (index.table, index.name))
+
+        logger.info(
+            f"Index advice: {advice.statements_analyzed} statements, "
+            f"{len(advice.missing)} missing, {len(advice.unused)} unused"
+        )
+        return advice
+
+    def apply(
+        self,
+        advice: IndexAdvice,
+        index_manager: Any,
+        drop_unused: bool = False,
+    ) -> Dict[str, int]:
+        """Apply recommendations through an :class:`IndexManager`.
+
+        Args:
+            advice: Result of :meth:`advise`
+            index_manager: IndexManager bound to the same database
+            drop_unused: Also drop the reported unused indexes
+
+        Returns:
+            Dictionary with ``created`` and ``dropped`` counts
+        """
+        created = sum(
+            1 for index in advice.missing if index_manager.create_index(index.create_sql)
+        )
+        dropped = 0
+        if drop_unused:
+            dropped = sum(
+                1 for index in advice.unused if index_manager.drop_index(index.name)
+            )
+        return {"created": created, "dropped": dropped}
+
+    def _collect_candidate(
+        self,
+        candidates: Dict[Tuple[str, Tuple[str, ...]], MissingIndex],
+        table: str,
+        step: _PlanStep,
+        predicates: Optional[_Predicates],
+        joined: bool,
+    ) -> None:
+        predicates = predicates or _Predicates()
+        lookup = predicates.lookup_columns(joined)
+        equality_count = len(predicates.equality) + (len(predicates.join) if joined else 0)
+        if step.automatic and step.equality_columns:
+            columns = tuple(self._canonical_column(table, c) for c in step.equality_columns)
+            reason = "automatic_index"
+        elif step.full_scan and lookup:
+            columns = lookup
+            reason = "full_scan"
+        elif (
+            not step.full_scan
+            and step.index_name
+            and equality_count > len(step.equality_columns)
+        ):
+            columns = lookup
+            reason = "partial_search"
+        else:
+            return
+
+        rows = self._estimate_rows(table)
+        if step.cost is not None:
+            benefit = step.cost
+        elif reason == "partial_search":
+            # Rows still examined after the leading equality columns narrow
+            # the search; assume each column is roughly ten-way selective.
+            benefit = max(1.0, rows / (10 ** len(step.equality_columns)))
+        else:
+            benefit = float(rows)
+
+        key = (table, columns)
+        candidate = candidates.get(key)
+        if candidate is None:
+            candidate = candidates[key] = MissingIndex(table=table, columns=columns, reason=reason)
+        candidate.occurrences += 1
+        candidate.estimated_benefit += benefit
+
+    def _finalize_candidates(
+        self,
+        candidates: Dict[Tuple[str, Tuple[str, ...]], MissingIndex],
+        existing: List[_ExistingIndex],
+    ) -> List[MissingIndex]:
+        """Drop candidates already served by an index and merge prefixes."""
+        existing_columns = [
+            (index.table, tuple(c.lower() for c in index.columns)) for index in existing
+        ]
+
+        def is_covered(table: str, columns: Tuple[str, ...]) -> bool:
+            wanted = tuple(c.lower() for c in columns)
+            return any(
+                t == table and have[: len(wanted)] == wanted for t, have in existing_columns
+            )
+
+        result: List[MissingIndex] = []
+        for candidate in sorted(candidates.values(), key=lambda c: -len(c.columns)):
+            if not candidate.columns or is_covered(candidate.table, candidate.columns):
+                continue
+            wider = next(
+                (
+                    kept
+                    for kept in result
+                    if kept.table == candidate.table
+                    and kept.columns[: len(candidate.columns)] == candidate.columns
+                ),
+                None,
+            )
+            if wider is not None:
+                wider.occurrences += candidate.occurrences
+                wider.estimated_benefit += candidate.estimated_benefit
+                continue
+            result.append(candidate)
+        result.sort(key=lambda c: (-c.estimated_benefit, c.table, c.columns))
+        return result
+
+    # ------------------------------------------------------------------
+    # Plan capture
+    # ------------------------------------------------------------------
+
+    def _plan(self, statement: str) -> List[_PlanStep]:
+        if self.db_type == "postgresql":
+            return self._plan_postgresql(statement)
+        return self._plan_sqlite(statement)
+
+    def _plan_sqlite(self, statement: str) -> List[_PlanStep]:
+        steps: List[_PlanStep] = []
+        for row in self.database.fetch_all(f"EXPLAIN QUERY PLAN {statement}"):
+            match = _SQLITE_PLAN_RE.match(str(row.get("detail", "")).strip())
+            if not match:
+                continue
+            using = match.group("using") or ""
+            constraint = match.group("cons") or ""
+            index_match = re.search(r"INDEX\s+(\w+)", using)
+            automatic = "AUTOMATIC" in using
+            equality = tuple(
+                re.findall(r"(\w+)=\?", constraint)
+            ) if match.group("op") == "SEARCH" else ()
+            steps.append(
+                _PlanStep(
+                    table=match.group("alias"),
+                    full_scan=match.group("op") == "SCAN",
+                    index_name=None if automatic or not index_match else index_match.group(1),
+                    automatic=automatic,
+                    equality_columns=equality,
+                )
+            )
+        return steps
+
+    def _plan_postgresql(self, statement: str) -> List[_PlanStep]:
+        row = self.database.fetch_one(f"EXPLAIN (FORMAT JSON) {statement}")
+        if not row:
+            return []
+        plan = next(iter(row.values())) if isinstance(row, dict) else row[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        if isinstance(plan, list):
+            plan = plan[0]
+
+        steps: List[_PlanStep] = []
+        stack = [plan.get("Plan", {})]
+        while stack:
+            node = stack.pop()
+            stack.extend(node.get("Plans", []))
+            relation = node.get("Relation Name")
+            node_type = node.get("Node Type", "")
+            if node_type == "Seq Scan" and relation:
+                steps.append(
+                    _PlanStep(
+                        table=node.get("Alias") or relation,
+                        full_scan=True,
+                        cost=float(node.get("Total Cost", 0.0)),
+                    )
+                )
+            elif node.get("Index Name"):
+                condition = node.get("Index Cond", "")
+                steps.append(
+                    _PlanStep(
+                        table=node.get("Alias") or relation or "",
+                        full_scan=False,
+                        index_name=node["Index Name"],
+                        equality_columns=tuple(
+                            re.findall(r"\(?(\w+)\s*=", condition)
+                        ),
+                    )
+                )
+        return steps
+
+    # ------------------------------------------------------------------
+    # Statement inspection
+    # ------------------------------------------------------------------
+
+    def _table_aliases(self, statement: str) -> Dict[str, str]:
+        """Map lower-cased aliases and table names to schema table names."""
+        aliases: Dict[str, str] = {}
+        for match in _TABLE_REF_RE.finditer(statement):
+            name = match.group(1) or match.group(3)
+            alias = match.group(2) or match.group(4)
+            table = self._resolve_table(name)
+            if table is None:
+                continue
+            aliases[name.lower()] = table
+            if alias and alias.lower() not in _SQL_KEYWORDS:
+                aliases[alias.lower()] = table
+        return aliases
+
+    def _predicate_columns(
+        self, statement: str, aliases: Dict[str, str]
+    ) -> Dict[str, _Predicates]:
+        """Return the columns each table is filtered or joined on."""
+        result: Dict[str, _Predicates] = {}
+        tables = sorted(set(aliases.values()))
+
+        def add(qualifier: Optional[str], column: str, kind: str) -> None:
+            if qualifier:
+                table = aliases.get(qualifier.lower())
+                candidates = [table] if table else []
+            else:
+                candidates = [
+                    t for t in tables if column.lower() in self._table_columns(t)
+                ]
+            if len(candidates) != 1:
+                return
+            table = candidates[0]
+            canonical = self._table_columns(table).get(column.lower())
+            if canonical is None:
+                return
+            result.setdefault(table, _Predicates()).add(canonical, kind)
+
+        for match in _PREDICATE_RE.finditer(statement):
+            operator = match.group(3).upper()
+            if operator in ("<>", "!="):
+                continue
+            if operator not in _EQUALITY_OPS:
+                kind = "range"
+            elif _JOIN_RHS_RE.match(statement, match.start(3)):
+                kind = "join"
+            else:
+                kind = "equality"
+            add(match.group(1), match.group(2), kind)
+        for match in _JOIN_RHS_RE.finditer(statement):
+            add(match.group(1), match.group(2), "join")
+        return result
+
+    # ------------------------------------------------------------------
+    # Catalog access
+    # ------------------------------------------------------------------
+
+    def _resolve_table(self, name: Optional[str]) -> Optional[str]:
+        if not name:
+            return None
+        if self._table_names is None:
+            if self.db_type == "postgresql":
+                rows = self.database.fetch_all(
+                    "SELECT tablename AS name FROM pg_tables "
+                    "WHERE schemaname = current_schema()"
+                )
+            else:
+                rows = self.database.fetch_all(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            self._table_names = {}
+            for row in rows:
+                table = str(row["name"])
+                # PostgreSQL folds the shared unquoted DDL to lower case;
+                # report the upper-case names used by the schema module.
+                self._table_names[table.lower()] = (
+                    table.upper() if self.db_type == "postgresql" else table
+                )
+        return self._table_names.get(name.lower())
+
+    def _table_columns(self, table: str) -> Dict[str, str]:
+        """Return ``lower-cased column -> column name`` for a table."""
+        if table not in self._columns_cache:
+            if self.db_type == "postgresql":
+                rows = self.database.fetch_all(
+                    "SELECT column_name AS name FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = ?",
+                    (table.lower(),),
+                )
+            else:
+                rows = self.database.fetch_all(f"PRAGMA table_info({table})")
+            self._columns_cache[table] = {
+                str(row["name"]).lower(): str(row["name"]) for row in rows
+            }
+        return self._columns_cache[table]
+
+    def _canonical_column(self, table: str, column: str) -> str:
+        return self._table_columns(table).get(column.lower(), column)
+
+    def _estimate_rows(self, table: str) -> int:
+        """Cheap row-count estimate (rowid bound on SQLite, reltuples on PG)."""
+        if table not in self._row_estimates:
+            try:
+                if self.db_type == "postgresql":
+                    row = self.database.fetch_one(
+                        "SELECT reltuples::bigint AS n FROM pg_class "
+                        "WHERE oid = to_regclass(?)",
+                        (table.lower(),),
+                    )
+                else:
+                    row = self.database.fetch_one(f"SELECT MAX(_rowid_) AS n FROM {table}")
+                self._row_estimates[table] = max(0, int((row or {}).get("n") or 0))
+            except (DatabaseError, TypeError, ValueError):
+                self._row_estimates[table] = 0
+        return self._row_estimates[table]
+
+    def _existing_indexes(self) -> List[_ExistingIndex]:
+        indexes: List[_ExistingIndex] = []
+        if self.db_type == "postgresql":
+            rows = self.database.fetch_all(
+                "SELECT i.indexname, i.tablename, i.indexdef, "
+                "x.indisprimary OR x.indisunique AS is_constraint "
+                "FROM pg_indexes i "
+                "JOIN pg_index x ON x.indexrelid = to_regclass(i.indexname) "
+                "WHERE i.schemaname = current_schema()"
+            )
+            for row in rows:
+                table = self._resolve_table(row["tablename"])
+                if table is None:
+                    continue
+                columns = re.search(r"\(([^()]*)\)\s*$", row["indexdef"] or "")
+                indexes.append(
+                    _ExistingIndex(
+                        table=table,
+                        name=row["indexname"],
+                        columns=tuple(
+                            self._canonical_column(table, c.strip().strip('"'))
+                            for c in (columns.group(1).split(",") if columns else [])
+                        ),
+                        secondary=not row["is_constraint"],
+                    )
+                )
+            return indexes
+
+        rows = self.database.fetch_all(
+            "SELECT name, tbl_name, sql FROM sqlite_master WHERE type = 'index'"
+        )
+        for row in rows:
+            info = self.database.fetch_all(f"PRAGMA index_info({row['name']})")
+            indexes.append(
+                _ExistingIndex(
+                    table=row["tbl_name"],
+                    name=row["name"],
+                    columns=tuple(str(col["name"]) for col in info if col["name"]),
+                    # Autoindexes back PRIMARY KEY / UNIQUE constraints.
+                    secondary=row["sql"] is not None
+                    and "UNIQUE" not in str(row["sql"]).upper(),
+                )
+            )
+        return indexes
+
+    def _server_index_scans(self) -> Dict[str, int]:
+        """Return PostgreSQL cumulative index scan counts keyed by index name."""
+        if self.db_type != "postgresql":
+            return {}
+        try:
+            rows = self.database.fetch_all(
+                "SELECT indexrelname, idx_scan FROM pg_stat_user_indexes "
+                "WHERE schemaname = current_schema()"
+            )
+        except DatabaseError as e:
+            logger.warning(f"Could not read pg_stat_user_indexes: {e}")
+            return {}
+        return {str(row["indexrelname"]).lower(): int(row["idx_scan"] or 0) for row in rows}
@@ -11,9 +11,10 @@ Index Design Principles:
 5. Covering indexes for frequently queried columns
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from src.database.base import BaseDatabase
+from src.database.partitioning import PARTITIONED_TABLES, partitioning_handler
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -327,6 +328,30 @@ INDEXES = {
 }
 
 
+def _index_name(statement: str) -> Optional[str]:
+    """Extract the index name from a CREATE INDEX statement.
+
+    Accepts both ``CREATE INDEX IF NOT EXISTS idx_name ON ...`` and
+    ``CREATE INDEX idx_name ON ...``.
+    """
+    parts = statement.split()
+
+    # Find INDEX keyword position
+    try:
+        idx_pos = parts.index("INDEX")
+    except ValueError:
+        return None
+
+    # Check if IF NOT EXISTS follows INDEX
+    if idx_pos + 4 < len(parts) and parts[idx_pos + 1] == "IF":
+        # Format: CREATE INDEX IF NOT EXISTS idx_name
+        return parts[idx_pos + 4]
+    if idx_pos + 1 < len(parts):
+        # Format: CREATE INDEX idx_name
+        return parts[idx_pos + 1]
+    return None
+
+
 class IndexManager:
     """Index management for database tables.
 
@@ -350,8 +375,21 @@ class IndexManager:
             database: Database handler instance
         """
         self.database = database
+        handler = partitioning_handler(database)
+        self._partitions = handler.partitions if handler is not None else None
         logger.info("IndexManager initialized")
 
+    def _execute_index(self, table_name: str, statement: str) -> None:
+        """Run a CREATE INDEX statement, per partition on partitioned tables."""
+        if (
+            self._partitions is not None
+            and table_name in PARTITIONED_TABLES
+            and self._partitions.is_partitioned(table_name)
+        ):
+            self._partitions.create_partitioned_index(statement)
+        else:
+            self.database.execute(statement)
+
     def create_indexes(self, table_name: str) -> bool:
         """Create all indexes for a specific table.
 
@@ -368,7 +406,7 @@ class IndexManager:
         try:
             index_statements = INDEXES[table_name]
             for statement in index_statements:
-                self.database.execute(statement)
+                self._execute_index(table_name, statement)
 
             logger.info(f"Created {len(index_statements)} indexes for {table_name}")
             return True
@@ -392,7 +430,7 @@ class IndexManager:
 
                 for statement in index_statements:
                     try:
-                        self.database.execute(statement)
+                        self._execute_index(table_name, statement)
                         success_count += 1
                     except Exception as e:
                         logger.error(f"Failed to create index: {e}")
@@ -435,24 +473,8 @@ class IndexManager:
             index_statements = INDEXES[table_name]
 
             for statement in index_statements:
-                # Extract index name from CREATE INDEX statement
-                # Format: "CREATE INDEX IF NOT EXISTS idx_name ON table_name(...)"
-                parts = statement.split()
-
-                # Find INDEX keyword position
-                try:
-                    idx_pos = parts.index("INDEX")
-                except ValueError:
-                    continue
-
-                # Check if IF NOT EXISTS follows INDEX
-                if idx_pos + 3 < len(parts) and parts[idx_pos + 1] == "IF":
-                    # Format: CREATE INDEX IF NOT EXISTS idx_name
-                    index_name = parts[idx_pos + 4]
-                elif idx_pos + 1 < len(parts):
-                    # Format: CREATE INDEX idx_name
-                    index_name = parts[idx_pos + 1]
-                else:
+                index_name = _index_name(statement)
+                if index_name is None:
                     continue
 
                 # Drop index
@@ -466,6 +488,50 @@ class IndexManager:
             logger.error(f"Failed to drop indexes from {table_name}: {e}")
             return False
 
+    def create_index(self, statement: str) -> bool:
+        """Create a single index from a CREATE INDEX statement.
+
+        Used to apply :mod:`src.database.index_advisor` recommendations that
+        are not part of the static ``INDEXES`` map.
+
+        Args:
+            statement: CREATE INDEX statement
+
+        Returns:
+            True if the index was created (or already existed), False otherwise
+        """
+        try:
+            parts = statement.split()
+            upper_parts = [part.upper() for part in parts]
+            table_name = ""
+            if "ON" in upper_parts[:-1]:
+                table_name = parts[upper_parts.index("ON") + 1].split("(", 1)[0].upper()
+            self._execute_index(table_name, statement)
+            logger.info(f"Created index: {_index_name(statement)}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to create index {_index_name(statement)}: {e}")
+            return False
+
+    def drop_index(self, index_name: str) -> bool:
+        """Drop a single index by name.
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            True if the index was dropped (or did not exist), False otherwise
+        """
+        try:
+            self.database.execute(f"DROP INDEX IF EXISTS {index_name}")
+            logger.info(f"Dropped index: {index_name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to drop index {index_name}: {e}")
+            return False
+
     def get_index_count(self, table_name: str) -> int:
         """Get the number of index definitions for a table.
 
@@ -0,0 +1,204 @@
+"""Scheduled database maintenance.
+
+Nothing in a long-running deployment checkpoints, vacuums or analyzes the
+database on its own: under continuous realtime writes the SQLite WAL keeps
+growing and every reader has to scan it, and after a large import the
+query planner works from statistics that describe a much smaller table.
+
+:class:`SQLiteMaintenanceScheduler` is polled between realtime cycles and
+runs what is due:
+
+- ``PRAGMA wal_checkpoint(PASSIVE)`` once ``checkpoint_interval`` has passed
+  since the last checkpoint. A passive checkpoint never waits for readers or
+  the writer.
+- ``PRAGMA wal_checkpoint(TRUNCATE)`` once the WAL file reaches
+  ``truncate_wal_bytes``, so it shrinks back to zero bytes.
+- At quiet times (non-race days, or ``quiet_hours`` on race days) and at most
+  once per ``quiet_interval``: an incremental vacuum (databases in
+  ``auto_vacuum = INCREMENTAL`` mode), ``PRAGMA optimize`` and a truncating
+  checkpoint.
+
+:func:`analyze_loaded_tables` refreshes PostgreSQL statistics of the tables
+an import has just bulk-loaded instead of waiting for autovacuum.
+
+Example:
+    >>> scheduler = SQLiteMaintenanceScheduler("data/keiba.db")
+    >>> scheduler.run_due(race_day=schedule.is_race_day())
+    ['checkpoint_passive']
+"""
+
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+from src.database.base import BaseDatabase, DatabaseError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CHECKPOINT_INTERVAL = timedelta(minutes=10)
+DEFAULT_TRUNCATE_WAL_BYTES = 256 * 1024 * 1024
+DEFAULT_QUIET_HOURS = (2, 3, 4, 5)
+DEFAULT_QUIET_INTERVAL = timedelta(hours=24)
+
+# Tables that received fewer rows than this are left to autovacuum.
+ANALYZE_MIN_ROWS = 1000
+
+_TABLE_NAME = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+class SQLiteMaintenanceScheduler:
+    """Checkpoint, vacuum and analyze a SQLite database when due.
+
+    Each :meth:`run_due` opens a short-lived connection, so the scheduler
+    holds no lock between runs. Call it while no import is writing.
+
+    Args:
+        db_path: Database file
+        checkpoint_interval: Time between passive checkpoints
+        truncate_wal_bytes: WAL file size that triggers a truncating
+            checkpoint
+        quiet_hours: Hours of a race day that count as quiet
+        quiet_interval: Minimum time between quiet-time runs
+        busy_timeout: Seconds a checkpoint waits for a lock
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        checkpoint_interval: timedelta = DEFAULT_CHECKPOINT_INTERVAL,
+        truncate_wal_bytes: int = DEFAULT_TRUNCATE_WAL_BYTES,
+        quiet_hours: Tuple[int, ...] = DEFAULT_QUIET_HOURS,
+        quiet_interval: timedelta = DEFAULT_QUIET_INTERVAL,
+        busy_timeout: float = 2.0,
+    ):
+        self.db_path = Path(db_path)
+        self.checkpoint_interval = checkpoint_interval
+        self.truncate_wal_bytes = truncate_wal_bytes
+        self.quiet_hours = quiet_hours
+        self.quiet_interval = quiet_interval
+        self.busy_timeout = busy_timeout
+        self.last_checkpoint: Optional[datetime] = None
+        self.last_quiet_run: Optional[datetime] = None
+
+    @property
+    def wal_path(self) -> Path:
+        return self.db_path.with_name(self.db_path.name + "-wal")
+
+    def wal_size(self) -> int:
+        """Return the size of the WAL file in bytes (0 if there is none)."""
+        try:
+            return self.wal_path.stat().st_size
+        except OSError:
+            return 0
+
+    def is_quiet(self, race_day: bool, now: datetime) -> bool:
+        """Return whether heavier maintenance may run at ``now``."""
+        return not race_day or now.hour in self.quiet_hours
+
+    def due_tasks(self, race_day: bool, now: Optional[datetime] = None) -> List[str]:
+        """Return the tasks :meth:`run_due` would run at ``now``."""
+        now = now or datetime.now()
+        if self.is_quiet(race_day, now) and (
+            self.last_quiet_run is None or now - self.last_quiet_run >= self.quiet_interval
+        ):
+            # Truncate last, so the WAL written by vacuum and ANALYZE goes too.
+            return ["incremental_vacuum", "optimize", "checkpoint_truncate"]
+        wal_size = self.wal_size()
+        if wal_size >= self.truncate_wal_bytes:
+            return ["checkpoint_truncate"]
+        if wal_size and (
+            self.last_checkpoint is None
+            or now - self.last_checkpoint >= self.checkpoint_interval
+        ):
+            return ["checkpoint_passive"]
+        return []
+
+    def run_due(self, race_day: bool, now: Optional[datetime] = None) -> List[str]:
+        """Run the maintenance that is due.
+
+        Args:
+            race_day: Whether races are held today
+            now: Current time (default: now)
+
+        Returns:
+            Names of the tasks that ran
+
+        Raises:
+            DatabaseError: If a maintenance statement fails
+        """
+        from src.database.sqlite_handler import SQLiteDatabase
+
+        now = now or datetime.now()
+        tasks = self.due_tasks(race_day, now)
+        if not tasks or not self.db_path.exists():
+            return []
+
+        done = []
+        database = SQLiteDatabase({"path": str(self.db_path), "timeout": self.busy_timeout})
+        with database:
+            for task in tasks:
+                if task == "checkpoint_passive":
+                    self._log_checkpoint("PASSIVE", database.checkpoint("PASSIVE"))
+                    self.last_checkpoint = now
+                elif task == "checkpoint_truncate":
+                    result = database.checkpoint("TRUNCATE")
+                    self._log_checkpoint("TRUNCATE", result)
+                    if not result["busy"]:
+                        self.last_checkpoint = now
+                elif task == "incremental_vacuum":
+                    if not database.incremental_vacuum():
+                        continue
+                elif task == "optimize":
+                    database.optimize()
+                    self.last_quiet_run = now
+                done.append(task)
+        return done
+
+    def _log_checkpoint(self, mode: str, result: Dict[str, int]) -> None:
+        if result["busy"]:
+            logger.info("WAL checkpoint could not complete; readers are active", mode=mode, **result)
+        else:
+            logger.info("WAL checkpoint", mode=mode, wal_bytes=self.wal_size(), **result)
+
+
+def analyze_loaded_tables(
+    database: BaseDatabase,
+    rows_by_table: Mapping[str, int],
+    min_rows: int = ANALYZE_MIN_ROWS,
+) -> List[str]:
+    """Run ``ANALYZE`` on the PostgreSQL tables an import bulk-loaded.
+
+    Other backends are left alone. Each table's statistics are committed on
+    their own, so one failure does not discard the others; call this after
+    the import's own commit.
+
+    Args:
+        database: Connected database handler
+        rows_by_table: Rows written per table (see
+            :meth:`~src.importer.importer.DataImporter.get_rows_by_table`)
+        min_rows: Tables that received fewer rows are skipped
+
+    Returns:
+        Analyzed tables
+    """
+    if database.get_db_type() != "postgresql":
+        return []
+    tables = sorted(
+        table
+        for table, rows in rows_by_table.items()
+        if rows >= min_rows and _TABLE_NAME.match(table)
+    )
+    analyzed = []
+    for table in tables:
+        try:
+            database.execute(f"ANALYZE {table}")
+            database.commit()
+        except DatabaseError as e:
+            logger.warning("ANALYZE after bulk load failed", table=table, error=str(e))
+            continue
+        analyzed.append(table)
+    if analyzed:
+        logger.info("Analyzed bulk-loaded tables", tables=analyzed)
+    return analyzed
@@ -0,0 +1,374 @@
+"""Incrementally maintained summary tables.
+
+Analytics dashboards repeatedly join NL_RA × NL_SE × NL_HR × NL_O1 to build
+per-race and per-horse summaries. :class:`MaterializedViewManager` keeps the
+results in ordinary tables:
+
+- ``MV_RACE_SUMMARY``: one row per race key with field size, winner,
+  winning time, favourite and its odds, and the main payouts. Races with
+  confirmed (NL_) data are summarised from NL_ tables; race-day races that
+  only exist in the realtime RT_ tables are summarised from those
+  (``Source`` tells which).
+- ``MV_HORSE_FORM``: one row per horse (``KettoNum``) with starts, wins,
+  places, the latest race and the average finish of the last five starts,
+  computed from NL_SE.
+
+The manager is a :class:`~src.database.changelog.ChangeListener`. Attached to
+:class:`~src.database.changelog.ChangeCaptureDatabase` (see
+``materialized_views.enabled``) it collects the race keys and horses touched
+by the importers and the realtime updater and recomputes only those rows
+right before the writer commits, in the same transaction.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+from src.utils.logger import get_logger
+
+from .base import BaseDatabase
+from .changelog import ChangeListener
+
+logger = get_logger(__name__)
+
+RACE_KEY_COLUMNS = ("Year", "MonthDay", "JyoCD", "Kaiji", "Nichiji", "RaceNum")
+
+MV_RACE_SUMMARY = "MV_RACE_SUMMARY"
+MV_HORSE_FORM = "MV_HORSE_FORM"
+
+MV_SCHEMAS = {
+    MV_RACE_SUMMARY: f"""
+        CREATE TABLE IF NOT EXISTS {MV_RACE_SUMMARY} (
+            Year INTEGER NOT NULL,
+            MonthDay INTEGER NOT NULL,
+            JyoCD TEXT NOT NULL,
+            Kaiji INTEGER NOT NULL,
+            Nichiji INTEGER NOT NULL,
+            RaceNum INTEGER NOT NULL,
+            Source TEXT NOT NULL,
+            Hondai TEXT,
+            Kyori INTEGER,
+            TrackCD TEXT,
+            FieldSize INTEGER,
+            WinnerUmaban INTEGER,
+            WinnerKettoNum TEXT,
+            WinningTime REAL,
+            FavoriteUmaban INTEGER,
+            FavoriteOdds REAL,
+            TanPay BIGINT,
+            FukuPay BIGINT,
+            UmarenPay BIGINT,
+            SanrentanPay BIGINT,
+            RefreshedAt TEXT NOT NULL,
+            PRIMARY KEY (Year, MonthDay, JyoCD, Kaiji, Nichiji, RaceNum)
+        )
+    """,
+    MV_HORSE_FORM: f"""
+        CREATE TABLE IF NOT EXISTS {MV_HORSE_FORM} (
+            KettoNum TEXT NOT NULL,
+            Bamei TEXT,
+            Starts INTEGER NOT NULL,
+            Wins INTEGER NOT NULL,
+            Top3 INTEGER NOT NULL,
+            LastRaceDate INTEGER,
+            LastKakuteiJyuni INTEGER,
+            AvgJyuniLast5 REAL,
+            RefreshedAt TEXT NOT NULL,
+            PRIMARY KEY (KettoNum)
+        )
+    """,
+}
+
+# Tables whose writes change a race summary / a horse's form.
+_RACE_SOURCE_TABLES = {
+    f"{prefix}_{suffix}" for prefix in ("NL", "RT") for suffix in ("RA", "SE", "HR", "O1")
+}
+_HORSE_SOURCE_TABLES = {"NL_SE"}
+
+# Races whose NL_RA row exists are summarised from NL_; otherwise from RT_.
+_SOURCES = ("NL", "RT")
+
+
+def _race_join(alias: str) -> str:
+    return " AND ".join(f"{alias}.{column} = ra.{column}" for column in RACE_KEY_COLUMNS)
+
+
+def _race_summary_select(prefix: str, where: str) -> str:
+    se_join = _race_join("se")
+    return f"""
+        SELECT ra.Year, ra.MonthDay, ra.JyoCD, ra.Kaiji, ra.Nichiji, ra.RaceNum,
+               '{prefix}' AS Source, ra.Hondai, ra.Kyori, ra.TrackCD,
+               (SELECT COUNT(*) FROM {prefix}_SE se
+                 WHERE {se_join} AND COALESCE(se.IJyoCD, '0') NOT IN ('1', '2')) AS FieldSize,
+               (SELECT se.Umaban FROM {prefix}_SE se
+                 WHERE {se_join} AND se.KakuteiJyuni = 1 ORDER BY se.Umaban LIMIT 1) AS WinnerUmaban,
+               (SELECT se.KettoNum FROM {prefix}_SE se
+                 WHERE {se_join} AND se.KakuteiJyuni = 1 ORDER BY se.Umaban LIMIT 1) AS WinnerKettoNum,
+               (SELECT se.Time FROM {prefix}_SE se
+                 WHERE {se_join} AND se.KakuteiJyuni = 1 ORDER BY se.Umaban LIMIT 1) AS WinningTime,
+               (SELECT se.Umaban FROM {prefix}_SE se
+                 WHERE {se_join} AND se.Ninki = 1 ORDER BY se.Umaban LIMIT 1) AS FavoriteUmaban,
+               COALESCE(
+                   (SELECT se.Odds FROM {prefix}_SE se
+                     WHERE {se_join} AND se.Ninki = 1 AND se.Odds > 0
+                     ORDER BY se.Umaban LIMIT 1),
+                   (SELECT MIN(CAST(o.TanOdds AS REAL)) / 10.0 FROM {prefix}_O1 o
+                     WHERE {_race_join("o")} AND o.TanNinki IN ('1', '01')
+                       AND o.TanOdds BETWEEN '0001' AND '9999')
+               ) AS FavoriteOdds,
+               hr.TanPay, hr.FukuPay, hr.UmarenPay, hr.SanrentanPay,
+               ? AS RefreshedAt
+          FROM {prefix}_RA ra
+          LEFT JOIN {prefix}_HR hr ON {_race_join("hr")}
+         WHERE {where}
+    """
+
+
+_HORSE_FORM_SELECT = """
+    SELECT se.KettoNum,
+           (SELECT s2.Bamei FROM NL_SE s2 WHERE s2.KettoNum = se.KettoNum
+             ORDER BY s2.Year DESC, s2.MonthDay DESC LIMIT 1) AS Bamei,
+           COUNT(*) AS Starts,
+           SUM(CASE WHEN se.KakuteiJyuni = 1 THEN 1 ELSE 0 END) AS Wins,
+           SUM(CASE WHEN se.KakuteiJyuni BETWEEN 1 AND 3 THEN 1 ELSE 0 END) AS Top3,
+           MAX(se.Year * 10000 + se.MonthDay) AS LastRaceDate,
+           (SELECT s2.KakuteiJyuni FROM NL_SE s2
+             WHERE s2.KettoNum = se.KettoNum AND s2.KakuteiJyuni > 0
+             ORDER BY s2.Year DESC, s2.MonthDay DESC LIMIT 1) AS LastKakuteiJyuni,
+           (SELECT AVG(recent.KakuteiJyuni) FROM (
+               SELECT s3.KakuteiJyuni FROM NL_SE s3
+                WHERE s3.KettoNum = se.KettoNum AND s3.KakuteiJyuni > 0
+                ORDER BY s3.Year DESC, s3.MonthDay DESC LIMIT 5) recent) AS AvgJyuniLast5,
+           ? AS RefreshedAt
+      FROM NL_SE se
+     WHERE COALESCE(se.IJyoCD, '0') NOT IN ('1', '2') AND {where}
+     GROUP BY se.KettoNum
+"""
+
+
+def _key_filter(alias: str, key: Dict[str, Any]) -> Tuple[str, tuple]:
+    columns = [column for column in RACE_KEY_COLUMNS if column in key]
+    where = " AND ".join(f"{alias}.{column} = ?" for column in columns)
+    return where, tuple(key[column] for column in columns)
+
+
+class MaterializedViewManager(ChangeListener):
+    """Create, rebuild and incrementally refresh the MV_ summary tables.
+
+    Args:
+        database: Handler used for reads and MV writes. When attached to a
+            ``ChangeCaptureDatabase`` pass the *wrapped* handler so MV writes
+            are not captured themselves.
+    """
+
+    def __init__(self, database: BaseDatabase):
+        self.database = database
+        self._pending_races: Set[Tuple[Tuple[str, Any], ...]] = set()
+        self._pending_horses: Set[str] = set()
+        self._rebuild_races = False
+        self._rebuild_horses = False
+
+    # ------------------------------------------------------------------
+    # Schema and full rebuild
+    # ------------------------------------------------------------------
+
+    def ensure_schema(self) -> None:
+        """Create the MV tables if they do not exist."""
+        for schema in MV_SCHEMAS.values():
+            self.database.execute(schema)
+
+    def rebuild(self) -> Dict[str, int]:
+        """Recompute both MV tables from scratch (does not commit).
+
+        Returns:
+            Row counts per MV table
+        """
+        self.ensure_schema()
+        self._reset()
+        return {
+            MV_RACE_SUMMARY: self._rebuild_race_summary(),
+            MV_HORSE_FORM: self._rebuild_horse_form(),
+        }
+
+    def _rebuild_race_summary(self) -> int:
+        self.database.execute(f"DELETE FROM {MV_RACE_SUMMARY}")
+        refreshed_at = self._now()
+        rows = 0
+        for prefix in _SOURCES:
+            if not self._tables_exist(prefix):
+                continue
+            where = "1 = 1"
+            if prefix != _SOURCES[0] and self._tables_exist(_SOURCES[0]):
+                where = (
+                    f"NOT EXISTS (SELECT 1 FROM {_SOURCES[0]}_RA nl "
+                    f"WHERE {_race_join('nl')})"
+                )
+            rows += max(
+                self.database.execute(
+                    f"INSERT INTO {MV_RACE_SUMMARY} "
+                    + _race_summary_select(prefix, where),
+                    (refreshed_at,),
+                ),
+                0,
+            )
+        return rows
+
+    def _rebuild_horse_form(self) -> int:
+        self.database.execute(f"DELETE FROM {MV_HORSE_FORM}")
+        if not self.database.table_exists("NL_SE"):
+            return 0
+        return max(
+            self.database.execute(
+                f"INSERT INTO {MV_HORSE_FORM} " + _HORSE_FORM_SELECT.format(where="1 = 1"),
+                (self._now(),),
+            ),
+            0,
+        )
+
+    # ------------------------------------------------------------------
+    # Incremental refresh
+    # ------------------------------------------------------------------
+
+    def mark_changes(self, changes: Iterable[tuple]) -> None:
+        """Record ``(table_name, op, key)`` changes for the next refresh."""
+        for table_name, _op, key in changes:
+            table = table_name.upper()
+            if table in _RACE_SOURCE_TABLES:
+                race_key = tuple(
+                    (column, key[column]) for column in RACE_KEY_COLUMNS if column in key
+                )
+                if race_key:
+                    self._pending_races.add(race_key)
+                else:
+                    self._rebuild_races = True
+            if table in _HORSE_SOURCE_TABLES:
+                if key.get("KettoNum") not in (None, ""):
+                    self._pending_horses.add(key["KettoNum"])
+                elif not any(column in key for column in RACE_KEY_COLUMNS):
+                    self._rebuild_horses = True
+
+    def refresh(self) -> Dict[str, int]:
+        """Recompute the MV rows affected by the recorded changes.
+
+        Returns:
+            Number of refreshed race and horse rows
+        """
+        races = 0
+        horses = 0
+        if self._rebuild_races:
+            races = self._rebuild_race_summary()
+        elif self._pending_races:
+            races = self._refresh_races(self._resolve_races(self._pending_races))
+        if self._rebuild_horses:
+            horses = self._rebuild_horse_form()
+        elif self._pending_horses:
+            horses = self._refresh_horses(sorted(self._pending_horses))
+        self._reset()
+        if races or horses:
+            logger.debug(f"Refreshed materialized views: {races} race(s), {horses} horse(s)")
+        return {MV_RACE_SUMMARY: races, MV_HORSE_FORM: horses}
+
+    def _resolve_races(
+        self, partial_keys: Iterable[Tuple[Tuple[str, Any], ...]]
+    ) -> List[Tuple[Any, ...]]:
+        """Expand partial race keys (e.g. Year + MonthDay) to full keys."""
+        races: Set[Tuple[Any, ...]] = set()
+        columns = ", ".join(RACE_KEY_COLUMNS)
+        for partial in partial_keys:
+            key = dict(partial)
+            if len(key) == len(RACE_KEY_COLUMNS):
+                races.add(tuple(key[column] for column in RACE_KEY_COLUMNS))
+                continue
+            where, params = _key_filter("t", key)
+            for table in (MV_RACE_SUMMARY, *sorted(_RACE_SOURCE_TABLES)):
+                if not self.database.table_exists(table):
+                    continue
+                for row in self.database.fetch_all(
+                    f"SELECT DISTINCT {columns} FROM {table} t WHERE {where}", params
+                ):
+                    races.add(tuple(row[column] for column in RACE_KEY_COLUMNS))
+        return sorted(races, key=lambda race: tuple(str(value) for value in race))
+
+    def _refresh_races(self, races: Sequence[Tuple[Any, ...]]) -> int:
+        refreshed_at = self._now()
+        key_where = " AND ".join(f"{column} = ?" for column in RACE_KEY_COLUMNS)
+        ra_where = " AND ".join(f"ra.{column} = ?" for column in RACE_KEY_COLUMNS)
+        available = [prefix for prefix in _SOURCES if self._tables_exist(prefix)]
+        for race in races:
+            self.database.execute(f"DELETE FROM {MV_RACE_SUMMARY} WHERE {key_where}", race)
+            for prefix in available:
+                inserted = self.database.execute(
+                    f"INSERT INTO {MV_RACE_SUMMARY} " + _race_summary_select(prefix, ra_where),
+                    (refreshed_at, *race),
+                )
+                if inserted and inserted > 0:
+                    break
+        return len(races)
+
+    def _refresh_horses(self, ketto_nums: Sequence[str]) -> int:
+        refreshed_at = self._now()
+        for start in range(0, len(ketto_nums), 500):
+            chunk = list(ketto_nums[start:start + 500])
+            placeholders = ", ".join("?" for _ in chunk)
+            self.database.execute(
+                f"DELETE FROM {MV_HORSE_FORM} WHERE KettoNum IN ({placeholders})", tuple(chunk)
+            )
+            self.database.execute(
+                f"INSERT INTO {MV_HORSE_FORM} "
+                + _HORSE_FORM_SELECT.format(where=f"se.KettoNum IN ({placeholders})"),
+                (refreshed_at, *chunk),
+            )
+        return len(ketto_nums)
+
+    # ------------------------------------------------------------------
+    # ChangeListener hooks
+    # ------------------------------------------------------------------
+
+    def on_connect(self) -> None:
+        self.ensure_schema()
+
+    def before_change(self, table_name: str, op: str, key: Dict[str, Any]) -> None:
+        """Remember the horses of NL_SE rows that are about to be deleted."""
+        if table_name.upper() not in _HORSE_SOURCE_TABLES or "KettoNum" in key:
+            return
+        if not any(column in key for column in RACE_KEY_COLUMNS):
+            self._rebuild_horses = True
+            return
+        where, params = _key_filter("se", key)
+        for row in self.database.fetch_all(
+            f"SELECT DISTINCT se.KettoNum FROM NL_SE se WHERE {where}", params
+        ):
+            self._pending_horses.add(row["KettoNum"])
+
+    def on_changes(self, changes: Sequence[tuple]) -> None:
+        self.mark_changes(changes)
+
+    def before_commit(self) -> None:
+        self.refresh()
+
+    def on_rollback(self) -> None:
+        self._reset()
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._pending_races.clear()
+        self._pending_horses.clear()
+        self._rebuild_races = False
+        self._rebuild_horses = False
+
+    def _tables_exist(self, prefix: str) -> bool:
+        return all(
+            self.database.table_exists(f"{prefix}_{suffix}")
+            for suffix in ("RA", "SE", "HR", "O1")
+        )
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec="seconds")
+
+    @property
+    def pending(self) -> Dict[str, int]:
+        """Number of race keys and horses waiting for the next refresh."""
+        return {"races": len(self._pending_races), "horses": len(self._pending_horses)}
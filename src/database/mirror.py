@@ -0,0 +1,467 @@
+"""Durable change log and asynchronous replay for dual-write mirroring.
+
+In ``async`` mirror mode :class:`~src.database.dual_handler.DualDatabase`
+does not write to the secondary from the caller's thread. Every mirrored
+write is appended to ``JLTSQL_MIRROR_LOG`` in the *primary* database inside
+the caller's transaction, so the primary rows and their log entries commit or
+roll back together. :class:`AsyncMirrorWorker` replays committed entries to
+the secondary in large batches from a background thread.
+
+The highest replayed LSN is kept in ``JLTSQL_MIRROR_STATE`` on the
+*secondary* and written in the same transaction as the replayed batch, so
+replay never writes to the primary per batch and never competes with the
+importer for SQLite's single write lock. Replayed entries are pruned from the
+primary in bulk, when the worker has caught up or when many have piled up.
+Should a backend not roll back DDL, an interrupted batch is replayed again on
+the next start; that is safe because mirrored writes are upserts,
+``IF NOT EXISTS`` DDL or key-addressed deletes.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.logger import get_logger
+
+from .base import BaseDatabase
+
+logger = get_logger(__name__)
+
+MIRROR_LOG_TABLE = "JLTSQL_MIRROR_LOG"
+MIRROR_STATE_TABLE = "JLTSQL_MIRROR_STATE"
+
+_LOG_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {MIRROR_LOG_TABLE} (
+    lsn INTEGER PRIMARY KEY AUTOINCREMENT,
+    op TEXT NOT NULL,
+    table_name TEXT,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_STATE_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {MIRROR_STATE_TABLE} (
+    name TEXT PRIMARY KEY,
+    lsn BIGINT NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+_STATE_UPSERT = (
+    f"INSERT INTO {MIRROR_STATE_TABLE} (name, lsn, updated_at) VALUES (?, ?, ?) "
+    "ON CONFLICT (name) DO UPDATE SET lsn = excluded.lsn, updated_at = excluded.updated_at"
+)
+
+_STATE_NAME = "secondary"
+
+
+@dataclass
+class MirrorEntry:
+    """One logged write operation."""
+
+    lsn: int
+    op: str
+    table_name: Optional[str]
+    payload: Any
+    created_at: str
+
+
+class MirrorLog:
+    """Append/read access to the mirror change log stored in a database.
+
+    Args:
+        database: Connected handler of the primary database. The caller owns
+            its transaction; :meth:`append` never commits.
+    """
+
+    def __init__(self, database: BaseDatabase):
+        self.database = database
+
+    def ensure_schema(self) -> None:
+        """Create the log table if it does not exist."""
+        self.database.execute(_LOG_SCHEMA)
+
+    def append(self, op: str, table_name: Optional[str], payload: Any) -> None:
+        """Append one operation to the log in the current transaction."""
+        self.database.execute(
+            f"INSERT INTO {MIRROR_LOG_TABLE} (op, table_name, payload, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                op,
+                table_name,
+                json.dumps(payload, ensure_ascii=False, default=str),
+                datetime.now().isoformat(timespec="seconds"),
+            ),
+        )
+
+    def head_lsn(self) -> int:
+        """Return the highest LSN ever assigned, 0 if nothing was logged.
+
+        Read from ``sqlite_sequence`` because :meth:`prune` removes
+        replayed entries; ``AUTOINCREMENT`` never reuses an LSN. Through the
+        writer's own connection this includes its uncommitted entries.
+        """
+        row = self.database.fetch_one(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (MIRROR_LOG_TABLE,)
+        )
+        return int((row or {}).get("seq") or 0)
+
+    def pruned_lsn(self) -> int:
+        """Return the highest LSN known to be replayed from the log alone.
+
+        Only replayed entries are pruned, so everything below the oldest
+        remaining entry has reached the secondary.
+        """
+        row = self.database.fetch_one(f"SELECT MIN(lsn) AS lsn FROM {MIRROR_LOG_TABLE}")
+        oldest = (row or {}).get("lsn")
+        return self.head_lsn() if oldest is None else int(oldest) - 1
+
+    def legacy_applied_lsn(self) -> int:
+        """Return the watermark older releases kept in the primary, 0 if none."""
+        if not self.database.table_exists(MIRROR_STATE_TABLE):
+            return 0
+        row = self.database.fetch_one(
+            f"SELECT lsn FROM {MIRROR_STATE_TABLE} WHERE name = ?", (_STATE_NAME,)
+        )
+        return int((row or {}).get("lsn") or 0)
+
+    def read(self, after_lsn: int, limit: int) -> List[MirrorEntry]:
+        """Return up to ``limit`` entries with an LSN greater than ``after_lsn``."""
+        rows = self.database.fetch_all(
+            f"SELECT lsn, op, table_name, payload, created_at FROM {MIRROR_LOG_TABLE} "
+            "WHERE lsn > ? ORDER BY lsn LIMIT ?",
+            (after_lsn, limit),
+        )
+        return [
+            MirrorEntry(
+                lsn=int(row["lsn"]),
+                op=row["op"],
+                table_name=row["table_name"],
+                payload=json.loads(row["payload"]),
+                created_at=row["created_at"],
+            )
+            for row in rows
+        ]
+
+    def oldest_pending_at(self, after_lsn: int) -> Optional[str]:
+        """Return the timestamp of the first entry not yet replayed."""
+        row = self.database.fetch_one(
+            f"SELECT created_at FROM {MIRROR_LOG_TABLE} WHERE lsn > ? ORDER BY lsn LIMIT 1",
+            (after_lsn,),
+        )
+        return row["created_at"] if row else None
+
+    def prune(self, up_to_lsn: int) -> int:
+        """Delete entries up to and including ``up_to_lsn`` and commit.
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = self.database.execute(
+            f"DELETE FROM {MIRROR_LOG_TABLE} WHERE lsn <= ?", (up_to_lsn,)
+        )
+        self.database.commit()
+        return deleted
+
+
+class MirrorState:
+    """Replay watermark stored in the secondary database.
+
+    Args:
+        database: Connected handler of the secondary. :meth:`mark_applied`
+            writes in the caller's transaction so the watermark commits with
+            the replayed batch.
+    """
+
+    def __init__(self, database: BaseDatabase):
+        self.database = database
+
+    def ensure_schema(self) -> None:
+        """Create the state table if it does not exist."""
+        self.database.execute(_STATE_SCHEMA)
+
+    def applied_lsn(self) -> Optional[int]:
+        """Return the highest LSN replayed, None if nothing was recorded."""
+        row = self.database.fetch_one(
+            f"SELECT lsn FROM {MIRROR_STATE_TABLE} WHERE name = ?", (_STATE_NAME,)
+        )
+        return None if row is None else int(row["lsn"])
+
+    def mark_applied(self, lsn: int) -> None:
+        """Record ``lsn`` as replayed in the current transaction."""
+        self.database.execute(
+            _STATE_UPSERT, (_STATE_NAME, lsn, datetime.now().isoformat(timespec="seconds"))
+        )
+
+
+def apply_entries(secondary: BaseDatabase, entries: List[MirrorEntry]) -> int:
+    """Replay log entries to ``secondary`` in order.
+
+    Consecutive row writes to the same table are merged into one
+    ``insert_many`` call, which matches sequential upsert semantics because
+    the handlers keep the last row per primary key.
+
+    Returns:
+        Number of operations issued to the secondary
+    """
+    operations = 0
+    pending_table: Optional[str] = None
+    pending_replace = True
+    pending_rows: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal operations, pending_rows
+        if pending_rows:
+            secondary.insert_many(pending_table, pending_rows, pending_replace)
+            operations += 1
+            pending_rows = []
+
+    for entry in entries:
+        payload = entry.payload
+        if entry.op in ("insert", "insert_many"):
+            rows = [payload["data"]] if entry.op == "insert" else payload["rows"]
+            use_replace = bool(payload.get("use_replace", True))
+            if pending_rows and (
+                entry.table_name != pending_table or use_replace != pending_replace
+            ):
+                flush()
+            pending_table = entry.table_name
+            pending_replace = use_replace
+            pending_rows.extend(rows)
+            continue
+
+        flush()
+        if entry.op == "execute":
+            parameters = payload.get("parameters")
+            secondary.execute(
+                payload["sql"], tuple(parameters) if parameters is not None else None
+            )
+        elif entry.op == "executemany":
+            secondary.executemany(
+                payload["sql"], [tuple(params) for params in payload["parameters"]]
+            )
+        elif entry.op == "create_table":
+            secondary.create_table(entry.table_name, payload["schema"])
+        else:
+            raise ValueError(f"Unknown mirror log operation: {entry.op!r}")
+        operations += 1
+
+    flush()
+    return operations
+
+
+class AsyncMirrorWorker:
+    """Background thread replaying the mirror log to the secondary.
+
+    The worker owns two connections that are never used by the writer
+    thread: a reader of the primary's log and the secondary itself, which
+    also holds the replay watermark. The primary is only written when
+    replayed entries are pruned: once the worker has caught up, or when
+    ``prune_entries`` replayed entries have accumulated. Failures roll back
+    the secondary batch, drop the secondary connection and retry with
+    exponential backoff, so an outage only increases lag.
+
+    Args:
+        log_reader: Unconnected handler for the primary database
+        secondary: Unconnected handler for the secondary database
+        batch_size: Maximum log entries replayed per secondary transaction
+        poll_interval: Seconds to wait for new entries when idle
+        max_backoff: Upper bound for the retry delay in seconds
+        prune_entries: Replayed entries that force a prune while busy
+            (default: 100 batches)
+    """
+
+    def __init__(
+        self,
+        log_reader: BaseDatabase,
+        secondary: BaseDatabase,
+        batch_size: int = 1000,
+        poll_interval: float = 1.0,
+        max_backoff: float = 60.0,
+        prune_entries: Optional[int] = None,
+    ):
+        self.log_reader = log_reader
+        self.secondary = secondary
+        self.batch_size = max(1, int(batch_size))
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.prune_entries = max(1, int(prune_entries or self.batch_size * 100))
+        self._log = MirrorLog(log_reader)
+        self._state = MirrorState(secondary)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._lock = threading.Lock()
+        self._applied_lsn = 0
+        self._pruned_lsn = 0
+        self._errors = 0
+        self._consecutive_failures = 0
+        self._last_error: Optional[str] = None
+        self._last_replay_at: Optional[str] = None
+        self._sleep: Callable[[float], bool] = self._stop_event.wait
+
+    @property
+    def applied_lsn(self) -> int:
+        """Highest LSN replayed to the secondary."""
+        with self._lock:
+            return self._applied_lsn
+
+    @property
+    def error_count(self) -> int:
+        """Number of failed replay attempts since start."""
+        with self._lock:
+            return self._errors
+
+    @property
+    def last_error(self) -> Optional[str]:
+        with self._lock:
+            return self._last_error
+
+    @property
+    def last_replay_at(self) -> Optional[str]:
+        with self._lock:
+            return self._last_replay_at
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Connect the log reader and start the replay thread.
+
+        Until the secondary is reached the watermark is estimated from the
+        log itself: pruned entries have all been replayed.
+        """
+        if self.is_running():
+            return
+        self.log_reader.connect()
+        pruned = max(self._log.pruned_lsn(), self._log.legacy_applied_lsn())
+        with self._lock:
+            self._applied_lsn = self._pruned_lsn = pruned
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="jltsql-mirror", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Async mirror worker started at LSN {self._applied_lsn}")
+
+    def notify(self) -> None:
+        """Wake the worker after new entries were committed."""
+        self._wake_event.set()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the worker; unreplayed entries stay in the durable log."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("Mirror worker did not stop gracefully")
+                return
+        self._thread = None
+        for database in (self.secondary, self.log_reader):
+            try:
+                if database.is_connected():
+                    database.disconnect()
+            except Exception as e:
+                logger.warning(f"Mirror worker disconnect failed: {e}")
+
+    def replay_once(self) -> int:
+        """Replay one batch synchronously.
+
+        Returns:
+            Number of log entries replayed (0 when the log is drained)
+        """
+        entries = self._log.read(self.applied_lsn, self.batch_size)
+        if not entries:
+            return 0
+        if not self.secondary.is_connected():
+            self._connect_secondary()
+            entries = self._log.read(self.applied_lsn, self.batch_size)
+            if not entries:
+                return 0
+        try:
+            self.secondary.begin_transaction()
+            apply_entries(self.secondary, entries)
+            self._state.mark_applied(entries[-1].lsn)
+            self.secondary.commit()
+        except Exception:
+            try:
+                self.secondary.rollback()
+            except Exception:
+                pass
+            raise
+        last_lsn = entries[-1].lsn
+        with self._lock:
+            self._applied_lsn = last_lsn
+            self._last_replay_at = datetime.now().isoformat(timespec="seconds")
+            self._consecutive_failures = 0
+        return len(entries)
+
+    def _connect_secondary(self) -> None:
+        """Connect the secondary and resume from the watermark it holds."""
+        self.secondary.connect()
+        self._state.ensure_schema()
+        applied = self._state.applied_lsn()
+        self.secondary.commit()
+        if applied is None:
+            # First start after an upgrade: the watermark was in the primary.
+            applied = max(self._log.legacy_applied_lsn(), self._pruned_lsn)
+        with self._lock:
+            self._applied_lsn = applied
+
+    def prune(self) -> int:
+        """Delete replayed entries from the primary's log in one statement.
+
+        Returns:
+            Number of entries deleted
+        """
+        applied = self.applied_lsn
+        if applied <= self._pruned_lsn:
+            return 0
+        deleted = self._log.prune(applied)
+        self._pruned_lsn = applied
+        return deleted
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                replayed = self.replay_once()
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                    self._consecutive_failures += 1
+                    self._last_error = str(e)
+                    failures = self._consecutive_failures
+                delay = min(self.max_backoff, self.poll_interval * (2 ** min(failures, 16)))
+                logger.warning(
+                    f"Async mirror replay failed (attempt {failures}, retry in {delay:.1f}s): {e}"
+                )
+                try:
+                    self.secondary.disconnect()
+                except Exception:
+                    pass
+                self._sleep(delay)
+                continue
+            if replayed == 0 or self.applied_lsn - self._pruned_lsn >= self.prune_entries:
+                try:
+                    self.prune()
+                except Exception as e:
+                    # Pruning only reclaims space; retry on the next pass.
+                    logger.warning(f"Async mirror log prune failed: {e}")
+            if replayed < self.batch_size:
+                self._wake_event.wait(self.poll_interval)
+                self._wake_event.clear()
+
+    def wait_until(self, lsn: int, timeout: float = 30.0) -> bool:
+        """Block until ``lsn`` has been replayed or ``timeout`` elapses."""
+        deadline = time.monotonic() + timeout
+        while self.applied_lsn < lsn:
+            if time.monotonic() >= deadline:
+                return False
+            self._wake_event.set()
+            time.sleep(0.05)
+        return True
@@ -0,0 +1,288 @@
+"""Declarative range partitioning for the large PostgreSQL tables.
+
+``NL_SE`` and the odds tables (``NL_O1``-``NL_O6``, ``TS_O1``-``TS_O6``,
+``TS_SOKUHO_O1``-``TS_SOKUHO_O6``) grow by millions of rows per year. With
+``databases.postgresql.partitioning.enabled`` set, :class:`SchemaManager`
+creates them as ``PARTITION BY RANGE (Year)`` parents with one child table per
+year (``nl_se_y2026`` covers ``Year >= 2026 AND Year < 2027``). Every partitioned
+table carries ``Year`` in its primary key, so the existing
+``INSERT ... ON CONFLICT`` upserts work unchanged against the parent and
+PostgreSQL routes each row to its year. :class:`PartitionManager` creates the
+missing year partitions just before a batch is written, builds indexes one
+partition at a time, and implements retention by dropping whole partitions
+instead of running ``DELETE`` + ``VACUUM``.
+
+Partitioning only applies to tables created while it is enabled; existing
+heap tables are left as they are. SQLite and ``dual`` mode are unaffected.
+"""
+
+import re
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from src.utils.logger import get_logger
+
+from .base import BaseDatabase, DatabaseError
+
+logger = get_logger(__name__)
+
+PARTITION_COLUMN = "Year"
+
+PARTITIONED_TABLES = frozenset(
+    ["NL_SE"]
+    + [f"NL_O{n}" for n in range(1, 7)]
+    + [f"TS_O{n}" for n in range(1, 7)]
+    + [f"TS_SOKUHO_O{n}" for n in range(1, 7)]
+)
+
+_BOUND_RE = re.compile(r"FROM\s*\((-?\d+)\)\s*TO\s*\((-?\d+)\)", re.IGNORECASE)
+_INDEX_RE = re.compile(
+    r"CREATE\s+(UNIQUE\s+)?INDEX\s+IF\s+NOT\s+EXISTS\s+(\w+)\s+ON\s+(\w+)\s*(\(.*\))\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def partition_name(table_name: str, year: int) -> str:
+    """Return the child table name holding ``year`` of ``table_name``."""
+    return f"{table_name.lower()}_y{int(year)}"
+
+
+def partitioned_ddl(schema_sql: str) -> str:
+    """Turn a ``CREATE TABLE`` statement into a ``PARTITION BY RANGE`` parent.
+
+    Args:
+        schema_sql: CREATE TABLE statement from ``SCHEMAS``
+
+    Returns:
+        The same statement with ``PARTITION BY RANGE (Year)`` appended
+    """
+    statement = schema_sql.strip().rstrip(";").rstrip()
+    return f"{statement} PARTITION BY RANGE ({PARTITION_COLUMN})"
+
+
+def partitioning_handler(db: Any) -> Optional[BaseDatabase]:
+    """Return the PostgreSQL handler behind ``db`` if partitioning is enabled.
+
+    Follows ``wrapped`` through :class:`~src.database.changelog.ChangeCaptureDatabase`.
+    ``dual`` mode executes DDL on SQLite as well and is never partitioned.
+    """
+    from .changelog import unwrap_database
+
+    db = unwrap_database(db)
+    if getattr(db, "partitioning", False) is True and db.get_db_type() == "postgresql":
+        return db
+    return None
+
+
+def _years(values: Iterable[Any]) -> Set[int]:
+    years = set()
+    for value in values:
+        try:
+            years.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return years
+
+
+def _row_years(rows: Iterable[Dict[str, Any]]) -> Set[int]:
+    values = []
+    for row in rows:
+        value = row.get(PARTITION_COLUMN)
+        if value is None:
+            value = row.get(PARTITION_COLUMN.lower())
+        values.append(value)
+    return _years(values)
+
+
+class PartitionManager:
+    """Create, list and drop the year partitions of partitioned tables.
+
+    Known partitions are cached per table so steady-state imports issue no
+    catalog queries. The cache is cleared on rollback because partitions
+    created inside a rolled-back transaction no longer exist.
+
+    Examples:
+        >>> manager = PartitionManager(db)
+        >>> manager.ensure_partitions("NL_SE", [2025, 2026])
+        >>> manager.drop_partitions_before("NL_SE", 2016)
+    """
+
+    def __init__(self, database: BaseDatabase):
+        """Initialize partition manager.
+
+        Args:
+            database: PostgreSQL database handler
+        """
+        self.database = database
+        self._partitioned: Dict[str, bool] = {}
+        self._years: Dict[str, Set[int]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached catalog lookups."""
+        self._partitioned.clear()
+        self._years.clear()
+
+    def is_partitioned(self, table_name: str) -> bool:
+        """Check whether ``table_name`` exists as a partitioned parent table."""
+        key = table_name.upper()
+        if key not in self._partitioned:
+            row = self.database.fetch_one(
+                "SELECT COUNT(*) AS n FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(?)",
+                (table_name.lower(),),
+            )
+            self._partitioned[key] = bool(row and row["n"])
+        return self._partitioned[key]
+
+    def list_partitions(self, table_name: str) -> List[Dict[str, Any]]:
+        """List the partitions of a table.
+
+        Args:
+            table_name: Partitioned parent table
+
+        Returns:
+            ``{"name", "year_from", "year_to"}`` dicts ordered by year
+        """
+        rows = self.database.fetch_all(
+            "SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(?)",
+            (table_name.lower(),),
+        )
+        partitions = []
+        for row in rows:
+            match = _BOUND_RE.search(row["bound"] or "")
+            if match is None:
+                continue
+            partitions.append(
+                {
+                    "name": row["name"],
+                    "year_from": int(match.group(1)),
+                    "year_to": int(match.group(2)),
+                }
+            )
+        return sorted(partitions, key=lambda partition: partition["year_from"])
+
+    def ensure_partitions(self, table_name: str, years: Iterable[int]) -> int:
+        """Create the year partitions that do not exist yet.
+
+        Args:
+            table_name: Partitioned parent table
+            years: Years about to be written
+
+        Returns:
+            Number of partitions created
+        """
+        key = table_name.upper()
+        if not self.is_partitioned(table_name):
+            return 0
+        known = self._years.get(key)
+        if known is None:
+            known = {
+                year
+                for partition in self.list_partitions(table_name)
+                for year in range(partition["year_from"], partition["year_to"])
+            }
+            self._years[key] = known
+        created = 0
+        for year in sorted(set(years) - known):
+            self.database.execute(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(table_name, year)} "
+                f"PARTITION OF {table_name.lower()} "
+                f"FOR VALUES FROM ({year}) TO ({year + 1})"
+            )
+            known.add(year)
+            created += 1
+            logger.info(f"Created partition {partition_name(table_name, year)}")
+        return created
+
+    def ensure_row_partitions(self, table_name: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Create the partitions needed for ``rows`` of ``table_name``."""
+        if table_name.upper() not in PARTITIONED_TABLES:
+            return 0
+        return self.ensure_partitions(table_name, _row_years(rows))
+
+    def ensure_value_partitions(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+    ) -> int:
+        """:meth:`ensure_row_partitions` for value tuples in ``columns`` order."""
+        if table_name.upper() not in PARTITIONED_TABLES:
+            return 0
+        lowered = [column.lower() for column in columns]
+        if PARTITION_COLUMN.lower() not in lowered:
+            return 0
+        index = lowered.index(PARTITION_COLUMN.lower())
+        return self.ensure_partitions(table_name, _years(row[index] for row in rows))
+
+    def drop_partitions_before(self, table_name: str, year: int) -> List[str]:
+        """Drop every partition holding only years before ``year``.
+
+        Args:
+            table_name: Partitioned parent table
+            year: First year to keep
+
+        Returns:
+            Names of the dropped partitions
+        """
+        if not self.is_partitioned(table_name):
+            raise DatabaseError(f"{table_name} is not a partitioned table")
+        dropped = []
+        for partition in self.list_partitions(table_name):
+            if partition["year_to"] > year:
+                continue
+            self.database.execute(f"DROP TABLE IF EXISTS {partition['name']}")
+            dropped.append(partition["name"])
+            logger.info(f"Dropped partition {partition['name']}")
+        self._years.pop(table_name.upper(), None)
+        return dropped
+
+    def apply_retention(self, retention_years: int, today: Optional[date] = None) -> Dict[str, List[str]]:
+        """Drop partitions older than ``retention_years`` from every partitioned table.
+
+        Args:
+            retention_years: Number of years to keep, including the current year
+            today: Reference date (default: today)
+
+        Returns:
+            Dictionary mapping table names to dropped partitions
+        """
+        if retention_years < 1:
+            raise DatabaseError("retention_years must be at least 1")
+        first_kept = (today or date.today()).year - retention_years + 1
+        results = {}
+        for table_name in sorted(PARTITIONED_TABLES):
+            if self.is_partitioned(table_name):
+                results[table_name] = self.drop_partitions_before(table_name, first_kept)
+        return results
+
+    def create_partitioned_index(self, statement: str) -> None:
+        """Build an index on a partitioned table one partition at a time.
+
+        ``CREATE INDEX`` on a partitioned parent builds every partition inside
+        one statement while holding locks on all of them. Creating the parent
+        index with ``ON ONLY`` and attaching per-partition indexes keeps each
+        build to a single year; partitions created later inherit the index.
+
+        Args:
+            statement: ``CREATE INDEX IF NOT EXISTS name ON table(...)`` statement
+        """
+        match = _INDEX_RE.match(statement.strip())
+        if match is None:
+            self.database.execute(statement)
+            return
+        unique, index_name, table_name, columns = match.groups()
+        unique = unique or ""
+        self.database.execute(
+            f"CREATE {unique}INDEX IF NOT EXISTS {index_name} "
+            f"ON ONLY {table_name.lower()} {columns}"
+        )
+        for partition in self.list_partitions(table_name):
+            child_index = f"{partition['name']}_{index_name}"[:63]
+            self.database.execute(
+                f"CREATE {unique}INDEX IF NOT EXISTS {child_index} "
+                f"ON {partition['name']} {columns}"
+            )
+            self.database.execute(f"ALTER INDEX {index_name} ATTACH PARTITION {child_index}")
@@ -3,7 +3,10 @@
 This module provides PostgreSQL database operations for JLTSQL.
 """
 
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 try:
     import psycopg
@@ -20,12 +23,58 @@ except ImportError:
             "or the fallback driver: pip install pg8000"
         )
 
-from src.database.base import BaseDatabase, DatabaseError
+from src.database.base import COMMIT_SECONDS, BaseDatabase, DatabaseError
+from src.database.partitioning import PartitionManager
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _normalize_numeric(cast: Callable[[str], Any], value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        text = value.strip()
+        if not text or set(text) <= {"*"}:
+            return None
+        try:
+            return cast(text)
+        except ValueError:
+            return None
+    if value == "":
+        return None
+    return value
+
+
+def _normalize_integer(value: Any) -> Any:
+    return _normalize_numeric(int, value)
+
+
+def _normalize_real(value: Any) -> Any:
+    return _normalize_numeric(float, value)
+
+
+@lru_cache(maxsize=None)
+def _column_normalizer(table_name: str, column: str) -> Optional[Callable[[Any], Any]]:
+    """Return the insert normalizer of a numeric column, or None for pass-through.
+
+    Resolved once per (table, column); see
+    :meth:`PostgreSQLDatabase._normalize_insert_value`.
+    """
+    try:
+        from src.database.schema_types import get_column_type
+
+        column_type = get_column_type(table_name, column)
+    except Exception:
+        column_type = None
+
+    if column_type in ("INTEGER", "BIGINT"):
+        return _normalize_integer
+    if column_type == "REAL":
+        return _normalize_real
+    return None
+
+
 class PostgreSQLDatabase(BaseDatabase):
     """PostgreSQL database handler.
 
@@ -40,6 +89,8 @@ class PostgreSQLDatabase(BaseDatabase):
         - password: Database password
         - sslmode: SSL mode (default: prefer)
         - connect_timeout: Connection timeout in seconds (default: 10)
+        - partitioning: ``{"enabled": bool, "retention_years": int}``; see
+          :mod:`src.database.partitioning`
 
     Examples:
         >>> config = {
@@ -68,6 +119,9 @@ class PostgreSQLDatabase(BaseDatabase):
         self.sslmode = config.get("sslmode", "prefer")
         self.connect_timeout = config.get("connect_timeout", 10)
         self._transaction_active = False
+        partitioning = config.get("partitioning") or {}
+        self.partitioning = bool(partitioning.get("enabled", False))
+        self.partitions = PartitionManager(self)
 
     def get_db_type(self) -> str:
         """Get database type identifier.
@@ -576,6 +630,7 @@ class PostgreSQLDatabase(BaseDatabase):
             raise DatabaseError("Database not connected")
 
         try:
+            started = time.perf_counter()
             if DRIVER == "pg8000":
                 if self._transaction_active:
                     self._connection.run("COMMIT")
@@ -584,6 +639,7 @@ class PostgreSQLDatabase(BaseDatabase):
                 self._connection.commit()
                 logger.debug("Transaction committed")
                 self._transaction_active = False
+            COMMIT_SECONDS.labels("postgresql").observe(time.perf_counter() - started)
 
         except Exception as e:
             raise DatabaseError(f"Failed to commit transaction: {e}")
@@ -621,6 +677,7 @@ class PostgreSQLDatabase(BaseDatabase):
                 self._connection.rollback()
                 logger.debug("Transaction rolled back")
                 self._transaction_active = False
+            self.partitions.clear_cache()
 
         except DatabaseError:
             raise
@@ -653,37 +710,8 @@ class PostgreSQLDatabase(BaseDatabase):
         convert only blank/placeholder numeric fields to NULL and leave text
         fields intact. Odds records use '*' placeholders for unavailable odds.
         """
-        try:
-            from src.database.schema_types import get_column_type
-
-            column_type = get_column_type(table_name, column)
-        except Exception:
-            column_type = None
-
-        if column_type not in ("INTEGER", "BIGINT", "REAL"):
-            return value
-
-        if value is None:
-            return None
-
-        if isinstance(value, str):
-            text = value.strip()
-            if not text or set(text) <= {"*"}:
-                return None
-            if column_type in ("INTEGER", "BIGINT"):
-                try:
-                    return int(text)
-                except ValueError:
-                    return None
-            if column_type == "REAL":
-                try:
-                    return float(text)
-                except ValueError:
-                    return None
-
-        if value == "":
-            return None
-        return value
+        normalizer = _column_normalizer(table_name, column)
+        return value if normalizer is None else normalizer(value)
 
     @classmethod
     def _normalize_insert_data(cls, table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -693,6 +721,28 @@ class PostgreSQLDatabase(BaseDatabase):
             for column, value in data.items()
         }
 
+    @staticmethod
+    def _normalize_insert_rows(
+        table_name: str,
+        columns: Sequence[str],
+        rows: List[tuple],
+    ) -> List[tuple]:
+        """Normalize value tuples; only numeric columns are touched."""
+        normalizers = [
+            (index, normalizer)
+            for index, column in enumerate(columns)
+            if (normalizer := _column_normalizer(table_name, column)) is not None
+        ]
+        if not normalizers:
+            return rows
+        normalized = []
+        for row in rows:
+            values = list(row)
+            for index, normalizer in normalizers:
+                values[index] = normalizer(values[index])
+            normalized.append(tuple(values))
+        return normalized
+
     @staticmethod
     def _dedupe_rows_by_primary_key(
         rows: List[Dict[str, Any]],
@@ -716,14 +766,29 @@ class PostgreSQLDatabase(BaseDatabase):
         if any(column is None for column in resolved_pk_columns):
             return rows
 
+        # dict keeps the first insertion position of a key and its last row.
         deduped: Dict[tuple, Dict[str, Any]] = {}
-        order: List[tuple] = []
         for row in rows:
-            key = tuple(row.get(column) for column in resolved_pk_columns)
-            if key not in deduped:
-                order.append(key)
-            deduped[key] = row
-        return [deduped[key] for key in order]
+            deduped[tuple([row.get(column) for column in resolved_pk_columns])] = row
+        return list(deduped.values())
+
+    @staticmethod
+    def _dedupe_value_rows(
+        columns: Sequence[str],
+        rows: List[tuple],
+        pk_columns: List[str],
+    ) -> List[tuple]:
+        """:meth:`_dedupe_rows_by_primary_key` for value tuples in ``columns`` order."""
+        if not rows or not pk_columns:
+            return rows
+        index_by_lower = {column.lower(): index for index, column in enumerate(columns)}
+        pk_indexes = [index_by_lower.get(column.lower()) for column in pk_columns]
+        if None in pk_indexes:
+            return rows
+        deduped: Dict[tuple, tuple] = {}
+        for row in rows:
+            deduped[tuple([row[index] for index in pk_indexes])] = row
+        return list(deduped.values())
 
     def insert(self, table_name: str, data: Dict[str, Any], use_replace: bool = True) -> int:
         """Insert single row into table.
@@ -745,6 +810,8 @@ class PostgreSQLDatabase(BaseDatabase):
             raise DatabaseError("No data provided for insert")
 
         data = self._normalize_insert_data(table_name, data)
+        if self.partitioning:
+            self.partitions.ensure_row_partitions(table_name, [data])
         columns = list(data.keys())
         values = list(data.values())
         placeholders = ", ".join(["?" for _ in columns])
@@ -795,17 +862,23 @@ class PostgreSQLDatabase(BaseDatabase):
         if not data_list:
             raise DatabaseError("No data provided for insert")
 
-        data_list = [self._normalize_insert_data(table_name, row) for row in data_list]
-
-        # Use the union of all row keys. Expanded records can be heterogeneous
-        # (for example O1 horse rows vs bracket-quinella rows).
-        columns: List[str] = []
-        seen_columns = set()
-        for row in data_list:
-            for column in row.keys():
-                if column not in seen_columns:
-                    columns.append(column)
-                    seen_columns.add(column)
+        columns = self._batch_columns(data_list)
+        return self._insert_rows(
+            table_name, columns, self._batch_values(data_list, columns), use_replace
+        )
+
+    def _insert_rows(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: List[tuple],
+        use_replace: bool = True,
+    ) -> int:
+        """Upsert value tuples given in ``columns`` order with multi-row VALUES."""
+        rows = self._normalize_insert_rows(table_name, columns, rows)
+        if self.partitioning:
+            self.partitions.ensure_value_partitions(table_name, columns, rows)
+
         placeholders = ", ".join(["?" for _ in columns])
         row_placeholders = f"({placeholders})"
         # Quote column names (lowercase for PostgreSQL)
@@ -814,7 +887,7 @@ class PostgreSQLDatabase(BaseDatabase):
         if use_replace:
             # Get primary key columns for this table
             pk_columns = self._get_primary_key_columns(table_name)
-            data_list = self._dedupe_rows_by_primary_key(data_list, pk_columns)
+            rows = self._dedupe_value_rows(columns, rows, pk_columns)
 
             if pk_columns:
                 # Build ON CONFLICT DO UPDATE clause
@@ -838,17 +911,14 @@ class PostgreSQLDatabase(BaseDatabase):
         inserted = 0
         max_params = 30000
         chunk_size = max(1, max_params // max(1, len(columns)))
-        for start in range(0, len(data_list), chunk_size):
-            chunk = data_list[start:start + chunk_size]
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
             values_sql = ", ".join([row_placeholders] * len(chunk))
             sql = (
                 f"INSERT INTO {table_name} ({', '.join(quoted_columns)}) "
                 f"VALUES {values_sql}{conflict_sql}"
             )
-            flat_values = []
-            for row in chunk:
-                flat_values.extend(row.get(col) for col in columns)
-            self.execute(sql, tuple(flat_values))
+            self.execute(sql, tuple(chain.from_iterable(chunk)))
             inserted += len(chunk)
 
         return inserted
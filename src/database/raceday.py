@@ -0,0 +1,314 @@
+"""Per-race verification figures for race-day checks.
+
+``scripts/raceday_verify.py`` runs every 30 minutes while races are on, which
+is also when the realtime writer is busiest. :class:`RaceDayVerifier` collects
+every per-race figure the verification needs -- race headers, starters,
+confirmed winners, payouts, final and speed-report odds and timeseries odds
+snapshots -- with a single grouped ``UNION ALL`` query over the day, through
+any :class:`~src.database.base.BaseDatabase`.
+
+Figures are persisted per race (``YYYYMMDDJJKKNNRR``) in a JSON state file.
+Before querying, the verifier reads a cheap write version of every table and
+re-reads only the tables written since the previous run; the figures of the
+other tables are carried over from the state:
+
+- SQLite: ``MAX(rowid)``. Upserts are ``INSERT OR REPLACE``, which gives
+  every written row a new rowid. Deleting rows other than the newest one is
+  not detected; run without state to recount.
+- PostgreSQL: the insert/update/delete counters of ``pg_stat_user_tables``
+  (summed over the yearly partitions). The statistics are flushed shortly
+  after commit, so a write committed just before a run may only be picked up
+  by the next one.
+
+Example:
+    >>> verifier = RaceDayVerifier(database, "20260815",
+    ...                            state_path="data/raceday_state_20260815.json")
+    >>> result = verifier.run()
+    >>> result.count("NL_SE", "winners"), result.changed
+"""
+
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.logger import get_logger
+
+from .base import BaseDatabase
+
+logger = get_logger(__name__)
+
+_WINNERS = "SUM(CASE WHEN KakuteiJyuni = 1 THEN 1 ELSE 0 END)"
+_SNAPSHOTS = "COUNT(DISTINCT HassoTime)"
+_LATEST = "MAX(HassoTime)"
+
+# Figures read per race from each table besides its row count.
+RACE_TABLES: Dict[str, Dict[str, str]] = {
+    "NL_RA": {},
+    "RT_RA": {},
+    "NL_SE": {"winners": _WINNERS},
+    "RT_SE": {"winners": _WINNERS},
+    "NL_H1": {},
+    "NL_H6": {},
+    "RT_H1": {},
+    "RT_H6": {},
+    **{f"{prefix}_O{number}": {} for prefix in ("NL", "RT") for number in range(1, 7)},
+    **{
+        f"TS_SOKUHO_O{number}": {"snapshots": _SNAPSHOTS, "latest": _LATEST}
+        for number in range(1, 7)
+    },
+}
+
+_FIGURES = ("winners", "snapshots", "latest")
+_PARTITION_SUFFIX = re.compile(r"_y\d{4}$")
+
+
+@dataclass
+class RaceDayResult:
+    """Per-race figures of one race day.
+
+    Attributes:
+        race_date: Race day (YYYYMMDD)
+        races: Race records keyed by ``YYYYMMDDJJKKNNRR``. Each carries its
+            ``JyoCD``/``Kaiji``/``Nichiji``/``RaceNum``, ``tables`` (table
+            name to ``{"rows": n, ...}``) and ``changed_at``.
+        changed: Races whose figures changed since the previous run (all
+            races on a run without state)
+        queried_tables: Tables read by this run
+        missing_tables: Race tables that do not exist
+    """
+
+    race_date: str
+    races: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    changed: List[str] = field(default_factory=list)
+    queried_tables: List[str] = field(default_factory=list)
+    missing_tables: List[str] = field(default_factory=list)
+
+    def count(self, table: str, figure: str = "rows") -> int:
+        """Sum a figure of ``table`` over all races."""
+        return sum(
+            int(race["tables"].get(table, {}).get(figure) or 0)
+            for race in self.races.values()
+        )
+
+    def races_with(self, table: str) -> int:
+        """Number of races that have rows in ``table``."""
+        return sum(1 for race in self.races.values() if table in race["tables"])
+
+    def latest(self, table: str) -> Optional[str]:
+        """Latest ``HassoTime`` snapshot of a timeseries table."""
+        values = [
+            str(race["tables"][table]["latest"])
+            for race in self.races.values()
+            if race["tables"].get(table, {}).get("latest")
+        ]
+        return max(values) if values else None
+
+    def venues(self, table: str) -> Dict[str, int]:
+        """Races with rows in ``table`` per JyoCD."""
+        venues: Dict[str, int] = {}
+        for race in self.races.values():
+            if table in race["tables"]:
+                venues[race["JyoCD"]] = venues.get(race["JyoCD"], 0) + 1
+        return dict(sorted(venues.items()))
+
+    def duplicate_race_keys(self, table: str) -> int:
+        """Venue/race numbers stored under more than one Kaiji/Nichiji."""
+        seen: Dict[tuple, int] = {}
+        for race in self.races.values():
+            if table in race["tables"]:
+                key = (race["JyoCD"], race["RaceNum"])
+                seen[key] = seen.get(key, 0) + 1
+        return sum(1 for count in seen.values() if count > 1)
+
+
+class RaceDayVerifier:
+    """Collect per-race figures of a race day, re-reading only written tables.
+
+    Args:
+        database: Connected database handler
+        race_date: Race day (YYYYMMDD)
+        state_path: JSON state file of the previous run. Without it every
+            run reads all tables.
+    """
+
+    def __init__(
+        self,
+        database: BaseDatabase,
+        race_date: str,
+        state_path: Optional[str] = None,
+    ):
+        self.database = database
+        self.race_date = race_date
+        self.state_path = Path(state_path) if state_path else None
+        self.db_type = database.get_db_type()
+
+    def run(self) -> RaceDayResult:
+        """Read the figures of every table written since the previous run.
+
+        Returns:
+            :class:`RaceDayResult` of the day
+        """
+        existing = self._existing_tables()
+        result = RaceDayResult(
+            race_date=self.race_date,
+            missing_tables=[table for table in RACE_TABLES if table not in existing],
+        )
+        versions = self._table_versions(existing)
+        state = self._load_state()
+        previous_versions = state.get("versions", {})
+        previous_races = state.get("races", {})
+        result.queried_tables = [
+            table
+            for table in existing
+            if table not in versions
+            or table not in previous_versions
+            or versions[table] != previous_versions[table]
+        ]
+
+        races: Dict[str, Dict[str, Any]] = {}
+        for race_id, record in previous_races.items():
+            kept = {
+                table: figures
+                for table, figures in record["tables"].items()
+                if table in existing and table not in result.queried_tables
+            }
+            if kept:
+                races[race_id] = {**record, "tables": kept}
+        for row in self._query(result.queried_tables):
+            race_id, race = self._race(races, row)
+            figures = {"rows": int(row["row_count"] or 0)}
+            for name in RACE_TABLES[row["table_name"]]:
+                if row.get(name) is not None:
+                    figures[name] = row[name] if name == "latest" else int(row[name])
+            race["tables"][row["table_name"]] = figures
+
+        now = datetime.now().isoformat(timespec="seconds")
+        for race_id, race in races.items():
+            previous = previous_races.get(race_id)
+            if previous is None or previous.get("tables") != race["tables"]:
+                race["changed_at"] = now
+                result.changed.append(race_id)
+        result.changed.sort()
+        result.races = dict(sorted(races.items()))
+
+        if self.state_path is not None:
+            self._save_state({
+                "race_date": self.race_date,
+                "database": self._database_label(),
+                "checked_at": now,
+                "versions": versions,
+                "races": result.races,
+            })
+        logger.debug(
+            "Race-day figures collected",
+            race_date=self.race_date,
+            races=len(result.races),
+            changed=len(result.changed),
+            queried_tables=len(result.queried_tables),
+        )
+        return result
+
+    def _race(self, races: Dict[str, Dict[str, Any]], row: Dict[str, Any]) -> tuple:
+        jyo = str(row["jyo"]).zfill(2)
+        kaiji, nichiji, race_num = int(row["kaiji"]), int(row["nichiji"]), int(row["race_num"])
+        race_id = f"{self.race_date}{jyo}{kaiji:02d}{nichiji:02d}{race_num:02d}"
+        race = races.setdefault(race_id, {
+            "JyoCD": jyo,
+            "Kaiji": kaiji,
+            "Nichiji": nichiji,
+            "RaceNum": race_num,
+            "tables": {},
+        })
+        return race_id, race
+
+    def _existing_tables(self) -> List[str]:
+        if self.db_type == "postgresql":
+            rows = self.database.fetch_all(
+                "SELECT table_name AS name FROM information_schema.tables "
+                "WHERE table_schema = current_schema()"
+            )
+        else:
+            rows = self.database.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        names = {str(row["name"]).upper() for row in rows}
+        return [table for table in RACE_TABLES if table in names]
+
+    def _table_versions(self, tables: List[str]) -> Dict[str, Optional[int]]:
+        """Return a value that changes whenever a table is written.
+
+        Tables without a known version are left out and always re-read.
+        """
+        if not tables:
+            return {}
+        if self.db_type == "postgresql":
+            rows = self.database.fetch_all(
+                "SELECT relname, n_tup_ins + n_tup_upd + n_tup_del AS writes "
+                "FROM pg_stat_user_tables WHERE schemaname = current_schema()"
+            )
+            versions: Dict[str, Optional[int]] = {}
+            for row in rows:
+                table = _PARTITION_SUFFIX.sub("", str(row["relname"])).upper()
+                if table in tables:
+                    versions[table] = (versions.get(table) or 0) + int(row["writes"] or 0)
+            return versions
+        row = self.database.fetch_one(
+            "SELECT "
+            + ", ".join(f"(SELECT MAX(rowid) FROM {table}) AS v{index}" for index, table in enumerate(tables))
+        ) or {}
+        return {table: row.get(f"v{index}") for index, table in enumerate(tables)}
+
+    def _query(self, tables: List[str]) -> List[Dict[str, Any]]:
+        """Read the per-race figures of ``tables`` in one statement."""
+        if not tables:
+            return []
+        selects = []
+        for table in tables:
+            figures = RACE_TABLES[table]
+            columns = ", ".join(f"{figures.get(name, 'NULL')} AS {name}" for name in _FIGURES)
+            selects.append(
+                f"SELECT '{table}' AS table_name, JyoCD AS jyo, Kaiji AS kaiji, "
+                f"Nichiji AS nichiji, RaceNum AS race_num, COUNT(*) AS row_count, {columns} "
+                f"FROM {table} WHERE Year = ? AND MonthDay = ? "
+                "GROUP BY JyoCD, Kaiji, Nichiji, RaceNum"
+            )
+        year, month_day = int(self.race_date[:4]), int(self.race_date[4:])
+        return self.database.fetch_all(
+            "\nUNION ALL\n".join(selects), (year, month_day) * len(selects)
+        )
+
+    def _database_label(self) -> str:
+        config = getattr(self.database, "config", None) or {}
+        if self.db_type == "postgresql":
+            return (
+                f"postgresql://{config.get('host', 'localhost')}:"
+                f"{config.get('port', 5432)}/{config.get('database', 'keiba')}"
+            )
+        return str(Path(config.get("path", "")).resolve())
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self.state_path is None:
+            return {}
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if state.get("race_date") != self.race_date or state.get("database") != self._database_label():
+            return {}
+        return state
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+            os.replace(temp_name, self.state_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,176 @@
+"""Read-only SQLite reader connections.
+
+Exports, verification scripts and the race-day schedule only read the
+database while the realtime updater writes to it. :func:`open_reader` opens
+a ``mode=ro`` URI connection with ``query_only`` and memory-mapped I/O. In
+WAL mode such a reader sees the last committed snapshot and never takes the
+write lock, so an analytics query cannot make the writer time out with
+``database is locked``, and a running write transaction does not block the
+reader.
+
+Readers run in autocommit mode: a read transaction, and with it the WAL
+snapshot, ends when a statement's rows have been fetched, so an idle reader
+never holds back a checkpoint.
+
+:class:`ReaderPool` keeps one reader per thread for code that queries
+repeatedly; :func:`reader_pool` returns the process-wide pool of a file.
+
+Example:
+    >>> conn = reader_pool("data/keiba.db").connection()
+    >>> conn.execute("SELECT COUNT(*) FROM NL_RA").fetchone()[0]
+    >>> db = SQLiteDatabase({"path": "data/keiba.db", "read_only": True})
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from src.database.base import DatabaseError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Reader pragmas; journal_mode and synchronous belong to the writer.
+READER_PRAGMAS: Dict[str, Union[str, int]] = {
+    "query_only": "ON",
+    "mmap_size": 268435456,  # 256MB
+    "cache_size": -16000,  # 16MB
+    "temp_store": "MEMORY",
+}
+
+PathLike = Union[str, Path]
+
+
+def reader_uri(path: PathLike, shared_cache: bool = True) -> str:
+    """Return the read-only URI of a database file.
+
+    Args:
+        path: Database file
+        shared_cache: Share the page cache between the readers of the file
+
+    Returns:
+        ``file:`` URI with ``mode=ro`` (and ``cache=shared``)
+    """
+    uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+    if shared_cache:
+        uri += "&cache=shared"
+    return uri
+
+
+def open_reader(
+    path: PathLike,
+    timeout: float = 30.0,
+    shared_cache: bool = True,
+    pragmas: Optional[Dict[str, Union[str, int]]] = None,
+) -> sqlite3.Connection:
+    """Open a read-only connection to an existing SQLite database.
+
+    Args:
+        path: Database file; it is never created
+        timeout: Busy timeout in seconds
+        shared_cache: Share the page cache between the readers of the file
+        pragmas: Pragmas overriding :data:`READER_PRAGMAS`
+
+    Returns:
+        Autocommit connection with :class:`sqlite3.Row` rows
+
+    Raises:
+        DatabaseError: If the file does not exist or cannot be opened
+    """
+    from src.database.sqlite_handler import CACHED_STATEMENTS, _pragma_statement
+
+    if not Path(path).is_file():
+        raise DatabaseError(f"SQLite database not found: {path}")
+    statements = [
+        _pragma_statement(name, value)
+        for name, value in {**READER_PRAGMAS, **(pragmas or {})}.items()
+    ]
+    try:
+        connection = sqlite3.connect(
+            reader_uri(path, shared_cache),
+            uri=True,
+            timeout=timeout,
+            # A pool closes its readers from whichever thread shuts it down.
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=CACHED_STATEMENTS,
+        )
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Failed to open SQLite reader for {path}: {e}")
+    try:
+        for statement in statements:
+            connection.execute(statement)
+    except sqlite3.Error as e:
+        connection.close()
+        raise DatabaseError(f"Failed to configure SQLite reader for {path}: {e}")
+    connection.row_factory = sqlite3.Row
+    return connection
+
+
+class ReaderPool:
+    """One read-only connection per thread to a SQLite database.
+
+    Connections are opened on first use in each thread and reused until
+    :meth:`close`.
+
+    Args:
+        path: Database file
+        timeout: Busy timeout in seconds
+        shared_cache: Share the page cache between the pool's readers
+    """
+
+    def __init__(self, path: PathLike, timeout: float = 30.0, shared_cache: bool = True):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.shared_cache = shared_cache
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's reader, opening it if needed.
+
+        Raises:
+            DatabaseError: If the reader cannot be opened
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = open_reader(self.path, self.timeout, self.shared_cache)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+            logger.debug("Opened SQLite reader", path=str(self.path))
+        return connection
+
+    def close(self) -> None:
+        """Close the readers of every thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+_pools: Dict[Path, ReaderPool] = {}
+_pools_lock = threading.Lock()
+
+
+def reader_pool(path: PathLike) -> ReaderPool:
+    """Return the process-wide :class:`ReaderPool` of a database file."""
+    key = Path(path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ReaderPool(key)
+        return pool
+
+
+def close_reader_pools() -> None:
+    """Close every process-wide reader pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
@@ -98,6 +98,7 @@ Benefits with PRIMARY KEY constraints:
 """
 
 import re
+from datetime import date
 from typing import Any, Dict, List
 
 from src.database.base import BaseDatabase
@@ -2928,6 +2929,33 @@ class SchemaManager:
         """
         return list(SCHEMAS.keys())
 
+    def _execute_create(self, table_name: str, schema_sql: str) -> None:
+        """Execute a CREATE TABLE statement, partitioned when configured.
+
+        With PostgreSQL partitioning enabled, tables in
+        :data:`~src.database.partitioning.PARTITIONED_TABLES` that do not exist
+        yet are created as ``PARTITION BY RANGE (Year)`` parents with a
+        partition for the current year. Existing tables are never converted.
+        """
+        from src.database.partitioning import (
+            PARTITIONED_TABLES,
+            partitioned_ddl,
+            partitioning_handler,
+        )
+
+        handler = partitioning_handler(self.db)
+        if (
+            handler is None
+            or table_name not in PARTITIONED_TABLES
+            or self.db.table_exists_strict(table_name)
+        ):
+            self.db.execute(schema_sql)
+            return
+        self.db.execute(partitioned_ddl(schema_sql))
+        handler.partitions.clear_cache()
+        handler.partitions.ensure_partitions(table_name, [date.today().year])
+        logger.info(f"Created {table_name} partitioned by Year")
+
     def create_table(self, table_name: str) -> bool:
         """Additively migrate and create a single table.
 
@@ -2951,7 +2979,7 @@ class SchemaManager:
             _preflight_existing_strict_storage(self.db)
             if table_name not in STRICT_RECREATE_TABLES:
                 migrate_table_if_needed(self.db, table_name, schema_sql)
-            self.db.execute(schema_sql)
+            self._execute_create(table_name, schema_sql)
             verify_table_schema(self.db, table_name, schema_sql)
             if table_name in STRICT_SE_STORAGE_TABLES:
                 from src.importer.importer import verify_se_storage_schema
@@ -3049,7 +3077,7 @@ class SchemaManager:
 
         for table_name, schema_sql in SCHEMAS.items():
             try:
-                self.db.execute(schema_sql)
+                self._execute_create(table_name, schema_sql)
                 verify_table_schema(self.db, table_name, schema_sql)
                 if table_name in STRICT_SE_STORAGE_TABLES:
                     from src.importer.importer import verify_se_storage_schema
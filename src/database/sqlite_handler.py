@@ -3,15 +3,67 @@
 This module provides SQLite database operations for JLTSQL.
 """
 
+import re
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from src.database.base import BaseDatabase, DatabaseError
+from src.database.readers import open_reader
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Connection pragmas; ``databases.sqlite.pragma`` overrides them per key.
+DEFAULT_PRAGMAS: Dict[str, Union[str, int]] = {
+    "journal_mode": "WAL",  # WALモードで高速化
+    "synchronous": "NORMAL",  # 同期モードを緩和
+    "cache_size": -64000,  # 64MBキャッシュ
+    "temp_store": "MEMORY",  # 一時テーブルをメモリに
+}
+
+# Bulk-load session pragmas; ``databases.sqlite.bulk_load.pragma`` overrides
+# them per key. The WAL is kept: a crash mid-import loses the open
+# transaction, not the database.
+BULK_LOAD_PRAGMAS: Dict[str, Union[str, int]] = {
+    "synchronous": "OFF",
+    "cache_size": -262144,  # 256MB
+    "mmap_size": 1073741824,  # 1GB
+    "wal_autocheckpoint": 100000,  # pages; checkpointed once at the end
+    "locking_mode": "EXCLUSIVE",
+}
+
+BULK_LOAD_CHECKS = ("integrity_check", "quick_check", "none")
+
+# Prepared INSERT statements are cached per connection; one per table and
+# column set is well above the default of 128 for a full setup import.
+CACHED_STATEMENTS = 512
+
+WAL_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# Rows sampled per index by ANALYZE / PRAGMA optimize; bounds the run time
+# on large tables at the cost of approximate statistics.
+ANALYSIS_LIMIT = 1000
+
+_PRAGMA_NAME = re.compile(r"^[a-z_]+$")
+_PRAGMA_VALUE = re.compile(r"^-?[A-Za-z0-9_]+$")
+
+
+def _pragma_statement(name: str, value: Union[str, int]) -> str:
+    """Return ``PRAGMA name = value`` after validating both parts.
+
+    Pragmas cannot be bound as parameters, so only plain names and
+    identifier/integer values are accepted.
+    """
+    if not isinstance(name, str) or not _PRAGMA_NAME.match(name):
+        raise DatabaseError(f"Invalid SQLite pragma name: {name!r}")
+    if isinstance(value, bool) or not isinstance(value, (str, int)) or not _PRAGMA_VALUE.match(
+        str(value)
+    ):
+        raise DatabaseError(f"Invalid value for SQLite pragma {name}: {value!r}")
+    return f"PRAGMA {name} = {value}"
+
 
 class SQLiteDatabase(BaseDatabase):
     """SQLite database handler.
@@ -22,6 +74,12 @@ class SQLiteDatabase(BaseDatabase):
         - path: Path to SQLite database file
         - timeout: Connection timeout in seconds (default: 30)
         - check_same_thread: Check same thread (default: False)
+        - read_only: Open a ``mode=ro`` reader (:func:`~src.database.readers.open_reader`)
+          instead of a writer; the file must exist (default: False)
+        - pragma: Connection pragmas overriding :data:`DEFAULT_PRAGMAS`
+        - bulk_load: ``{"enabled": bool, "check": str, "pragma": {...}}`` for
+          :meth:`bulk_load` (default: enabled, ``integrity_check``,
+          :data:`BULK_LOAD_PRAGMAS`)
 
     Examples:
         >>> config = {"path": "./data/keiba.db"}
@@ -41,6 +99,17 @@ class SQLiteDatabase(BaseDatabase):
         self.db_path = Path(config.get("path", "./data/keiba.db"))
         self.timeout = config.get("timeout", 30.0)
         self.check_same_thread = config.get("check_same_thread", False)
+        self.read_only = bool(config.get("read_only", False))
+        self.pragmas = {**DEFAULT_PRAGMAS, **(config.get("pragma") or {})}
+        bulk_load = config.get("bulk_load") or {}
+        self.bulk_load_enabled = bool(bulk_load.get("enabled", True))
+        self.bulk_load_check = bulk_load.get("check", "integrity_check")
+        if self.bulk_load_check not in BULK_LOAD_CHECKS:
+            raise DatabaseError(f"Unsupported SQLite bulk_load.check: {self.bulk_load_check!r}")
+        self.bulk_load_pragmas = {**BULK_LOAD_PRAGMAS, **(bulk_load.get("pragma") or {})}
+        for pragmas in (self.pragmas, self.bulk_load_pragmas):
+            for name, value in pragmas.items():
+                _pragma_statement(name, value)
 
     def get_db_type(self) -> str:
         """Get database type identifier.
@@ -67,10 +136,18 @@ class SQLiteDatabase(BaseDatabase):
         """Establish SQLite database connection.
 
         Creates database file and parent directories if they don't exist.
+        A ``read_only`` handler opens a reader on the existing file instead.
 
         Raises:
             DatabaseError: If connection fails
         """
+        if self.read_only:
+            self._connection = open_reader(self.db_path, timeout=self.timeout)
+            self._cursor = self._connection.cursor()
+            self._transaction_active = False
+            logger.info(f"Opened read-only SQLite database: {self.db_path}")
+            return
+
         try:
             # Create parent directories if needed
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -79,14 +156,13 @@ class SQLiteDatabase(BaseDatabase):
                 str(self.db_path),
                 timeout=self.timeout,
                 check_same_thread=self.check_same_thread,
+                cached_statements=CACHED_STATEMENTS,
             )
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
-            # Performance optimizations for bulk import
-            self._connection.execute("PRAGMA journal_mode = WAL")  # WALモードで高速化
-            self._connection.execute("PRAGMA synchronous = NORMAL")  # 同期モードを緩和
-            self._connection.execute("PRAGMA cache_size = -64000")  # 64MBキャッシュ
-            self._connection.execute("PRAGMA temp_store = MEMORY")  # 一時テーブルをメモリに
+            # Performance pragmas (DEFAULT_PRAGMAS + databases.sqlite.pragma)
+            for name, value in self.pragmas.items():
+                self._connection.execute(_pragma_statement(name, value))
             # Use Row factory for dict-like access
             self._connection.row_factory = sqlite3.Row
             self._cursor = self._connection.cursor()
@@ -287,6 +363,82 @@ class SQLiteDatabase(BaseDatabase):
         except DatabaseError:
             raise
 
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Run a large import with bulk-load pragmas, then restore and verify.
+
+        The current value of every pragma in ``bulk_load_pragmas`` is saved
+        and restored on exit. After a successful session the WAL is
+        checkpointed and truncated, and ``bulk_load_check``
+        (``PRAGMA integrity_check`` by default) must report ``ok``.
+        Enter and leave the session outside a transaction.
+
+        Raises:
+            DatabaseError: If a pragma fails or the check finds a problem
+
+        Examples:
+            >>> with db.bulk_load():
+            ...     importer.import_records(records)
+            ...     db.commit()
+        """
+        if not self.bulk_load_enabled:
+            yield
+            return
+        if not self._connection:
+            raise DatabaseError("Database not connected")
+
+        saved = {}
+        try:
+            for name, value in self.bulk_load_pragmas.items():
+                row = self._connection.execute(f"PRAGMA {name}").fetchone()
+                if row is not None:
+                    saved[name] = row[0]
+                self._connection.execute(_pragma_statement(name, value))
+        except sqlite3.Error as e:
+            self._restore_pragmas(saved)
+            raise DatabaseError(f"Failed to start SQLite bulk load: {e}") from e
+        logger.info("SQLite bulk load started", pragmas=self.bulk_load_pragmas)
+
+        try:
+            yield
+        except BaseException:
+            self._restore_pragmas(saved)
+            raise
+        self._restore_pragmas(saved)
+        self._finish_bulk_load()
+
+    def _restore_pragmas(self, saved: Dict[str, Any]) -> None:
+        if not self._connection:
+            return
+        for name, value in reversed(list(saved.items())):
+            try:
+                self._connection.execute(_pragma_statement(name, value))
+            except (sqlite3.Error, DatabaseError) as e:
+                logger.warning("Failed to restore SQLite pragma", pragma=name, error=str(e))
+
+    def _finish_bulk_load(self) -> None:
+        if self.has_pending_transaction():
+            logger.warning("SQLite bulk load ended inside a transaction; skipping checkpoint")
+            return
+        try:
+            journal_mode = self._connection.execute("PRAGMA journal_mode").fetchone()[0]
+            if str(journal_mode).lower() == "wal":
+                self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if self.bulk_load_check == "none":
+                # A read releases an EXCLUSIVE lock after locking_mode=NORMAL.
+                self._connection.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+                result = ["ok"]
+            else:
+                rows = self._connection.execute(f"PRAGMA {self.bulk_load_check}").fetchall()
+                result = [str(row[0]) for row in rows]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to finish SQLite bulk load: {e}") from e
+        if result != ["ok"]:
+            raise DatabaseError(
+                f"SQLite {self.bulk_load_check} failed after bulk load: {'; '.join(result[:5])}"
+            )
+        logger.info("SQLite bulk load finished", check=self.bulk_load_check)
+
     def vacuum(self) -> None:
         """Vacuum database to reclaim space.
 
@@ -299,3 +451,65 @@ class SQLiteDatabase(BaseDatabase):
 
         except DatabaseError:
             raise
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Dict[str, int]:
+        """Copy WAL frames into the database file.
+
+        Args:
+            mode: ``PASSIVE`` (never waits for readers or writers), ``FULL``,
+                ``RESTART`` or ``TRUNCATE`` (also truncates the WAL file)
+
+        Returns:
+            ``busy`` (1 if the checkpoint could not complete), ``log`` (WAL
+            frames) and ``checkpointed`` (frames copied)
+
+        Raises:
+            DatabaseError: If the mode is unknown or the checkpoint fails
+        """
+        mode = mode.upper()
+        if mode not in WAL_CHECKPOINT_MODES:
+            raise DatabaseError(f"Unsupported WAL checkpoint mode: {mode!r}")
+        row = self.fetch_one(f"PRAGMA wal_checkpoint({mode})")
+        result = {
+            "busy": int(row["busy"]),
+            "log": int(row["log"]),
+            "checkpointed": int(row["checkpointed"]),
+        }
+        logger.debug("WAL checkpoint", mode=mode, **result)
+        return result
+
+    def incremental_vacuum(self, pages: int = 0) -> bool:
+        """Return free pages to the file system.
+
+        Only databases created with ``auto_vacuum = INCREMENTAL`` keep the
+        bookkeeping for this; others would need a full :meth:`vacuum`.
+
+        Args:
+            pages: Pages to free (0: all free pages)
+
+        Returns:
+            False if the database is not in incremental auto-vacuum mode
+        """
+        row = self.fetch_one("PRAGMA auto_vacuum")
+        if row is None or int(row["auto_vacuum"]) != 2:
+            return False
+        self.fetch_all(f"PRAGMA incremental_vacuum({int(pages)})")
+        logger.info("Incremental vacuum", pages=pages or "all")
+        return True
+
+    def optimize(self, analysis_limit: int = ANALYSIS_LIMIT) -> None:
+        """Refresh the query planner statistics.
+
+        A database without ``sqlite_stat1`` is analyzed once in full; after
+        that ``PRAGMA optimize`` re-analyzes only the tables whose contents
+        changed enough to matter.
+
+        Args:
+            analysis_limit: Rows sampled per index (0: no limit)
+        """
+        self.execute(_pragma_statement("analysis_limit", int(analysis_limit)))
+        if self.table_exists("sqlite_stat1"):
+            self.execute("PRAGMA optimize")
+        else:
+            self.execute("ANALYZE")
+        logger.info("SQLite statistics optimized")
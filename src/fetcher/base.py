@@ -6,19 +6,30 @@ This module provides the base class for fetching JV-Data from JV-Link.
 import gc
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Iterator, Optional
+from time import perf_counter
+from typing import Callable, Iterator, Optional, Union
 
 from src.jvlink.constants import JV_READ_NO_MORE_DATA, JV_READ_SUCCESS
-from src.jvlink.wrapper import JVLinkWrapper
+from src.jvlink.bridge import JVLinkBridgeError
+from src.jvlink.wrapper import JVLinkError, JVLinkWrapper
 from src.parser.factory import ParserFactory
-from src.utils.logger import get_logger
-from src.utils.progress import JVLinkProgressDisplay
+from src.utils.logger import flush_throttled_logs, get_logger
+from src.utils.metrics import counter, histogram
+from src.utils.profiler import current_profiler
+from src.utils.progress import JVLinkProgressDisplay, NullProgressDisplay
 
 logger = get_logger(__name__)
 
+JV_READ_SECONDS = histogram("jltsql_jv_read_seconds", "JVRead call latency")
+RECORDS_FETCHED = counter("jltsql_records_fetched_total", "Records returned by JVRead")
+
 JV_READ_DOWNLOAD_TIMEOUT_SECONDS = 300.0
 JV_READ_DOWNLOAD_POLL_INTERVAL_SECONDS = 0.2
 
+# Data records read between clock checks for the periodic GC and progress
+# report. A file switch forces a check on the next record.
+PROGRESS_SAMPLE_RECORDS = 256
+
 
 class FetcherError(Exception):
     """Data fetcher error."""
@@ -26,6 +37,29 @@ class FetcherError(Exception):
     pass
 
 
+class RecordSource:
+    """Provenance of one physical JV-Data record.
+
+    Every row parsed from one record shares a single instance under
+    ``record["_source"]``; full-struct parsers (O1-O6, H1, H6) expand one
+    record into many rows, and the importer groups them by its identity.
+    The raw bytes themselves are not kept.
+
+    Attributes:
+        file: JV-Link file name, or ``cache:<spec>[/<date>]`` for NL cache replays
+        index: 1-based position of the record in the read
+    """
+
+    __slots__ = ("file", "index")
+
+    def __init__(self, file: str, index: int):
+        self.file = file
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"RecordSource({self.file!r}, {self.index})"
+
+
 class BaseFetcher(ABC):
     """Abstract base class for data fetchers.
 
@@ -45,23 +79,25 @@ class BaseFetcher(ABC):
         self,
         sid: str = "UNKNOWN",
         show_progress: bool = True,
+        progress_mode: Optional[str] = None,
     ):
         """Initialize base fetcher.
 
         Args:
             sid: Session ID for JV-Link API (default: "UNKNOWN")
             show_progress: Show stylish progress display (default: True)
+            progress_mode: Progress display when shown: "rich", "jsonl" or
+                "none" (default: JLTSQL_PROGRESS, then "rich")
         """
-        # Prefer the configured subprocess bridge over in-process COM.
-        # Runtime architecture support is established only by the release E2E.
-        from src.jvlink.bridge import find_bridge_executable
-        bridge_exe = find_bridge_executable()
-        if bridge_exe is not None:
-            from src.jvlink.bridge import JVLinkBridge
-            logger.info("Using JVLinkBridge (C#) for JRA", bridge_path=str(bridge_exe))
-            self.jvlink = JVLinkBridge(sid, bridge_path=bridge_exe)
-        else:
-            self.jvlink = JVLinkWrapper(sid)
+        # A full cache replay never calls JV-Link, so a client that cannot be
+        # created here (no COM, no bridge) is only an error once it is used.
+        self._jvlink = None
+        self._jvlink_error: Optional[Exception] = None
+        try:
+            self._jvlink = self._create_jvlink(sid)
+        except (JVLinkError, JVLinkBridgeError) as error:
+            logger.debug("JV-Link unavailable until first use", error=str(error))
+            self._jvlink_error = error
 
         self.parser_factory = ParserFactory()
         self._records_fetched = 0
@@ -72,11 +108,47 @@ class BaseFetcher(ABC):
         self._files_processed = 0
         self._total_files = 0
         self.show_progress = show_progress
-        self.progress_display: Optional[JVLinkProgressDisplay] = None
+        self.progress_mode = progress_mode
+        self.progress_display: Optional[Union[JVLinkProgressDisplay, NullProgressDisplay]] = None
         self._start_time = None
 
         logger.info(f"{self.__class__.__name__} initialized", sid=sid)
 
+    @staticmethod
+    def _create_jvlink(sid: str):
+        # A configured replay (jvlink.replay / JVLINK_REPLAY_SOURCE) stands in
+        # for JV-Link entirely, so offline runs never probe COM or the bridge.
+        from src.jvlink.replay import create_replay_client, record_session
+        replay = create_replay_client(sid)
+        if replay is not None:
+            return replay
+
+        # Prefer the configured subprocess bridge over in-process COM.
+        # Runtime architecture support is established only by the release E2E.
+        from src.jvlink.bridge import find_bridge_executable
+        bridge_exe = find_bridge_executable()
+        if bridge_exe is not None:
+            from src.jvlink.bridge import JVLinkBridge
+            logger.info("Using JVLinkBridge (C#) for JRA", bridge_path=str(bridge_exe))
+            return record_session(JVLinkBridge(sid, bridge_path=bridge_exe))
+        return record_session(JVLinkWrapper(sid))
+
+    @property
+    def jvlink(self):
+        """JV-Link client.
+
+        Raises:
+            JVLinkError: If the client could not be created at initialization
+        """
+        error = getattr(self, "_jvlink_error", None)
+        if self._jvlink is None and error is not None:
+            raise error
+        return self._jvlink
+
+    @jvlink.setter
+    def jvlink(self, value) -> None:
+        self._jvlink = value
+
     @abstractmethod
     def fetch(self, **kwargs) -> Iterator[dict]:
         """Fetch and parse records.
@@ -98,6 +170,7 @@ class BaseFetcher(ABC):
         to_date: Optional[str] = None,
         recover_file_error: Optional[Callable[[int, str], None]] = None,
         consume_replayed_record: Optional[Callable[[], bool]] = None,
+        on_raw_record: Optional[Callable[[bytes, dict], None]] = None,
     ) -> Iterator[dict]:
         """Internal method to fetch and parse records.
 
@@ -108,6 +181,9 @@ class BaseFetcher(ABC):
                 corrupt downloaded files (-402/-403).
             consume_replayed_record: Optional callback that returns True when a
                 record replayed after recovery must be skipped.
+            on_raw_record: Optional callback called with the raw buffer and its
+                first row within ``to_date``, once per record and before that
+                row is yielded (e.g., NL cache write-through).
 
         Yields:
             Dictionary of parsed record data
@@ -119,194 +195,255 @@ class BaseFetcher(ABC):
         last_update_time = self._start_time
         update_interval = 2.0  # Update progress every 2 seconds
         last_gc_time = self._start_time  # Periodic GC to free COM buffers
+        # The clock is read once per PROGRESS_SAMPLE_RECORDS data records
+        # (starting with the first), not per record.
+        records_until_clock = 0
         download_wait_started: Optional[float] = None
+        profiler = current_profiler()
+        # JVRead latency and the fetched-record count are published once per
+        # timed read and when the loop ends, not per record.
+        reads_until_timed = 0
+        untimed_reads = 0
+        unpublished_records = 0
+        read_seconds = 0.0
 
-        while True:
-            try:
-                # Read next record
-                ret_code, buff, filename = self.jvlink.jv_read()
-
-                if ret_code == -3:
-                    now = time.monotonic()
-                    if download_wait_started is None:
-                        download_wait_started = now
-                    elapsed = now - download_wait_started
-                    if elapsed >= JV_READ_DOWNLOAD_TIMEOUT_SECONDS:
-                        raise FetcherError(
-                            "JVRead file-downloading wait timeout after "
-                            f"{elapsed:.1f} seconds"
-                        )
-                    logger.debug(
-                        "JVRead waiting for file download",
-                        filename=filename,
-                        elapsed_seconds=elapsed,
-                    )
-                    time.sleep(JV_READ_DOWNLOAD_POLL_INTERVAL_SECONDS)
-                    continue
-
-                download_wait_started = None
-
-                # Return code meanings:
-                # > 0: Success with data (value is data length)
-                # 0: Read complete (no more data)
-                # -1: File switch (continue reading)
-                # < -1: Error
-
-                if ret_code == JV_READ_SUCCESS:
-                    # Complete (0)
-                    logger.info("Read complete - no more data")
-                    if self.progress_display and task_id is not None:
-                        # Explicitly set to 100% complete
-                        elapsed = time.time() - self._start_time
-                        speed = self._records_fetched / elapsed if elapsed > 0 else 0
-                        self.progress_display.update(
-                            task_id,
-                            completed=self._total_files if self._total_files > 0 else 100,
-                            total=self._total_files if self._total_files > 0 else 100,
-                            status="完了",
-                        )
-                        self.progress_display.update_stats(
-                            fetched=self._records_fetched,
-                            parsed=self._records_parsed,
-                            failed=self._records_failed,
-                            speed=speed,
-                        )
-                    break
-
-                elif ret_code == JV_READ_NO_MORE_DATA:
-                    # File switch (-1) - ファイル処理完了
-                    self._files_processed += 1
-                    # Update progress based on files processed (not records)
-                    if self.progress_display and task_id is not None and self._total_files > 0:
-                        self.progress_display.update(
-                            task_id,
-                            completed=self._files_processed,
-                            status=f"ファイル {self._files_processed}/{self._total_files}",
-                        )
-                    continue
-
-                elif ret_code > 0:
-                    # Success with data (ret_code is data length)
-                    # Replayed records still hold COM buffers. Run the normal
-                    # periodic collection before a replay skip so a long setup
-                    # import cannot bypass the E_UNEXPECTED mitigation.
-                    current_time = time.time()
-                    if (current_time - last_gc_time) >= 10.0:
-                        gc.collect()
-                        last_gc_time = current_time
-
-                    if consume_replayed_record is not None and consume_replayed_record():
-                        if (current_time - last_update_time) >= update_interval:
-                            logger.info(
-                                "Replaying records after historical recovery",
-                                records_previously_emitted=self._records_fetched,
-                                files_processed=self._files_processed,
-                                total_files=self._total_files,
+        try:
+            while True:
+                try:
+                    # Read next record. Only one JVRead per PROGRESS_SAMPLE_RECORDS is
+                    # timed; the calls in between are counted and published with it.
+                    reads_until_timed -= 1
+                    if reads_until_timed > 0:
+                        untimed_reads += 1
+                        ret_code, buff, filename = self.jvlink.jv_read()
+                    else:
+                        reads_until_timed = PROGRESS_SAMPLE_RECORDS
+                        read_started = perf_counter()
+                        ret_code, buff, filename = self.jvlink.jv_read()
+                        read_seconds = perf_counter() - read_started
+                        reads = untimed_reads + 1
+                        JV_READ_SECONDS.observe(read_seconds, reads)
+                        if unpublished_records:
+                            RECORDS_FETCHED.inc(unpublished_records)
+                        if profiler is not None:
+                            profiler.record(
+                                "fetch", "-", read_seconds * reads, count=unpublished_records
                             )
-                            last_update_time = current_time
-                        continue
-                    self._records_fetched += 1
-
-                    # Parse record
-                    try:
-                        data = self.parser_factory.parse(buff)
-                        if data:
-                            # Full-struct parsers (H1, H6) return List[Dict]
-                            records_list = data if isinstance(data, list) else [data]
-
-                            for record_item in records_list:
-                                # Filter by to_date if specified
-                                if to_date and not self._is_within_date_range(record_item, to_date):
-                                    logger.debug(
-                                        "Skipping record outside date range",
-                                        record_num=self._records_fetched,
-                                        to_date=to_date,
-                                    )
-                                    continue
-
-                                self._records_parsed += 1
-                                # Include raw buffer for callers that need it (e.g., RealtimeUpdater)
-                                record_item["_raw"] = buff
-                                yield record_item
-                        else:
-                            self._records_failed += 1
-                            logger.warning(
-                                "Failed to parse record",
-                                record_num=self._records_fetched,
+                        untimed_reads = 0
+                        unpublished_records = 0
+
+                    if ret_code == -3:
+                        now = time.monotonic()
+                        if download_wait_started is None:
+                            download_wait_started = now
+                        elapsed = now - download_wait_started
+                        if elapsed >= JV_READ_DOWNLOAD_TIMEOUT_SECONDS:
+                            raise FetcherError(
+                                "JVRead file-downloading wait timeout after "
+                                f"{elapsed:.1f} seconds"
                             )
-
-                    except Exception as e:
-                        self._records_failed += 1
-                        logger.error(
-                            "Error parsing record",
-                            record_num=self._records_fetched,
-                            error=str(e),
-                        )
-
-                    # Periodic GC to free COM buffer references (every 10s).
-                    # kmy-keiba frees COM buffers with Array.Resize(ref buff, 0) after each read.
-                    # In Python, COM BSTR data may accumulate and cause E_UNEXPECTED.
-                    # Update progress display (stats only - progress updated on file switch)
-                    current_time = time.time()
-                    if (current_time - last_update_time) >= update_interval:
-                        elapsed = current_time - self._start_time
-                        speed = self._records_fetched / elapsed if elapsed > 0 else 0
-
-                        # ログに進捗を出力（quickstart.pyで検出用）
-                        logger.info(
-                            "Processing records",
-                            records_fetched=self._records_fetched,
-                            records_parsed=self._records_parsed,
-                            files_processed=self._files_processed,
-                            total_files=self._total_files,
-                            speed=f"{speed:.0f}",
+                        logger.debug(
+                            "JVRead waiting for file download",
+                            filename=filename,
+                            elapsed_seconds=elapsed,
                         )
+                        time.sleep(JV_READ_DOWNLOAD_POLL_INTERVAL_SECONDS)
+                        continue
 
-                        if self.progress_display:
-                            # Update stats display (progress bar updated on file switch)
+                    download_wait_started = None
+
+                    # Return code meanings:
+                    # > 0: Success with data (value is data length)
+                    # 0: Read complete (no more data)
+                    # -1: File switch (continue reading)
+                    # < -1: Error
+
+                    if ret_code == JV_READ_SUCCESS:
+                        # Complete (0)
+                        logger.info("Read complete - no more data")
+                        # Report parse failures suppressed during the read
+                        flush_throttled_logs()
+                        if self.progress_display and task_id is not None:
+                            # Explicitly set to 100% complete
+                            elapsed = time.time() - self._start_time
+                            speed = self._records_fetched / elapsed if elapsed > 0 else 0
+                            self.progress_display.update(
+                                task_id,
+                                completed=self._total_files if self._total_files > 0 else 100,
+                                total=self._total_files if self._total_files > 0 else 100,
+                                status="完了",
+                            )
                             self.progress_display.update_stats(
                                 fetched=self._records_fetched,
                                 parsed=self._records_parsed,
                                 failed=self._records_failed,
                                 speed=speed,
                             )
-                        last_update_time = current_time
-
-                elif ret_code in (-402, -403):
-                    # Only the two official corrupt-downloaded-file statuses
-                    # enter targeted file recovery. Call-order errors
-                    # (-201/-202/-203), download failure (-502), and missing
-                    # file (-503) cannot be repaired by repeating JVRead or by
-                    # deleting the returned path.
-                    logger.warning(
-                        "JVRead returned a corrupt downloaded file",
-                        ret_code=ret_code,
-                        filename=filename,
-                    )
-                    if recover_file_error is not None:
-                        recover_file_error(ret_code, filename or "")
-                        self._repaired_read_errors += 1
+                        break
+
+                    elif ret_code == JV_READ_NO_MORE_DATA:
+                        # File switch (-1) - ファイル処理完了
+                        self._files_processed += 1
+                        records_until_clock = 0
+                        # Update progress based on files processed (not records)
+                        if self.progress_display and task_id is not None and self._total_files > 0:
+                            self.progress_display.update(
+                                task_id,
+                                completed=self._files_processed,
+                                status=f"ファイル {self._files_processed}/{self._total_files}",
+                            )
+                        continue
+
+                    elif ret_code > 0:
+                        # Success with data (ret_code is data length)
+                        # Replayed records still hold COM buffers. Run the normal
+                        # periodic collection before a replay skip so a long setup
+                        # import cannot bypass the E_UNEXPECTED mitigation.
+                        records_until_clock -= 1
+                        check_clock = records_until_clock <= 0
+                        if check_clock:
+                            records_until_clock = PROGRESS_SAMPLE_RECORDS
+                            current_time = time.time()
+                            if (current_time - last_gc_time) >= 10.0:
+                                gc.collect()
+                                last_gc_time = current_time
+
+                        if consume_replayed_record is not None and consume_replayed_record():
+                            if check_clock and (current_time - last_update_time) >= update_interval:
+                                logger.info(
+                                    "Replaying records after historical recovery",
+                                    records_previously_emitted=self._records_fetched,
+                                    files_processed=self._files_processed,
+                                    total_files=self._total_files,
+                                )
+                                last_update_time = current_time
+                            continue
+                        self._records_fetched += 1
+                        unpublished_records += 1
+
+                        # Parse record. Only parser failures count as failed
+                        # records; an on_raw_record failure aborts the fetch.
+                        try:
+                            data = self.parser_factory.parse(buff)
+                        except Exception as e:
+                            data = None
+                            self._records_failed += 1
+                            logger.error(
+                                "Error parsing record",
+                                record_num=self._records_fetched,
+                                error=str(e),
+                            )
+                        else:
+                            if data:
+                                # Full-struct parsers (H1, H6) return List[Dict]
+                                records_list = data if isinstance(data, list) else [data]
+
+                                source = None
+                                for record_item in records_list:
+                                    # Filter by to_date if specified
+                                    if to_date and not self._is_within_date_range(record_item, to_date):
+                                        logger.debug(
+                                            "Skipping record outside date range",
+                                            record_num=self._records_fetched,
+                                            to_date=to_date,
+                                        )
+                                        continue
+
+                                    self._records_parsed += 1
+                                    if source is None:
+                                        source = RecordSource(filename or "", self._records_fetched)
+                                        if on_raw_record is not None:
+                                            on_raw_record(buff, record_item)
+                                    record_item["_source"] = source
+                                    yield record_item
+                            else:
+                                self._records_failed += 1
+                                logger.warning(
+                                    "Failed to parse record",
+                                    record_num=self._records_fetched,
+                                )
+
+                        # Periodic GC to free COM buffer references (every 10s).
+                        # kmy-keiba frees COM buffers with Array.Resize(ref buff, 0) after each read.
+                        # In Python, COM BSTR data may accumulate and cause E_UNEXPECTED.
+                        # Update progress display (stats only - progress updated on file switch)
+                        if check_clock and (current_time - last_update_time) >= update_interval:
+                            elapsed = current_time - self._start_time
+                            speed = self._records_fetched / elapsed if elapsed > 0 else 0
+
+                            # ログに進捗を出力（quickstart.pyで検出用）
+                            logger.info(
+                                "Processing records",
+                                records_fetched=self._records_fetched,
+                                records_parsed=self._records_parsed,
+                                files_processed=self._files_processed,
+                                total_files=self._total_files,
+                                speed=f"{speed:.0f}",
+                            )
+
+                            if self.progress_display:
+                                # Update stats display (progress bar updated on file switch)
+                                self.progress_display.update_stats(
+                                    fetched=self._records_fetched,
+                                    parsed=self._records_parsed,
+                                    failed=self._records_failed,
+                                    speed=speed,
+                                )
+                            last_update_time = current_time
+
+                    elif ret_code in (-402, -403):
+                        # Only the two official corrupt-downloaded-file statuses
+                        # enter targeted file recovery. Call-order errors
+                        # (-201/-202/-203), download failure (-502), and missing
+                        # file (-503) cannot be repaired by repeating JVRead or by
+                        # deleting the returned path.
+                        logger.warning(
+                            "JVRead returned a corrupt downloaded file",
+                            ret_code=ret_code,
+                            filename=filename,
+                        )
+                        if recover_file_error is not None:
+                            recover_file_error(ret_code, filename or "")
+                            self._repaired_read_errors += 1
+                        else:
+                            self._recoverable_read_errors += 1
+                            raise FetcherError(
+                                "JVRead corrupt-file recovery is unavailable for "
+                                f"error code {ret_code} ({filename or 'unknown file'})"
+                            )
+                        continue
+
                     else:
-                        self._recoverable_read_errors += 1
-                        raise FetcherError(
-                            "JVRead corrupt-file recovery is unavailable for "
-                            f"error code {ret_code} ({filename or 'unknown file'})"
+                        # Fatal error (< -1, other codes)
+                        logger.error(
+                            "JVRead error",
+                            ret_code=ret_code,
                         )
-                    continue
-
-                else:
-                    # Fatal error (< -1, other codes)
-                    logger.error(
-                        "JVRead error",
-                        ret_code=ret_code,
-                    )
-                    raise FetcherError(f"JVRead returned error code: {ret_code}")
-
-            except FetcherError:
-                raise
-            except Exception as e:
-                logger.error("Error during fetch", error=str(e))
-                raise FetcherError(f"Failed to fetch data: {e}") from e
+                        raise FetcherError(f"JVRead returned error code: {ret_code}")
+
+                except FetcherError:
+                    raise
+                except Exception as e:
+                    logger.error("Error during fetch", error=str(e))
+                    raise FetcherError(f"Failed to fetch data: {e}") from e
+        finally:
+            # Publish what the last sample did not cover, also when the
+            # consumer stops early or the read fails.
+            if untimed_reads:
+                JV_READ_SECONDS.observe(read_seconds, untimed_reads)
+            if unpublished_records:
+                RECORDS_FETCHED.inc(unpublished_records)
+            if profiler is not None and (untimed_reads or unpublished_records):
+                profiler.record(
+                    "fetch", "-", read_seconds * untimed_reads, count=unpublished_records
+                )
+            self._flush_parse_metrics()
+
+    def _flush_parse_metrics(self) -> None:
+        """Publish the parser factory's sampled parse metrics, if it keeps any."""
+        flush_metrics = getattr(self.parser_factory, "flush_metrics", None)
+        if flush_metrics is not None:
+            flush_metrics()
 
     def _delete_corrupt_file_best_effort(self, error_code: int, filename: str) -> None:
         """Remove a corrupt JV-Link file for the next run without masking failure."""
@@ -0,0 +1,146 @@
+"""Per-race-key checkpoints for time-series odds backfills.
+
+``jltsql realtime timeseries`` opens one JVRTOpen stream per race key, and a
+year of 0B41/0B42 is thousands of keys. :class:`TimeSeriesCheckpoint` records
+the outcome of every key in ``JLTSQL_TS_CHECKPOINT`` in the target database,
+so an interrupted run resumed with ``--resume`` skips what already finished:
+
+- ``success`` keys fetched ``success_settle`` or more after the race day
+  (the first 8 digits of the ``YYYYMMDDJJRR`` key) are final and never
+  fetched again. A race fetched earlier may still have changed odds,
+  results or payouts, so it is fetched again once ``no_data_cooldown`` has
+  passed, until one fetch lands after the settle window.
+- ``no_data`` keys are retried once ``no_data_cooldown`` has passed; recent
+  races can still gain data.
+- Failed keys (``error:<code>``, ``exception``) are always retried.
+
+The fetcher only reads checkpoints. The caller records a key after its
+records are committed, so a crash can never mark unsaved rows as done.
+
+Example:
+    >>> checkpoint = TimeSeriesCheckpoint(database)
+    >>> checkpoint.ensure_schema()
+    >>> for record in fetcher.fetch_time_series_batch_from_db(
+    ...     "0B41", db_path, checkpoint=checkpoint, progress_callback=collect
+    ... ):
+    ...     save(record)
+    >>> checkpoint.record_many("0B41", finished_keys)
+    >>> database.commit()
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.database.base import BaseDatabase
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TS_CHECKPOINT_TABLE = "JLTSQL_TS_CHECKPOINT"
+
+STATUS_SUCCESS = "success"
+STATUS_NO_DATA = "no_data"
+
+DEFAULT_NO_DATA_COOLDOWN = timedelta(hours=24)
+DEFAULT_SUCCESS_SETTLE = timedelta(days=7)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {TS_CHECKPOINT_TABLE} (
+    spec TEXT NOT NULL,
+    race_key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    record_count INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (spec, race_key)
+)
+"""
+
+_UPSERT = (
+    f"INSERT INTO {TS_CHECKPOINT_TABLE} "
+    "(spec, race_key, status, record_count, fetched_at) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (spec, race_key) DO UPDATE SET "
+    "status = excluded.status, record_count = excluded.record_count, "
+    "fetched_at = excluded.fetched_at"
+)
+
+
+class TimeSeriesCheckpoint:
+    """Outcome of every time-series race key fetched per spec.
+
+    Args:
+        database: Connected database handler. :meth:`record_many` does not
+            commit; the caller commits together with its own writes.
+        no_data_cooldown: Time before a ``no_data`` key, or a ``success`` key
+            that is not final yet, is fetched again
+        success_settle: Time after the race day from which a ``success``
+            fetch is final
+    """
+
+    def __init__(
+        self,
+        database: BaseDatabase,
+        no_data_cooldown: timedelta = DEFAULT_NO_DATA_COOLDOWN,
+        success_settle: timedelta = DEFAULT_SUCCESS_SETTLE,
+    ):
+        self.database = database
+        self.no_data_cooldown = no_data_cooldown
+        self.success_settle = success_settle
+        self._loaded: Dict[str, Dict[str, Tuple[str, str]]] = {}
+
+    def ensure_schema(self) -> None:
+        """Create the checkpoint table if it does not exist."""
+        self.database.execute(_SCHEMA)
+
+    def load(self, spec: str) -> Dict[str, Tuple[str, str]]:
+        """Return ``race_key -> (status, fetched_at)`` of ``spec``, read once."""
+        if spec not in self._loaded:
+            rows = self.database.fetch_all(
+                f"SELECT race_key, status, fetched_at FROM {TS_CHECKPOINT_TABLE} WHERE spec = ?",
+                (spec,),
+            )
+            self._loaded[spec] = {
+                str(row["race_key"]): (str(row["status"]), str(row["fetched_at"]))
+                for row in rows
+            }
+            logger.info("Loaded time-series checkpoints", spec=spec, keys=len(rows))
+        return self._loaded[spec]
+
+    def should_fetch(self, spec: str, race_key: str, now: Optional[datetime] = None) -> bool:
+        """Return whether ``race_key`` still has to be fetched for ``spec``."""
+        entry = self.load(spec).get(race_key)
+        if entry is None:
+            return True
+        status, fetched_at = entry
+        if status not in (STATUS_SUCCESS, STATUS_NO_DATA):
+            return True
+        try:
+            fetched = datetime.fromisoformat(fetched_at)
+        except ValueError:
+            return True
+        if status == STATUS_SUCCESS:
+            try:
+                race_day = datetime.strptime(race_key[:8], "%Y%m%d")
+            except ValueError:
+                return False
+            if fetched >= race_day + self.success_settle:
+                return False
+        return (now or datetime.now()) - fetched >= self.no_data_cooldown
+
+    def record_many(self, spec: str, outcomes: Iterable[Tuple[str, str, int]]) -> int:
+        """Store ``(race_key, status, record_count)`` outcomes of ``spec``.
+
+        Returns:
+            Number of keys recorded
+        """
+        fetched_at = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (spec, race_key, status, int(record_count), fetched_at)
+            for race_key, status, record_count in outcomes
+        ]
+        if rows:
+            self.database.executemany(_UPSERT, rows)
+            loaded = self._loaded.get(spec)
+            if loaded is not None:
+                for _spec, race_key, status, _count, at in rows:
+                    loaded[race_key] = (status, at)
+        return len(rows)
@@ -7,14 +7,15 @@ import time
 from datetime import datetime, timedelta
 from typing import Iterator, Optional
 
-from src.fetcher.base import BaseFetcher, FetcherError
+from src.fetcher.base import BaseFetcher, FetcherError, RecordSource
 from src.jvlink.constants import (
     JVOPEN_OPTION_SETUP,
     JVOPEN_OPTION_SETUP_SPLIT,
     validate_jvopen_combination,
 )
 from src.utils.logger import get_logger
-from src.utils.progress import JVLinkProgressDisplay
+from src.utils.profiler import profile_iter
+from src.utils.progress import create_progress_display
 
 logger = get_logger(__name__)
 
@@ -103,8 +104,13 @@ class HistoricalFetcher(BaseFetcher):
 
     JVD_SELF_REPAIR_MAX_RETRIES = 2
 
-    def __init__(self, sid: str = "UNKNOWN", show_progress: bool = True):
-        super().__init__(sid, show_progress=show_progress)
+    def __init__(
+        self,
+        sid: str = "UNKNOWN",
+        show_progress: bool = True,
+        progress_mode: Optional[str] = None,
+    ):
+        super().__init__(sid, show_progress=show_progress, progress_mode=progress_mode)
         self.cache_manager = None
         self._jvd_self_repair_attempts = 0
         self._jvd_replay_records_remaining = 0
@@ -281,7 +287,7 @@ class HistoricalFetcher(BaseFetcher):
 
         # Create progress display if enabled
         if self.show_progress:
-            self.progress_display = JVLinkProgressDisplay()
+            self.progress_display = create_progress_display(getattr(self, "progress_mode", None))
             self.progress_display.start()
 
         download_task_id = None
@@ -399,35 +405,33 @@ class HistoricalFetcher(BaseFetcher):
             # Fetch and parse records (with optional cache write-through).
             # The cache stores raw jv_read buffers, so write once per buffer, not
             # once per parsed record: full-struct parsers (H1/H6) expand one
-            # buffer into thousands of rows that all carry the same `_raw`. Rows
-            # from one buffer share a header, hence the same record date, so the
-            # first surviving row stands in for all of them. Identity is a safe
-            # "same buffer" test because each jv_read() returns a new bytes
-            # object and last_cached_raw keeps it alive.
-            last_cached_raw = None
-            for data in self._fetch_and_parse(
+            # buffer into thousands of rows. Rows from one buffer share a
+            # header, hence the same record date, so the first surviving row
+            # stands in for all of them. The buffer is handed over here only;
+            # the yielded rows carry a RecordSource, not the bytes.
+            def write_through(raw: bytes, data: dict) -> None:
+                nonlocal cache_range_complete
+                rec_date = _extract_record_date(data)
+                if rec_date:
+                    if rec_date not in cache_checkpoints:
+                        cache_checkpoints[rec_date] = active_cache_manager.checkpoint_nl(
+                            data_spec,
+                            rec_date,
+                        )
+                    active_cache_manager.write_nl_record(data_spec, rec_date, raw)
+                else:
+                    # The record is yielded/imported, but cannot be replayed
+                    # from this date-keyed cache. Keep the range incomplete;
+                    # the finally block rolls back any partial appends.
+                    cache_range_complete = False
+
+            yield from self._fetch_and_parse(
                 fetch_task_id,
                 to_date=to_date,
                 recover_file_error=self._recover_historical_read_error,
                 consume_replayed_record=self._consume_replayed_record,
-            ):
-                raw = data.get("_raw") if active_cache_manager else None
-                if raw is not None and raw is not last_cached_raw:
-                    last_cached_raw = raw
-                    rec_date = _extract_record_date(data)
-                    if rec_date:
-                        if rec_date not in cache_checkpoints:
-                            cache_checkpoints[rec_date] = active_cache_manager.checkpoint_nl(
-                                data_spec,
-                                rec_date,
-                            )
-                        active_cache_manager.write_nl_record(data_spec, rec_date, raw)
-                    else:
-                        # The record is yielded/imported, but cannot be replayed
-                        # from this date-keyed cache. Keep the range incomplete;
-                        # the finally block rolls back any partial appends.
-                        cache_range_complete = False
-                yield data
+                on_raw_record=write_through if active_cache_manager else None,
+            )
 
             if self._jvd_replay_records_remaining > 0:
                 raise FetcherError(
@@ -593,32 +597,37 @@ class HistoricalFetcher(BaseFetcher):
         elif cache_manager.has_nl_range(data_spec, from_date, to_date):
             # Full cache hit: yield from cache
             self.reset_statistics()
-            for raw in cache_manager.read_nl(data_spec, from_date, to_date):
-                self._records_fetched += 1
-                try:
-                    parsed = self.parser_factory.parse(raw)
-                    if not parsed:
+            cached = cache_manager.read_nl(data_spec, from_date, to_date)
+            try:
+                for raw in profile_iter(cached, "fetch"):
+                    self._records_fetched += 1
+                    try:
+                        parsed = self.parser_factory.parse(raw)
+                        if not parsed:
+                            self._records_failed += 1
+                            logger.warning(
+                                "Failed to parse cached record",
+                                record_num=self._records_fetched,
+                                data_spec=data_spec,
+                            )
+                            continue
+
+                        records = parsed if isinstance(parsed, list) else [parsed]
+                        source = RecordSource(f"cache:{data_spec}", self._records_fetched)
+                        for record in records:
+                            self._records_parsed += 1
+                            record["_source"] = source
+                            yield record
+                    except Exception as error:
                         self._records_failed += 1
-                        logger.warning(
-                            "Failed to parse cached record",
+                        logger.error(
+                            "Error parsing cached record",
                             record_num=self._records_fetched,
                             data_spec=data_spec,
+                            error=str(error),
                         )
-                        continue
-
-                    records = parsed if isinstance(parsed, list) else [parsed]
-                    for record in records:
-                        self._records_parsed += 1
-                        record["_raw"] = raw
-                        yield record
-                except Exception as error:
-                    self._records_failed += 1
-                    logger.error(
-                        "Error parsing cached record",
-                        record_num=self._records_fetched,
-                        data_spec=data_spec,
-                        error=str(error),
-                    )
+            finally:
+                self._flush_parse_metrics()
         else:
             # Cache miss: fetch from JV-Link, write to cache
             self.cache_manager = cache_manager
@@ -3,7 +3,7 @@
 This module provides realtime data fetching from JV-Link.
 """
 
-from typing import Callable, Iterable, Iterator, Optional, List
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, List
 
 from src.fetcher.base import BaseFetcher, FetcherError
 from src.jvlink.constants import (
@@ -17,6 +17,9 @@ from src.jvlink.constants import (
 )
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.fetcher.checkpoint import TimeSeriesCheckpoint
+
 logger = get_logger(__name__)
 
 
@@ -373,6 +376,7 @@ class RealtimeFetcher(BaseFetcher):
         to_date: Optional[str] = None,
         pg_config: Optional[dict] = None,
         progress_callback: Optional[Callable[[dict], None]] = None,
+        checkpoint: Optional["TimeSeriesCheckpoint"] = None,
     ) -> Iterator[dict]:
         """Fetch time series odds for races registered in the database.
 
@@ -407,6 +411,10 @@ class RealtimeFetcher(BaseFetcher):
                        of SQLite.
             progress_callback: Optional callback called after each race key is
                                attempted. Receives counters and key status.
+            checkpoint: Optional :class:`~src.fetcher.checkpoint.TimeSeriesCheckpoint`.
+                        Keys it reports as finished are skipped (status
+                        ``skipped``). Recording outcomes is left to the
+                        caller, after the key's records are committed.
 
         Yields:
             Dictionary of parsed record data
@@ -470,12 +478,13 @@ class RealtimeFetcher(BaseFetcher):
             db_file = Path(db_path)
             if not db_file.exists():
                 raise FetcherError(f"Database not found: {db_path}")
-            import sqlite3
-            from contextlib import closing
+            from src.database.readers import reader_pool
 
-            with closing(sqlite3.connect(db_path)) as conn:
+            # Read-only reader: a long backfill must not hold the writer's lock.
+            try:
+                reader = reader_pool(db_path).connection()
                 has_rt_ra = (
-                    conn.execute(
+                    reader.execute(
                         """
                         SELECT 1
                         FROM sqlite_master
@@ -484,6 +493,8 @@ class RealtimeFetcher(BaseFetcher):
                     ).fetchone()
                     is not None
                 )
+            except Exception as e:
+                raise FetcherError(f"Database query failed: {e}")
             rt_union = (
                 """
                     UNION
@@ -565,13 +576,7 @@ class RealtimeFetcher(BaseFetcher):
             if pg_config:
                 race_rows = self._fetch_time_series_race_rows_from_postgres(query, params, pg_config)
             else:
-                import sqlite3
-                from contextlib import closing
-
-                with closing(sqlite3.connect(db_path)) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(query, params)
-                    race_rows = cursor.fetchall()
+                race_rows = reader.execute(query, params).fetchall()
         except Exception as e:
             raise FetcherError(f"Database query failed: {e}")
 
@@ -591,6 +596,7 @@ class RealtimeFetcher(BaseFetcher):
         success_keys = 0
         no_data_keys = 0
         error_keys = 0
+        skipped_keys = 0
         total_records = 0
 
         try:
@@ -622,6 +628,24 @@ class RealtimeFetcher(BaseFetcher):
                             "success_keys": success_keys,
                             "no_data_keys": no_data_keys,
                             "error_keys": error_keys,
+                            "skipped_keys": skipped_keys,
+                            "records_for_key": 0,
+                            "total_records": total_records,
+                        })
+                    continue
+
+                if checkpoint is not None and not checkpoint.should_fetch(data_spec, key):
+                    skipped_keys += 1
+                    if progress_callback:
+                        progress_callback({
+                            "status": "skipped",
+                            "key": key,
+                            "processed_keys": processed_keys,
+                            "total_keys": total_keys,
+                            "success_keys": success_keys,
+                            "no_data_keys": no_data_keys,
+                            "error_keys": error_keys,
+                            "skipped_keys": skipped_keys,
                             "records_for_key": 0,
                             "total_records": total_records,
                         })
@@ -692,6 +716,7 @@ class RealtimeFetcher(BaseFetcher):
                             "success_keys": success_keys,
                             "no_data_keys": no_data_keys,
                             "error_keys": error_keys,
+                            "skipped_keys": skipped_keys,
                             "records_for_key": records_for_key,
                             "total_records": total_records,
                         })
@@ -709,6 +734,7 @@ class RealtimeFetcher(BaseFetcher):
             success_keys=success_keys,
             no_data_keys=no_data_keys,
             error_keys=error_keys,
+            skipped_keys=skipped_keys,
             total_records=total_records,
         )
 
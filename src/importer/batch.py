@@ -3,16 +3,21 @@
 This module provides utilities for batch processing of JV-Data.
 """
 
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from itertools import islice
-from typing import Iterator, List
+from typing import Iterator, List, Optional
 
 from src.database.base import BaseDatabase
+from src.database.changelog import unwrap_database
+from src.database.maintenance import analyze_loaded_tables
 from src.database.schema import create_all_tables
+from src.database.sqlite_handler import SQLiteDatabase
 from src.fetcher.historical import HistoricalFetcher, validate_date_range
 from src.importer.importer import DataImporter, ImporterError
 from src.jvlink.constants import validate_jvopen_combination
 from src.utils.logger import get_logger
+from src.utils.profiler import StageProfiler, current_profiler
 
 logger = get_logger(__name__)
 
@@ -25,6 +30,7 @@ logger = get_logger(__name__)
 # long request must remain one provider open; calendar chunking would repeat
 # the later tail for every chunk.
 SPLIT_SETUP_OPTION = 4
+SETUP_OPTIONS = (3, SPLIT_SETUP_OPTION)
 SETUP_COMMIT_INTERVAL = 10000
 
 
@@ -44,6 +50,12 @@ def _chunks(records: Iterator[dict], size: int) -> Iterator[Iterator[dict]]:
         yield iter(())
 
 
+def _profiled(stage: str):
+    """Time ``stage`` under the active profiler, if any."""
+    profiler = current_profiler()
+    return profiler.stage(stage) if profiler is not None else nullcontext()
+
+
 def _accumulate_stats(totals: dict, stats: dict) -> None:
     """Add one import's statistics into a running total, in place."""
     for key, value in stats.items():
@@ -84,6 +96,7 @@ class BatchProcessor:
         sid: str = "UNKNOWN",
         show_progress: bool = True,
         cache_manager=None,
+        progress_mode: Optional[str] = None,
     ):
         """Initialize batch processor.
 
@@ -93,10 +106,13 @@ class BatchProcessor:
             sid: Session ID for JV-Link API (default: "UNKNOWN")
             show_progress: Show stylish progress display (default: True)
             cache_manager: Optional CacheManager for local file cache read/write
+            progress_mode: Progress display when shown: "rich", "jsonl" or
+                "none" (default: JLTSQL_PROGRESS, then "rich")
         """
         self.fetcher = HistoricalFetcher(
             sid,
             show_progress=show_progress,
+            progress_mode=progress_mode,
         )
         self.importer = DataImporter(database, batch_size)
         self.database = database
@@ -111,8 +127,9 @@ class BatchProcessor:
     def __del__(self):
         """Release JV-Link COM/bridge resources when processor is garbage-collected."""
         try:
-            if hasattr(self.fetcher, 'jvlink') and hasattr(self.fetcher.jvlink, 'cleanup'):
-                self.fetcher.jvlink.cleanup()
+            jvlink = getattr(self.fetcher, '_jvlink', None)
+            if hasattr(jvlink, 'cleanup'):
+                jvlink.cleanup()
         except Exception:
             pass
 
@@ -124,6 +141,7 @@ class BatchProcessor:
         option: int = 1,
         auto_commit: bool = True,
         ensure_tables: bool = True,
+        profiler: Optional[StageProfiler] = None,
     ) -> dict:
         """Process data for a date range.
 
@@ -138,6 +156,8 @@ class BatchProcessor:
                     4=分割セットアップ（初回のみダイアログ）
             auto_commit: Whether to auto-commit
             ensure_tables: Whether to ensure tables exist
+            profiler: Optional StageProfiler activated for the whole run,
+                including cache replay and the final commit
 
         Returns:
             Dictionary with processing statistics
@@ -156,6 +176,11 @@ class BatchProcessor:
             already imported after JVOpen has returned and streaming begins.
             A failed JVOpen itself has no import progress to commit.
 
+            On SQLite, option 3/4 runs inside ``SQLiteDatabase.bulk_load()``;
+            safe pragmas are restored and the database is checked afterwards.
+            On PostgreSQL, tables that received at least ``ANALYZE_MIN_ROWS``
+            rows are analyzed after the commit.
+
         Examples:
             >>> processor = BatchProcessor(database=db)
             >>> stats = processor.process_date_range("RACE", "20240601", "20240630")
@@ -165,6 +190,12 @@ class BatchProcessor:
         validate_jvopen_combination(data_spec, option)
         validate_date_range(from_date, to_date)
 
+        if profiler is not None:
+            with profiler.activate():
+                return self.process_date_range(
+                    data_spec, from_date, to_date, option, auto_commit, ensure_tables
+                )
+
         logger.info(
             "Starting batch processing",
             data_spec=data_spec,
@@ -176,8 +207,41 @@ class BatchProcessor:
         # Ensure tables exist
         if ensure_tables:
             logger.info("Ensuring all tables exist")
-            create_all_tables(self.database)
+            with _profiled("schema"):
+                create_all_tables(self.database)
+
+        # Setup imports write whole data specs; run them in SQLite's
+        # bulk-load session (databases.sqlite.bulk_load).
+        # Change capture wraps the handler; its bulk_load() is delegated.
+        session = (
+            self.database.bulk_load()
+            if option in SETUP_OPTIONS
+            and isinstance(unwrap_database(self.database), SQLiteDatabase)
+            else nullcontext()
+        )
+        # PostgreSQL plans against stale statistics until autovacuum gets
+        # round to the freshly loaded tables; analyze them right away.
+        rows_by_table = getattr(self.importer, "get_rows_by_table", None) if auto_commit else None
+        rows_before = rows_by_table() if rows_by_table is not None else {}
+        with session:
+            stats = self._fetch_and_import(data_spec, from_date, to_date, option, auto_commit)
+        if rows_by_table is not None:
+            loaded = {
+                table: rows - rows_before.get(table, 0)
+                for table, rows in rows_by_table().items()
+            }
+            analyze_loaded_tables(self.database, loaded)
+        return stats
 
+    def _fetch_and_import(
+        self,
+        data_spec: str,
+        from_date: str,
+        to_date: str,
+        option: int,
+        auto_commit: bool,
+    ) -> dict:
+        """Fetch one data spec and import it; see :meth:`process_date_range`."""
         # Fetch and import records (use cache if available)
         try:
             if self.cache_manager:
@@ -225,7 +289,8 @@ class BatchProcessor:
                             )
                         }
                     )
-                    self.database.commit()
+                    with _profiled("commit"):
+                        self.database.commit()
 
             # Combine statistics
             fetch_stats = self.fetcher.get_statistics()
@@ -241,7 +306,8 @@ class BatchProcessor:
             self._raise_if_rejected(combined_stats)
 
             if auto_commit and not commit_per_chunk:
-                self.database.commit()
+                with _profiled("commit"):
+                    self.database.commit()
 
             logger.info("Batch processing completed", **combined_stats)
 
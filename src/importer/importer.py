@@ -5,6 +5,7 @@ This module imports parsed JV-Data records into database.
 
 import json
 import re
+import time
 from itertools import chain
 from typing import Any, Dict, Iterator, List, Optional
 
@@ -22,9 +23,16 @@ from src.parser.status_domain import (
     validate_record_header,
 )
 from src.utils.logger import get_logger
+from src.utils.metrics import counter, histogram
+from src.utils.profiler import current_profiler
 
 logger = get_logger(__name__)
 
+BATCH_FLUSH_SECONDS = histogram(
+    "jltsql_batch_flush_seconds", "Time to write one import batch", ["table"]
+)
+ROWS_WRITTEN = counter("jltsql_rows_written_total", "Rows written per table", ["table"])
+
 
 class TransactionRecoveryError(RuntimeError):
     """A failed transaction could not be rolled back or invalidated safely."""
@@ -5446,11 +5454,14 @@ def _standard_odds_physical_fingerprint(
     configured = _standard_odds_config(record, owner_table_name)
     if configured is None:
         raise SchemaMigrationError(f"{owner_table_name} is not a standard odds owner table")
+    source = record.get("_source")
+    if source is not None:
+        # Fetchers attach the same RecordSource object to every expanded row.
+        # Object identity avoids comparing O6 headers thousands of times;
+        # the pending rows keep it alive until the boundary is flushed.
+        return owner_table_name, "source", id(source)
     raw = record.get("_raw")
     if isinstance(raw, (bytes, bytearray, memoryview)):
-        # Fetchers attach the same raw buffer object to every expanded row.
-        # Object identity avoids re-hashing an O6 buffer thousands of times;
-        # the pending rows keep it alive until the boundary is flushed.
         return owner_table_name, "raw", id(raw)
     return (
         owner_table_name,
@@ -5866,6 +5877,9 @@ def _standard_vote_physical_fingerprint(
     configured = _standard_vote_config(record, owner_table_name)
     if configured is None:
         raise SchemaMigrationError(f"{owner_table_name} is not a standard vote owner table")
+    source = record.get("_source")
+    if source is not None:
+        return owner_table_name, "source", id(source)
     raw = record.get("_raw")
     if isinstance(raw, (bytes, bytearray, memoryview)):
         return owner_table_name, "raw", id(raw)
@@ -7978,6 +7992,9 @@ class DataImporter:
         self._records_failed = 0
         self._batches_processed = 0
         self._single_record_stats_checkpoint: Optional[tuple[int, int, int, int]] = None
+        # Rows written per table over the importer's lifetime; unlike the
+        # statistics above it is not reset per import_records() call.
+        self._rows_by_table: Dict[str, int] = {}
         self._jravan_tables_ready = not use_jravan_schema
         self._verified_mining_native_tables: set[str] = set()
         self._verified_hy_tables: set[str] = set()
@@ -8179,6 +8196,13 @@ class DataImporter:
 
     def _record_for_table(self, record: dict, table_name: str) -> dict:
         """Return the parser representation required by the target schema."""
+        profiler = current_profiler()
+        if profiler is not None:
+            with profiler.stage("convert", table_name):
+                return self._table_record(record, table_name)
+        return self._table_record(record, table_name)
+
+    def _table_record(self, record: dict, table_name: str) -> dict:
         if table_name in {"BATAIJYU", "MINING", "TAISENGATA_MINING"}:
             wide_record = record.get("_wide_record")
             if isinstance(wide_record, dict):
@@ -8191,6 +8215,10 @@ class DataImporter:
         Delegates to the module-level convert_record_types() so that
         DataImporter and RealtimeUpdater share identical coercion rules.
         """
+        profiler = current_profiler()
+        if profiler is not None:
+            with profiler.stage("convert", table_name):
+                return convert_record_types(record, table_name)
         return convert_record_types(record, table_name)
 
     @staticmethod
@@ -8308,9 +8336,12 @@ class DataImporter:
         standard_odds_fingerprints: dict[str, tuple] = {}
         standard_vote_fingerprints: dict[str, tuple] = {}
         last_expanded_record_fingerprint = None
+        profiler = current_profiler()
 
         try:
             for record in records:
+                if profiler is not None:
+                    validate_started = time.perf_counter()
                 record_type, _ = validate_import_record_header(record)
                 # Get record type and table name
                 # Note: Japanese parsers use 'レコード種別ID', JRA-VAN standard uses 'RecordSpec'
@@ -8408,6 +8439,10 @@ class DataImporter:
                 if table_name not in self._verified_mining_native_tables:
                     if verify_mining_native_schema(self.database, record, table_name):
                         self._verified_mining_native_tables.add(table_name)
+                if profiler is not None:
+                    profiler.record(
+                        "validate", record_type, time.perf_counter() - validate_started
+                    )
 
                 if _is_standard_vote_record_erase(record, table_name):
                     pending = batch_buffers.setdefault(table_name, [])
@@ -8617,6 +8652,29 @@ class DataImporter:
         if not batch:
             return
 
+        imported_before = self._records_imported
+        started = time.perf_counter()
+        profiler = current_profiler()
+        try:
+            if profiler is None:
+                self._write_batch(table_name, batch, auto_commit)
+            else:
+                with profiler.stage("flush", table_name):
+                    self._write_batch(table_name, batch, auto_commit)
+        finally:
+            written = max(0, self._records_imported - imported_before)
+            BATCH_FLUSH_SECONDS.labels(table_name).observe(time.perf_counter() - started)
+            ROWS_WRITTEN.labels(table_name).inc(written)
+            self._rows_by_table[table_name] = self._rows_by_table.get(table_name, 0) + written
+
+    def _write_batch(
+        self,
+        table_name: str,
+        batch: List[dict],
+        auto_commit: bool,
+    ):
+        """Write a non-empty batch through the table-specific storage path."""
+
         if table_name not in self._verified_rc_tables:
             if verify_rc_storage_schema(self.database, table_name):
                 self._verified_rc_tables.add(table_name)
@@ -9480,6 +9538,14 @@ class DataImporter:
             "batches_processed": self._batches_processed,
         }
 
+    def get_rows_by_table(self) -> Dict[str, int]:
+        """Get the rows written per table since the importer was created.
+
+        Returns:
+            Dictionary mapping table name to rows written
+        """
+        return dict(self._rows_by_table)
+
     def reset_statistics(self):
         """Reset import statistics."""
         self._records_imported = 0
@@ -7,12 +7,15 @@ Key optimizations:
 - Adaptive batch sizing based on performance
 """
 
+import time
 from itertools import chain
 from typing import Dict, Iterator, List, Optional, Union
 
 from src.database.base import BaseDatabase, DatabaseError
 from src.database.migration import SchemaMigrationError
 from src.importer.importer import (
+    BATCH_FLUSH_SECONDS,
+    ROWS_WRITTEN,
     _ORDERED_MASTER_STORAGE_TABLES,
     _PREPARED_CH_SEISEKI_ROWS_KEY,
     _PREPARED_CK_ROWS_KEY,
@@ -895,6 +898,22 @@ class OptimizedDataImporter:
         if not batch:
             return
 
+        imported_before = self._records_imported
+        started = time.perf_counter()
+        try:
+            self._write_batch_optimized(table_name, batch, commit_batch)
+        finally:
+            BATCH_FLUSH_SECONDS.labels(table_name).observe(time.perf_counter() - started)
+            ROWS_WRITTEN.labels(table_name).inc(max(0, self._records_imported - imported_before))
+
+    def _write_batch_optimized(
+        self,
+        table_name: str,
+        batch: List[dict],
+        commit_batch: bool,
+    ):
+        """Write a non-empty batch through the table-specific storage path."""
+
         if table_name in _RC_STORAGE_TABLES:
             # RC validation/write failures propagate directly and never enter
             # the generic per-row fallback below.
@@ -0,0 +1,353 @@
+"""Parallel import of NL cache files (``jltsql cache import``).
+
+Replaying a complete NL cache needs no JV-Link session, so the cached
+``{SPEC}/{YYYYMMDD}`` files can be processed independently. The range is cut
+into one shard per spec and date file and the shards are spread over worker
+processes:
+
+- PostgreSQL: every worker parses its shards and writes them through its own
+  connection, opened once per worker process and reused for all its shards.
+- SQLite (and ``dual``, whose primary is SQLite): the workers only parse.
+  The parent is the single writer and applies the shards in spec/date order,
+  exactly as a serial cache replay would.
+
+Each shard is one transaction. Rows are written with the importer's normal
+upsert semantics, so a shard can be re-run after a failure without
+duplicating anything. Cache files are keyed by the record's event date, so
+the versions of one race all land in the same shard.
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.cache import CacheManager
+from src.database import create_database_from_config
+from src.database.base import BaseDatabase
+from src.database.schema import create_all_tables
+from src.fetcher.base import RecordSource
+from src.importer.importer import DataImporter
+from src.parser.factory import ParserFactory
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Backends whose writes all go through one file handle.
+SINGLE_WRITER_DB_TYPES = frozenset({"sqlite", "dual"})
+
+Shard = Tuple[str, str]
+
+# Per-process state of a PostgreSQL import worker.
+_worker_database: Optional[BaseDatabase] = None
+_worker_importer: Optional[DataImporter] = None
+_worker_parser: Optional[ParserFactory] = None
+
+
+def plan_shards(
+    cache_manager: CacheManager, specs: List[str], from_date: str, to_date: str
+) -> List[Shard]:
+    """Return the ``(spec, date)`` shards that hold cached records.
+
+    Args:
+        cache_manager: Cache to import from
+        specs: Data specification codes, in import order
+        from_date: Start date (YYYYMMDD)
+        to_date: End date (YYYYMMDD)
+
+    Returns:
+        Shards ordered by spec, then date. Complete dates without a cache
+        file (days without records) are skipped.
+
+    Raises:
+        ValueError: If any spec is not completely cached for the range
+    """
+    start = datetime.strptime(from_date, "%Y%m%d").date()
+    end = datetime.strptime(to_date, "%Y%m%d").date()
+    dates = [
+        (start + timedelta(days=offset)).strftime("%Y%m%d")
+        for offset in range((end - start).days + 1)
+    ]
+
+    shards: List[Shard] = []
+    for spec in specs:
+        missing = [date_str for date_str in dates if not cache_manager.has_nl(spec, date_str)]
+        if missing:
+            raise ValueError(
+                f"{spec} is not completely cached for {from_date}..{to_date}: "
+                f"{len(missing)} date(s) missing, first {missing[0]}. "
+                "Run 'jltsql cache build' for the range first."
+            )
+        shards.extend(
+            (spec, date_str)
+            for date_str in dates
+            if cache_manager.has_nl_records(spec, date_str)
+        )
+    return shards
+
+
+def parse_shard(cache_dir: str, shard: Shard, parser: Optional[ParserFactory] = None) -> dict:
+    """Parse every cached record of one shard.
+
+    Args:
+        cache_dir: Cache directory
+        shard: ``(spec, date)`` to read
+        parser: Parser factory to reuse (default: a new one)
+
+    Returns:
+        Dictionary with the parsed ``records`` and fetch statistics
+    """
+    spec, date_str = shard
+    parser = parser or ParserFactory()
+    records: List[dict] = []
+    fetched = failed = 0
+    for raw in CacheManager(cache_dir).read_nl(spec, date_str, date_str):
+        fetched += 1
+        try:
+            parsed = parser.parse(raw)
+        except Exception as error:
+            failed += 1
+            logger.error(
+                "Error parsing cached record",
+                data_spec=spec,
+                date=date_str,
+                record_num=fetched,
+                error=str(error),
+            )
+            continue
+        if not parsed:
+            failed += 1
+            logger.warning(
+                "Failed to parse cached record",
+                data_spec=spec,
+                date=date_str,
+                record_num=fetched,
+            )
+            continue
+        # Expanded rows share one source; the importer groups them by it.
+        source = RecordSource(f"cache:{spec}/{date_str}", fetched)
+        for record in parsed if isinstance(parsed, list) else [parsed]:
+            record["_source"] = source
+            records.append(record)
+    return {
+        "records": records,
+        "records_fetched": fetched,
+        "records_parsed": len(records),
+        "records_failed": failed,
+    }
+
+
+def _import_parsed(database: BaseDatabase, importer: DataImporter, shard: Shard, parsed: dict) -> dict:
+    """Write one parsed shard in its own transaction; roll it back on rejection."""
+    stats = {
+        "records_fetched": parsed["records_fetched"],
+        "records_parsed": parsed["records_parsed"],
+        "records_imported": 0,
+        "records_failed": parsed["records_failed"],
+        "shards_failed": 0,
+    }
+    error = None
+    if not parsed["records_failed"]:
+        try:
+            database.begin_transaction()
+            import_stats = importer.import_records(iter(parsed["records"]), auto_commit=False)
+            stats["records_failed"] += int(import_stats.get("records_failed", 0) or 0)
+            if not stats["records_failed"]:
+                database.commit()
+                stats["records_imported"] = int(import_stats.get("records_imported", 0) or 0)
+        except Exception as exc:
+            error = str(exc)
+    if stats["records_failed"] or error:
+        try:
+            database.rollback()
+        except Exception as rollback_error:
+            logger.warning("Shard rollback failed", error=str(rollback_error))
+        stats["shards_failed"] = 1
+        stats["failed_shard"] = f"{shard[0]}/{shard[1]}"
+        logger.error(
+            "Cache shard import failed",
+            data_spec=shard[0],
+            date=shard[1],
+            records_failed=stats["records_failed"],
+            error=error,
+        )
+    return stats
+
+
+def _init_worker(config: Dict[str, Any], db_type: str, batch_size: int) -> None:
+    """Open the connection a PostgreSQL worker keeps for all its shards."""
+    from multiprocessing.util import Finalize
+
+    from src.utils.config import Config
+
+    global _worker_database, _worker_importer, _worker_parser
+    _worker_database = create_database_from_config(
+        Config(config) if config is not None else None, db_type_override=db_type
+    )
+    _worker_database.connect()
+    _worker_importer = DataImporter(_worker_database, batch_size)
+    _worker_parser = ParserFactory()
+    # Pool workers leave through os._exit, so atexit would never run.
+    Finalize(_worker_database, _worker_database.disconnect, exitpriority=10)
+
+
+def _import_shard(cache_dir: str, shard: Shard) -> dict:
+    """Parse and write one shard on the worker's own connection."""
+    parsed = parse_shard(cache_dir, shard, _worker_parser)
+    return _import_parsed(_worker_database, _worker_importer, shard, parsed)
+
+
+def _in_order(
+    executor: ProcessPoolExecutor, func: Callable, items: List, window: int
+) -> Iterator[Any]:
+    """Like ``executor.map`` but with at most ``window`` results pending.
+
+    A single writer is slower than the parsers; bounding the window keeps
+    parsed shards from piling up in the parent's memory.
+    """
+    items_iter = iter(items)
+    pending: List[Future] = [
+        executor.submit(func, *item) for item in islice(items_iter, window)
+    ]
+    while pending:
+        result = pending.pop(0).result()
+        item = next(items_iter, None)
+        if item is not None:
+            pending.append(executor.submit(func, *item))
+        yield result
+
+
+class ParallelCacheImporter:
+    """Import a completely cached range with several worker processes.
+
+    Examples:
+        >>> importer = ParallelCacheImporter(config, CacheManager("data/cache"),
+        ...                                  db_type="postgresql", workers=8)
+        >>> stats = importer.run(["RACE", "DIFN"], "20160101", "20251231")
+        >>> print(stats["records_imported"], stats["shards_failed"])
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        cache_manager: CacheManager,
+        db_type: str,
+        workers: Optional[int] = None,
+        batch_size: int = 1000,
+        progress: Optional[Callable[[Shard, dict], None]] = None,
+    ):
+        """Initialize the importer.
+
+        Args:
+            config: Loaded configuration (``Config``) or ``None`` for defaults
+            cache_manager: Cache to import from
+            db_type: ``sqlite``, ``postgresql`` or ``dual``
+            workers: Worker processes (default: CPU count). With 1 everything
+                runs in the calling process.
+            batch_size: Records per importer batch
+            progress: Optional callback invoked with each finished shard and
+                its statistics
+        """
+        self.config = config
+        self.cache_manager = cache_manager
+        self.db_type = db_type
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = batch_size
+        self.progress = progress
+
+    def run(self, specs: List[str], from_date: str, to_date: str) -> dict:
+        """Import every cached shard of ``specs`` between the two dates.
+
+        Args:
+            specs: Data specification codes
+            from_date: Start date (YYYYMMDD)
+            to_date: End date (YYYYMMDD)
+
+        Returns:
+            Dictionary with import statistics; ``failed_shards`` lists the
+            ``SPEC/YYYYMMDD`` shards that were rolled back
+
+        Raises:
+            ValueError: If the range is invalid or not completely cached
+        """
+        from src.fetcher.historical import validate_date_range
+
+        validate_date_range(from_date, to_date)
+        shards = plan_shards(self.cache_manager, specs, from_date, to_date)
+        logger.info(
+            "Starting parallel cache import",
+            specs=specs,
+            from_date=from_date,
+            to_date=to_date,
+            shards=len(shards),
+            workers=self.workers,
+            db_type=self.db_type,
+        )
+
+        single_writer = self.db_type in SINGLE_WRITER_DB_TYPES or self.workers == 1
+        database = create_database_from_config(self.config, db_type_override=self.db_type)
+        with database:
+            # DDL once, before any worker writes.
+            create_all_tables(database)
+            if single_writer:
+                totals = self._collect(self._run_single_writer(database, shards))
+        if not single_writer:
+            totals = self._collect(self._run_workers(shards))
+
+        totals["shards"] = len(shards)
+        totals["workers"] = self.workers
+        logger.info("Parallel cache import completed", **{
+            key: value for key, value in totals.items() if key != "failed_shards"
+        })
+        return totals
+
+    def _run_single_writer(self, database: BaseDatabase, shards: List[Shard]) -> Iterator[Tuple[Shard, dict]]:
+        importer = DataImporter(database, self.batch_size)
+        cache_dir = str(self.cache_manager.cache_dir)
+        if self.workers == 1:
+            parser = ParserFactory()
+            for shard in shards:
+                parsed = parse_shard(cache_dir, shard, parser)
+                yield shard, _import_parsed(database, importer, shard, parsed)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            parsed_shards = _in_order(
+                executor,
+                parse_shard,
+                [(cache_dir, shard) for shard in shards],
+                window=self.workers * 2,
+            )
+            for shard, parsed in zip(shards, parsed_shards):
+                yield shard, _import_parsed(database, importer, shard, parsed)
+
+    def _run_workers(self, shards: List[Shard]) -> Iterator[Tuple[Shard, dict]]:
+        config = self.config.to_dict() if hasattr(self.config, "to_dict") else self.config
+        cache_dir = str(self.cache_manager.cache_dir)
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(config, self.db_type, self.batch_size),
+        ) as executor:
+            futures = [(shard, executor.submit(_import_shard, cache_dir, shard)) for shard in shards]
+            for shard, future in futures:
+                yield shard, future.result()
+
+    def _collect(self, results: Iterator[Tuple[Shard, dict]]) -> dict:
+        totals: dict = {
+            "records_fetched": 0,
+            "records_parsed": 0,
+            "records_imported": 0,
+            "records_failed": 0,
+            "shards_failed": 0,
+            "failed_shards": [],
+        }
+        for shard, stats in results:
+            for key in ("records_fetched", "records_parsed", "records_imported", "records_failed", "shards_failed"):
+                totals[key] += stats[key]
+            if "failed_shard" in stats:
+                totals["failed_shards"].append(stats["failed_shard"])
+            if self.progress is not None:
+                self.progress(shard, stats)
+        return totals
@@ -4,6 +4,8 @@ Platform support:
 - Windows (32-bit Python): direct COM via pywin32 (`JVLinkWrapper`)
 - Windows (64-bit Python): `JVLinkBridge` subprocess
 - Linux/Docker: `JVLinkBridge` subprocess through an external Wine runner
+- Any platform, offline: `JVLinkReplay` serving cached or recorded sessions
+  (`jvlink.replay` / `JVLINK_REPLAY_SOURCE`)
 """
 
 import sys
@@ -0,0 +1,566 @@
+"""Record/replay stand-in for the JV-Link API.
+
+``JVLinkReplay`` implements the ``jv_init`` / ``jv_open`` / ``jv_rt_open`` /
+``jv_read`` / ``jv_close`` surface of ``JVLinkWrapper`` and ``JVLinkBridge``
+from recorded data, so ``BatchProcessor``, the realtime monitors and
+``scripts/background_updater.py`` can run end to end on hosts without
+JV-Link COM or the bridge (Linux CI, load-test boxes).
+
+Sources:
+- A ``CacheManager`` directory: ``jv_open`` serves ``nl/{SPEC}`` date files
+  from the requested start point on, one date file per JV-Link file;
+  ``jv_rt_open`` serves the ``rt/{RecordSpec}/{YYYYMMDD}.bin`` files of the
+  record types the spec delivers, filtered by a ``YYYYMMDDJJRR`` race key.
+- A session log (JSON lines) captured by ``JVLinkRecorder`` around a real
+  client: each open returns the recorded result and serves the reads recorded
+  after it.
+
+Pacing:
+- ``max``: records are returned as fast as they are read.
+- ``realtime``: recorded gaps between reads (session logs) or ``interval``
+  seconds between records (cache sources) are reproduced.
+- ``burst``: ``burst_size`` records back to back, then ``burst_interval``
+  seconds of silence, like odds refreshes before post time.
+
+All waits are divided by ``speed``; ``speed: 10`` with ``realtime`` pacing
+delivers a race day at ten times its recorded rate.
+
+Replay is selected with the ``jvlink.replay`` config section (applied by the
+CLI) or, for scripts that do not read ``config.yaml``, ``JVLINK_REPLAY_SOURCE``
+/ ``JVLINK_REPLAY_PACING`` / ``JVLINK_REPLAY_SPEED``. ``jvlink.record_session``
+(or ``JVLINK_RECORD_SESSION``) records a real client's session for later
+replay.
+"""
+
+import base64
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.cache.manager import CacheManager
+from src.jvlink.constants import (
+    JV_READ_NO_MORE_DATA,
+    JV_READ_SUCCESS,
+    JV_RT_ERROR,
+    JV_RT_JVINIT_NOT_CALLED,
+    JV_RT_NOT_CLOSED,
+    JV_RT_SUCCESS,
+    validate_jvopen_combination,
+)
+from src.jvlink.wrapper import JVLinkError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PACING_MODES = ("max", "realtime", "burst")
+
+DEFAULT_REPLAY_SETTINGS: Dict[str, Any] = {
+    "enabled": False,
+    "source": None,
+    "pacing": "max",
+    "speed": 1.0,
+    "interval": 0.05,
+    "burst_size": 200,
+    "burst_interval": 5.0,
+}
+
+# Record types each JVRTOpen spec delivers (JV-Data仕様書 データ種別一覧).
+RT_SPEC_RECORD_TYPES: Dict[str, Tuple[str, ...]] = {
+    "0B11": ("WH",),
+    "0B12": ("RA", "SE", "HR"),
+    "0B13": ("DM",),
+    "0B14": ("WE", "AV", "JC", "TC", "CC"),
+    "0B15": ("RA", "SE", "HR"),
+    "0B16": ("WE", "AV", "JC", "TC", "CC"),
+    "0B17": ("TM",),
+    "0B20": ("H1", "H6"),
+    "0B30": ("O1", "O2", "O3", "O4", "O5", "O6"),
+    "0B31": ("O1",),
+    "0B32": ("O2",),
+    "0B33": ("O3",),
+    "0B34": ("O4",),
+    "0B35": ("O5",),
+    "0B36": ("O6",),
+    "0B41": ("O1",),
+    "0B42": ("O2",),
+    "0B51": ("WF",),
+}
+
+_READ_CALLS = ("jv_read", "jv_gets")
+
+_configured: Optional[Dict[str, Any]] = None
+_record_path: Optional[str] = None
+
+
+def configure_jvlink(jvlink_config: Optional[Dict[str, Any]]) -> None:
+    """Apply the ``jvlink`` config section for every client created later.
+
+    Args:
+        jvlink_config: The ``jvlink`` section. Its ``replay`` mapping selects
+            ``JVLinkReplay``; ``record_session`` names a session log that
+            real clients are recorded to. Missing keys fall back to the
+            ``JVLINK_REPLAY_*`` / ``JVLINK_RECORD_SESSION`` environment
+            variables.
+    """
+    global _configured, _record_path
+    jvlink_config = jvlink_config or {}
+    replay = jvlink_config.get("replay")
+    _configured = dict(replay) if replay else None
+    _record_path = jvlink_config.get("record_session") or None
+
+
+def replay_settings() -> Optional[Dict[str, Any]]:
+    """Return the active replay settings, or None when replay is off."""
+    if _configured is not None:
+        if not _configured.get("enabled", False):
+            return None
+        return {**DEFAULT_REPLAY_SETTINGS, **_configured}
+
+    source = os.environ.get("JVLINK_REPLAY_SOURCE", "").strip()
+    if not source:
+        return None
+    settings = {**DEFAULT_REPLAY_SETTINGS, "enabled": True, "source": source}
+    pacing = os.environ.get("JVLINK_REPLAY_PACING", "").strip()
+    if pacing:
+        settings["pacing"] = pacing
+    speed = os.environ.get("JVLINK_REPLAY_SPEED", "").strip()
+    if speed:
+        try:
+            settings["speed"] = float(speed)
+        except ValueError as error:
+            raise JVLinkError(f"JVLINK_REPLAY_SPEED must be a number, got {speed!r}") from error
+    return settings
+
+
+def record_session(client: Any) -> Any:
+    """Wrap a real client in ``JVLinkRecorder`` when a session log is configured."""
+    path = _record_path or os.environ.get("JVLINK_RECORD_SESSION", "").strip()
+    if not path:
+        return client
+    return JVLinkRecorder(client, path)
+
+
+def create_replay_client(sid: str) -> Optional["JVLinkReplay"]:
+    """Return a configured ``JVLinkReplay``, or None when replay is off."""
+    settings = replay_settings()
+    if settings is None:
+        return None
+    options = {key: value for key, value in settings.items() if key != "enabled"}
+    logger.info(
+        "Using JV-Link replay",
+        source=str(options["source"]),
+        pacing=options["pacing"],
+        speed=options["speed"],
+    )
+    return JVLinkReplay(sid, **options)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"b64": base64.b64encode(bytes(value)).decode("ascii")}
+    if isinstance(value, tuple):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict) and "b64" in value:
+        return base64.b64decode(value["b64"])
+    if isinstance(value, list):
+        return tuple(_decode(item) for item in value)
+    return value
+
+
+class JVLinkReplay:
+    """JV-Link client serving recorded data.
+
+    Args:
+        sid: Session ID (kept for logging parity with the real clients)
+        source: ``CacheManager`` directory or session log file
+        pacing: One of ``max``, ``realtime``, ``burst``
+        speed: Divisor applied to every wait
+        interval: Seconds between records for ``realtime`` pacing of a cache
+        burst_size: Records per burst for ``burst`` pacing
+        burst_interval: Seconds between bursts for ``burst`` pacing
+
+    Raises:
+        JVLinkError: If the source does not exist or a setting is invalid
+
+    Examples:
+        >>> replay = JVLinkReplay("JLTSQL", "data/replay/cache")
+        >>> replay.jv_init()
+        0
+        >>> result, read_count, download_count, _ = replay.jv_open("RACE", "20260103235959", 4)
+        >>> while replay.jv_read()[0] != 0:
+        ...     pass
+        >>> replay.jv_close()
+        0
+    """
+
+    def __init__(
+        self,
+        sid: str = "UNKNOWN",
+        source: Optional[str] = None,
+        pacing: str = "max",
+        speed: float = 1.0,
+        interval: float = 0.05,
+        burst_size: int = 200,
+        burst_interval: float = 5.0,
+    ):
+        """Initialize the replay client."""
+        if not source:
+            raise JVLinkError("JV-Link replay requires a source")
+        self.source = Path(source).expanduser()
+        if not self.source.exists():
+            raise JVLinkError(f"JV-Link replay source not found: {self.source}")
+        if pacing not in PACING_MODES:
+            raise JVLinkError(
+                f"Unsupported JV-Link replay pacing {pacing!r}; use one of {', '.join(PACING_MODES)}"
+            )
+        if not isinstance(speed, (int, float)) or not math.isfinite(speed) or speed <= 0:
+            raise JVLinkError(f"JV-Link replay speed must be positive, got {speed!r}")
+
+        self.sid = sid
+        self.pacing = pacing
+        self.speed = float(speed)
+        self.interval = float(interval)
+        self.burst_size = max(1, int(burst_size))
+        self.burst_interval = float(burst_interval)
+
+        self._session: Optional[List[Dict[str, Any]]] = None
+        self._session_cursor = 0
+        if self.source.is_file():
+            self._session = self._load_session(self.source)
+        self._cache = None if self._session is not None else CacheManager(self.source)
+
+        self._initialized = False
+        self._is_open = False
+        self._stream: Iterator[Tuple[int, Optional[bytes], Optional[str], float]] = iter(())
+        self._download_count = 0
+        self._due = 0.0
+        self._served = 0
+
+    # --- Sources ---
+    @staticmethod
+    def _load_session(path: Path) -> List[Dict[str, Any]]:
+        entries = []
+        with open(path, encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError as error:
+                    raise JVLinkError(
+                        f"Invalid JV-Link session log line {line_number} in {path}: {error}"
+                    ) from error
+        return entries
+
+    def _session_open(self, call: str, args: Tuple) -> Optional[Tuple]:
+        """Find the recorded ``call`` for ``args`` and queue the reads after it."""
+        entries = self._session or []
+        order = list(range(self._session_cursor, len(entries))) + list(
+            range(0, self._session_cursor)
+        )
+        matches = [i for i in order if entries[i].get("call") == call]
+        exact = [i for i in matches if tuple(entries[i].get("args", ())) == tuple(args)]
+        by_spec = [i for i in matches if tuple(entries[i].get("args", ()))[:1] == tuple(args)[:1]]
+        candidates = exact or by_spec
+        if not candidates:
+            return None
+
+        index = candidates[0]
+        reads = []
+        cursor = index + 1
+        while cursor < len(entries) and entries[cursor].get("call") in _READ_CALLS + (
+            "jv_status",
+        ):
+            entry = entries[cursor]
+            if entry["call"] in _READ_CALLS:
+                reads.append(entry)
+            cursor += 1
+        self._session_cursor = cursor % len(entries) if entries else 0
+        self._stream = self._session_reads(entries[index].get("t", 0.0), reads)
+        return _decode(entries[index]["result"])
+
+    def _session_reads(self, opened_at: float, reads: List[Dict[str, Any]]):
+        previous = opened_at
+        for entry in reads:
+            result = _decode(entry["result"])
+            gap = max(0.0, entry.get("t", previous) - previous)
+            previous = entry.get("t", previous)
+            if entry["call"] == "jv_gets":
+                ret_code, buff = result[0], result[1]
+                filename = None
+            else:
+                ret_code, buff, filename = result
+            if ret_code == JV_READ_SUCCESS:
+                return
+            yield ret_code, buff, filename, gap
+
+    def _nl_dates(self, spec: str) -> List[str]:
+        suffix = f".v{CacheManager.NL_CACHE_SCHEMA_VERSION}.bin"
+        directory = self.source / "nl" / spec.upper()
+        if not directory.is_dir():
+            return []
+        return sorted(path.name[: -len(suffix)] for path in directory.glob(f"*{suffix}"))
+
+    def _cache_files(self, files: List[Tuple[str, Iterator[bytes]]]):
+        for index, (filename, records) in enumerate(files):
+            if index:
+                yield JV_READ_NO_MORE_DATA, None, filename, 0.0
+            for raw in records:
+                yield len(raw), raw, filename, self.interval
+
+    @staticmethod
+    def _matches_key(raw: bytes, key: str) -> bool:
+        # Year+MonthDay, JyoCD and RaceNum of the race-keyed record header.
+        if len(key) != 12:
+            return True
+        return (
+            raw[11:19] == key[:8].encode("ascii")
+            and raw[19:21] == key[8:10].encode("ascii")
+            and raw[25:27] == key[10:12].encode("ascii")
+        )
+
+    # --- JV-Link surface ---
+    def jv_init(self) -> int:
+        """Initialize the replay session.
+
+        Returns:
+            0 (JV_RT_SUCCESS)
+        """
+        self._initialized = True
+        logger.info("JV-Link replay initialized", sid=self.sid, source=str(self.source))
+        return JV_RT_SUCCESS
+
+    def _check_open_allowed(self) -> None:
+        if not self._initialized:
+            raise JVLinkError("JVInit has not been called", error_code=JV_RT_JVINIT_NOT_CALLED)
+        if self._is_open:
+            raise JVLinkError("Previous stream is still open", error_code=JV_RT_NOT_CLOSED)
+
+    def _start_stream(self) -> None:
+        self._is_open = True
+        self._due = time.monotonic()
+        self._served = 0
+
+    def jv_open(
+        self,
+        data_spec: str,
+        fromtime: str,
+        option: int = 1,
+    ) -> Tuple[int, int, int, str]:
+        """Open a recorded historical stream.
+
+        Args:
+            data_spec: One or more concatenated four-character data specs
+            fromtime: ``YYYYMMDDhhmmss`` start point, optionally ``-end``
+            option: JVOpen option (validated like the real clients)
+
+        Returns:
+            Tuple of (result_code, read_count, download_count, last_file_timestamp);
+            result_code is -1 when nothing was recorded for the request
+        """
+        validate_jvopen_combination(data_spec, option)
+        self._check_open_allowed()
+
+        if self._session is not None:
+            result = self._session_open("jv_open", (data_spec, fromtime, option))
+            if result is None:
+                return JV_RT_ERROR, 0, 0, ""
+            self._download_count = result[2]
+            self._start_stream()
+            return result
+
+        start, _, end = fromtime.partition("-")
+        start_date, start_time = start[:8], start[8:14] or "000000"
+        end_date = end[:8] or "99991231"
+        files = []
+        for offset in range(0, len(data_spec), 4):
+            spec = data_spec[offset:offset + 4]
+            for date_str in self._nl_dates(spec):
+                after_start = date_str > start_date or (
+                    date_str == start_date and start_time < "235959"
+                )
+                if after_start and date_str <= end_date:
+                    files.append(
+                        (f"{spec}{date_str}.jvd", self._cache.read_nl(spec, date_str, date_str))
+                    )
+        if not files:
+            return JV_RT_ERROR, 0, 0, ""
+
+        self._download_count = 0
+        self._stream = self._cache_files(files)
+        self._start_stream()
+        logger.info("JV-Link replay stream opened", data_spec=data_spec, files=len(files))
+        return JV_RT_SUCCESS, len(files), 0, files[-1][0][4:12] + "235959"
+
+    def jv_rt_open(self, data_spec: str, key: str = "") -> Tuple[int, int]:
+        """Open a recorded realtime stream.
+
+        Args:
+            data_spec: Realtime spec (e.g. ``0B12``, ``0B31``)
+            key: ``YYYYMMDD`` or ``YYYYMMDDJJRR`` key
+
+        Returns:
+            Tuple of (result_code, read_count); result_code is -1 when nothing
+            was recorded for the key
+        """
+        self._check_open_allowed()
+
+        if self._session is not None:
+            result = self._session_open("jv_rt_open", (data_spec, key))
+            if result is None:
+                return JV_RT_ERROR, 0
+            self._start_stream()
+            return result
+
+        date_str = key[:8]
+        files = []
+        for record_type in RT_SPEC_RECORD_TYPES.get(data_spec, ()):
+            records = [
+                raw
+                for raw in self._cache.read_rt(record_type, date_str)
+                if self._matches_key(raw, key)
+            ]
+            if records:
+                files.append((f"{data_spec}{record_type}{date_str}", iter(records)))
+        if not files:
+            return JV_RT_ERROR, 0
+
+        self._stream = self._cache_files(files)
+        self._start_stream()
+        return JV_RT_SUCCESS, 0
+
+    def _pace(self, gap: float) -> None:
+        if self.pacing == "max":
+            return
+        if self.pacing == "burst":
+            gap = self.burst_interval if self._served and self._served % self.burst_size == 0 else 0.0
+        self._due += gap / self.speed
+        delay = self._due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def jv_read(self) -> Tuple[int, Optional[bytes], Optional[str]]:
+        """Return the next recorded record.
+
+        Returns:
+            Tuple of (return_code, buffer, filename) with the real clients'
+            meanings: >0 data length, 0 end of stream, -1 file switch
+
+        Raises:
+            JVLinkError: If no stream is open
+        """
+        if not self._is_open:
+            raise JVLinkError("JV-Link stream not open. Call jv_open() or jv_rt_open() first.")
+        item = next(self._stream, None)
+        if item is None:
+            return JV_READ_SUCCESS, None, None
+        ret_code, buff, filename, gap = item
+        if ret_code > 0:
+            self._pace(gap)
+            self._served += 1
+            return ret_code, buff, filename
+        return ret_code, None, filename
+
+    def jv_gets(self) -> Tuple[int, Optional[bytes]]:
+        """Return the next recorded record without its filename."""
+        ret_code, buff, _ = self.jv_read()
+        return ret_code, buff
+
+    def jv_status(self) -> int:
+        """Report every announced download as complete."""
+        return self._download_count
+
+    def jv_file_delete(self, filename: str) -> int:
+        """Accept a JVFiledelete request; recorded files are never deleted."""
+        logger.info("JV-Link replay ignored JVFiledelete", filename=filename)
+        return JV_RT_SUCCESS
+
+    def jv_close(self) -> int:
+        """Close the current stream."""
+        self._is_open = False
+        self._stream = iter(())
+        self._download_count = 0
+        return JV_RT_SUCCESS
+
+    def is_open(self) -> bool:
+        """Check if a replay stream is open."""
+        return self._is_open
+
+    def cleanup(self) -> None:
+        """Release the session (nothing to release for a replay)."""
+        self.jv_close()
+        self._initialized = False
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.jv_init()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.jv_close()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<JVLinkReplay source={self.source} pacing={self.pacing} speed={self.speed}>"
+
+
+class JVLinkRecorder:
+    """Proxy around a real JV-Link client that writes a replayable session log.
+
+    Every ``jv_*`` call is forwarded to ``client`` and appended to ``path`` as
+    one JSON line with its arguments, result and the seconds since the
+    recorder was created; record buffers are base64 encoded.
+
+    Args:
+        client: ``JVLinkWrapper`` or ``JVLinkBridge``
+        path: Session log file (appended to)
+    """
+
+    _RECORDED = frozenset(
+        {"jv_init", "jv_open", "jv_rt_open", "jv_read", "jv_gets", "jv_status", "jv_close"}
+    )
+
+    def __init__(self, client: Any, path: str):
+        """Initialize the recorder."""
+        self._client = client
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, "a", encoding="utf-8")
+        self._started = time.monotonic()
+        logger.info("Recording JV-Link session", path=str(self.path))
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name not in self._RECORDED or not callable(attribute):
+            return attribute
+
+        def recorded(*args):
+            result = attribute(*args)
+            entry = {
+                "t": round(time.monotonic() - self._started, 6),
+                "call": name,
+                "args": list(args),
+                "result": _encode(result),
+            }
+            self._handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if name == "jv_close":
+                self._handle.flush()
+            return result
+
+        return recorded
+
+    def cleanup(self) -> None:
+        """Flush the log and clean up the wrapped client."""
+        if not self._handle.closed:
+            self._handle.close()
+        cleanup = getattr(self._client, "cleanup", None)
+        if cleanup is not None:
+            cleanup()
@@ -4,7 +4,7 @@ from collections.abc import Mapping
 from datetime import date
 from typing import Any, List
 
-from src.parser.base import BaseParser, FieldDef, validate_fixed_record
+from src.parser.base import BaseParser, FieldDef, decode_jvdata, validate_fixed_record
 from src.parser.code_domains import OFFICIAL_JYO_CODES_2001
 
 
@@ -121,7 +121,7 @@ class AVParser(BaseParser):
 
     @staticmethod
     def decode_field(data: bytes) -> str:
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, record: bytes) -> dict[str, Any]:
         """Parse AV by byte offsets because Bamei is a multibyte cp932 field."""
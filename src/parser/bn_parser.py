@@ -7,8 +7,7 @@ Source: 公式JV-Data仕様書 Ver.4.9.0.1
 Generated by: scripts/generate_all_parsers.py
 """
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -30,7 +29,7 @@ class BNParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """Strictly decode one byte-sliced CP932 field and trim padding."""
-        return data.decode(ENCODING_JVDATA).strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, data: bytes) -> dict[str, str] | None:
         """
@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 """CH trainer-master parser for the official current 3862-byte layout."""
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -30,7 +29,7 @@ class CHParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """Strictly decode one byte-sliced CP932 field and trim padding."""
-        return data.decode(ENCODING_JVDATA).strip()
+        return decode_jvdata(data).strip()
 
     def _parse_recent_wins(self, data: bytes, result: dict[str, object]) -> None:
         for block in range(1, 4):
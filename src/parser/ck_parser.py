@@ -5,8 +5,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.parser.converters import ConversionError, convert_value
 from src.utils.logger import get_logger
 
@@ -106,7 +105,7 @@ class CKParser:
 
     @staticmethod
     def decode_field(data: bytes) -> str:
-        return data.decode(ENCODING_JVDATA, errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _require_digits(name: str, value: str) -> None:
@@ -2,8 +2,7 @@
 
 from typing import Any
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -25,7 +24,7 @@ class DMParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """Decode one byte-sliced CP932 field strictly and trim padding."""
-        return data.decode(ENCODING_JVDATA).strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _is_fixed_numeric(value: str, length: int) -> bool:
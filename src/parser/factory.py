@@ -7,11 +7,23 @@ Auto-generated parsers based on: 公式JV-Data仕様書 Ver.4.9.0.1
 """
 
 import importlib
+import time
 from typing import Any, Dict, Optional
 from src.utils.logger import get_logger
+from src.utils.metrics import histogram
+from src.utils.profiler import current_profiler
 
 logger = get_logger(__name__)
 
+PARSE_SECONDS = histogram(
+    "jltsql_parse_seconds", "Time to parse one record", ["record_type"]
+)
+
+# Parses of one record type per timed parse. The first parse of each type is
+# always timed; the others are counted and published with the next timed one
+# or by flush_metrics().
+PARSE_SAMPLE_RECORDS = 256
+
 
 # All supported record types (38 official JRA)
 ALL_RECORD_TYPES = [
@@ -45,6 +57,8 @@ class ParserFactory:
         """Initialize parser factory with dynamic parser loading."""
         self._parsers: Dict[str, Any] = {}
         self._parser_classes: Dict[str, Any] = {}
+        # record_type -> [untimed parses since the last timed one, its seconds]
+        self._parse_samples: Dict[str, list] = {}
 
         logger.info("ParserFactory initialized", total_types=len(ALL_RECORD_TYPES))
 
@@ -158,8 +172,18 @@ class ParserFactory:
                 logger.warning(f"No parser available for record type: {record_type}")
                 return None
 
-            parsed_result = parser.parse(record)
             # Some parsers (H1, H6) return List[Dict] for full-struct records
+            sample = self._parse_samples.get(record_type)
+            if sample is not None and sample[0] < PARSE_SAMPLE_RECORDS - 1:
+                sample[0] += 1
+                return parser.parse(record)
+
+            started = time.perf_counter()
+            parsed_result = parser.parse(record)
+            elapsed = time.perf_counter() - started
+            count = sample[0] + 1 if sample is not None else 1
+            self._parse_samples[record_type] = [0, elapsed]
+            self._publish_parse_sample(record_type, elapsed, count)
             return parsed_result
 
         except UnicodeDecodeError:
@@ -169,6 +193,24 @@ class ParserFactory:
             logger.error("Failed to parse record", error=str(e))
             return None
 
+    def flush_metrics(self) -> None:
+        """Publish the parses counted since the last timed parse of each type.
+
+        Untimed parses are attributed the latency of the last timed parse of
+        their record type.
+        """
+        for record_type, sample in self._parse_samples.items():
+            if sample[0]:
+                self._publish_parse_sample(record_type, sample[1], sample[0])
+                sample[0] = 0
+
+    @staticmethod
+    def _publish_parse_sample(record_type: str, seconds: float, count: int) -> None:
+        PARSE_SECONDS.labels(record_type).observe(seconds, count)
+        profiler = current_profiler()
+        if profiler is not None:
+            profiler.record("parse", record_type, seconds * count, count=count)
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<ParserFactory types={len(ALL_RECORD_TYPES)} cached={len(self._parsers)}>"
@@ -0,0 +1,153 @@
+"""Fixed-stride decoding of repeated record regions.
+
+Odds (O1-O6) and vote (H1/H6) records end in a long run of equal-width
+entries: 4,896 combinations of 17 bytes in O6, 4,896 of 21 bytes in H6.
+Decoding each field with its own ``bytes.decode("cp932")`` call dominates
+their parse time.
+
+:class:`FixedStrideRegion` decodes the whole region once. The region of an
+official record is ASCII, so it is decoded with the ASCII codec and split
+into fields by one compiled regular expression. A region with other bytes
+falls back to decoding field by field with strict CP932, lazily and in
+layout order, so a malformed field raises the same error at the same entry
+as the per-field parsers did.
+
+Unused slots (組番 blank or all zeros) are dropped by the region itself when
+it is given a ``skip`` check. In the CP932 fallback only the first field of
+such a slot is decoded, so bytes left in an unused slot cannot reject the
+record, just as the per-field parsers never looked at them.
+
+Validation runs over the whole region as well: :meth:`~FixedStrideRegion.unaccepted`
+matches the decoded region against one compiled run of acceptable entries (see
+:func:`accepting`) and hands back only the entries it could not accept, which
+the caller then checks field by field with its usual error messages.
+
+Values stay text: odds, votes and 人気 are stored as TEXT so that the
+official marker values (``----``, ``****``, blanks) survive, so they are not
+converted to numbers here.
+
+Example:
+    >>> O6_ENTRIES = FixedStrideRegion(40, 4896, (6, 7, 4), skip=unset_key)
+    >>> for kumi, odds, ninki in O6_ENTRIES.stripped(data):
+    ...     ...
+"""
+
+import re
+from typing import Callable, Iterator, Optional, Pattern, Sequence, Tuple
+
+
+def unset_key(key: str) -> bool:
+    """Return whether a stripped 組番/馬番 marks an unused slot (blank or zeros)."""
+    return not key.strip("0 ")
+
+
+def accepting(entry: str) -> Pattern[str]:
+    """Compile a pattern matching a run of entries that each match ``entry``.
+
+    ``entry`` is a regular expression of exactly one entry's width; ``.``
+    matches any character, line breaks included.
+    """
+    return re.compile(f"(?:{entry})*", re.DOTALL)
+
+
+class FixedStrideRegion:
+    """``count`` entries of ``widths`` bytes each, starting at ``start``.
+
+    Args:
+        start: Byte offset of the first entry
+        count: Number of entries
+        widths: Byte widths of the fields of one entry (at least two)
+        skip: Optional check on the stripped first field; entries for which
+            it returns True are not yielded and, in the CP932 fallback, the
+            rest of their fields are never decoded
+    """
+
+    def __init__(
+        self,
+        start: int,
+        count: int,
+        widths: Sequence[int],
+        skip: Optional[Callable[[str], bool]] = None,
+    ):
+        if len(widths) < 2:
+            raise ValueError("A fixed-stride region needs at least two fields per entry")
+        self.start = start
+        self.count = count
+        self.widths = tuple(widths)
+        self.skip = skip
+        self.stride = sum(self.widths)
+        self.end = start + count * self.stride
+        self._bounds = []
+        offset = 0
+        for width in self.widths:
+            self._bounds.append((offset, offset + width))
+            offset += width
+        self._pattern = re.compile(
+            "".join(f"(.{{{width}}})" for width in self.widths), re.DOTALL
+        )
+
+    def entries(self, data: bytes) -> Iterator[Tuple[str, ...]]:
+        """Yield the decoded, unstripped fields of every complete entry.
+
+        Entries that would run past the end of ``data`` or that ``skip``
+        rejects are not yielded.
+
+        Raises:
+            UnicodeDecodeError: If a non-ASCII field is not valid CP932
+        """
+        available = max(0, min(self.count, (len(data) - self.start) // self.stride))
+        region = data[self.start:self.start + available * self.stride]
+        try:
+            text = region.decode("ascii")
+        except UnicodeDecodeError:
+            return self._decode_fields(region)
+        entries = self._pattern.findall(text)
+        skip = self.skip
+        if skip is None:
+            return iter(entries)
+        return (entry for entry in entries if not skip(entry[0].strip()))
+
+    def stripped(self, data: bytes) -> Iterator[Tuple[str, ...]]:
+        """Yield every entry's fields decoded and stripped like ``decode_field``."""
+        return (tuple(map(str.strip, entry)) for entry in self.entries(data))
+
+    def unaccepted(self, data: bytes, accept: Pattern[str]) -> Iterator[Tuple[str, ...]]:
+        """Yield the stripped entries not matched by ``accept``, in layout order.
+
+        ``accept`` comes from :func:`accepting`. An ASCII region is matched
+        in one pass and only entries after a mismatch are looked at one by
+        one; entries ``skip`` rejects are never yielded. A region with other
+        bytes yields every entry, decoded as :meth:`entries` does.
+
+        Raises:
+            UnicodeDecodeError: If a non-ASCII field is not valid CP932
+        """
+        available = max(0, min(self.count, (len(data) - self.start) // self.stride))
+        region = data[self.start:self.start + available * self.stride]
+        try:
+            text = region.decode("ascii")
+        except UnicodeDecodeError:
+            return self.stripped(data)
+        return self._unaccepted_text(text, accept)
+
+    def _unaccepted_text(self, text: str, accept: Pattern[str]) -> Iterator[Tuple[str, ...]]:
+        skip = self.skip
+        stride = self.stride
+        position = accept.match(text).end()
+        while position < len(text):
+            entry = self._pattern.match(text, position).groups()
+            if skip is None or not skip(entry[0].strip()):
+                yield tuple(map(str.strip, entry))
+            position = accept.match(text, position + stride).end()
+
+    def _decode_fields(self, region: bytes) -> Iterator[Tuple[str, ...]]:
+        (key_low, key_high), *bounds = self._bounds
+        skip = self.skip
+        for offset in range(0, len(region), self.stride):
+            entry = region[offset:offset + self.stride]
+            key = entry[key_low:key_high].decode("cp932", errors="strict")
+            if skip is not None and skip(key.strip()):
+                continue
+            yield (key,) + tuple(
+                entry[low:high].decode("cp932", errors="strict") for low, high in bounds
+            )
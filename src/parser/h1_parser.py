@@ -31,7 +31,8 @@ from datetime import date
 from typing import Dict, List, Mapping, Optional
 from uuid import uuid4
 
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
+from src.parser.fixed_region import FixedStrideRegion
 from src.utils.logger import get_logger
 
 # Array definitions: (bet_type, start_0indexed, count, entry_size, kumi_len, ninki_len)
@@ -48,6 +49,12 @@ _H1_ARRAYS = [
     ("Sanrenpuku", 12479, 816, 20, 6, 3),
 ]
 
+# 票数部はASCIIのため賭式ごとに1回でデコードする（組番・票数・人気順）
+_H1_REGIONS = [
+    (bet_type, FixedStrideRegion(start, count, (kumi_len, 11, ninki_len)))
+    for bet_type, start, count, entry_size, kumi_len, ninki_len in _H1_ARRAYS
+]
+
 _TOTAL_NAMES = [
     "TanHyoTotal", "FukuHyoTotal", "WakuHyoTotal",
     "UmarenHyoTotal", "WideHyoTotal", "UmatanHyoTotal", "SanrenfukuHyoTotal",
@@ -227,12 +234,12 @@ class H1Parser:
 
     @staticmethod
     def decode_field(data: bytes) -> str:
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def decode_fixed_flags(data: bytes) -> str:
         """Decode positional one-byte flags without shifting blank entries."""
-        return data.decode("cp932", errors="strict")
+        return decode_jvdata(data)
 
     def _parse_header(self, data: bytes) -> Dict[str, str]:
         """Parse common header fields (first 83 bytes)."""
@@ -278,13 +285,13 @@ class H1Parser:
             totals[name] = self.decode_field(data[offset:offset + 11])
 
         rows = []
-        for bet_type, start, count, entry_size, kumi_len, ninki_len in _H1_ARRAYS:
-            for i in range(count):
-                offset = start + (entry_size * i)
-                kumi = self.decode_field(data[offset:offset + kumi_len])
-                raw_hyo = data[offset + kumi_len:offset + kumi_len + self.VOTE_WIDTH]
-                hyo = self.decode_field(raw_hyo)
-                if hyo == "" and raw_hyo != b" " * self.VOTE_WIDTH:
+        blank_hyo = " " * self.VOTE_WIDTH
+        for bet_type, region in _H1_REGIONS:
+            kumi_len = region.widths[0]
+            for raw_kumi, raw_hyo, raw_ninki in region.entries(data):
+                kumi = raw_kumi.strip()
+                hyo = raw_hyo.strip()
+                if hyo == "" and raw_hyo != blank_hyo:
                     # ``str.strip()`` also removes tabs and other CP932
                     # whitespace.  Only the official fixed-width initial
                     # value (11 ASCII spaces) may become the canonical empty
@@ -292,7 +299,7 @@ class H1Parser:
                     raise ValueError(
                         "H1 blank Hyo must be exactly 11 ASCII spaces"
                     )
-                ninki = self.decode_field(data[offset + kumi_len + 11:offset + kumi_len + 11 + ninki_len])
+                ninki = raw_ninki.strip()
 
                 # Skip empty entries (all spaces or zeros)
                 if not kumi or kumi == "0" * kumi_len:
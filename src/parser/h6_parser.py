@@ -24,10 +24,17 @@ from datetime import date
 from typing import Dict, List, Mapping, Optional
 from uuid import uuid4
 
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
+from src.parser.fixed_region import FixedStrideRegion
 from src.utils.logger import get_logger
 
 
+def _is_unregistered(kumi: str) -> bool:
+    # Unregistered fixed-width slots carry an all-space body. They have no
+    # vote value to validate and are not provider rows.
+    return not kumi or kumi == "000000"
+
+
 class H6Parser:
     """
     H6レコードパーサー（フルストラクト対応）
@@ -56,6 +63,10 @@ class H6Parser:
     # 組番が1件も無い snapshot（発売なし・レース中止）でも公式の票数合計は
     # 提供されるため、H1 の総計行（Kumi='TOTAL'）と同じ sentinel で1行だけ保持する。
     TOTAL_COMBINATION = "TOTAL"
+    # HyoSanrentan[4896]×21（組番6・票数11・人気順4）。ASCIIのため領域ごと1回でデコードする。
+    ENTRIES = FixedStrideRegion(
+        50, 4896, (COMBINATION_WIDTH, VOTE_WIDTH, FAVOURITE_WIDTH), skip=_is_unregistered
+    )
 
     @staticmethod
     def _require_ascii_digits(field_name: str, value: object, width: int) -> str:
@@ -166,12 +177,12 @@ class H6Parser:
 
     @staticmethod
     def decode_field(data: bytes) -> str:
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def decode_fixed_flags(data: bytes) -> str:
         """Decode positional one-byte flags without shifting blank entries."""
-        return data.decode("cp932", errors="strict")
+        return decode_jvdata(data)
 
     def _parse_header(self, data: bytes) -> Dict[str, str]:
         """Parse common header fields (first 50 bytes)."""
@@ -226,24 +237,17 @@ class H6Parser:
         header["SanrentanHenkanHyoTotal"] = henkan_hyo
 
         rows = []
-        # HyoSanrentan[4896] × 21 bytes starting at position 50
-        for i in range(4896):
-            offset = 50 + (21 * i)
-            kumi = self.decode_field(data[offset:offset + 6])
-
-            # Unregistered fixed-width slots carry an all-space body. They
-            # have no vote value to validate and are not provider rows.
-            if not kumi or kumi == "000000":
-                continue
-
-            raw_hyo = data[offset + 6:offset + 17]
-            if raw_hyo == b" " * self.VOTE_WIDTH:
+        blank_hyo = " " * self.VOTE_WIDTH
+        for raw_kumi, raw_hyo, raw_ninki in self.ENTRIES.entries(data):
+            # Unregistered slots are already dropped by ENTRIES.
+            kumi = raw_kumi.strip()
+            if raw_hyo == blank_hyo:
                 if header["DataKubun"] != "9":
                     raise ValueError(
                         "H6 blank SanrentanHyo is only valid for DataKubun 9"
                     )
                 hyo = ""
-            elif not all(0x30 <= value <= 0x39 for value in raw_hyo):
+            elif not (raw_hyo.isascii() and raw_hyo.isdigit()):
                 # Do not use ``str.strip()`` for the vote span. A tab next to
                 # digits would otherwise become a shorter digit string and
                 # could escape the exact raw fixed-width contract.
@@ -252,8 +256,8 @@ class H6Parser:
                     "status-9 initial value"
                 )
             else:
-                hyo = raw_hyo.decode("ascii")
-            ninki = self.decode_field(data[offset + 17:offset + 21])
+                hyo = raw_hyo
+            ninki = raw_ninki.strip()
 
             row = dict(header)
             row["SanrentanKumi"] = kumi
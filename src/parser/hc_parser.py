@@ -6,7 +6,7 @@ from collections.abc import Mapping
 from datetime import date
 
 from src.parser import status_domain
-from src.parser.base import FieldDef
+from src.parser.base import FieldDef, decode_jvdata
 from src.utils.logger import get_logger
 
 
@@ -51,7 +51,7 @@ class HCParser:
 
     @staticmethod
     def _decode_field(data: bytes) -> str:
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _require_ascii_digits(field_name: str, value: object, width: int) -> str:
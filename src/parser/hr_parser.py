@@ -9,14 +9,40 @@ JV-Data仕様書 Ver.4.9.0.1に基づく払戻レコードのパース
 
 from collections.abc import Mapping
 from datetime import date
-from typing import Dict, Optional
+from itertools import takewhile
+from typing import Dict, Optional, Sequence, Tuple
 
 from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.parser.code_domains import OFFICIAL_JYO_CODES_2001
+from src.parser.layout_compiler import official_layout
 from src.utils.logger import get_logger
 
 
+def _column_names(
+    official_names: Sequence[str], payout_groups: Sequence[tuple]
+) -> Tuple[str, ...]:
+    """Return the column name of every official HR layout field, in layout order.
+
+    払戻配列はすべての要素を返す。1件目は後方互換のため接尾辞なし
+    (TanUmaban)、2件目以降は番号付き (TanUmaban2, TanUmaban3, ...)。
+    複勝は最大5頭、ワイドは最大7組が同時に払い戻されるため、1件目のみの
+    抽出では的中の大半を取りこぼす (2026-06-11 修正、jrvltsql-nar#6 と同型)。
+    予備の3件 (16バイト × 3) はワイドと馬単の間に Yobi1〜Yobi9 として入る。
+    """
+    names = list(takewhile(lambda name: not name.startswith("Pay"), official_names))
+    for group, *prefixes, count, _, _, _ in payout_groups:
+        if group == "Umatan":
+            names.extend(f"Yobi{index}" for index in range(1, 10))
+        for index in range(1, count + 1):
+            suffix = "" if index == 1 else str(index)
+            names.extend(prefix + suffix for prefix in prefixes)
+    names.append("RecordDelimiter")
+    if len(names) != len(official_names):
+        raise ValueError("HR official layout does not match the payout groups")
+    return tuple(names)
+
+
 class HRParser:
     """
     HRレコードパーサー
@@ -74,13 +100,17 @@ class HRParser:
         ),
     )
 
+    # Extractor compiled from the official layout (src/parser/official_layouts.py).
+    LAYOUT = official_layout(RECORD_TYPE)
+    FIELD_NAMES = _column_names(LAYOUT.names, PAYOUT_GROUPS)
+
     def __init__(self):
         self.logger = get_logger(__name__)
 
     @staticmethod
     def decode_field(data: bytes) -> str:
         """バイトデータをデコードして文字列に変換"""
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _require_date(field_name: str, value: object) -> date:
@@ -363,105 +393,11 @@ class HRParser:
             # twice for HR while every other parser reaches it exactly once.
             data.decode(ENCODING_JVDATA, errors="strict")
 
-            # 10. 登録頭数 (位置:28, 長さ:2)
-            result["TorokuTosu"] = self.decode_field(data[pos : pos + 2])
-            pos += 2
-
-            # 11. 出走頭数 (位置:30, 長さ:2)
-            result["SyussoTosu"] = self.decode_field(data[pos : pos + 2])
-            pos += 2
-
-            # 12-20. 不成立フラグ (各1バイト × 9)
-            for i in range(1, 10):
-                result[f"FuseirituFlag{i}"] = self.decode_field(data[pos : pos + 1])
-                pos += 1
-
-            # 21-29. 特払フラグ (各1バイト × 9)
-            for i in range(1, 10):
-                result[f"TokubaraiFlag{i}"] = self.decode_field(data[pos : pos + 1])
-                pos += 1
-
-            # 30-38. 返還フラグ (各1バイト × 9)
-            for i in range(1, 10):
-                result[f"HenkanFlag{i}"] = self.decode_field(data[pos : pos + 1])
-                pos += 1
-
-            # 39-66. 返還馬番情報 (各1バイト × 28)
-            for i in range(1, 29):
-                result[f"HenkanUma{i}"] = self.decode_field(data[pos : pos + 1])
-                pos += 1
-
-            # 67-74. 返還枠番情報 (各1バイト × 8)
-            for i in range(1, 9):
-                result[f"HenkanWaku{i}"] = self.decode_field(data[pos : pos + 1])
-                pos += 1
-
-            # 75-82. 返還同枠情報 (各1バイト × 8) - JV-Data仕様書: 位置95, 8バイト
-            for i in range(1, 9):
-                result[f"HenkanDoWaku{i}"] = self.decode_field(data[pos : pos + 1])
-                pos += 1
-
-            # ここから配列データ
-            # pos = 102 at this point (JV-Data仕様書: 単勝払戻は位置103から、0始まりで102)
-
-            # 払戻配列はすべての要素を抽出する。
-            # 1件目は後方互換のため接尾辞なし (TanUmaban)、2件目以降は
-            # 番号付き (TanUmaban2, TanUmaban3, ...)。
-            # 複勝は最大5頭、ワイドは最大7組が同時に払い戻されるため、
-            # 1件目のみの抽出では的中の大半を取りこぼす (2026-06-11 修正、
-            # jrvltsql-nar#6 と同型)。
-
-            def _entry_suffix(index: int) -> str:
-                return "" if index == 1 else str(index)
-
-            def _extract_array(prefix_a, prefix_b, prefix_c, count, len_a, len_b, len_c, start):
-                p = start
-                for i in range(1, count + 1):
-                    sfx = _entry_suffix(i)
-                    result[f"{prefix_a}{sfx}"] = self.decode_field(data[p : p + len_a])
-                    result[f"{prefix_b}{sfx}"] = self.decode_field(
-                        data[p + len_a : p + len_a + len_b]
-                    )
-                    result[f"{prefix_c}{sfx}"] = self.decode_field(
-                        data[p + len_a + len_b : p + len_a + len_b + len_c]
-                    )
-                    p += len_a + len_b + len_c
-                return p
-
-            # 単勝払戻 (3件配列: 馬番2 + 払戻9 + 人気2 = 13バイト × 3)
-            pos = _extract_array("TanUmaban", "TanPay", "TanNinki", 3, 2, 9, 2, pos)
-
-            # 複勝払戻 (5件配列: 馬番2 + 払戻9 + 人気2 = 13バイト × 5)
-            pos = _extract_array("FukuUmaban", "FukuPay", "FukuNinki", 5, 2, 9, 2, pos)
-
-            # 枠連払戻 (3件配列: 組合せ2 + 払戻9 + 人気2 = 13バイト × 3)
-            pos = _extract_array("WakuKumi", "WakuPay", "WakuNinki", 3, 2, 9, 2, pos)
-
-            # 馬連払戻 (3件配列: 組合せ4 + 払戻9 + 人気3 = 16バイト × 3)
-            pos = _extract_array("UmarenKumi", "UmarenPay", "UmarenNinki", 3, 4, 9, 3, pos)
-
-            # ワイド払戻 (7件配列: 組合せ4 + 払戻9 + 人気3 = 16バイト × 7)
-            pos = _extract_array("WideKumi", "WidePay", "WideNinki", 7, 4, 9, 3, pos)
-
-            # 予備 (3件配列: 16バイト × 3 = 48バイト)
-            for index in range(3):
-                start = pos + index * 16
-                base = index * 3 + 1
-                result[f"Yobi{base}"] = self.decode_field(data[start : start + 4])
-                result[f"Yobi{base + 1}"] = self.decode_field(data[start + 4 : start + 13])
-                result[f"Yobi{base + 2}"] = self.decode_field(data[start + 13 : start + 16])
-            pos += 48
-
-            # 馬単払戻 (6件配列: 組合せ4 + 払戻9 + 人気3 = 16バイト × 6)
-            pos = _extract_array("UmatanKumi", "UmatanPay", "UmatanNinki", 6, 4, 9, 3, pos)
-
-            # 三連複払戻 (3件配列: 組合せ6 + 払戻9 + 人気3 = 18バイト × 3)
-            pos = _extract_array(
-                "SanrenfukuKumi", "SanrenfukuPay", "SanrenfukuNinki", 3, 6, 9, 3, pos
-            )
-
-            # 三連単払戻 (6件配列: 組合せ6 + 払戻9 + 人気4 = 19バイト × 6)
-            pos = _extract_array("SanrentanKumi", "SanrentanPay", "SanrentanNinki", 6, 6, 9, 4, pos)
+            # 本文は公式レイアウトから生成した抽出関数で読む。先頭27バイトは
+            # 解釈用の本文でも変わらないため、ヘッダは上で読んだ値と同じになる。
+            fields = dict(zip(self.FIELD_NAMES, self.LAYOUT.extract(data)))
+            delimiter = fields.pop("RecordDelimiter")
+            result.update(fields)
 
             if result["DataKubun"] == "0":
                 result[self.STATUS9_OPAQUE_FIELD] = ""
@@ -491,8 +427,7 @@ class HRParser:
                 result[self.LEGACY_RESERVED_FIELD] = ""
 
             # レコード区切 (2バイト)
-            if pos < len(data):
-                result["RecordDelimiter"] = self.decode_field(data[pos : pos + 2])
+            result["RecordDelimiter"] = delimiter
 
             self.validate_current_fields(result)
 
@@ -8,7 +8,7 @@ Current layout verified against the official SDK 5.0.0 structure definition.
 
 from typing import Dict, Optional
 
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -30,7 +30,7 @@ class HYParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """バイトデータをデコードして文字列に変換"""
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, data: bytes) -> Optional[Dict[str, str]]:
         """
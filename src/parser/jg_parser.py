@@ -11,7 +11,7 @@ Ver.4.1.1 only appended the initial value of item 10 (血統登録番号); the
 
 from typing import Dict, Optional
 
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -52,7 +52,7 @@ class JGParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """バイトデータをフィールド単位で厳密にデコードして文字列に変換"""
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _require_ascii_digits(name: str, value: str, width: int) -> None:
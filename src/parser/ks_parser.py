@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 """KS jockey-master parser for the official current 4,173-byte layout."""
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -44,7 +43,7 @@ class KSParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """Strictly decode one byte-sliced CP932 field and trim its padding."""
-        return data.decode(ENCODING_JVDATA).strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _require_digits(name: str, value: str) -> None:
@@ -0,0 +1,173 @@
+"""Compiled field extractors for fixed-width JV-Data layouts.
+
+Hand-unrolled parsers slice and decode every field on its own::
+
+    result["Year"] = self.decode_field(data[11:15])
+    result["MonthDay"] = self.decode_field(data[15:19])
+
+:class:`CompiledLayout` generates the equivalent extractor once per layout,
+with the offsets baked into the code as constants. The extractor decodes the
+whole record once with the ASCII codec and ``surrogateescape``, which keeps
+one character per byte, so every field is a slice of that one string. Only
+a field that really holds CP932 text (馬名, 馬主名, ...) is decoded again from
+its own bytes, strictly, so a field boundary that splits a multibyte
+character still raises :class:`UnicodeDecodeError`.
+
+Long runs of equal-width entries are not unrolled; they are exposed as
+:class:`~src.parser.fixed_region.FixedStrideRegion` readers.
+
+The official layouts of the record types read this way (RA, SE, HR and
+O1-O6) are generated from the layout manifest into
+:mod:`src.parser.official_layouts` by ``scripts/generate_official_layouts.py``;
+:func:`official_layout` compiles them on first use.
+
+Example:
+    >>> layout = official_layout("RA")
+    >>> row = layout.as_dict(data)
+    >>> row["Hondai"], row["Kyori"]
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.jvlink.constants import ENCODING_JVDATA
+from src.parser.fixed_region import FixedStrideRegion
+
+
+class RegionLayout(NamedTuple):
+    """A repeated group of equal-width entries.
+
+    Attributes:
+        name: Group name
+        start: Byte offset of the first entry (0-indexed)
+        count: Number of entries
+        fields: ``(name, width)`` of the fields of one entry
+    """
+
+    name: str
+    start: int
+    count: int
+    fields: Tuple[Tuple[str, int], ...]
+
+
+class RecordLayout(NamedTuple):
+    """Byte layout of one record type.
+
+    Attributes:
+        length: Record length in bytes, CRLF included
+        fields: ``(name, start, width)`` of every unrolled field, 0-indexed
+        regions: Repeated groups read with a :class:`FixedStrideRegion`
+    """
+
+    length: int
+    fields: Tuple[Tuple[str, int, int], ...]
+    regions: Tuple[RegionLayout, ...] = ()
+
+
+def _decode_span(text: str, data: bytes, start: int, end: int) -> str:
+    value = text[start:end]
+    if not value.isascii():
+        value = data[start:end].decode(ENCODING_JVDATA, errors="strict")
+    return value.strip()
+
+
+def render_extractor(spans: Sequence[Tuple[int, int]]) -> str:
+    """Return the source of an ``extract(data)`` function for ``spans``.
+
+    Args:
+        spans: ``(start, end)`` byte offsets of the fields, in output order
+
+    Returns:
+        Python source defining ``extract``
+    """
+    fast = "".join(f"        text[{start}:{end}].strip(),\n" for start, end in spans)
+    slow = "".join(
+        f"        _decode_span(text, data, {start}, {end}),\n" for start, end in spans
+    )
+    return (
+        "def extract(data):\n"
+        '    text = data.decode("ascii", "surrogateescape")\n'
+        "    if text.isascii():\n"
+        f"        return (\n{fast}        )\n"
+        f"    return (\n{slow}    )\n"
+    )
+
+
+class CompiledLayout:
+    """Extractor generated from a :class:`RecordLayout`.
+
+    Args:
+        record_type: Record type, used to name the generated code
+        layout: Field and region layout
+
+    Attributes:
+        names: Names of the unrolled fields, in layout order
+        regions: Readers of the repeated groups, by group name
+        region_fields: Field names of one entry of each repeated group
+        source: Generated extractor source
+    """
+
+    def __init__(self, record_type: str, layout: RecordLayout):
+        names = [name for name, _, _ in layout.fields]
+        if len(set(names)) != len(names):
+            raise ValueError(f"{record_type} layout has duplicate field names")
+        self.record_type = record_type
+        self.length = layout.length
+        self.names: Tuple[str, ...] = tuple(names)
+        self._spans: Dict[str, Tuple[int, int]] = {
+            name: (start, start + width) for name, start, width in layout.fields
+        }
+        self.regions: Dict[str, FixedStrideRegion] = {}
+        self.region_fields: Dict[str, Tuple[str, ...]] = {}
+        for region in layout.regions:
+            self.regions[region.name] = FixedStrideRegion(
+                region.start, region.count, [width for _, width in region.fields]
+            )
+            self.region_fields[region.name] = tuple(name for name, _ in region.fields)
+
+        self.source = render_extractor(list(self._spans.values()))
+        namespace: Dict[str, Any] = {"_decode_span": _decode_span}
+        exec(compile(self.source, f"<{record_type} layout>", "exec"), namespace)
+        self.extract: Callable[[bytes], Tuple[str, ...]] = namespace["extract"]
+
+    def span(self, name: str) -> Tuple[int, int]:
+        """Return the ``(start, end)`` byte offsets of an unrolled field."""
+        return self._spans[name]
+
+    def region(
+        self, name: str, skip: Optional[Callable[[str], bool]] = None
+    ) -> FixedStrideRegion:
+        """Return a reader of a repeated group that drops entries ``skip`` matches.
+
+        See :class:`~src.parser.fixed_region.FixedStrideRegion` for ``skip``.
+        """
+        region = self.regions[name]
+        return FixedStrideRegion(region.start, region.count, region.widths, skip=skip)
+
+    def as_dict(self, data: bytes) -> Dict[str, str]:
+        """Return the stripped unrolled fields of ``data`` by name.
+
+        Raises:
+            UnicodeDecodeError: If a non-ASCII field is not valid CP932
+        """
+        return dict(zip(self.names, self.extract(data)))
+
+    def region_rows(self, name: str, data: bytes) -> List[Dict[str, str]]:
+        """Return the stripped entries of a repeated group as dictionaries."""
+        fields = self.region_fields[name]
+        return [dict(zip(fields, entry)) for entry in self.regions[name].stripped(data)]
+
+
+@lru_cache(maxsize=None)
+def official_layout(record_type: str) -> CompiledLayout:
+    """Return the compiled official layout of a record type.
+
+    Raises:
+        ValueError: If the manifest has no layout for ``record_type``
+    """
+    from src.parser.official_layouts import OFFICIAL_LAYOUTS
+
+    layout = OFFICIAL_LAYOUTS.get(record_type)
+    if layout is None:
+        raise ValueError(f"No official layout for record type: {record_type}")
+    return CompiledLayout(record_type, layout)
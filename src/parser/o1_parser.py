@@ -11,7 +11,9 @@ Generated by: scripts/generate_all_parsers.py
 from typing import Dict, List, Mapping, Optional
 
 from src.parser import odds_domain
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
+from src.parser.fixed_region import unset_key
+from src.parser.layout_compiler import official_layout
 from src.utils.logger import get_logger
 
 
@@ -42,6 +44,21 @@ class O1Parser:
     WIN_ODDS_WIDTHS = (("TanOdds", 4), ("TanNinki", 2))
     PLACE_ODDS_WIDTHS = (("FukuOddsLow", 4), ("FukuOddsHigh", 4), ("FukuNinki", 2))
     BRACKET_ODDS_WIDTHS = (("WakurenOdds", 5), ("WakurenNinki", 2))
+    # Extractor compiled from the official layout (src/parser/official_layouts.py).
+    LAYOUT = official_layout(RECORD_TYPE)
+    FIELD_NAMES = odds_domain.column_names(
+        LAYOUT.names,
+        TansyoFlag="TanFlag",
+        FukusyoFlag="FukuFlag",
+        FukuChakuBaraiKey="FukuChakubaraiKey",
+        TotalHyosuTansyo="TanVote",
+        TotalHyosuFukusyo="FukuVote",
+        TotalHyosuWakuren="WakurenVote",
+    )
+    # オッズ部はASCIIのため繰返しごとに1回でデコードする
+    WIN_ENTRIES = LAYOUT.region("OddsTansyoInfo", skip=unset_key)
+    PLACE_ENTRIES = LAYOUT.region("OddsFukusyoInfo", skip=unset_key)
+    BRACKET_ENTRIES = LAYOUT.region("OddsWakurenInfo", skip=unset_key)
     TOTAL_FIELDS = ("TanVote", "FukuVote", "WakurenVote")
     # 単複行は組番を持たないため "00"、枠連行は馬番を持たないため "0" を置く。
     HORSE_ROW_COMBINATION = "00"
@@ -130,7 +147,7 @@ class O1Parser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """バイトデータをデコードして文字列に変換"""
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, data: bytes) -> Optional[List[Dict[str, object]]]:
         """
@@ -145,52 +162,15 @@ class O1Parser:
         try:
             validate_fixed_record(data, self.RECORD_TYPE, self.RECORD_LENGTH)
 
-            base = {
-                "RecordSpec": self.decode_field(data[0:2]),
-                "DataKubun": self.decode_field(data[2:3]),
-                "MakeDate": self.decode_field(data[3:11]),
-                "Year": self.decode_field(data[11:15]),
-                "MonthDay": self.decode_field(data[15:19]),
-                "JyoCD": self.decode_field(data[19:21]),
-                "Kaiji": self.decode_field(data[21:23]),
-                "Nichiji": self.decode_field(data[23:25]),
-                "RaceNum": self.decode_field(data[25:27]),
-                "HassoTime": self.decode_field(data[27:35]),
-                "TorokuTosu": self.decode_field(data[35:37]),
-                "SyussoTosu": self.decode_field(data[37:39]),
-                "TanFlag": self.decode_field(data[39:40]),
-                "FukuFlag": self.decode_field(data[40:41]),
-                "WakurenFlag": self.decode_field(data[41:42]),
-                "FukuChakubaraiKey": self.decode_field(data[42:43]),
-            }
-
             # O1 has fixed arrays: 28 tan, 28 fuku, 36 wakuren, then 3 vote totals.
-            tan_start = 43
-            fuku_start = tan_start + 28 * 8
-            wakuren_start = fuku_start + 28 * 12
-            votes_start = wakuren_start + 36 * 9
-            tan_vote = self.decode_field(data[votes_start:votes_start + 11])
-            fuku_vote = self.decode_field(data[votes_start + 11:votes_start + 22])
-            wakuren_vote = self.decode_field(data[votes_start + 22:votes_start + 33])
-            base.update(
-                {
-                    "TanVote": tan_vote,
-                    "FukuVote": fuku_vote,
-                    "WakurenVote": wakuren_vote,
-                }
-            )
+            base = dict(zip(self.FIELD_NAMES, self.LAYOUT.extract(data)))
+            del base["crlf"]
+            tan_vote = base["TanVote"]
+            fuku_vote = base["FukuVote"]
+            wakuren_vote = base["WakurenVote"]
 
             rows_by_umaban: Dict[str, Dict[str, str]] = {}
-            for i in range(28):
-                pos = tan_start + i * 8
-                item = data[pos:pos + 8]
-                if len(item) < 8:
-                    continue
-                umaban = self.decode_field(item[0:2])
-                odds = self.decode_field(item[2:6])
-                ninki = self.decode_field(item[6:8])
-                if not umaban.strip("0 "):
-                    continue
+            for umaban, odds, ninki in self.WIN_ENTRIES.stripped(data):
                 rows_by_umaban.setdefault(
                     umaban,
                     {**base, "Umaban": umaban, "FukuUmaban": umaban, "Kumi": "00"},
@@ -199,17 +179,7 @@ class O1Parser:
                     {"TanOdds": odds, "TanNinki": ninki, "TanVote": tan_vote}
                 )
 
-            for i in range(28):
-                pos = fuku_start + i * 12
-                item = data[pos:pos + 12]
-                if len(item) < 12:
-                    continue
-                umaban = self.decode_field(item[0:2])
-                low = self.decode_field(item[2:6])
-                high = self.decode_field(item[6:10])
-                ninki = self.decode_field(item[10:12])
-                if not umaban.strip("0 "):
-                    continue
+            for umaban, low, high, ninki in self.PLACE_ENTRIES.stripped(data):
                 rows_by_umaban.setdefault(
                     umaban,
                     {**base, "Umaban": umaban, "FukuUmaban": umaban, "Kumi": "00"},
@@ -225,16 +195,7 @@ class O1Parser:
                 )
 
             rows = list(rows_by_umaban.values())
-            for i in range(36):
-                pos = wakuren_start + i * 9
-                item = data[pos:pos + 9]
-                if len(item) < 9:
-                    continue
-                kumi = self.decode_field(item[0:2])
-                odds = self.decode_field(item[2:7])
-                ninki = self.decode_field(item[7:9])
-                if not kumi.strip("0 "):
-                    continue
+            for kumi, odds, ninki in self.BRACKET_ENTRIES.stripped(data):
                 rows.append(
                     {
                         **base,
@@ -11,7 +11,9 @@ Generated by: scripts/generate_all_parsers.py
 from typing import Dict, List, Optional
 
 from src.parser import odds_domain
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
+from src.parser.fixed_region import unset_key
+from src.parser.layout_compiler import official_layout
 from src.utils.logger import get_logger
 
 
@@ -38,6 +40,11 @@ class O6Parser(odds_domain.OddsCombinationValidationMixin):
     # オッズ部の繰返し回数と1件のバイト数
     ENTRY_COUNT = 4896
     ENTRY_WIDTH = 17
+    # Extractor compiled from the official layout (src/parser/official_layouts.py).
+    LAYOUT = official_layout(RECORD_TYPE)
+    FIELD_NAMES = odds_domain.column_names(LAYOUT.names, TotalHyosuSanrentan="Vote")
+    # オッズ部はASCIIのため領域ごと1回でデコードする
+    ENTRIES = LAYOUT.region("OddsSanrentanInfo", skip=unset_key)
     # 組合せを持たない snapshot でも公式の票数合計を保持する sentinel
     TOTAL_COMBINATION = odds_domain.TOTAL_COMBINATION
 
@@ -47,7 +54,7 @@ class O6Parser(odds_domain.OddsCombinationValidationMixin):
     @staticmethod
     def decode_field(data: bytes) -> str:
         """バイトデータをデコードして文字列に変換"""
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, data: bytes) -> Optional[List[Dict[str, object]]]:
         """
@@ -62,37 +69,17 @@ class O6Parser(odds_domain.OddsCombinationValidationMixin):
         try:
             validate_fixed_record(data, self.RECORD_TYPE, self.RECORD_LENGTH)
 
-            base = {
-                "RecordSpec": self.decode_field(data[0:2]),
-                "DataKubun": self.decode_field(data[2:3]),
-                "MakeDate": self.decode_field(data[3:11]),
-                "Year": self.decode_field(data[11:15]),
-                "MonthDay": self.decode_field(data[15:19]),
-                "JyoCD": self.decode_field(data[19:21]),
-                "Kaiji": self.decode_field(data[21:23]),
-                "Nichiji": self.decode_field(data[23:25]),
-                "RaceNum": self.decode_field(data[25:27]),
-                "HassoTime": self.decode_field(data[27:35]),
-                "TorokuTosu": self.decode_field(data[35:37]),
-                "SyussoTosu": self.decode_field(data[37:39]),
-                "SanrentanFlag": self.decode_field(data[39:40]),
-            }
-            vote = self.decode_field(data[-13:-2]) if len(data) >= 13 else ""
-            base["Vote"] = vote
+            base = dict(zip(self.FIELD_NAMES, self.LAYOUT.extract(data)))
+            del base["crlf"]
+            vote = base["Vote"]
             rows = []
-            for pos in range(40, max(40, len(data) - 13), 17):
-                item = data[pos:pos + 17]
-                if len(item) < 17:
-                    continue
-                kumi = self.decode_field(item[0:6])
-                odds = self.decode_field(item[6:13])
-                ninki = self.decode_field(item[13:17])
-                if not kumi.strip("0 "):
-                    continue
+            for kumi, odds, ninki in self.ENTRIES.stripped(data):
                 rows.append({**base, "Kumi": kumi, "Odds": odds, "Ninki": ninki, "Vote": vote})
 
             if rows:
-                return odds_domain.attach_snapshot_metadata(rows)
+                return odds_domain.attach_snapshot_metadata(
+                    rows, entries_checked=self.entries_valid(data)
+                )
             # 組合せが1件も無い snapshot（発売なし・レース中止・削除）でも
             # 公式の票数合計は提供される。H1/H6 と同じ sentinel 行で保持する。
             totals_only = dict(base)
@@ -15,7 +15,10 @@
 """
 
 from datetime import date
-from typing import Mapping
+from functools import lru_cache
+from typing import Mapping, Pattern, Sequence
+
+from src.parser.fixed_region import FixedStrideRegion, accepting
 
 # データ区分（0:削除 1:中間 2:前日売最終 3:最終 4:確定 5:確定(月曜) 9:レース中止）
 DATA_KUBUN_VALUES = frozenset({"0", "1", "2", "3", "4", "5", "9"})
@@ -84,6 +87,11 @@ def require_announced_time(record_type: str, value: object) -> None:
         raise ValueError(f"{record_type} HassoTime must end with a real hhmm")
 
 
+@lru_cache(maxsize=None)
+def _cancelled_markers(width: int) -> frozenset:
+    return frozenset(character * width for character in CANCELLED_MARKER_CHARACTERS)
+
+
 def require_marker_or_digits(record_type: str, field_name: str, value: object, width: int) -> None:
     """オッズ・人気順は数値／取消記号／空白（登録なし）のいずれか。"""
 
@@ -92,11 +100,53 @@ def require_marker_or_digits(record_type: str, field_name: str, value: object, w
     if value == "":
         # 登録なし（公式初期値は空白）。parse 後は空文字になる。
         return
-    if value in tuple(character * width for character in CANCELLED_MARKER_CHARACTERS):
+    if value in _cancelled_markers(width):
         return
     require_ascii_digits(record_type, field_name, value, width)
 
 
+def _marker_or_digits_pattern(width: int) -> str:
+    # require_marker_or_digits を通る値: 空白（登録なし）・取消記号・数字のみ。
+    return f"(?: {{{width}}}|-{{{width}}}|\\*{{{width}}}|[0-9]{{{width}}})"
+
+
+@lru_cache(maxsize=None)
+def combination_entries_pattern(key_width: int, value_widths: tuple[int, ...]) -> Pattern[str]:
+    """One-pass pattern of an odds region whose every used entry is valid.
+
+    An entry is either an unused slot (組番 of zeros/blanks, contents not
+    looked at) or an exact-width ASCII 組番 followed by values that
+    :func:`require_marker_or_digits` accepts. Entries outside this pattern
+    are not necessarily invalid; they are checked one by one.
+    """
+
+    rest = sum(value_widths)
+    used = f"[0-9]{{{key_width}}}" + "".join(map(_marker_or_digits_pattern, value_widths))
+    return accepting(f"[0 ]{{{key_width}}}.{{{rest}}}|{used}")
+
+
+def validate_combination_entries(
+    record_type: str,
+    region: FixedStrideRegion,
+    data: bytes,
+    key_field: tuple[str, int],
+    value_fields: tuple[tuple[str, int], ...],
+) -> None:
+    """Validate every used entry of an odds region as the per-row checks would.
+
+    The region is matched once; only entries the pattern does not accept
+    go through :func:`require_ascii_digits` / :func:`require_marker_or_digits`,
+    so the first invalid entry raises the same error as its expanded row.
+    """
+
+    key_name, key_width = key_field
+    accept = combination_entries_pattern(key_width, tuple(width for _, width in value_fields))
+    for key, *values in region.unaccepted(data, accept):
+        require_ascii_digits(record_type, key_name, key, key_width)
+        for (field_name, width), value in zip(value_fields, values):
+            require_marker_or_digits(record_type, field_name, value, width)
+
+
 def require_vote_total(record_type: str, field_name: str, value: object) -> None:
     if value in ("", None):
         # 提供データは合計エリアを空白で送ることがある（parse 後は空文字）。
@@ -160,6 +210,32 @@ class OddsCombinationValidationMixin:
     def _body_fields(cls) -> tuple[str, ...]:
         return tuple(name for name, _ in cls.ODDS_WIDTHS) + (cls.FAVOURITE_FIELD,)
 
+    @classmethod
+    def validate_entries(cls, data: bytes) -> None:
+        """Validate the 組番/オッズ/人気 of every combination in one region pass."""
+
+        validate_combination_entries(
+            cls.RECORD_TYPE,
+            cls.ENTRIES,
+            data,
+            ("Kumi", cls.COMBINATION_WIDTH),
+            cls.ODDS_WIDTHS + ((cls.FAVOURITE_FIELD, cls.FAVOURITE_WIDTH),),
+        )
+
+    @classmethod
+    def entries_valid(cls, data: bytes) -> bool:
+        """Whether :meth:`validate_entries` accepts the record.
+
+        A parser marks its snapshot with the result; invalid entries are then
+        rejected with their own error by the per-row validation.
+        """
+
+        try:
+            cls.validate_entries(data)
+        except ValueError:
+            return False
+        return True
+
     @classmethod
     def validate_key_fields(cls, record: Mapping[str, object]) -> None:
         validate_key_fields(cls.RECORD_TYPE, record)
@@ -191,6 +267,8 @@ class OddsCombinationValidationMixin:
         if record.get("Kumi") == TOTAL_COMBINATION:
             validate_totals_only_row(record_type, record, body_fields=cls._body_fields())
             return
+        if checked_by_region(record, ("Kumi",) + cls._body_fields()):
+            return
         require_ascii_digits(record_type, "Kumi", record.get("Kumi"), cls.COMBINATION_WIDTH)
         for field_name, width in cls.ODDS_WIDTHS:
             require_marker_or_digits(record_type, field_name, record.get(field_name), width)
@@ -202,10 +280,56 @@ class OddsCombinationValidationMixin:
         )
 
 
-def attach_snapshot_metadata(rows: list[dict[str, object]]) -> list[dict[str, object]]:
-    """Mark one complete official odds snapshot for storage replacement."""
+def column_names(layout_names: Sequence[str], **renames: str) -> tuple[str, ...]:
+    """公式レイアウトの項目名を、レイアウト順のまま既存の列名に読み替える。
+
+    発表月日時分は全レコード共通で HassoTime、レコード区切は crlf のまま返す。
+    """
+
+    renames = {"HappyoTime": "HassoTime", **renames}
+    return tuple(renames.get(name, name) for name in layout_names)
+
+
+class OddsSnapshot(list):
+    """The rows of one snapshot, shared by every expanded row.
+
+    ``entries_checked`` is True when the parser validated the combination
+    region of the physical record in one pass (``validate_entries``).
+    """
+
+    entries_checked = False
+
+
+def checked_by_region(record: Mapping[str, object], fields: tuple[str, ...]) -> bool:
+    """Whether ``fields`` of ``record`` are those of a region-validated snapshot row.
+
+    The row is compared with its copy in the snapshot, so a row whose
+    combination fields were changed after parsing is validated again.
+    """
+
+    snapshot = record.get(SNAPSHOT_ROWS_KEY)
+    if not isinstance(snapshot, OddsSnapshot) or not snapshot.entries_checked:
+        return False
+    index = record.get(SNAPSHOT_INDEX_KEY)
+    if not isinstance(index, int) or not 0 <= index < len(snapshot):
+        return False
+    parsed = snapshot[index]
+    return all(record.get(name) == parsed.get(name) for name in fields)
+
+
+def attach_snapshot_metadata(
+    rows: list[dict[str, object]],
+    entries_checked: bool = False,
+) -> list[dict[str, object]]:
+    """Mark one complete official odds snapshot for storage replacement.
+
+    Args:
+        rows: Expanded rows of one physical record
+        entries_checked: The parser validated their combination region
+    """
 
-    snapshot_rows = [dict(row) for row in rows]
+    snapshot_rows = OddsSnapshot(dict(row) for row in rows)
+    snapshot_rows.entries_checked = entries_checked
     return [
         {**row, SNAPSHOT_ROWS_KEY: snapshot_rows, SNAPSHOT_INDEX_KEY: index}
         for index, row in enumerate(snapshot_rows)
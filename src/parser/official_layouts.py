@@ -0,0 +1,261 @@
+"""
+JV-Data公式レイアウト（コンパイル済み抽出関数で読むレコード種別）
+
+このファイルは自動生成されました。編集しないでください。
+Source: JRA-VAN Data Lab SDK 5.0.0 Python JV-Data structures (JV-Data 4.9.0.1)
+Source SHA-256: 8994f985fce846f1b4fcbc3ddf2a5c6394c586a458478346891222b3b61e4ee3
+Generated by: scripts/generate_official_layouts.py
+"""
+
+from typing import Dict
+
+from src.parser.layout_compiler import RecordLayout, RegionLayout
+
+OFFICIAL_LAYOUTS: Dict[str, RecordLayout] = {
+    "RA": RecordLayout(
+        length=1272,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("YoubiCD", 27, 1), ("TokuNum", 28, 4), ("Hondai", 32, 60),
+            ("Fukudai", 92, 60), ("Kakko", 152, 60), ("HondaiEng", 212, 120),
+            ("FukudaiEng", 332, 120), ("KakkoEng", 452, 120), ("Ryakusyo10", 572, 20),
+            ("Ryakusyo6", 592, 12), ("Ryakusyo3", 604, 6), ("Kubun", 610, 1), ("Nkai", 611, 3),
+            ("GradeCD", 614, 1), ("GradeCDBefore", 615, 1), ("SyubetuCD", 616, 2),
+            ("KigoCD", 618, 3), ("JyuryoCD", 621, 1), ("JyokenCD1", 622, 3), ("JyokenCD2", 625, 3),
+            ("JyokenCD3", 628, 3), ("JyokenCD4", 631, 3), ("JyokenCD5", 634, 3),
+            ("JyokenName", 637, 60), ("Kyori", 697, 4), ("KyoriBefore", 701, 4),
+            ("TrackCD", 705, 2), ("TrackCDBefore", 707, 2), ("CourseKubunCD", 709, 2),
+            ("CourseKubunCDBefore", 711, 2), ("Honsyokin1", 713, 8), ("Honsyokin2", 721, 8),
+            ("Honsyokin3", 729, 8), ("Honsyokin4", 737, 8), ("Honsyokin5", 745, 8),
+            ("Honsyokin6", 753, 8), ("Honsyokin7", 761, 8), ("HonsyokinBefore1", 769, 8),
+            ("HonsyokinBefore2", 777, 8), ("HonsyokinBefore3", 785, 8),
+            ("HonsyokinBefore4", 793, 8), ("HonsyokinBefore5", 801, 8), ("Fukasyokin1", 809, 8),
+            ("Fukasyokin2", 817, 8), ("Fukasyokin3", 825, 8), ("Fukasyokin4", 833, 8),
+            ("Fukasyokin5", 841, 8), ("FukasyokinBefore1", 849, 8), ("FukasyokinBefore2", 857, 8),
+            ("FukasyokinBefore3", 865, 8), ("HassoTime", 873, 4), ("HassoTimeBefore", 877, 4),
+            ("TorokuTosu", 881, 2), ("SyussoTosu", 883, 2), ("NyusenTosu", 885, 2),
+            ("TenkoCD", 887, 1), ("SibaBabaCD", 888, 1), ("DirtBabaCD", 889, 1),
+            ("LapTime1", 890, 3), ("LapTime2", 893, 3), ("LapTime3", 896, 3), ("LapTime4", 899, 3),
+            ("LapTime5", 902, 3), ("LapTime6", 905, 3), ("LapTime7", 908, 3), ("LapTime8", 911, 3),
+            ("LapTime9", 914, 3), ("LapTime10", 917, 3), ("LapTime11", 920, 3),
+            ("LapTime12", 923, 3), ("LapTime13", 926, 3), ("LapTime14", 929, 3),
+            ("LapTime15", 932, 3), ("LapTime16", 935, 3), ("LapTime17", 938, 3),
+            ("LapTime18", 941, 3), ("LapTime19", 944, 3), ("LapTime20", 947, 3),
+            ("LapTime21", 950, 3), ("LapTime22", 953, 3), ("LapTime23", 956, 3),
+            ("LapTime24", 959, 3), ("LapTime25", 962, 3), ("SyogaiMileTime", 965, 4),
+            ("HaronTimeS3", 969, 3), ("HaronTimeS4", 972, 3), ("HaronTimeL3", 975, 3),
+            ("HaronTimeL4", 978, 3), ("Corner1", 981, 1), ("Syukaisu1", 982, 1),
+            ("Jyuni1", 983, 70), ("Corner2", 1053, 1), ("Syukaisu2", 1054, 1),
+            ("Jyuni2", 1055, 70), ("Corner3", 1125, 1), ("Syukaisu3", 1126, 1),
+            ("Jyuni3", 1127, 70), ("Corner4", 1197, 1), ("Syukaisu4", 1198, 1),
+            ("Jyuni4", 1199, 70), ("RecordUpKubun", 1269, 1), ("crlf", 1270, 2),
+        ),
+    ),
+    "SE": RecordLayout(
+        length=555,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("Wakuban", 27, 1), ("Umaban", 28, 2), ("KettoNum", 30, 10),
+            ("Bamei", 40, 36), ("UmaKigoCD", 76, 2), ("SexCD", 78, 1), ("HinsyuCD", 79, 1),
+            ("KeiroCD", 80, 2), ("Barei", 82, 2), ("TozaiCD", 84, 1), ("ChokyosiCode", 85, 5),
+            ("ChokyosiRyakusyo", 90, 8), ("BanusiCode", 98, 6), ("BanusiName", 104, 64),
+            ("Fukusyoku", 168, 60), ("reserved1", 228, 60), ("Futan", 288, 3),
+            ("FutanBefore", 291, 3), ("Blinker", 294, 1), ("reserved2", 295, 1),
+            ("KisyuCode", 296, 5), ("KisyuCodeBefore", 301, 5), ("KisyuRyakusyo", 306, 8),
+            ("KisyuRyakusyoBefore", 314, 8), ("MinaraiCD", 322, 1), ("MinaraiCDBefore", 323, 1),
+            ("BaTaijyu", 324, 3), ("ZogenFugo", 327, 1), ("ZogenSa", 328, 3), ("IJyoCD", 331, 1),
+            ("NyusenJyuni", 332, 2), ("KakuteiJyuni", 334, 2), ("DochakuKubun", 336, 1),
+            ("DochakuTosu", 337, 1), ("Time", 338, 4), ("ChakusaCD", 342, 3),
+            ("ChakusaCDP", 345, 3), ("ChakusaCDPP", 348, 3), ("Jyuni1c", 351, 2),
+            ("Jyuni2c", 353, 2), ("Jyuni3c", 355, 2), ("Jyuni4c", 357, 2), ("Odds", 359, 4),
+            ("Ninki", 363, 2), ("Honsyokin", 365, 8), ("Fukasyokin", 373, 8),
+            ("reserved3", 381, 3), ("reserved4", 384, 3), ("HaronTimeL4", 387, 3),
+            ("HaronTimeL3", 390, 3), ("KettoNum1", 393, 10), ("Bamei1", 403, 36),
+            ("KettoNum2", 439, 10), ("Bamei2", 449, 36), ("KettoNum3", 485, 10),
+            ("Bamei3", 495, 36), ("TimeDiff", 531, 4), ("RecordUpKubun", 535, 1),
+            ("DMKubun", 536, 1), ("DMTime", 537, 5), ("DMGosaP", 542, 4), ("DMGosaM", 546, 4),
+            ("DMJyuni", 550, 2), ("KyakusituKubun", 552, 1), ("crlf", 553, 2),
+        ),
+    ),
+    "HR": RecordLayout(
+        length=719,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("TorokuTosu", 27, 2), ("SyussoTosu", 29, 2),
+            ("FuseirituFlag1", 31, 1), ("FuseirituFlag2", 32, 1), ("FuseirituFlag3", 33, 1),
+            ("FuseirituFlag4", 34, 1), ("FuseirituFlag5", 35, 1), ("FuseirituFlag6", 36, 1),
+            ("FuseirituFlag7", 37, 1), ("FuseirituFlag8", 38, 1), ("FuseirituFlag9", 39, 1),
+            ("TokubaraiFlag1", 40, 1), ("TokubaraiFlag2", 41, 1), ("TokubaraiFlag3", 42, 1),
+            ("TokubaraiFlag4", 43, 1), ("TokubaraiFlag5", 44, 1), ("TokubaraiFlag6", 45, 1),
+            ("TokubaraiFlag7", 46, 1), ("TokubaraiFlag8", 47, 1), ("TokubaraiFlag9", 48, 1),
+            ("HenkanFlag1", 49, 1), ("HenkanFlag2", 50, 1), ("HenkanFlag3", 51, 1),
+            ("HenkanFlag4", 52, 1), ("HenkanFlag5", 53, 1), ("HenkanFlag6", 54, 1),
+            ("HenkanFlag7", 55, 1), ("HenkanFlag8", 56, 1), ("HenkanFlag9", 57, 1),
+            ("HenkanUma1", 58, 1), ("HenkanUma2", 59, 1), ("HenkanUma3", 60, 1),
+            ("HenkanUma4", 61, 1), ("HenkanUma5", 62, 1), ("HenkanUma6", 63, 1),
+            ("HenkanUma7", 64, 1), ("HenkanUma8", 65, 1), ("HenkanUma9", 66, 1),
+            ("HenkanUma10", 67, 1), ("HenkanUma11", 68, 1), ("HenkanUma12", 69, 1),
+            ("HenkanUma13", 70, 1), ("HenkanUma14", 71, 1), ("HenkanUma15", 72, 1),
+            ("HenkanUma16", 73, 1), ("HenkanUma17", 74, 1), ("HenkanUma18", 75, 1),
+            ("HenkanUma19", 76, 1), ("HenkanUma20", 77, 1), ("HenkanUma21", 78, 1),
+            ("HenkanUma22", 79, 1), ("HenkanUma23", 80, 1), ("HenkanUma24", 81, 1),
+            ("HenkanUma25", 82, 1), ("HenkanUma26", 83, 1), ("HenkanUma27", 84, 1),
+            ("HenkanUma28", 85, 1), ("HenkanWaku1", 86, 1), ("HenkanWaku2", 87, 1),
+            ("HenkanWaku3", 88, 1), ("HenkanWaku4", 89, 1), ("HenkanWaku5", 90, 1),
+            ("HenkanWaku6", 91, 1), ("HenkanWaku7", 92, 1), ("HenkanWaku8", 93, 1),
+            ("HenkanDoWaku1", 94, 1), ("HenkanDoWaku2", 95, 1), ("HenkanDoWaku3", 96, 1),
+            ("HenkanDoWaku4", 97, 1), ("HenkanDoWaku5", 98, 1), ("HenkanDoWaku6", 99, 1),
+            ("HenkanDoWaku7", 100, 1), ("HenkanDoWaku8", 101, 1), ("PayTansyo1Umaban1", 102, 2),
+            ("PayTansyo1Pay1", 104, 9), ("PayTansyo1Ninki1", 113, 2),
+            ("PayTansyo2Umaban2", 115, 2), ("PayTansyo2Pay2", 117, 9),
+            ("PayTansyo2Ninki2", 126, 2), ("PayTansyo3Umaban3", 128, 2),
+            ("PayTansyo3Pay3", 130, 9), ("PayTansyo3Ninki3", 139, 2),
+            ("PayFukusyo1Umaban1", 141, 2), ("PayFukusyo1Pay1", 143, 9),
+            ("PayFukusyo1Ninki1", 152, 2), ("PayFukusyo2Umaban2", 154, 2),
+            ("PayFukusyo2Pay2", 156, 9), ("PayFukusyo2Ninki2", 165, 2),
+            ("PayFukusyo3Umaban3", 167, 2), ("PayFukusyo3Pay3", 169, 9),
+            ("PayFukusyo3Ninki3", 178, 2), ("Umaban4", 180, 2), ("PayFukusyo4Pay4", 182, 9),
+            ("PayFukusyo4Ninki4", 191, 2), ("Umaban5", 193, 2), ("PayFukusyo5Pay5", 195, 9),
+            ("PayFukusyo5Ninki5", 204, 2), ("PayWakuren1Umaban1", 206, 2),
+            ("PayWakuren1Pay1", 208, 9), ("PayWakuren1Ninki1", 217, 2),
+            ("PayWakuren2Umaban2", 219, 2), ("PayWakuren2Pay2", 221, 9),
+            ("PayWakuren2Ninki2", 230, 2), ("PayWakuren3Umaban3", 232, 2),
+            ("PayWakuren3Pay3", 234, 9), ("PayWakuren3Ninki3", 243, 2),
+            ("PayUmaren1Kumi1", 245, 4), ("PayUmaren1Pay1", 249, 9), ("PayUmaren1Ninki1", 258, 3),
+            ("PayUmaren2Kumi2", 261, 4), ("PayUmaren2Pay2", 265, 9), ("PayUmaren2Ninki2", 274, 3),
+            ("PayUmaren3Kumi3", 277, 4), ("PayUmaren3Pay3", 281, 9), ("PayUmaren3Ninki3", 290, 3),
+            ("PayWide1Kumi1", 293, 4), ("PayWide1Pay1", 297, 9), ("PayWide1Ninki1", 306, 3),
+            ("PayWide2Kumi2", 309, 4), ("PayWide2Pay2", 313, 9), ("PayWide2Ninki2", 322, 3),
+            ("PayWide3Kumi3", 325, 4), ("PayWide3Pay3", 329, 9), ("PayWide3Ninki3", 338, 3),
+            ("PayWide4Kumi4", 341, 4), ("PayWide4Pay4", 345, 9), ("PayWide4Ninki4", 354, 3),
+            ("PayWide5Kumi5", 357, 4), ("PayWide5Pay5", 361, 9), ("PayWide5Ninki5", 370, 3),
+            ("PayWide6Kumi6", 373, 4), ("PayWide6Pay6", 377, 9), ("PayWide6Ninki6", 386, 3),
+            ("Kumi7", 389, 4), ("Pay7", 393, 9), ("Ninki7", 402, 3),
+            ("PayReserved11Kumi1", 405, 4), ("PayReserved11Pay1", 409, 9),
+            ("PayReserved11Ninki1", 418, 3), ("PayReserved12Kumi2", 421, 4),
+            ("PayReserved12Pay2", 425, 9), ("PayReserved12Ninki2", 434, 3),
+            ("PayReserved13Kumi3", 437, 4), ("PayReserved13Pay3", 441, 9),
+            ("PayReserved13Ninki3", 450, 3), ("PayUmatan1Kumi1", 453, 4),
+            ("PayUmatan1Pay1", 457, 9), ("PayUmatan1Ninki1", 466, 3), ("PayUmatan2Kumi2", 469, 4),
+            ("PayUmatan2Pay2", 473, 9), ("PayUmatan2Ninki2", 482, 3), ("PayUmatan3Kumi3", 485, 4),
+            ("PayUmatan3Pay3", 489, 9), ("PayUmatan3Ninki3", 498, 3), ("PayUmatan4Kumi4", 501, 4),
+            ("PayUmatan4Pay4", 505, 9), ("PayUmatan4Ninki4", 514, 3), ("PayUmatan5Kumi5", 517, 4),
+            ("PayUmatan5Pay5", 521, 9), ("PayUmatan5Ninki5", 530, 3), ("PayUmatan6Kumi6", 533, 4),
+            ("PayUmatan6Pay6", 537, 9), ("PayUmatan6Ninki6", 546, 3),
+            ("PaySanrenpuku1Kumi1", 549, 6), ("PaySanrenpuku1Pay1", 555, 9),
+            ("PaySanrenpuku1Ninki1", 564, 3), ("PaySanrenpuku2Kumi2", 567, 6),
+            ("PaySanrenpuku2Pay2", 573, 9), ("PaySanrenpuku2Ninki2", 582, 3),
+            ("PaySanrenpuku3Kumi3", 585, 6), ("PaySanrenpuku3Pay3", 591, 9),
+            ("PaySanrenpuku3Ninki3", 600, 3), ("PaySanrentan1Kumi1", 603, 6),
+            ("PaySanrentan1Pay1", 609, 9), ("PaySanrentan1Ninki1", 618, 4),
+            ("PaySanrentan2Kumi2", 622, 6), ("PaySanrentan2Pay2", 628, 9),
+            ("PaySanrentan2Ninki2", 637, 4), ("PaySanrentan3Kumi3", 641, 6),
+            ("PaySanrentan3Pay3", 647, 9), ("PaySanrentan3Ninki3", 656, 4),
+            ("PaySanrentan4Kumi4", 660, 6), ("PaySanrentan4Pay4", 666, 9),
+            ("PaySanrentan4Ninki4", 675, 4), ("PaySanrentan5Kumi5", 679, 6),
+            ("PaySanrentan5Pay5", 685, 9), ("PaySanrentan5Ninki5", 694, 4),
+            ("PaySanrentan6Kumi6", 698, 6), ("PaySanrentan6Pay6", 704, 9),
+            ("PaySanrentan6Ninki6", 713, 4), ("crlf", 717, 2),
+        ),
+    ),
+    "O1": RecordLayout(
+        length=962,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("HappyoTime", 27, 8), ("TorokuTosu", 35, 2),
+            ("SyussoTosu", 37, 2), ("TansyoFlag", 39, 1), ("FukusyoFlag", 40, 1),
+            ("WakurenFlag", 41, 1), ("FukuChakuBaraiKey", 42, 1), ("TotalHyosuTansyo", 927, 11),
+            ("TotalHyosuFukusyo", 938, 11), ("TotalHyosuWakuren", 949, 11), ("crlf", 960, 2),
+        ),
+        regions=(
+            RegionLayout("OddsTansyoInfo", 43, 28, (
+                ("Umaban", 2), ("Odds", 4), ("Ninki", 2),
+            )),
+            RegionLayout("OddsFukusyoInfo", 267, 28, (
+                ("Umaban", 2), ("OddsLow", 4), ("OddsHigh", 4), ("Ninki", 2),
+            )),
+            RegionLayout("OddsWakurenInfo", 603, 36, (
+                ("Kumi", 2), ("Odds", 5), ("Ninki", 2),
+            )),
+        ),
+    ),
+    "O2": RecordLayout(
+        length=2042,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("HappyoTime", 27, 8), ("TorokuTosu", 35, 2),
+            ("SyussoTosu", 37, 2), ("UmarenFlag", 39, 1), ("TotalHyosuUmaren", 2029, 11),
+            ("crlf", 2040, 2),
+        ),
+        regions=(
+            RegionLayout("OddsUmarenInfo", 40, 153, (
+                ("Kumi", 4), ("Odds", 6), ("Ninki", 3),
+            )),
+        ),
+    ),
+    "O3": RecordLayout(
+        length=2654,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("HappyoTime", 27, 8), ("TorokuTosu", 35, 2),
+            ("SyussoTosu", 37, 2), ("WideFlag", 39, 1), ("TotalHyosuWide", 2641, 11),
+            ("crlf", 2652, 2),
+        ),
+        regions=(
+            RegionLayout("OddsWideInfo", 40, 153, (
+                ("Kumi", 4), ("OddsLow", 5), ("OddsHigh", 5), ("Ninki", 3),
+            )),
+        ),
+    ),
+    "O4": RecordLayout(
+        length=4031,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("HappyoTime", 27, 8), ("TorokuTosu", 35, 2),
+            ("SyussoTosu", 37, 2), ("UmatanFlag", 39, 1), ("TotalHyosuUmatan", 4018, 11),
+            ("crlf", 4029, 2),
+        ),
+        regions=(
+            RegionLayout("OddsUmatanInfo", 40, 306, (
+                ("Kumi", 4), ("Odds", 6), ("Ninki", 3),
+            )),
+        ),
+    ),
+    "O5": RecordLayout(
+        length=12293,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("HappyoTime", 27, 8), ("TorokuTosu", 35, 2),
+            ("SyussoTosu", 37, 2), ("SanrenpukuFlag", 39, 1), ("TotalHyosuSanrenpuku", 12280, 11),
+            ("crlf", 12291, 2),
+        ),
+        regions=(
+            RegionLayout("OddsSanrenInfo", 40, 816, (
+                ("Kumi", 6), ("Odds", 6), ("Ninki", 3),
+            )),
+        ),
+    ),
+    "O6": RecordLayout(
+        length=83285,
+        fields=(
+            ("RecordSpec", 0, 2), ("DataKubun", 2, 1), ("MakeDate", 3, 8), ("Year", 11, 4),
+            ("MonthDay", 15, 4), ("JyoCD", 19, 2), ("Kaiji", 21, 2), ("Nichiji", 23, 2),
+            ("RaceNum", 25, 2), ("HappyoTime", 27, 8), ("TorokuTosu", 35, 2),
+            ("SyussoTosu", 37, 2), ("SanrentanFlag", 39, 1), ("TotalHyosuSanrentan", 83272, 11),
+            ("crlf", 83283, 2),
+        ),
+        regions=(
+            RegionLayout("OddsSanrentanInfo", 40, 4896, (
+                ("Kumi", 6), ("Odds", 7), ("Ninki", 4),
+            )),
+        ),
+    ),
+}
@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 """Parser for the official 501-byte JV-Data RC record master."""
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -30,7 +29,7 @@ class RCParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """Strictly decode one byte-sliced CP932 field and trim its padding."""
-        return data.decode(ENCODING_JVDATA).strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, data: bytes) -> dict[str, str] | None:
         """Return every official RC field, or ``None`` for invalid framing."""
@@ -12,6 +12,7 @@ from collections.abc import Mapping
 from datetime import date
 
 from src.parser import status_domain
+from src.parser.base import decode_jvdata
 from src.utils.logger import get_logger
 
 
@@ -66,7 +67,7 @@ class SKParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """バイトデータをデコードして文字列に変換"""
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     @staticmethod
     def _require_ascii_digits(field_name: str, value: object, width: int) -> str:
@@ -11,7 +11,7 @@ so this parser distinguishes them by the embedded data-creation date.
 import json
 from datetime import date
 
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.parser.code_domains import OFFICIAL_JYO_CODES_2001
 from src.utils.logger import get_logger
 
@@ -69,7 +69,7 @@ class WFParser:
 
     @staticmethod
     def decode_field(data: bytes) -> str:
-        return data.decode("cp932", errors="strict").strip()
+        return decode_jvdata(data).strip()
 
     # ------------------------------------------------------------------
     # Shared field validators (also used by the importer caller validator)
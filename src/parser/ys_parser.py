@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 """Parser for the official 382-byte JV-Data YS schedule record."""
 
-from src.jvlink.constants import ENCODING_JVDATA
-from src.parser.base import validate_fixed_record
+from src.parser.base import decode_jvdata, validate_fixed_record
 from src.utils.logger import get_logger
 
 
@@ -33,7 +32,7 @@ class YSParser:
     @staticmethod
     def decode_field(data: bytes) -> str:
         """Strictly decode one byte-sliced CP932 field and trim its padding."""
-        return data.decode(ENCODING_JVDATA).strip()
+        return decode_jvdata(data).strip()
 
     def parse(self, data: bytes) -> dict[str, str] | None:
         """Return every official YS field, or ``None`` for invalid framing."""
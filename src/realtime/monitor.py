@@ -10,8 +10,12 @@ from datetime import datetime
 from typing import Optional
 
 from src.jvlink.constants import JV_RT_SUCCESS, JV_READ_SUCCESS
-from src.realtime.updater import RealtimeUpdater, summarize_update_result
-from src.utils.logger import get_logger
+from src.realtime.updater import (
+    REALTIME_CYCLE_SECONDS,
+    RealtimeUpdater,
+    summarize_update_result,
+)
+from src.utils.logger import flush_throttled_logs, get_logger
 
 logger = get_logger(__name__)
 
@@ -52,8 +56,9 @@ class RealtimeMonitor:
         self.polling_interval = polling_interval
         self.sid = sid
 
+        from src.jvlink.replay import create_replay_client, record_session
         from src.jvlink.wrapper import JVLinkWrapper
-        self.jvlink = JVLinkWrapper(sid=sid)
+        self.jvlink = create_replay_client(sid) or record_session(JVLinkWrapper(sid=sid))
 
         self.updater = RealtimeUpdater(database)
 
@@ -142,6 +147,8 @@ class RealtimeMonitor:
         except Exception as e:
             logger.error(f"Error closing JV-Link stream: {e}")
 
+        # Report rejections still held back by the throttled record log
+        flush_throttled_logs()
         logger.info("Real-time monitor stopped", **self._stats)
 
     def get_status(self) -> dict:
@@ -170,7 +177,8 @@ class RealtimeMonitor:
         try:
             while self._running and not self._stop_event.is_set():
                 try:
-                    self._poll_once()
+                    with REALTIME_CYCLE_SECONDS.time():
+                        self._poll_once()
                 except Exception as e:
                     logger.error(f"Error in polling loop: {e}", exc_info=True)
                     self._stats["errors"] += 1
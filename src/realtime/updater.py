@@ -11,6 +11,7 @@ from src.database.migration import SchemaMigrationError
 from src.database.schema_types import get_table_primary_key_columns
 from src.importer.importer import (
     CANCELLATION_STATE_RECORD_TYPES,
+    ROWS_WRITTEN,
     MiningSnapshotMutationError,
     TransactionRecoveryError,
     clean_record_metadata,
@@ -44,10 +45,79 @@ from src.jvlink.constants import (
     DATA_KUBUN_UPDATE,
 )
 from src.parser.factory import ParserFactory
+from src.parser.odds_domain import SNAPSHOT_INDEX_KEY
 from src.parser.status_domain import DataKubunContext, validate_record_header
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, get_throttled_logger
+from src.utils.metrics import gauge, histogram
 
 logger = get_logger(__name__)
+# Per-record failures are rate limited so a malformed burst cannot flood the log.
+record_log = get_throttled_logger(__name__)
+
+REALTIME_CYCLE_SECONDS = histogram(
+    "jltsql_realtime_cycle_seconds",
+    "Duration of one realtime polling cycle",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+REALTIME_LAG_SECONDS = gauge(
+    "jltsql_realtime_lag_seconds",
+    "Seconds between the newest HappyoTime seen and its processing",
+    ["record_type"],
+)
+
+
+def observe_happyo_lag(records: List[Dict], now: Optional[datetime] = None) -> Dict[str, float]:
+    """Update the realtime lag gauge from the records' HappyoTime (MMDDhhmm).
+
+    HappyoTime is read once per source record: rows expanded from one odds
+    snapshot share its header, so only the leading row is looked at, and each
+    distinct (Year, HappyoTime) is parsed once.
+
+    Args:
+        records: Parsed realtime records
+        now: Processing time (default: now)
+
+    Returns:
+        Lag in seconds per record type for the records that carry HappyoTime
+    """
+    now = now or datetime.now()
+    newest: Dict[str, datetime] = {}
+    announced_at: Dict[tuple, Optional[datetime]] = {}
+    for record in records:
+        if not isinstance(record, dict) or record.get(SNAPSHOT_INDEX_KEY, 0) != 0:
+            continue
+        happyo = record.get("HappyoTime")
+        if not isinstance(happyo, str):
+            continue
+        key = (record.get("Year"), happyo)
+        if key not in announced_at:
+            announced_at[key] = _announced_at(record.get("Year"), happyo, now)
+        announced = announced_at[key]
+        if announced is None:
+            continue
+        record_type = record.get("RecordSpec") or "unknown"
+        if record_type not in newest or announced > newest[record_type]:
+            newest[record_type] = announced
+    lags = {}
+    for record_type, announced in newest.items():
+        lags[record_type] = (now - announced).total_seconds()
+        REALTIME_LAG_SECONDS.labels(record_type).set(lags[record_type])
+    return lags
+
+
+def _announced_at(year, happyo: str, now: datetime) -> Optional[datetime]:
+    if len(happyo) != 8 or not happyo.isdigit():
+        return None
+    try:
+        return datetime(
+            int(year or now.year),
+            int(happyo[:2]),
+            int(happyo[2:4]),
+            int(happyo[4:6]),
+            int(happyo[6:]),
+        )
+    except (TypeError, ValueError):
+        return None
 
 
 def summarize_update_result(result) -> tuple[List[Dict], int]:
@@ -327,7 +397,7 @@ class RealtimeUpdater:
                         self._verified_wf_tables.add(table_name)
                 validate_wf_record(record, table_name)
         except SchemaMigrationError as error:
-            logger.error(f"Rejected realtime {table_name} record: {error}")
+            record_log.error("Rejected realtime record", key=table_name, table=table_name, error=str(error))
             return str(error)
         return None
 
@@ -356,7 +426,7 @@ class RealtimeUpdater:
             # Parse record
             parsed_data = self.parser_factory.parse(buff)
             if not parsed_data:
-                logger.warning("Failed to parse record")
+                record_log.warning("Failed to parse record")
                 return None
 
             # The physical parser validates the accumulated contract. Realtime
@@ -383,7 +453,7 @@ class RealtimeUpdater:
                 else None
             )
             if spec not in self.RECORD_TYPE_TABLE:
-                logger.warning(f"Unknown realtime record type: {spec}")
+                record_log.warning("Unknown realtime record type", key=spec, spec=spec)
                 return None
 
             # Write to RT cache if enabled
@@ -417,6 +487,8 @@ class RealtimeUpdater:
         the same expanded record repeatedly, so callers can save the parsed rows
         directly through this method. Returns a list when parsed_data is a list.
         """
+        if parsed_data:
+            observe_happyo_lag(parsed_data if isinstance(parsed_data, list) else [parsed_data])
         if isinstance(parsed_data, list):
             header_errors: list[tuple[Optional[str], str]] = []
             for item in parsed_data:
@@ -773,6 +845,7 @@ class RealtimeUpdater:
             verify_odds_storage_schema,
         )
 
+        observe_happyo_lag(records)
         grouped: dict[str, list[Dict]] = {}
         odds_snapshots: list[tuple[str, Dict]] = []
         errors = 0
@@ -926,7 +999,7 @@ class RealtimeUpdater:
             if table_name is None:
                 table_name = self.RECORD_TYPE_TABLE.get(record_type)
             if not table_name:
-                logger.warning(f"Unknown record type: {record_type}")
+                record_log.warning("Unknown record type", key=record_type, record_type=record_type)
                 errors += 1
                 continue
 
@@ -965,6 +1038,7 @@ class RealtimeUpdater:
             for table_name, rows in grouped.items():
                 self.database.insert_many(table_name, rows)
                 inserted += len(rows)
+                ROWS_WRITTEN.labels(table_name).inc(len(rows))
 
             if owned_transaction_started:
                 self.database.commit()
@@ -1234,7 +1308,7 @@ class RealtimeUpdater:
                     "error": alias_error,
                 }
             if not record_type:
-                logger.warning("Missing RecordSpec in parsed data")
+                record_log.warning("Missing RecordSpec in parsed data")
                 return None
 
             record_data_kubun = resolve_record_data_kubun(parsed_data)
@@ -1270,7 +1344,7 @@ class RealtimeUpdater:
                 table_name = self.RECORD_TYPE_TABLE.get(record_type)
 
             if not table_name:
-                logger.warning(f"Unknown record type: {record_type}")
+                record_log.warning("Unknown record type", key=record_type, record_type=record_type)
                 return None
 
             from src.importer.importer import verify_mining_native_schema
@@ -1321,11 +1395,19 @@ class RealtimeUpdater:
                 # ERASE(0) is treated same as DELETE
                 return self._handle_delete_record(table_name, parsed_data)
             else:
-                logger.warning(f"Unknown DataKubun: {head_data_kubun}")
+                record_log.warning("Unknown DataKubun", key=head_data_kubun, data_kubun=head_data_kubun)
                 return None
 
         except ValueError as e:
-            logger.error(f"Rejected realtime record: {e}")
+            # 棄却理由の異なるレコードが1つの抑制グループにまとめられないよう、
+            # レコード種別と例外クラスごとに間引く。
+            record_type = parsed_data.get("RecordSpec") if isinstance(parsed_data, dict) else None
+            record_log.error(
+                "Rejected realtime record",
+                key=(record_type, type(e).__name__),
+                record_type=record_type,
+                error=str(e),
+            )
             raise
         except Exception as e:
             logger.error(f"Error processing single record: {e}", exc_info=True)
@@ -1397,7 +1479,7 @@ class RealtimeUpdater:
             }
 
         except Exception as e:
-            logger.error(f"Failed to insert record: {e}")
+            record_log.error("Failed to insert record", key=table_name, table=table_name, error=str(e))
             return {
                 "operation": "insert",
                 "table": table_name,
@@ -1439,7 +1521,7 @@ class RealtimeUpdater:
             }
 
         except Exception as e:
-            logger.error(f"Failed to update record: {e}")
+            record_log.error("Failed to update record", key=table_name, table=table_name, error=str(e))
             return {
                 "operation": "update",
                 "table": table_name,
@@ -15,7 +15,7 @@ from src.jvlink.bridge import JVLinkBridgeError
 from src.jvlink.wrapper import JVLinkError
 from src.realtime.updater import RealtimeUpdater, summarize_update_result
 from src.database.base import BaseDatabase
-from src.utils.logger import get_logger
+from src.utils.logger import flush_throttled_logs, get_logger
 
 logger = get_logger(__name__)
 
@@ -179,6 +179,8 @@ class RealtimeMonitor:
             self.status.is_running = False
             self.status.stopped_at = datetime.now()
 
+            # Report rejections still held back by the throttled record log
+            flush_throttled_logs()
             logger.info(
                 "Realtime monitor stopped",
                 records_imported=self.status.records_imported,
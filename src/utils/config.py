@@ -111,6 +111,14 @@ def _expand_env_vars(config: Any) -> Any:
         return config
 
 
+def _validate_pragmas(pragmas: Any, section: str) -> None:
+    if not isinstance(pragmas, dict):
+        raise ConfigError(f"{section} must be a mapping")
+    for name, value in pragmas.items():
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            raise ConfigError(f"{section}.{name} must be a string or an integer")
+
+
 def _validate_config(config: Dict[str, Any]) -> None:
     """Validate configuration.
 
@@ -129,6 +137,26 @@ def _validate_config(config: Dict[str, Any]) -> None:
     if not isinstance(config["jvlink"], dict):
         raise ConfigError("Section jvlink must be a mapping")
 
+    replay = config["jvlink"].get("replay", {})
+    if not isinstance(replay, dict):
+        raise ConfigError("jvlink.replay must be a mapping")
+    if not isinstance(replay.get("enabled", False), bool):
+        raise ConfigError("jvlink.replay.enabled must be a boolean")
+    if replay.get("enabled", False) and not isinstance(replay.get("source"), str):
+        raise ConfigError("jvlink.replay.source must be a path when replay is enabled")
+    if replay.get("pacing", "max") not in {"max", "realtime", "burst"}:
+        raise ConfigError(f"Unsupported jvlink.replay.pacing: {replay.get('pacing')}")
+    for key in ("speed", "interval", "burst_interval"):
+        value = replay.get(key, 1.0)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            raise ConfigError(f"jvlink.replay.{key} must be a positive number")
+    burst_size = replay.get("burst_size", 1)
+    if isinstance(burst_size, bool) or not isinstance(burst_size, int) or burst_size < 1:
+        raise ConfigError("jvlink.replay.burst_size must be a positive integer")
+    record_path = config["jvlink"].get("record_session")
+    if record_path is not None and not isinstance(record_path, str):
+        raise ConfigError("jvlink.record_session must be a string")
+
     if "databases" not in config:
         raise ConfigError("Missing required section: databases")
     if not isinstance(config["databases"], dict):
@@ -177,6 +205,61 @@ def _validate_config(config: Dict[str, Any]) -> None:
                 f"databases.{backend}"
             )
 
+    sqlite_config = databases.get("sqlite", {})
+    _validate_pragmas(sqlite_config.get("pragma", {}), "databases.sqlite.pragma")
+    bulk_load = sqlite_config.get("bulk_load", {})
+    if not isinstance(bulk_load, dict):
+        raise ConfigError("databases.sqlite.bulk_load must be a mapping")
+    if not isinstance(bulk_load.get("enabled", True), bool):
+        raise ConfigError("databases.sqlite.bulk_load.enabled must be a boolean")
+    if bulk_load.get("check", "integrity_check") not in {"integrity_check", "quick_check", "none"}:
+        raise ConfigError(f"Unsupported databases.sqlite.bulk_load.check: {bulk_load.get('check')}")
+    _validate_pragmas(bulk_load.get("pragma", {}), "databases.sqlite.bulk_load.pragma")
+
+    partitioning = databases.get("postgresql", {}).get("partitioning", {})
+    if not isinstance(partitioning, dict):
+        raise ConfigError("databases.postgresql.partitioning must be a mapping")
+    if not isinstance(partitioning.get("enabled", False), bool):
+        raise ConfigError("databases.postgresql.partitioning.enabled must be a boolean")
+    retention_years = partitioning.get("retention_years")
+    if retention_years is not None and (
+        isinstance(retention_years, bool)
+        or not isinstance(retention_years, int)
+        or retention_years < 1
+    ):
+        raise ConfigError(
+            "databases.postgresql.partitioning.retention_years must be a positive integer"
+        )
+
+    dual_config = database_selector.get("dual", {})
+    if not isinstance(dual_config, dict):
+        raise ConfigError("database.dual must be a mapping")
+    mirror_mode = dual_config.get("mirror", "sync")
+    if mirror_mode not in {"sync", "async"}:
+        raise ConfigError(f"Unsupported database.dual.mirror: {mirror_mode}")
+    batch_size = dual_config.get("batch_size", 1000)
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1:
+        raise ConfigError("database.dual.batch_size must be a positive integer")
+    poll_interval = dual_config.get("poll_interval", 1.0)
+    if (
+        isinstance(poll_interval, bool)
+        or not isinstance(poll_interval, (int, float))
+        or poll_interval <= 0
+    ):
+        raise ConfigError("database.dual.poll_interval must be a positive number")
+
+    change_log_config = config.get("change_log", {})
+    if not isinstance(change_log_config, dict):
+        raise ConfigError("Section change_log must be a mapping")
+    if not isinstance(change_log_config.get("enabled", False), bool):
+        raise ConfigError("change_log.enabled must be a boolean")
+
+    materialized_config = config.get("materialized_views", {})
+    if not isinstance(materialized_config, dict):
+        raise ConfigError("Section materialized_views must be a mapping")
+    if not isinstance(materialized_config.get("enabled", False), bool):
+        raise ConfigError("materialized_views.enabled must be a boolean")
+
     logging_config = config.get("logging", {})
     if not isinstance(logging_config, dict):
         raise ConfigError("Section logging must be a mapping")
@@ -198,6 +281,8 @@ def _validate_config(config: Dict[str, Any]) -> None:
         enabled = value.get("enabled", True)
         if not isinstance(enabled, bool):
             raise ConfigError(f"logging.{subsection}.enabled must be a boolean")
+    if not isinstance(logging_config.get("queue", False), bool):
+        raise ConfigError("logging.queue must be a boolean")
     log_path = logging_config.get("file", {}).get("path")
     if log_path is not None and not isinstance(log_path, str):
         raise ConfigError("logging.file.path must be a string")
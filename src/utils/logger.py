@@ -1,14 +1,22 @@
 """Logging configuration module."""
 
+import atexit
 import logging
-import logging.config
 import logging.handlers
+import queue
 import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional
 
-import structlog
-import yaml
+if TYPE_CHECKING:
+    import structlog
+
+_structlog = None
+_handlers: List[logging.Handler] = []
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(
@@ -17,6 +25,7 @@ def setup_logging(
     log_to_console: bool = True,
     log_to_file: bool = True,
     console_level: str = "ERROR",
+    use_queue: bool = False,
 ) -> None:
     """Setup logging configuration.
 
@@ -26,6 +35,9 @@ def setup_logging(
         log_to_console: Whether to log to console
         log_to_file: Whether to log to file
         console_level: Console log level (default: ERROR - only critical errors)
+        use_queue: Hand records to a background writer thread through a
+            ``QueueHandler`` so logging callers never wait on file or
+            console I/O (default: False)
     """
     # Create logs directory if it doesn't exist
     if log_to_file:
@@ -65,13 +77,55 @@ def setup_logging(
         file_handler.setFormatter(file_formatter)
         handlers.append(file_handler)
 
+    _stop_listener()
+    root_handlers: List[logging.Handler] = handlers
+    if use_queue and handlers:
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        global _listener
+        _listener = logging.handlers.QueueListener(
+            records, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        root_handlers = [_InProcessQueueHandler(records)]
+
     # Configure root logger
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        handlers=handlers,
+        handlers=root_handlers,
         force=True,
     )
 
+    global _handlers
+    _handlers = handlers
+    if _structlog is not None:
+        _configure_structlog(_structlog, handlers)
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that passes records to the writer thread unformatted.
+
+    ``QueueHandler.prepare`` formats records for pickling, which would
+    render structlog's event dicts with the default formatter. The queue
+    never leaves the process, so the writer thread formats them with the
+    handlers' own formatters instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener() -> None:
+    """Stop the background writer thread after it drained the queue."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _configure_structlog(structlog, handlers: List[logging.Handler]) -> None:
+    """Route structlog through stdlib logging and render ``handlers`` with it."""
     # Configure structlog to use stdlib integration (respects handler levels)
     structlog.configure(
         processors=[
@@ -103,7 +157,62 @@ def setup_logging(
         handler.setFormatter(formatter)
 
 
-def get_logger(name: str) -> structlog.BoundLogger:
+def _load_structlog():
+    """Import and configure structlog on first use.
+
+    structlog imports rich and pygments for its console renderer, which
+    dominates the start-up time of short CLI invocations. Loggers are
+    therefore handed out as lazy proxies and structlog is only imported
+    when a message is actually emitted.
+    """
+    global _structlog
+    if _structlog is None:
+        import structlog
+
+        _configure_structlog(structlog, _handlers)
+        _structlog = structlog
+    return _structlog
+
+
+def _discard(*args, **kwargs) -> None:
+    return None
+
+
+class _LazyLogger:
+    """Structured logger proxy that defers importing structlog.
+
+    Calls for a level the stdlib logger does not emit are dropped without
+    importing structlog; ``structlog.stdlib.filter_by_level`` would drop
+    them anyway. Everything else is delegated to the structlog logger.
+    """
+
+    _LEVELS = {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "warn": logging.WARNING,
+        "error": logging.ERROR,
+        "exception": logging.ERROR,
+        "critical": logging.CRITICAL,
+        "fatal": logging.CRITICAL,
+    }
+
+    def __init__(self, name: str):
+        self._name = name
+        self._logger = None
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        if self._logger is None:
+            level = self._LEVELS.get(attr)
+            if level is not None and not logging.getLogger(self._name).isEnabledFor(level):
+                return _discard
+            self._logger = _load_structlog().get_logger(self._name)
+        return getattr(self._logger, attr)
+
+
+def get_logger(name: str) -> "structlog.stdlib.BoundLogger":
     """Get a structured logger instance.
 
     Args:
@@ -117,7 +226,132 @@ def get_logger(name: str) -> structlog.BoundLogger:
         >>> logger.info("Starting data import", records=1000)
         >>> logger.error("Import failed", error=str(e))
     """
-    return structlog.get_logger(name)
+    return _LazyLogger(name)
+
+
+class ThrottledLogger:
+    """Rate-limited, deduplicating front end of a structured logger.
+
+    For hot paths that can fail once per record. Messages are grouped by
+    level, event and an optional ``key`` (e.g. the field name). The first
+    message of a group is logged; repeats within ``interval`` seconds are
+    only counted. The next message after the interval, a timer ``interval``
+    seconds after the first suppressed repeat, or :func:`flush_throttled_logs`
+    (called when a fetch read completes, when a monitor stops and at exit)
+    logs the count with ``suppressed=<count>`` and ``window_seconds``, so a
+    malformed batch yields one line per group and interval instead of one
+    per record, and no count is held back while the stream is quiet.
+
+    Calls for a disabled level return before anything else is done, and
+    field values that are callables are only called when a line is
+    actually logged.
+
+    Examples:
+        >>> field_log = get_throttled_logger(__name__)
+        >>> field_log.warning("Failed to convert field", key="Kyori",
+        ...                   field="Kyori", value=lambda: raw.strip())
+    """
+
+    def __init__(self, name: str, interval: float = 60.0):
+        self._name = name
+        self._logger = get_logger(name)
+        self.interval = interval
+        self._lock = threading.Lock()
+        # (level, event, key) -> [window start, suppressed count, last fields]
+        self._groups: Dict[tuple, list] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        _throttled_loggers.add(self)
+
+    def debug(self, event: str, key: Hashable = None, **fields: Any) -> None:
+        self._log("debug", event, key, fields)
+
+    def info(self, event: str, key: Hashable = None, **fields: Any) -> None:
+        self._log("info", event, key, fields)
+
+    def warning(self, event: str, key: Hashable = None, **fields: Any) -> None:
+        self._log("warning", event, key, fields)
+
+    def error(self, event: str, key: Hashable = None, **fields: Any) -> None:
+        self._log("error", event, key, fields)
+
+    def _log(self, level: str, event: str, key: Hashable, fields: Dict[str, Any]) -> None:
+        if not logging.getLogger(self._name).isEnabledFor(_LazyLogger._LEVELS[level]):
+            return
+        group = (level, event, key)
+        now = time.monotonic()
+        with self._lock:
+            state = self._groups.get(group)
+            if state is not None and now - state[0] < self.interval:
+                state[1] += 1
+                state[2] = fields
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.interval, self._flush_on_timer)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+            suppressed = state[1] if state is not None else 0
+            window = now - state[0] if state is not None else 0.0
+            self._groups[group] = [now, 0, fields]
+        if suppressed:
+            fields = {**fields, "suppressed": suppressed, "window_seconds": round(window)}
+        self._emit(level, event, fields)
+
+    def flush(self) -> None:
+        """Log the count of every group with suppressed messages."""
+        now = time.monotonic()
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending = []
+            for group, state in self._groups.items():
+                if state[1]:
+                    pending.append((group, state[1], now - state[0], state[2]))
+                    state[1] = 0
+        for (level, event, _key), suppressed, window, fields in pending:
+            self._emit(
+                level,
+                event,
+                {**fields, "suppressed": suppressed, "window_seconds": round(window)},
+            )
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+        self.flush()
+
+    def _emit(self, level: str, event: str, fields: Dict[str, Any]) -> None:
+        fields = {name: value() if callable(value) else value for name, value in fields.items()}
+        getattr(self._logger, level)(event, **fields)
+
+
+_throttled_loggers: "weakref.WeakSet[ThrottledLogger]" = weakref.WeakSet()
+
+
+def get_throttled_logger(name: str, interval: float = 60.0) -> ThrottledLogger:
+    """Get a rate-limited logger for per-record messages.
+
+    Args:
+        name: Logger name (typically __name__)
+        interval: Seconds during which repeats of a message are only counted
+
+    Returns:
+        :class:`ThrottledLogger` instance
+    """
+    return ThrottledLogger(name, interval=interval)
+
+
+def flush_throttled_logs() -> None:
+    """Log the suppressed-message counts of every throttled logger."""
+    for throttled in list(_throttled_loggers):
+        throttled.flush()
+
+
+# Registered after logging's own shutdown hook, so the queue is drained
+# before the handlers are closed.
+atexit.register(_stop_listener)
+# Runs before _stop_listener (atexit is LIFO), so the last counts are written.
+atexit.register(flush_throttled_logs)
 
 
 def setup_logging_from_config(config: dict) -> None:
@@ -146,6 +380,7 @@ def setup_logging_from_config(config: dict) -> None:
         log_file=log_file,
         log_to_console=log_to_console,
         log_to_file=log_to_file,
+        use_queue=logging_config.get("queue", False),
     )
 
 
@@ -179,6 +414,10 @@ def setup_logging_from_yaml(config_path: Optional[str] = None) -> None:
     if not config_file.exists():
         raise FileNotFoundError(f"Logging config file not found: {config_path}")
 
+    import logging.config
+
+    import yaml
+
     # Load YAML configuration
     with open(config_file, 'r', encoding='utf-8') as f:
         config_dict = yaml.safe_load(f)
@@ -207,7 +446,15 @@ def get_rotation_info() -> dict:
     """
     rotation_info = {}
 
-    for handler in logging.getLogger().handlers:
+    handlers = [
+        handler
+        for handler in logging.getLogger().handlers
+        if not isinstance(handler, _InProcessQueueHandler)
+    ]
+    if _listener is not None:
+        # Handlers behind the queue writer thread
+        handlers.extend(_listener.handlers)
+    for handler in handlers:
         handler_name = handler.__class__.__name__
         info = {'type': handler_name}
 
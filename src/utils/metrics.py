@@ -0,0 +1,466 @@
+"""In-process pipeline metrics for JLTSQL.
+
+A small, dependency-free registry of counters, gauges and latency histograms
+shared by the fetcher, parsers, importers, database handlers and the realtime
+updater. The background updater serves it in the Prometheus text format at
+``/metrics`` and writes a JSON snapshot that ``jltsql status --json`` reports.
+
+Metrics used by the pipeline are declared once at module level::
+
+    JV_READ_SECONDS = histogram("jltsql_jv_read_seconds", "JVRead call latency")
+
+    started = time.perf_counter()
+    ret_code, buff, filename = jvlink.jv_read()
+    JV_READ_SECONDS.observe(time.perf_counter() - started)
+
+Labelled metrics return a cached child per label value, so hot loops pay one
+dict lookup plus a lock per observation. Per-record loops (JVRead, parsing)
+time one call in a few hundred and publish it with ``observe(seconds, count=n)``
+for the ``n`` calls it stands for, so the counts stay exact and only the
+latency is sampled.
+
+A child process (the background updater runs historical updates as
+``jltsql fetch`` subprocesses) writes its raw samples with
+:meth:`MetricsRegistry.write_state` to the file named by
+``JLTSQL_METRICS_EXPORT``; the parent adds them to its own registry with
+:meth:`MetricsRegistry.merge_state_file`.
+"""
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+METRICS_EXPORT_ENV = "JLTSQL_METRICS_EXPORT"
+
+
+class MetricsError(Exception):
+    """Metric declared twice with a different type or labels."""
+
+    pass
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_buckets", "counts", "sum", "count")
+
+    def __init__(self, lock: threading.Lock, buckets: Tuple[float, ...]):
+        self._lock = lock
+        self._buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float, count: int = 1) -> None:
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[index] += count
+            self.sum += value * count
+            self.count += count
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric:
+    """A named metric family with zero or more label dimensions."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._default = None if self.labelnames else self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: Any):
+        """Return the child for one combination of label values."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise MetricsError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self) -> List[Tuple[Dict[str, str], Any]]:
+        """Return ``(labels, child)`` pairs in insertion order."""
+        return [
+            (dict(zip(self.labelnames, key)), child)
+            for key, child in list(self._children.items())
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild(self._lock)
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class Histogram(_Metric):
+    """Latency distribution over fixed cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self._lock, self.buckets)
+
+    def observe(self, value: float, count: int = 1) -> None:
+        """Record ``value``; ``count`` > 1 stands for that many sampled calls."""
+        self._default.observe(value, count)
+
+    def time(self):
+        return self._default.time()
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = [
+        name + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in labels.items()
+    ]
+    return "{" + ",".join(parts) + "}"
+
+
+class MetricsRegistry:
+    """Collection of metric families keyed by name.
+
+    Examples:
+        >>> registry = MetricsRegistry()
+        >>> rows = registry.counter("rows_total", "Rows written", ["table"])
+        >>> rows.labels("NL_RA").inc(100)
+        >>> print(registry.render_prometheus())
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self.started_at = time.time()
+
+    def _register(self, metric_class: type, name: str, documentation: str, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not metric_class or existing.labelnames != tuple(labelnames):
+                    raise MetricsError(f"Metric {name} already registered differently")
+                return existing
+            metric = metric_class(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Return a registered metric by name."""
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Drop all recorded samples, keeping the registered metrics."""
+        with self._lock:
+            for metric in self._metrics.values():
+                with metric._lock:
+                    metric._children.clear()
+                metric._default = None if metric.labelnames else metric.labels()
+            self.started_at = time.time()
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, child in metric.samples():
+                if metric.kind != "histogram":
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(child.value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(metric.buckets + (math.inf,), child.counts):
+                    cumulative += count
+                    bucket_labels = {**labels, "le": _format_value(bound)}
+                    lines.append(
+                        f"{metric.name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                    )
+                lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_value(child.sum)}")
+                lines.append(f"{metric.name}_count{_format_labels(labels)} {child.count}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary of all recorded samples.
+
+        Histograms are summarized as count, sum, mean and the p50/p95/p99
+        bucket upper bounds.
+        """
+        metrics: Dict[str, Any] = {}
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            samples = []
+            for labels, child in metric.samples():
+                if metric.kind != "histogram":
+                    samples.append({"labels": labels, "value": child.value})
+                    continue
+                samples.append(
+                    {
+                        "labels": labels,
+                        "count": child.count,
+                        "sum": round(child.sum, 6),
+                        "mean": round(child.sum / child.count, 6) if child.count else None,
+                        "p50": _quantile(metric.buckets, child.counts, 0.50),
+                        "p95": _quantile(metric.buckets, child.counts, 0.95),
+                        "p99": _quantile(metric.buckets, child.counts, 0.99),
+                    }
+                )
+            if samples:
+                metrics[metric.name] = {"type": metric.kind, "samples": samples}
+        return {
+            "generated_at": time.time(),
+            "started_at": self.started_at,
+            "metrics": metrics,
+        }
+
+    def write_snapshot(self, path: Union[str, Path]) -> None:
+        """Atomically write :meth:`snapshot` as JSON to ``path``."""
+        _write_json(path, self.snapshot())
+
+    def export_state(self) -> Dict[str, Any]:
+        """Return the raw samples of every metric for :meth:`merge_state`."""
+        metrics: Dict[str, Any] = {}
+        for metric in list(self._metrics.values()):
+            samples = []
+            for labels, child in metric.samples():
+                if metric.kind != "histogram":
+                    samples.append({"labels": labels, "value": child.value})
+                    continue
+                samples.append(
+                    {
+                        "labels": labels,
+                        "counts": list(child.counts),
+                        "sum": child.sum,
+                        "count": child.count,
+                    }
+                )
+            if not samples:
+                continue
+            metrics[metric.name] = {
+                "type": metric.kind,
+                "documentation": metric.documentation,
+                "labelnames": list(metric.labelnames),
+                "buckets": list(getattr(metric, "buckets", ())),
+                "samples": samples,
+            }
+        return {"metrics": metrics}
+
+    def merge_state(self, state: Dict[str, Any]) -> None:
+        """Add the samples another process exported with :meth:`export_state`.
+
+        Counters and histograms are added; gauges take the exported value.
+        Metrics declared here with other labels or buckets are skipped.
+        """
+        kinds = {"counter": self.counter, "gauge": self.gauge}
+        for name, exported in state.get("metrics", {}).items():
+            kind = exported.get("type")
+            labelnames = exported.get("labelnames", [])
+            try:
+                if kind == "histogram":
+                    metric = self.histogram(
+                        name, exported["documentation"], labelnames, exported["buckets"]
+                    )
+                    if list(metric.buckets) != list(exported["buckets"]):
+                        continue
+                elif kind in kinds:
+                    metric = kinds[kind](name, exported["documentation"], labelnames)
+                else:
+                    continue
+            except MetricsError:
+                continue
+            for sample in exported["samples"]:
+                child = metric.labels(*(sample["labels"][label] for label in labelnames))
+                with metric._lock:
+                    if kind == "gauge":
+                        child.value = float(sample["value"])
+                    elif kind == "counter":
+                        child.value += sample["value"]
+                    else:
+                        for index, count in enumerate(sample["counts"]):
+                            child.counts[index] += count
+                        child.sum += sample["sum"]
+                        child.count += sample["count"]
+
+    def write_state(self, path: Union[str, Path]) -> None:
+        """Atomically write :meth:`export_state` as JSON to ``path``."""
+        _write_json(path, self.export_state())
+
+    def merge_state_file(self, path: Union[str, Path]) -> bool:
+        """Merge and delete a state file written by :meth:`write_state`.
+
+        Returns:
+            True if a valid file was merged
+        """
+        path = Path(path)
+        state = load_snapshot(path)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        if not isinstance(state, dict):
+            return False
+        self.merge_state(state)
+        return True
+
+
+def _write_json(path: Union[str, Path], data: Dict[str, Any]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    temp_path.replace(path)
+
+
+def _quantile(buckets: Tuple[float, ...], counts: List[int], q: float) -> Optional[float]:
+    total = sum(counts)
+    if not total:
+        return None
+    target = q * total
+    cumulative = 0
+    for bound, count in zip(buckets + (math.inf,), counts):
+        cumulative += count
+        if cumulative >= target:
+            return bound if not math.isinf(bound) else None
+    return None
+
+
+def load_snapshot(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Read a snapshot written by :meth:`MetricsRegistry.write_snapshot`.
+
+    Returns:
+        Snapshot dictionary, or None if the file does not exist or is invalid
+    """
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+REGISTRY = MetricsRegistry()
+
+DEFAULT_SNAPSHOT_PATH = Path("data") / "metrics.json"
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """Get or create a counter in the process-wide registry."""
+    return REGISTRY.counter(name, documentation, labelnames)
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    """Get or create a gauge in the process-wide registry."""
+    return REGISTRY.gauge(name, documentation, labelnames)
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """Get or create a histogram in the process-wide registry."""
+    return REGISTRY.histogram(name, documentation, labelnames, buckets)
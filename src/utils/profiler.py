@@ -0,0 +1,266 @@
+"""Stage profiler for JLTSQL import pipelines.
+
+Breaks a fetch or cache replay down into the pipeline stages
+
+    fetch -> parse -> validate -> convert -> flush -> commit
+
+(plus ``schema`` for table preparation) per record type (parse/validate) or
+table (convert/flush), and optionally samples Python stacks on a background
+thread. Both views can be written as a JSON report and as a
+flamegraph-compatible collapsed-stack (``.folded``) file.
+
+The hooks in the fetcher, parser factory and importer cost one global lookup
+when no profiler is active::
+
+    profiler = StageProfiler(sample_interval=0.005)
+    with profiler.activate():
+        processor.process_date_range("RACE", "20260101", "20260131")
+    json_path, folded_path = profiler.write("data/profile/fetch")
+
+Stages nest: time spent in ``convert`` while a ``flush`` is running is
+reported under ``convert`` only, so the stage totals add up to the measured
+time and the rest of the wall clock is reported as ``other``.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter as _Counter
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+STAGES: Tuple[str, ...] = ("fetch", "parse", "validate", "convert", "flush", "commit", "schema")
+
+DEFAULT_PROFILE_DIR = Path("data") / "profile"
+
+_active: Optional["StageProfiler"] = None
+
+
+def current_profiler() -> Optional["StageProfiler"]:
+    """Return the profiler activated for this process, if any."""
+    return _active
+
+
+class _Stage:
+    """Timer for one stage interval; subtracts nested stages from its parent."""
+
+    __slots__ = ("_profiler", "_name", "_key", "_started", "_children")
+
+    def __init__(self, profiler: "StageProfiler", name: str, key: str):
+        self._profiler = profiler
+        self._name = name
+        self._key = key
+        self._children = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self._profiler._stack.append(self)
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed = perf_counter() - self._started
+        stack = self._profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1]._children += elapsed
+        self._profiler.record(self._name, self._key, elapsed - self._children)
+
+
+class StageProfiler:
+    """Accumulates exclusive time per ``(stage, key)`` and sampled stacks.
+
+    Args:
+        sample_interval: Seconds between stack samples of the profiled
+            thread. None or 0 disables the sampling profiler.
+    """
+
+    def __init__(self, sample_interval: Optional[float] = None):
+        """Initialize an empty profile."""
+        self.sample_interval = sample_interval or None
+        self._totals: Dict[Tuple[str, str], List[float]] = {}
+        self._stack: List[_Stage] = []
+        self._samples: _Counter = _Counter()
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started: Optional[float] = None
+        self.wall_seconds = 0.0
+
+    def stage(self, name: str, key: Any = "-") -> _Stage:
+        """Return a context manager timing one ``name`` interval for ``key``."""
+        return _Stage(self, name, str(key))
+
+    def record(self, name: str, key: Any, seconds: float, count: int = 1) -> None:
+        """Add an externally measured interval.
+
+        ``seconds`` covering ``count`` > 1 calls (a batch, or one sampled call
+        scaled up) counts as ``seconds / count`` per call for the maximum.
+        """
+        totals = self._totals.get((name, key))
+        if totals is None:
+            totals = self._totals.setdefault((name, str(key)), [0, 0.0, 0.0])
+        totals[0] += count
+        totals[1] += seconds
+        slowest = seconds / count if count > 1 else seconds
+        if slowest > totals[2]:
+            totals[2] = slowest
+
+    @contextmanager
+    def activate(self) -> Iterator["StageProfiler"]:
+        """Make this the process profiler and measure wall time until exit."""
+        global _active
+        previous = _active
+        _active = self
+        self._started = perf_counter()
+        if self.sample_interval:
+            self._start_sampler(threading.get_ident())
+        try:
+            yield self
+        finally:
+            self._stop_sampler()
+            self.wall_seconds += perf_counter() - self._started
+            self._started = None
+            _active = previous
+
+    def _start_sampler(self, thread_id: int) -> None:
+        self._stop.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop,
+            args=(thread_id,),
+            name="jltsql-profiler",
+            daemon=True,
+        )
+        self._sampler.start()
+
+    def _stop_sampler(self) -> None:
+        if self._sampler is None:
+            return
+        self._stop.set()
+        self._sampler.join()
+        self._sampler = None
+
+    def _sample_loop(self, thread_id: int) -> None:
+        while not self._stop.wait(self.sample_interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            try:
+                names.append(self._stack[-1]._name)
+            except IndexError:
+                pass
+            self._samples[";".join(reversed(names))] += 1
+
+    def report(self) -> Dict[str, Any]:
+        """Return the per-stage and per-key breakdown as a JSON-ready dict."""
+        wall = self.wall_seconds
+        if self._started is not None:
+            wall += perf_counter() - self._started
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        by_key: List[Dict[str, Any]] = []
+        for (name, key), (count, seconds, slowest) in sorted(self._totals.items()):
+            summary = stages.setdefault(name, {"count": 0, "seconds": 0.0})
+            summary["count"] += count
+            summary["seconds"] += seconds
+            by_key.append(
+                {
+                    "stage": name,
+                    "key": key,
+                    "count": count,
+                    "seconds": round(seconds, 6),
+                    "mean_us": round(seconds / count * 1e6, 1) if count else None,
+                    "max_us": round(slowest * 1e6, 1),
+                }
+            )
+
+        ordered = [name for name in STAGES if name in stages]
+        ordered += sorted(name for name in stages if name not in STAGES)
+        measured = sum(summary["seconds"] for summary in stages.values())
+        stage_rows = [
+            {
+                "stage": name,
+                "count": stages[name]["count"],
+                "seconds": round(stages[name]["seconds"], 6),
+                "percent": round(stages[name]["seconds"] / wall * 100, 1) if wall else None,
+            }
+            for name in ordered
+        ]
+        stage_rows.append(
+            {
+                "stage": "other",
+                "count": None,
+                "seconds": round(max(0.0, wall - measured), 6),
+                "percent": round(max(0.0, wall - measured) / wall * 100, 1) if wall else None,
+            }
+        )
+        by_key.sort(key=lambda row: row["seconds"], reverse=True)
+        return {
+            "generated_at": time.time(),
+            "wall_seconds": round(wall, 6),
+            "sample_interval": self.sample_interval,
+            "samples": sum(self._samples.values()),
+            "stages": stage_rows,
+            "by_key": by_key,
+        }
+
+    def collapsed_stacks(self) -> List[str]:
+        """Return flamegraph ``stack count`` lines.
+
+        Sampled Python stacks, rooted at the active stage, are used when the
+        sampler ran; otherwise the stage timings are emitted as
+        ``stage;key microseconds`` so a flamegraph is available either way.
+        """
+        if self._samples:
+            return [f"{stack} {count}" for stack, count in sorted(self._samples.items())]
+        lines = []
+        for (name, key), (_, seconds, _) in sorted(self._totals.items()):
+            micros = int(round(seconds * 1e6))
+            if micros:
+                lines.append(f"{name} {micros}" if key == "-" else f"{name};{key} {micros}")
+        return lines
+
+    def write(self, prefix: Union[str, Path]) -> Tuple[Path, Path]:
+        """Write ``<prefix>.json`` and ``<prefix>.folded``.
+
+        Returns:
+            Paths of the JSON report and the collapsed-stack file
+        """
+        prefix = Path(prefix)
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        json_path = prefix.with_name(prefix.name + ".json")
+        folded_path = prefix.with_name(prefix.name + ".folded")
+        json_path.write_text(
+            json.dumps(self.report(), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        folded_path.write_text("\n".join(self.collapsed_stacks()) + "\n", encoding="utf-8")
+        return json_path, folded_path
+
+
+def profile_iter(iterable: Iterable, stage: str, key: Any = "-") -> Iterable:
+    """Time each ``next()`` of ``iterable`` as ``stage`` when profiling."""
+    profiler = _active
+    if profiler is None:
+        return iterable
+    return _timed_iter(profiler, iter(iterable), stage, str(key))
+
+
+def _timed_iter(profiler: StageProfiler, iterator: Iterator, stage: str, key: str) -> Iterator:
+    exhausted = object()
+    while True:
+        started = perf_counter()
+        item = next(iterator, exhausted)
+        if item is exhausted:
+            profiler.record(stage, key, perf_counter() - started, count=0)
+            return
+        profiler.record(stage, key, perf_counter() - started)
+        yield item
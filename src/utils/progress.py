@@ -1,12 +1,22 @@
 """Stylish progress display for JLTSQL using rich library.
 
 This module provides beautiful, informative progress bars for data fetching operations.
+
+Besides the rich display, two headless displays share its interface for
+service runs where nobody watches the terminal: :class:`NullProgressDisplay`
+renders nothing and :class:`JsonLinesProgressDisplay` writes one JSON event
+per line for orchestration tools. :func:`create_progress_display` selects one
+by name or from the ``JLTSQL_PROGRESS`` environment variable.
 """
 
+import json
+import os
+import sys
 import threading
 import time
 from contextlib import contextmanager
-from typing import Optional
+from datetime import datetime
+from typing import IO, Any, Dict, Optional
 
 from rich.console import Console, Group, RenderableType
 from rich.live import Live
@@ -549,3 +559,295 @@ class JVLinkProgressDisplay:
         """Exit context manager."""
         self.stop()
         return False
+
+
+PROGRESS_MODES = ("rich", "jsonl", "none")
+
+
+class NullProgressDisplay:
+    """Progress display that renders nothing.
+
+    Has the interface of :class:`JVLinkProgressDisplay`, so fetchers can
+    report progress unconditionally without a terminal or rich rendering.
+    """
+
+    def __init__(self):
+        """Initialize headless progress display."""
+        self._next_task_id = 0
+
+    def _new_task_id(self) -> int:
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        return task_id
+
+    def start(self):
+        """Start the display."""
+
+    def stop(self):
+        """Stop the display."""
+
+    def add_download_task(self, description: str, total: Optional[float] = None) -> int:
+        """Add a download progress task and return its ID."""
+        return self._new_task_id()
+
+    def add_task(self, description: str, total: Optional[float] = None) -> int:
+        """Add a progress task and return its ID."""
+        return self._new_task_id()
+
+    def update_download(
+        self,
+        task_id: int,
+        advance: Optional[float] = None,
+        completed: Optional[float] = None,
+        status: Optional[str] = None,
+    ):
+        """Update download progress."""
+
+    def update(
+        self,
+        task_id: int,
+        advance: Optional[float] = None,
+        completed: Optional[float] = None,
+        total: Optional[float] = None,
+        status: Optional[str] = None,
+    ):
+        """Update progress."""
+
+    def update_stats(
+        self,
+        fetched: int = 0,
+        parsed: int = 0,
+        failed: int = 0,
+        skipped: int = 0,
+        inserted: int = 0,
+        speed: Optional[float] = None,
+    ):
+        """Update statistics."""
+
+    def print_success(self, message: str):
+        """Report a success message."""
+
+    def print_error(self, message: str):
+        """Report an error message."""
+
+    def print_warning(self, message: str):
+        """Report a warning message."""
+
+    def print_info(self, message: str):
+        """Report an informational message."""
+
+    def print_separator(self):
+        """Separate two specs."""
+
+    def print_spec_header(self, spec: str, from_date: str = None, to_date: str = None):
+        """Report the start of a spec."""
+
+    @contextmanager
+    def task_context(self, description: str, total: Optional[float] = None):
+        """Context manager for a progress task.
+
+        Yields:
+            Task ID
+        """
+        yield self.add_task(description, total)
+
+    def __enter__(self):
+        """Enter context manager."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager."""
+        self.stop()
+        return False
+
+
+class JsonLinesProgressDisplay(NullProgressDisplay):
+    """Progress display that writes one JSON event per line.
+
+    Every event carries ``event`` and ``ts`` (local ISO timestamp):
+
+    - ``start`` / ``stop``
+    - ``spec``: ``spec``, ``description``, ``from_date``, ``to_date``
+    - ``task``: ``task``, ``kind`` (``fetch``/``download``), ``description``, ``total``
+    - ``progress``: ``task``, ``kind``, ``completed``, ``total``, ``status``
+    - ``stats``: ``fetched``, ``parsed``, ``failed``, ``skipped``, ``inserted``, ``speed``
+    - ``message``: ``level`` (``success``/``error``/``warning``/``info``), ``message``
+
+    Fetchers report progress on file switches and at most every couple of
+    seconds, so each event is written and flushed immediately.
+
+    Args:
+        stream: Writable text stream (default: ``sys.stderr``)
+        path: File to append events to instead of ``stream``. It is opened
+            on the first event and closed by :meth:`stop`.
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None, path: Optional[str] = None):
+        super().__init__()
+        self.path = path
+        self._stream = stream
+        self._owns_stream = False
+        self._lock = threading.Lock()
+        self._tasks: Dict[int, Dict[str, Any]] = {}
+
+    def emit(self, event: str, **fields: Any):
+        """Write one event line."""
+        payload = {"event": event, "ts": datetime.now().isoformat(timespec="milliseconds")}
+        payload.update(fields)
+        line = json.dumps(payload, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._stream is None:
+                if self.path:
+                    self._stream = open(self.path, "a", encoding="utf-8")
+                    self._owns_stream = True
+                else:
+                    self._stream = sys.stderr
+            self._stream.write(line)
+            self._stream.flush()
+
+    def start(self):
+        """Emit the ``start`` event."""
+        self.emit("start")
+
+    def stop(self):
+        """Emit the ``stop`` event and close an owned file."""
+        self.emit("stop")
+        with self._lock:
+            if self._owns_stream:
+                self._stream.close()
+                self._stream = None
+                self._owns_stream = False
+            self._tasks.clear()
+
+    def _add(self, kind: str, description: str, total: Optional[float]) -> int:
+        task_id = self._new_task_id()
+        self._tasks[task_id] = {"kind": kind, "completed": 0, "total": total}
+        self.emit("task", task=task_id, kind=kind, description=description, total=total)
+        return task_id
+
+    def _update(
+        self,
+        task_id: int,
+        advance: Optional[float],
+        completed: Optional[float],
+        total: Optional[float],
+        status: Optional[str],
+    ):
+        task = self._tasks.setdefault(task_id, {"kind": "fetch", "completed": 0, "total": None})
+        if completed is not None:
+            task["completed"] = completed
+        if advance is not None:
+            task["completed"] += advance
+        if total is not None:
+            task["total"] = total
+        self.emit(
+            "progress",
+            task=task_id,
+            kind=task["kind"],
+            completed=task["completed"],
+            total=task["total"],
+            status=status,
+        )
+
+    def add_download_task(self, description: str, total: Optional[float] = None) -> int:
+        """Add a download task and emit a ``task`` event."""
+        return self._add("download", description, total)
+
+    def add_task(self, description: str, total: Optional[float] = None) -> int:
+        """Add a fetch task and emit a ``task`` event."""
+        return self._add("fetch", description, total)
+
+    def update_download(
+        self,
+        task_id: int,
+        advance: Optional[float] = None,
+        completed: Optional[float] = None,
+        status: Optional[str] = None,
+    ):
+        """Emit a ``progress`` event for a download task."""
+        self._update(task_id, advance, completed, None, status)
+
+    def update(
+        self,
+        task_id: int,
+        advance: Optional[float] = None,
+        completed: Optional[float] = None,
+        total: Optional[float] = None,
+        status: Optional[str] = None,
+    ):
+        """Emit a ``progress`` event."""
+        self._update(task_id, advance, completed, total, status)
+
+    def update_stats(
+        self,
+        fetched: int = 0,
+        parsed: int = 0,
+        failed: int = 0,
+        skipped: int = 0,
+        inserted: int = 0,
+        speed: Optional[float] = None,
+    ):
+        """Emit a ``stats`` event."""
+        self.emit(
+            "stats",
+            fetched=fetched,
+            parsed=parsed,
+            failed=failed,
+            skipped=skipped,
+            inserted=inserted,
+            speed=round(speed, 1) if speed is not None else None,
+        )
+
+    def print_success(self, message: str):
+        """Emit a ``message`` event of level ``success``."""
+        self.emit("message", level="success", message=message)
+
+    def print_error(self, message: str):
+        """Emit a ``message`` event of level ``error``."""
+        self.emit("message", level="error", message=message)
+
+    def print_warning(self, message: str):
+        """Emit a ``message`` event of level ``warning``."""
+        self.emit("message", level="warning", message=message)
+
+    def print_info(self, message: str):
+        """Emit a ``message`` event of level ``info``."""
+        self.emit("message", level="info", message=message)
+
+    def print_spec_header(self, spec: str, from_date: str = None, to_date: str = None):
+        """Emit a ``spec`` event."""
+        self.emit(
+            "spec",
+            spec=spec,
+            description=SPEC_DESCRIPTIONS.get(spec, ""),
+            from_date=from_date,
+            to_date=to_date,
+        )
+
+
+def create_progress_display(mode: Optional[str] = None):
+    """Create a progress display by name.
+
+    Args:
+        mode: ``rich`` (default), ``jsonl`` or ``none``. Falls back to the
+            ``JLTSQL_PROGRESS`` environment variable. ``jsonl`` events go to
+            the file named by ``JLTSQL_PROGRESS_FILE``, or to stderr.
+
+    Returns:
+        :class:`JVLinkProgressDisplay`, :class:`JsonLinesProgressDisplay` or
+        :class:`NullProgressDisplay`
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    mode = (mode or os.environ.get("JLTSQL_PROGRESS") or "rich").strip().lower()
+    if mode == "rich":
+        return JVLinkProgressDisplay()
+    if mode == "jsonl":
+        return JsonLinesProgressDisplay(path=os.environ.get("JLTSQL_PROGRESS_FILE") or None)
+    if mode == "none":
+        return NullProgressDisplay()
+    raise ValueError(
+        f"Unknown progress display '{mode}' (expected one of: {', '.join(PROGRESS_MODES)})"
+    )
@@ -7,12 +7,9 @@ import sys
 import time
 import tomllib
 from datetime import datetime, timezone
-from importlib import metadata
 from pathlib import Path
 from typing import Optional
 
-from packaging.version import InvalidVersion, Version
-
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -79,6 +76,8 @@ def get_current_version() -> str:
         )
 
     # Installed wheels do not carry their source pyproject.
+    from importlib import metadata
+
     try:
         return metadata.version("jltsql")
     except metadata.PackageNotFoundError as error:
@@ -199,6 +198,9 @@ def _version_newer(latest: str, current: str) -> bool:
     Returns:
         True if latest is newer than current
     """
+    # packaging is only needed once a release has actually been fetched.
+    from packaging.version import InvalidVersion, Version
+
     try:
         return Version(latest.lstrip("v")) > Version(current.lstrip("v"))
     except InvalidVersion:
@@ -0,0 +1 @@
+"""Opt-in throughput benchmarks (``JLTSQL_RUN_BENCHMARKS=1``)."""
@@ -0,0 +1,115 @@
+"""Fixtures for the throughput benchmarks.
+
+Benchmarks are opt-in: set ``JLTSQL_RUN_BENCHMARKS=1``. Each result is
+compared with this runner's entry in ``baseline.json`` and fails when its
+median throughput falls below the entry's tolerance; a runner without an
+entry is skipped. ``JLTSQL_BENCHMARK_SAVE=1`` records the session's results as
+the runner's new baseline instead. See :func:`tests.benchmarks.harness.runner_label`.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from src.database.schema import create_all_tables
+from src.database.sqlite_handler import SQLiteDatabase
+from tests.benchmarks.harness import (
+    Measurement,
+    check_regression,
+    format_results,
+    load_baseline,
+    measure,
+    runner_baseline,
+    runner_label,
+    save_baseline,
+)
+from tests.fixtures.jvdata_corpus import CorpusGenerator
+
+_RESULTS: List[Measurement] = []
+
+
+def _saving() -> bool:
+    return os.getenv("JLTSQL_BENCHMARK_SAVE") == "1"
+
+
+@pytest.fixture(autouse=True)
+def _benchmarks_enabled():
+    if os.getenv("JLTSQL_RUN_BENCHMARKS") != "1":
+        pytest.skip("Set JLTSQL_RUN_BENCHMARKS=1 to run throughput benchmarks")
+
+
+@pytest.fixture(scope="session")
+def corpus_generator() -> CorpusGenerator:
+    return CorpusGenerator()
+
+
+@pytest.fixture(scope="session")
+def sqlite_template(tmp_path_factory) -> Path:
+    """An SQLite file with every table created, copied for each round."""
+    path = tmp_path_factory.mktemp("bench-template") / "template.db"
+    database = SQLiteDatabase({"path": str(path)})
+    with database:
+        create_all_tables(database)
+    return path
+
+
+@pytest.fixture
+def fresh_sqlite(sqlite_template, tmp_path) -> Callable[[], SQLiteDatabase]:
+    """Return a factory of connected databases copied from the template."""
+    opened: List[SQLiteDatabase] = []
+
+    def factory() -> SQLiteDatabase:
+        while opened:
+            opened.pop().disconnect()
+        path = tmp_path / "bench.db"
+        shutil.copyfile(sqlite_template, path)
+        database = SQLiteDatabase({"path": str(path)})
+        database.connect()
+        opened.append(database)
+        return database
+
+    yield factory
+    while opened:
+        opened.pop().disconnect()
+
+
+@pytest.fixture
+def throughput(request):
+    """Measure a benchmark and compare it with ``baseline.json``.
+
+    ``throughput(func, records, setup=None, rounds=5)`` times ``func`` and
+    fails the test when the result regressed past its threshold.
+    """
+    baseline = load_baseline()
+    runner = runner_label()
+    name = f"{Path(str(request.node.fspath)).stem}::{request.node.name}"
+
+    def run(func, records: int, setup=None, rounds: int = 5, warmup: int = 1) -> Measurement:
+        result = measure(name, func, records, setup=setup, rounds=rounds, warmup=warmup)
+        _RESULTS.append(result)
+        if _saving():
+            return result
+        if name not in runner_baseline(baseline, runner):
+            pytest.skip(f"No throughput baseline for runner {runner!r}")
+        failure = check_regression(result, baseline, runner)
+        if failure:
+            pytest.fail(failure)
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _RESULTS:
+        return
+    runner = runner_label()
+    terminalreporter.section("throughput")
+    terminalreporter.write_line(f"runner: {runner}")
+    for line in format_results(_RESULTS):
+        terminalreporter.write_line(line)
+    if _saving():
+        path = save_baseline(_RESULTS, runner)
+        terminalreporter.write_line(f"baseline written: {path}")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Throughput measurement and baseline comparison for ``tests/benchmarks``.
+
+Each benchmark runs a callable over a fixed corpus for a few rounds and
+reports the median round. Records/second is only comparable on the machine
+that produced it, so ``baseline.json`` keeps one set of results per runner:
+``JLTSQL_BENCHMARK_RUNNER`` names it (set it to the CI job label), and
+otherwise the host name and Python version do. A runner without recorded
+results is not gated; record them first with ``JLTSQL_BENCHMARK_SAVE=1``.
+
+For an A/B comparison of one change on one machine, pytest-benchmark's
+``--benchmark-autosave`` and ``--benchmark-compare-fail`` (dev extra) are the
+better tool; this harness only guards the corpus throughput of known runners.
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.5
+# Short benchmarks get extra rounds until this much time was measured.
+MIN_TIMED_SECONDS = 1.0
+MAX_ROUNDS = 200
+
+
+@dataclass
+class Measurement:
+    """Result of one benchmark."""
+
+    name: str
+    records: int
+    rounds: int
+    best_seconds: float
+    median_seconds: float
+    records_per_second: float
+
+
+def runner_label() -> str:
+    """Return the baseline key of the machine running the benchmarks."""
+    label = os.getenv("JLTSQL_BENCHMARK_RUNNER")
+    if label:
+        return label
+    return f"{platform.node() or 'unknown'}-py{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def measure(
+    name: str,
+    func: Callable[..., Any],
+    records: int,
+    setup: Optional[Callable[[], Tuple]] = None,
+    rounds: int = 5,
+    warmup: int = 1,
+) -> Measurement:
+    """Time ``func`` over ``records`` records and report the median round.
+
+    Args:
+        name: Baseline key of the benchmark
+        func: Callable processing the whole corpus once
+        records: Number of records ``func`` processes per call
+        setup: Optional callable returning ``func``'s arguments; it runs
+            before every round and is not timed
+        rounds: Minimum timed rounds; more run until ``MIN_TIMED_SECONDS``
+            were timed, up to ``MAX_ROUNDS``
+        warmup: Untimed rounds run first
+
+    Returns:
+        Measurement with the median round's throughput
+    """
+    timings: List[float] = []
+    round_index = 0
+    while round_index < warmup + rounds or (
+        sum(timings) < MIN_TIMED_SECONDS and len(timings) < MAX_ROUNDS
+    ):
+        args = setup() if setup is not None else ()
+        started = perf_counter()
+        func(*args)
+        elapsed = perf_counter() - started
+        if round_index >= warmup:
+            timings.append(elapsed)
+        round_index += 1
+
+    median = statistics.median(timings)
+    rate = records / median if median > 0 else float("inf")
+    return Measurement(
+        name=name,
+        records=records,
+        rounds=len(timings),
+        best_seconds=round(min(timings), 6),
+        median_seconds=round(median, 6),
+        records_per_second=round(rate, 1),
+    )
+
+
+def load_baseline(path: Union[str, Path] = BASELINE_PATH) -> Dict[str, Any]:
+    """Load a baseline file; a missing file is an empty baseline."""
+    path = Path(path)
+    if not path.exists():
+        return {"default_tolerance": DEFAULT_TOLERANCE, "runners": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def runner_baseline(baseline: Dict[str, Any], runner: str) -> Dict[str, Any]:
+    """Return the recorded results of ``runner``, or an empty mapping."""
+    return baseline.get("runners", {}).get(runner, {})
+
+
+def check_regression(
+    measurement: Measurement,
+    baseline: Dict[str, Any],
+    runner: str,
+) -> Optional[str]:
+    """Return a failure message if ``measurement`` is below its threshold.
+
+    The threshold is the runner's recorded records/second reduced by the
+    entry's ``tolerance`` (or the file's ``default_tolerance``). Benchmarks
+    without an entry for ``runner`` always pass.
+    """
+    entry = runner_baseline(baseline, runner).get(measurement.name)
+    if not entry:
+        return None
+    tolerance = entry.get("tolerance", baseline.get("default_tolerance", DEFAULT_TOLERANCE))
+    threshold = entry["records_per_second"] * (1.0 - tolerance)
+    if measurement.records_per_second >= threshold:
+        return None
+    change = (measurement.records_per_second / entry["records_per_second"] - 1.0) * 100
+    return (
+        f"{measurement.name}: throughput regressed {change:.1f}% on {runner} "
+        f"({measurement.records_per_second} < threshold {threshold:.1f} records/s)"
+    )
+
+
+def save_baseline(
+    measurements: List[Measurement],
+    runner: str,
+    path: Union[str, Path] = BASELINE_PATH,
+) -> Path:
+    """Merge ``measurements`` into ``runner``'s results, keeping tolerances."""
+    path = Path(path)
+    baseline = load_baseline(path)
+    runners = baseline.setdefault("runners", {})
+    entries = runners.setdefault(runner, {})
+    for measurement in measurements:
+        entry = entries.setdefault(measurement.name, {})
+        entry["records_per_second"] = measurement.records_per_second
+    runners[runner] = dict(sorted(entries.items()))
+    baseline["runners"] = dict(sorted(runners.items()))
+    path.write_text(json.dumps(baseline, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def format_results(measurements: List[Measurement]) -> List[str]:
+    """Return one summary line per measurement."""
+    width = max((len(m.name) for m in measurements), default=0)
+    return [
+        f"{m.name:<{width}}  {m.records_per_second:>12,.1f} rec/s  "
+        f"median {m.median_seconds:.4f}s  best {m.best_seconds:.4f}s"
+        for m in measurements
+    ]
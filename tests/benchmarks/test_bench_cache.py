@@ -0,0 +1,52 @@
+"""Local cache write and replay throughput."""
+
+from src.cache import CacheManager
+from tests.benchmarks.test_bench_import import RACE_DAY_MIX
+
+RECORDS_PER_TYPE = 200
+DATE = "20260104"
+
+
+def _race_day_raws(corpus_generator):
+    return [
+        raw
+        for record_type in RACE_DAY_MIX
+        for raw in corpus_generator.records(record_type, RECORDS_PER_TYPE)
+    ]
+
+
+def test_nl_cache_write_throughput(throughput, corpus_generator, tmp_path):
+    raws = _race_day_raws(corpus_generator)
+    rounds = iter(range(1000))
+
+    def write_all(cache):
+        for raw in raws:
+            cache.write_nl_record("RACE", DATE, raw)
+        cache.mark_nl_complete("RACE", DATE)
+
+    throughput(write_all, len(raws), setup=lambda: (CacheManager(tmp_path / f"w{next(rounds)}"),))
+
+
+def test_nl_cache_read_throughput(throughput, corpus_generator, tmp_path):
+    raws = _race_day_raws(corpus_generator)
+    cache = CacheManager(tmp_path / "cache")
+    for raw in raws:
+        cache.write_nl_record("RACE", DATE, raw)
+    cache.mark_nl_complete("RACE", DATE)
+
+    def read_all():
+        assert sum(1 for _ in cache.read_nl("RACE", DATE, DATE)) == len(raws)
+
+    throughput(read_all, len(raws))
+
+
+def test_rt_cache_round_trip_throughput(throughput, corpus_generator, tmp_path):
+    raws = corpus_generator.records("O1", RECORDS_PER_TYPE * 5)
+    rounds = iter(range(1000))
+
+    def round_trip(cache):
+        for raw in raws:
+            cache.write_rt_record("0B31", DATE, raw)
+        assert sum(1 for _ in cache.read_rt("0B31", DATE)) == len(raws)
+
+    throughput(round_trip, len(raws), setup=lambda: (CacheManager(tmp_path / f"rt{next(rounds)}"),))
@@ -0,0 +1,89 @@
+"""Import throughput into SQLite and a local PostgreSQL."""
+
+import os
+from uuid import uuid4
+
+import pytest
+
+from src.database.schema import create_all_tables
+from src.importer.importer import DataImporter
+from src.parser.factory import ParserFactory
+from tests.fixtures.jvdata_corpus import record_types
+
+RECORDS_PER_TYPE = 200
+# The record types a race-day RACE/DIFN fetch is dominated by.
+RACE_DAY_MIX = ("RA", "SE", "HR", "O1", "O2", "O3", "O4", "O5", "O6", "H1", "H6", "WH", "WE", "AV", "JC")
+
+
+def _parsed(corpus_generator, types, count):
+    factory = ParserFactory()
+    rows = []
+    for record_type in types:
+        for raw in corpus_generator.records(record_type, count):
+            parsed = factory.parse(raw)
+            rows.extend(parsed if isinstance(parsed, list) else [parsed])
+    return rows
+
+
+def _import(database, rows):
+    stats = DataImporter(database).import_records(iter(rows))
+    database.commit()
+    assert stats["records_failed"] == 0
+
+
+@pytest.mark.parametrize("record_type", record_types())
+def test_sqlite_import_throughput(throughput, corpus_generator, fresh_sqlite, record_type):
+    rows = _parsed(corpus_generator, (record_type,), RECORDS_PER_TYPE)
+    throughput(_import, len(rows), setup=lambda: (fresh_sqlite(), rows), rounds=3)
+
+
+def test_sqlite_import_race_day_mix(throughput, corpus_generator, fresh_sqlite):
+    rows = _parsed(corpus_generator, RACE_DAY_MIX, RECORDS_PER_TYPE)
+    throughput(_import, len(rows), setup=lambda: (fresh_sqlite(), rows), rounds=3)
+
+
+@pytest.fixture(scope="module")
+def postgresql_db():
+    if os.getenv("JLTSQL_RUN_POSTGRESQL_INTEGRATION") != "1":
+        pytest.skip("Set JLTSQL_RUN_POSTGRESQL_INTEGRATION=1 to run PostgreSQL tests")
+
+    from scripts.setup_pg_test_db import postgresql_test_config
+    from src.database.postgresql_handler import PostgreSQLDatabase
+
+    database = PostgreSQLDatabase(postgresql_test_config())
+    schema_name = f"jlt_bench_{uuid4().hex[:12]}"
+    database.connect()
+    try:
+        database.execute(f"CREATE SCHEMA {schema_name}")
+        database.execute(f"SET search_path TO {schema_name}")
+        create_all_tables(database)
+        database.commit()
+        yield database
+    finally:
+        try:
+            try:
+                database.rollback()
+            except Exception:
+                pass
+            database.execute(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE")
+            database.commit()
+        finally:
+            database.disconnect()
+
+
+def _empty(database):
+    tables = [
+        row["table_name"]
+        for row in database.fetch_all(
+            "SELECT table_name FROM information_schema.tables WHERE table_schema = current_schema()"
+        )
+    ]
+    database.execute(f"TRUNCATE {', '.join(tables)}")
+    database.commit()
+    return database
+
+
+@pytest.mark.parametrize("record_type", RACE_DAY_MIX)
+def test_postgresql_import_throughput(throughput, corpus_generator, postgresql_db, record_type):
+    rows = _parsed(corpus_generator, (record_type,), RECORDS_PER_TYPE)
+    throughput(_import, len(rows), setup=lambda: (_empty(postgresql_db), rows), rounds=3)
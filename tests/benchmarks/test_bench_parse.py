@@ -0,0 +1,20 @@
+"""Parser throughput for every record type in the layout manifest."""
+
+import pytest
+
+from src.parser.factory import ParserFactory
+from tests.fixtures.jvdata_corpus import record_types
+
+RECORDS_PER_TYPE = 200
+
+
+@pytest.mark.parametrize("record_type", record_types())
+def test_parse_throughput(throughput, corpus_generator, record_type):
+    raws = corpus_generator.records(record_type, RECORDS_PER_TYPE)
+    factory = ParserFactory()
+
+    def parse_all():
+        for raw in raws:
+            assert factory.parse(raw)
+
+    throughput(parse_all, len(raws))
@@ -0,0 +1,46 @@
+"""Realtime apply throughput through ``RealtimeUpdater``."""
+
+import pytest
+
+from src.parser.factory import ParserFactory
+from src.realtime.updater import RealtimeUpdater
+
+RECORDS_PER_TYPE = 100
+# Types delivered by 0B12/0B15/0B16/0B31 during a race day.
+REALTIME_MIX = ("RA", "SE", "HR", "O1", "WH", "WE", "AV", "JC", "TC", "CC")
+
+
+def _raws(corpus_generator, types):
+    return [
+        raw
+        for record_type in types
+        for raw in corpus_generator.records(record_type, RECORDS_PER_TYPE)
+    ]
+
+
+def test_process_record_throughput(throughput, corpus_generator, fresh_sqlite):
+    raws = _raws(corpus_generator, REALTIME_MIX)
+
+    def apply_all(database):
+        updater = RealtimeUpdater(database)
+        for raw in raws:
+            assert updater.process_record(raw)
+        database.commit()
+
+    throughput(apply_all, len(raws), setup=lambda: (fresh_sqlite(),), rounds=3)
+
+
+@pytest.mark.parametrize("record_type", ("O1", "O2"))
+def test_timeseries_batch_throughput(throughput, corpus_generator, fresh_sqlite, record_type):
+    factory = ParserFactory()
+    rows = []
+    for raw in corpus_generator.records(record_type, RECORDS_PER_TYPE * 5):
+        parsed = factory.parse(raw)
+        rows.extend(parsed if isinstance(parsed, list) else [parsed])
+
+    def apply_batch(database):
+        result = RealtimeUpdater(database).process_parsed_records_batch(rows, timeseries=True)
+        database.commit()
+        assert result["success"], result
+
+    throughput(apply_batch, len(rows), setup=lambda: (fresh_sqlite(),), rounds=3)
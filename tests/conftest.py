@@ -10,9 +10,22 @@ os.environ.setdefault("JLTSQL_SKIP_AUTO_LOGGING", "1")
 import pytest
 from unittest.mock import patch
 
+from src.utils.logger import flush_throttled_logs
+
 
 @pytest.fixture(autouse=True)
 def _no_sleep():
     """Automatically mock time.sleep in all tests to avoid real delays."""
     with patch("time.sleep"):
         yield
+
+
+@pytest.fixture(autouse=True)
+def _flush_throttled_logs():
+    """Write held-back log counts while this test's output is still captured.
+
+    Throttled loggers also flush at exit, when pytest has already closed the
+    streams the handlers were created with.
+    """
+    yield
+    flush_throttled_logs()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Synthetic JV-Data corpus generated from the official layout manifest.
+
+Every root record in ``official_layout/jvdata_sdk500_manifest.json`` (all 38
+record types, including O1-O6, H1/H6 and WF) is built by walking its
+structure tree: each scalar leaf is filled at its official byte offset, so a
+layout change in the manifest is picked up without touching this module.
+
+Values are chosen to pass the parsers' and importers' official-domain checks
+while varying the race/horse keys per record, so a corpus of N records per
+type imports as N distinct rows rather than N upserts of one row.
+
+All data is synthetic - no provider records are copied.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scripts.official_jvdata_oracle import load_manifest
+
+MANIFEST_PATH = Path(__file__).parent / "official_layout" / "jvdata_sdk500_manifest.json"
+
+# Leaves that carry the record/race identity and change with the record index.
+_JYO_CODES = ("05", "06", "08", "09")
+_RACES_PER_DAY = len(_JYO_CODES) * 12
+_VARYING_CODES = frozenset(
+    {
+        "KettoNum",
+        "KisyuCode",
+        "ChokyosiCode",
+        "BanusiCode",
+        "BreederCode",
+        "HansyokuNum",
+        "CourseCD",
+    }
+)
+# Leaves numbered by their position inside a repeated block.
+_SEQUENCE_FIELDS = frozenset({"Umaban", "Num"})
+_NAME_SUFFIXES = ("Bamei", "Name", "Ryakusyo", "Hondai", "Fukudai", "Kakko")
+_NAME_TEXT = "テスト"
+
+# Official DataKubun domains that do not include the common "1".
+_DATA_KUBUN = {"H1": "4", "H6": "4", "WF": "3"}
+# Per-type values that other leaves of the same record must agree with.
+_RECORD_OVERRIDES: Dict[str, Dict[str, str]] = {
+    "TK": {"TorokuTosu": "300"},
+}
+_FIXED_VALUES = {"HenkoID": "1", "ZogenFugo": "+", "crlf": "\r\n"}
+
+Leaf = Tuple[Tuple, str, int, int, Optional[int]]
+
+
+@lru_cache(maxsize=None)
+def _manifest() -> dict:
+    return load_manifest(MANIFEST_PATH)
+
+
+def record_types() -> List[str]:
+    """Return every root record type in the manifest, sorted."""
+    return sorted(_manifest()["root_records"])
+
+
+def _leaves(structure: str, base: int = 0, path: Tuple = (), repeat: Optional[int] = None):
+    """Yield ``(path, name, offset, width, repeat_index)`` for each scalar leaf."""
+    for field in _manifest()["structures"][structure]["fields"]:
+        start = base + field["start"] - 1
+        name = field["name"]
+        if field["kind"] == "scalar":
+            yield path + (name,), name, start, field["width"], repeat
+        elif field["kind"] == "nested":
+            yield from _leaves(field["struct"], start, path + (name,), repeat)
+        else:
+            for index in range(field["count"]):
+                offset = start + index * field["stride"]
+                if field["element_kind"] == "scalar":
+                    yield path + (name, index), name, offset, field["width"], index
+                else:
+                    yield from _leaves(field["struct"], offset, path + (name, index), index)
+
+
+@lru_cache(maxsize=None)
+def _layout(record_type: str) -> Tuple[int, Tuple[Leaf, ...]]:
+    contract = _manifest()["root_records"][record_type]
+    return contract["length"], tuple(_leaves(contract["struct"]))
+
+
+def _text(value: str, width: int) -> bytes:
+    encoded = value.encode("cp932")
+    while len(encoded) < width:
+        encoded += value.encode("cp932")
+    return encoded[:width].ljust(width, b" ")
+
+
+class CorpusGenerator:
+    """Build byte-exact JV-Data records for any record type.
+
+    Args:
+        start_date: Race date of record index 0; later indexes advance one
+            day per 48 races (4 venues x 12 races)
+
+    Examples:
+        >>> generator = CorpusGenerator()
+        >>> raw = generator.record("O1", 0)
+        >>> corpus = generator.corpus(per_type=100)
+    """
+
+    def __init__(self, start_date: date = date(2026, 1, 4)):
+        """Initialize the generator."""
+        self.start_date = start_date
+
+    def race_date(self, index: int) -> date:
+        """Return the race date used for record ``index``."""
+        return self.start_date + timedelta(days=index // _RACES_PER_DAY)
+
+    def record(self, record_type: str, index: int = 0) -> bytes:
+        """Return record ``index`` of ``record_type`` as raw CRLF-terminated bytes."""
+        length, leaves = _layout(record_type)
+        race_day = self.race_date(index)
+        values = {
+            "RecordSpec": record_type,
+            "DataKubun": _DATA_KUBUN.get(record_type, "1"),
+            "Year": f"{race_day.year:04d}",
+            "Month": f"{race_day.month:02d}",
+            "Day": f"{race_day.day:02d}",
+            "MonthDay": f"{race_day:%m%d}",
+            "JyoCD": _JYO_CODES[(index // 12) % len(_JYO_CODES)],
+            "Kaiji": "01",
+            "Nichiji": "01",
+            "RaceNum": f"{index % 12 + 1:02d}",
+            **_FIXED_VALUES,
+            **_RECORD_OVERRIDES.get(record_type, {}),
+        }
+
+        buffer = bytearray(b"0" * length)
+        for path, name, offset, width, repeat in leaves:
+            if name in _SEQUENCE_FIELDS:
+                value = str((repeat or 0) + 1).zfill(width)
+            elif name in _VARYING_CODES and repeat is None:
+                value = str(index + 1).zfill(width)
+            elif name.endswith(_NAME_SUFFIXES):
+                buffer[offset:offset + width] = _text(_NAME_TEXT, width)
+                continue
+            else:
+                value = values.get(name)
+                if value is None:
+                    continue
+            buffer[offset:offset + width] = value.encode("ascii").ljust(width, b" ")[:width]
+        return bytes(buffer)
+
+    def records(self, record_type: str, count: int, start: int = 0) -> List[bytes]:
+        """Return ``count`` consecutive records of one type."""
+        return [self.record(record_type, index) for index in range(start, start + count)]
+
+    def corpus(
+        self,
+        per_type: int = 10,
+        types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[bytes]]:
+        """Return ``per_type`` records for each requested (default: every) type."""
+        return {
+            record_type: self.records(record_type, per_type)
+            for record_type in (types or record_types())
+        }
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.database.changelog import ChangeCaptureDatabase
 from src.database.migration import SchemaMigrationError
 from src.database.schema import SCHEMAS
 from src.database.sqlite_handler import SQLiteDatabase
@@ -610,3 +611,60 @@ def test_invalid_dates_stop_before_schema_transaction_or_fetch(
     assert "begin_transaction" not in [
         name for name, _args, _kwargs in processor.database.mock_calls
     ]
+
+
+@pytest.mark.parametrize("captured", [False, True])
+@pytest.mark.parametrize(("option", "bulk"), [(1, False), (4, True)])
+def test_setup_options_import_inside_the_sqlite_bulk_load_session(
+    tmp_path, option, bulk, captured
+):
+    database = SQLiteDatabase({"path": str(tmp_path / "bulk.db")})
+    processor = BatchProcessor.__new__(BatchProcessor)
+    # change_log.enabled は SQLite ハンドラを包むが、bulk load は維持する。
+    processor.database = ChangeCaptureDatabase(database) if captured else database
+    processor.cache_manager = None
+    processor.fetcher = MagicMock()
+    processor.fetcher.fetch.return_value = iter([])
+    processor.fetcher.get_statistics.return_value = {"records_failed": 0}
+    synchronous_during_import = []
+
+    def import_records(records, auto_commit):
+        list(records)
+        row = database.fetch_one("PRAGMA synchronous")
+        synchronous_during_import.append(row["synchronous"])
+        return {"records_imported": 0, "records_failed": 0}
+
+    processor.importer = MagicMock()
+    processor.importer.import_records.side_effect = import_records
+
+    with database:
+        processor.process_date_range(
+            "RACE", "20260101", "20260131", option=option, ensure_tables=False
+        )
+        synchronous_after = database.fetch_one("PRAGMA synchronous")["synchronous"]
+
+    assert synchronous_during_import == [0 if bulk else 1]
+    assert synchronous_after == 1
+
+
+def test_postgresql_import_analyzes_only_the_tables_it_loaded():
+    processor = BatchProcessor.__new__(BatchProcessor)
+    processor.database = MagicMock()
+    processor.database.get_db_type.return_value = "postgresql"
+    processor.cache_manager = None
+    processor.fetcher = MagicMock()
+    processor.fetcher.fetch.return_value = iter([])
+    processor.fetcher.get_statistics.return_value = {"records_failed": 0}
+    processor.importer = MagicMock()
+    processor.importer.import_records.return_value = {"records_failed": 0}
+    processor.importer.get_rows_by_table.side_effect = [
+        {"NL_RA": 5000, "NL_SE": 10},
+        {"NL_RA": 5000, "NL_SE": 20010, "NL_HR": 40},
+    ]
+
+    processor.process_date_range("RACE", "20260101", "20260131", option=1, ensure_tables=False)
+
+    analyzed = [
+        c.args[0] for c in processor.database.execute.call_args_list if c.args[0].startswith("ANALYZE")
+    ]
+    assert analyzed == ["ANALYZE NL_SE"]
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the change-data-capture log."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.cli.main import cli
+from src.database.changelog import (
+    ChangeCaptureDatabase,
+    ChangeLog,
+    _statement_changes,
+    iter_changes,
+    unwrap_database,
+)
+from src.database.schema import SchemaManager
+from src.database.schema_types import get_table_column_nullability
+from src.database.sqlite_handler import SQLiteDatabase
+from src.importer.importer import DataImporter
+from src.importer.importer_optimized import OptimizedDataImporter
+from tests.test_av_official_contract import parsed_av
+
+
+def _horse(ketto_num, **values):
+    """Return an NL_UM row with every NOT NULL column filled."""
+    row = {
+        column: "0"
+        for column, nullable in get_table_column_nullability("NL_UM").items()
+        if not nullable
+    }
+    row.update(KettoNum=ketto_num, **values)
+    return row
+
+
+class TestStatementChanges(unittest.TestCase):
+    """Raw DML is reduced to primary-key changes where possible."""
+
+    def test_delete_by_key(self):
+        changes = _statement_changes(
+            "DELETE FROM NL_SE WHERE Year = ? AND KettoNum = ?", ("2024", "123")
+        )
+        self.assertEqual(changes, [("NL_SE", "delete", {"Year": "2024", "KettoNum": "123"})])
+
+    def test_non_key_predicate_is_kept(self):
+        changes = _statement_changes("DELETE FROM NL_SE WHERE Year < ?", ("2020",))
+        self.assertEqual(
+            changes, [("NL_SE", "delete", {"_where": "Year < ?", "_params": ["2020"]})]
+        )
+
+    def test_update_skips_set_parameters(self):
+        changes = _statement_changes(
+            "UPDATE NL_RA SET Hondai = ? WHERE Year = ?", ("x", "2024")
+        )
+        self.assertEqual(changes, [("NL_RA", "update", {"Year": "2024"})])
+
+    def test_select_is_ignored(self):
+        self.assertEqual(_statement_changes("SELECT * FROM NL_RA", None), [])
+
+
+class TestChangeCaptureDatabase(unittest.TestCase):
+    """Captured writes share the data transaction and are read in LSN order."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "test.db"
+        self.db = ChangeCaptureDatabase(SQLiteDatabase({"path": str(self.db_path)}))
+        self.db.connect()
+        SchemaManager(self.db).create_table("NL_UM")
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_upserts_and_deletes_are_logged_with_keys(self):
+        self.db.insert_many("NL_UM", [_horse("1", Bamei="A"), _horse("2")])
+        self.db.insert("NL_UM", _horse("1", Bamei="B"))
+        self.db.execute("DELETE FROM NL_UM WHERE KettoNum = ?", ("2",))
+        self.db.commit()
+
+        changes = list(iter_changes(self.db))
+
+        self.assertEqual([change.lsn for change in changes], [1, 2, 3, 4])
+        self.assertEqual(
+            [(change.op, change.key) for change in changes],
+            [
+                ("upsert", {"KettoNum": "1"}),
+                ("upsert", {"KettoNum": "2"}),
+                ("upsert", {"KettoNum": "1"}),
+                ("delete", {"KettoNum": "2"}),
+            ],
+        )
+        self.assertEqual([c.lsn for c in iter_changes(self.db, since_lsn=3)], [4])
+
+    def test_rolled_back_writes_are_not_logged(self):
+        self.db.begin_transaction()
+        self.db.insert("NL_UM", _horse("1"))
+        self.db.rollback()
+
+        self.assertEqual(list(iter_changes(self.db)), [])
+
+    def test_iter_changes_pages_and_filters(self):
+        self.db.insert_many("NL_UM", [_horse(str(i)) for i in range(5)])
+        self.db.commit()
+
+        changes = list(ChangeLog(self.db).iter_changes(0, tables=["NL_UM"], batch_size=2))
+
+        self.assertEqual([change.key["KettoNum"] for change in changes], ["0", "1", "2", "3", "4"])
+        self.assertEqual(list(iter_changes(self.db, tables=["NL_RA"])), [])
+
+
+class _OptimizedSQLiteDatabase(SQLiteDatabase):
+    """SQLite handler with a backend-specific bulk insert."""
+
+    def insert_many_optimized(self, table_name, data_list):
+        return self.insert_many(table_name, data_list)
+
+
+class TestChangeCaptureDelegation(unittest.TestCase):
+    """Backend-specific handler methods stay reachable through the wrapper."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sqlite = _OptimizedSQLiteDatabase({"path": str(Path(self.temp_dir.name) / "t.db")})
+        self.db = ChangeCaptureDatabase(self.sqlite)
+        self.db.connect()
+        SchemaManager(self.db).create_table("NL_UM")
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_unknown_attributes_are_delegated(self):
+        self.assertIs(unwrap_database(ChangeCaptureDatabase(self.db)), self.sqlite)
+        self.assertEqual(self.db.bulk_load_check, self.sqlite.bulk_load_check)
+        self.assertIn("busy", self.db.checkpoint("PASSIVE"))
+        self.db.optimize()
+        self.assertFalse(hasattr(self.db, "no_such_method"))
+
+    def test_backend_bulk_insert_is_captured(self):
+        self.assertEqual(self.db.insert_many_optimized("NL_UM", [_horse("7")]), 1)
+        self.db.commit()
+
+        changes = list(iter_changes(self.db))
+
+        self.assertEqual([(c.op, c.key) for c in changes], [("upsert", {"KettoNum": "7"})])
+
+    def test_missing_backend_bulk_insert_is_not_reported(self):
+        db = ChangeCaptureDatabase(SQLiteDatabase({"path": ":memory:"}))
+
+        self.assertFalse(hasattr(db, "insert_many_optimized"))
+
+
+class TestImporterCapture(unittest.TestCase):
+    """Importers write through the wrapper without knowing about it."""
+
+    def test_both_importers_log_the_record_key(self):
+        for importer_class in (DataImporter, OptimizedDataImporter):
+            with self.subTest(importer=importer_class.__name__), \
+                    tempfile.TemporaryDirectory() as temp_dir:
+                db = ChangeCaptureDatabase(
+                    SQLiteDatabase({"path": str(Path(temp_dir) / "test.db")})
+                )
+                with db:
+                    SchemaManager(db).create_table("NL_AV")
+                    result = importer_class(db).import_records(iter([parsed_av()]))
+                    changes = list(iter_changes(db))
+
+                self.assertEqual(result["records_imported"], 1)
+                self.assertEqual([(c.table_name, c.op) for c in changes], [("NL_AV", "upsert")])
+                self.assertEqual(changes[0].key["Umaban"], 1)
+
+
+class TestChangesTailCommand(unittest.TestCase):
+    """CLI wiring for ``jltsql changes tail``."""
+
+    def setUp(self):
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.db_path = root / "keiba.db"
+        self.config_path = root / "config.yaml"
+        self.config_path.write_text(
+            "database:\n"
+            "  type: sqlite\n"
+            "databases:\n"
+            "  sqlite:\n"
+            "    enabled: true\n"
+            f"    path: {self.db_path.as_posix()}\n"
+            "jvlink: {}\n"
+            "change_log:\n"
+            "  enabled: true\n"
+            "auto_update_check: false\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tail_json_since(self):
+        with ChangeCaptureDatabase(SQLiteDatabase({"path": str(self.db_path)})) as db:
+            SchemaManager(db).create_table("NL_UM")
+            db.insert_many("NL_UM", [_horse("1"), _horse("2")])
+
+        result = self.runner.invoke(
+            cli,
+            ["--config", str(self.config_path), "changes", "tail", "--since", "1", "--json"],
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        self.assertEqual([(line["lsn"], line["key"]) for line in lines], [(2, {"KettoNum": "2"})])
+
+
+if __name__ == "__main__":
+    unittest.main()
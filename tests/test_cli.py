@@ -136,8 +136,8 @@ class TestUpdateCommand(unittest.TestCase):
         with self.runner.isolated_filesystem():
             self.assertEqual(self.runner.invoke(cli, ["init"]).exit_code, 0)
             with (
-                patch("src.cli.main.check_for_updates", return_value=None),
-                patch("src.cli.main.perform_update", return_value=False),
+                patch("src.utils.updater.check_for_updates", return_value=None),
+                patch("src.utils.updater.perform_update", return_value=False),
             ):
                 result = self.runner.invoke(cli, ["update", "--force"])
 
@@ -572,6 +572,67 @@ auto_update_check: false
         self.assertNotIn("[OK] 0B41", result.output)
         self.assertNotIn("Complete!", result.output)
 
+    def test_timeseries_resume_checkpoints_keys_after_their_batch(self):
+        from src.database.sqlite_handler import SQLiteDatabase
+        from src.fetcher.checkpoint import TS_CHECKPOINT_TABLE
+
+        passed_checkpoints = []
+
+        def fetch_batch(**kwargs):
+            passed_checkpoints.append(kwargs["checkpoint"])
+            yield {"RecordSpec": "O1", "Year": 2026, "MonthDay": 816}
+            kwargs["progress_callback"]({"status": "success", "key": "202608160511", "records_for_key": 1})
+            kwargs["progress_callback"]({"status": "no_data", "key": "202608160512", "records_for_key": 0})
+            kwargs["progress_callback"]({"status": "skipped", "key": "202608160501", "records_for_key": 0})
+
+        fetcher = MagicMock()
+        fetcher.fetch_time_series_batch_from_db.side_effect = fetch_batch
+        updater = MagicMock()
+        updater.process_parsed_records_batch.return_value = {"success": True, "inserted": 1, "errors": 0}
+
+        with self.runner.isolated_filesystem():
+            Path("config.yaml").write_text(
+                """
+database:
+  type: sqlite
+databases:
+  sqlite:
+    enabled: true
+    path: keiba.db
+jvlink:
+  sid: TEST
+auto_update_check: false
+"""
+            )
+            with patch(
+                "src.fetcher.realtime.RealtimeFetcher", return_value=fetcher
+            ), patch(
+                "src.realtime.updater.RealtimeUpdater", return_value=updater
+            ):
+                result = self.runner.invoke(
+                    cli,
+                    [
+                        "--config", "config.yaml", "realtime", "timeseries", "--spec", "0B41",
+                        "--from", "20260816", "--to", "20260816",
+                        "--db", "sqlite", "--db-path", "keiba.db", "--resume",
+                    ],
+                )
+
+            with SQLiteDatabase({"path": "keiba.db"}) as database:
+                rows = database.fetch_all(
+                    f"SELECT spec, race_key, status, record_count FROM {TS_CHECKPOINT_TABLE} ORDER BY race_key"
+                )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIsNotNone(passed_checkpoints[0])
+        self.assertEqual(
+            rows,
+            [
+                {"spec": "0B41", "race_key": "202608160511", "status": "success", "record_count": 1},
+                {"spec": "0B41", "race_key": "202608160512", "status": "no_data", "record_count": 0},
+            ],
+        )
+
 
 class TestExportCommand(unittest.TestCase):
     """Test export command."""
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Start-up import budget for short jltsql invocations.
+
+Cron and raceday scripts call the CLI hundreds of times a day, so
+``jltsql --help`` and ``jltsql status`` must not import the importer, the
+schema/metadata tables or the structlog/rich renderers. The import time is
+measured with ``python -X importtime`` in a fresh interpreter; the budget can
+be raised on slow machines with ``JLTSQL_STARTUP_BUDGET_MS``.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+IMPORT_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+HEAVY_MODULES = (
+    "structlog",
+    "src.importer.importer",
+    "src.importer.batch",
+    "src.parser.factory",
+    "src.database.schema",
+    "src.database.schema_metadata",
+)
+DEFAULT_BUDGET_MS = {"--help": 150, "status": 250}
+
+CONFIG_YAML = """\
+auto_update_check: false
+jvlink: {}
+databases:
+  sqlite:
+    enabled: true
+    path: data/keiba.db
+logging:
+  file:
+    enabled: false
+"""
+
+
+def _import_profile(args, cwd):
+    """Run the CLI under ``-X importtime``; return (total ms, module names)."""
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), JLTSQL_STATE_DIR=str(cwd))
+    env.pop("JLTSQL_SKIP_AUTO_LOGGING", None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli.main", *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+
+    total_us = 0
+    modules = set()
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indent, module = match.groups()
+        modules.add(module)
+        if not indent:
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+@pytest.fixture
+def configured_dir(tmp_path):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "config.yaml").write_text(CONFIG_YAML, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("command", ["--help", "status"])
+def test_short_commands_skip_heavy_imports(command, configured_dir):
+    _, modules = _import_profile([command], configured_dir)
+
+    assert not modules & set(HEAVY_MODULES)
+    if command == "--help":
+        assert "rich.console" not in modules
+
+
+@pytest.mark.parametrize("command", ["--help", "status"])
+def test_short_commands_stay_within_the_startup_budget(command, configured_dir):
+    budget_ms = float(
+        os.environ.get("JLTSQL_STARTUP_BUDGET_MS", DEFAULT_BUDGET_MS[command])
+    )
+
+    # Best of three keeps a busy machine from failing a single noisy run.
+    elapsed_ms = min(_import_profile([command], configured_dir)[0] for _ in range(3))
+
+    assert elapsed_ms <= budget_ms, (
+        f"jltsql {command} spent {elapsed_ms:.0f} ms importing modules "
+        f"(budget {budget_ms:.0f} ms)"
+    )
@@ -0,0 +1,172 @@
+"""Single-pass, incremental and sampled checks of the data-quality checker."""
+
+import json
+
+from scripts.check_data_quality import IN_PLACE_UPDATE_TABLES, DataQualityChecker
+from src.database.schema import SCHEMAS
+from src.database.schema_jravan import JRAVAN_SCHEMAS
+from src.database.sqlite_handler import SQLiteDatabase
+from src.importer.importer import (
+    _STANDARD_ODDS_CONFIG_BY_OWNER,
+    _STANDARD_VOTE_CONFIG_BY_OWNER,
+    _upsert_rows_by_official_key,
+)
+
+RACE_INSERT = (
+    "INSERT INTO NL_RA (RecordSpec, DataKubun, MakeDate, Year, MonthDay, JyoCD, "
+    "Kaiji, Nichiji, RaceNum, Hondai) VALUES ('RA', '7', ?, ?, ?, ?, 1, 1, ?, ?)"
+)
+RESULT_INSERT = (
+    "INSERT INTO NL_SE (RecordSpec, DataKubun, MakeDate, Year, MonthDay, JyoCD, "
+    "Kaiji, Nichiji, RaceNum, Umaban, KettoNum) "
+    "VALUES ('SE', '7', ?, ?, ?, ?, 1, 1, ?, ?, ?)"
+)
+
+
+def _race_database(path, races=((2026, 105, "05"), (2026, 1231, "10"))):
+    database = SQLiteDatabase({"path": str(path)})
+    with database:
+        database.create_table("NL_RA", SCHEMAS["NL_RA"])
+        database.create_table("NL_SE", SCHEMAS["NL_SE"])
+        _add_races(database, races)
+    return path
+
+
+def _add_races(database, races):
+    for year, month_day, jyo in races:
+        for race_num in range(1, 13):
+            database.execute(
+                RACE_INSERT, ("20260101", year, month_day, jyo, race_num, f"Race {race_num}")
+            )
+            database.executemany(
+                RESULT_INSERT,
+                [
+                    ("20260101", year, month_day, jyo, race_num, umaban, f"2023{race_num:03d}{umaban:03d}")
+                    for umaban in range(1, 9)
+                ],
+            )
+    database.commit()
+
+
+def _messages(checker, table):
+    return [issue["message"] for issue in checker.issues if issue["table"] == table]
+
+
+def test_single_pass_accepts_integer_month_day_and_text_codes(tmp_path):
+    path = _race_database(tmp_path / "keiba.db")
+
+    checker = DataQualityChecker(str(path))
+    checker.check_all()
+
+    assert _messages(checker, "NL_RA") == []
+    assert checker.table_stats["NL_RA"] == {
+        "record_count": 24,
+        "quality": "GOOD",
+        "mode": "full",
+        "checks": {
+            "date_fields": "CHECKED",
+            "code_JyoCD": "CHECKED",
+            "code_Kaiji": "CHECKED",
+            "code_Nichiji": "CHECKED",
+            "code_RaceNum": "CHECKED",
+            "code_TrackCD": "CHECKED",
+            "null_values": "CHECKED",
+            "duplicates": "CHECKED",
+        },
+    }
+
+
+def test_single_pass_reports_invalid_dates_and_codes(tmp_path):
+    path = _race_database(tmp_path / "keiba.db", races=((2026, 1332, "5"), (1800, 101, "06")))
+
+    checker = DataQualityChecker(str(path))
+    checker.check_all()
+
+    assert _messages(checker, "NL_RA") == [
+        "12 records (50.0%) with invalid Year",
+        "12 records (50.0%) with invalid MonthDay format",
+        "12 records (50.0%) with invalid JyoCD (競馬場コード (01-99))",
+    ]
+    assert checker.table_stats["NL_RA"]["quality"] == "WARNING"
+
+
+def test_incremental_run_checks_only_rows_after_the_watermark(tmp_path):
+    path = _race_database(tmp_path / "keiba.db")
+    state_file = tmp_path / "quality_state.json"
+
+    first = DataQualityChecker(str(path), state_file=str(state_file))
+    first.check_all()
+    unchanged = DataQualityChecker(str(path), state_file=str(state_file))
+    unchanged.check_all()
+    with SQLiteDatabase({"path": str(path)}) as database:
+        _add_races(database, [(2026, 1399, "06")])
+    second = DataQualityChecker(str(path), state_file=str(state_file))
+    second.check_all()
+
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    assert state["databases"][str(path.resolve())]["NL_RA"]["value"] == 36
+    assert first.table_stats["NL_RA"]["mode"] == "full"
+    assert unchanged.table_stats["NL_RA"] == {
+        "record_count": 0,
+        "quality": "UNCHANGED",
+        "mode": "incremental",
+    }
+    assert second.table_stats["NL_RA"]["record_count"] == 12
+    assert second.table_stats["NL_RA"]["mode"] == "incremental"
+    assert _messages(second, "NL_RA") == [
+        "12 records (100.0%) with invalid MonthDay format (new/changed rows)",
+    ]
+
+
+def test_sampled_run_checks_large_tables_only_and_keeps_watermarks(tmp_path):
+    path = _race_database(tmp_path / "keiba.db")
+    state_file = tmp_path / "quality_state.json"
+
+    checker = DataQualityChecker(
+        str(path), state_file=str(state_file), sample_percent=50, sample_min_rows=100
+    )
+    checker.check_all()
+
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    watermarks = state["databases"][str(path.resolve())]
+    assert checker.table_stats["NL_RA"]["mode"] == "full"
+    assert checker.table_stats["NL_SE"]["mode"] == "sampled"
+    assert checker.table_stats["NL_SE"]["record_count"] == 96
+    assert checker.table_stats["NL_SE"]["checks"]["duplicates"] == "SKIPPED (sampled)"
+    assert "NL_RA" in watermarks
+    assert "NL_SE" not in watermarks
+
+
+def test_incremental_run_rechecks_rows_upserted_in_place(tmp_path):
+    path = tmp_path / "keiba.db"
+    state_file = tmp_path / "quality_state.json"
+    key = ("Year", "MonthDay", "JyoCD", "Kaiji", "Nichiji", "RaceNum")
+    row = {"RecordSpec": "H6", "DataKubun": "4", "MakeDate": "20260101", "Year": 2026,
+           "MonthDay": 105, "JyoCD": "05", "Kaiji": 1, "Nichiji": 1, "RaceNum": 11}
+    with SQLiteDatabase({"path": str(path)}) as database:
+        database.create_table("HYOSU2", JRAVAN_SCHEMAS["HYOSU2"])
+        database.execute(f"CREATE UNIQUE INDEX UX_HYOSU2 ON HYOSU2 ({', '.join(key)})")
+        _upsert_rows_by_official_key(database, "HYOSU2", [row], key)
+        database.commit()
+    DataQualityChecker(str(path), state_file=str(state_file)).check_all()
+
+    with SQLiteDatabase({"path": str(path)}) as database:
+        _upsert_rows_by_official_key(database, "HYOSU2", [{**row, "HyoTotal1": "00000000123"}], key)
+        database.commit()
+        # ON CONFLICT DO UPDATE keeps the rowid, so a rowid watermark would skip the row.
+        assert database.fetch_all("SELECT rowid AS id, HyoTotal1 FROM HYOSU2") == [
+            {"id": 1, "HyoTotal1": "00000000123"}
+        ]
+    second = DataQualityChecker(str(path), state_file=str(state_file))
+    second.check_all()
+
+    assert second.table_stats["HYOSU2"]["mode"] == "full"
+    assert second.table_stats["HYOSU2"]["record_count"] == 1
+    state = json.loads(state_file.read_text(encoding="utf-8"))
+    assert "HYOSU2" not in state["databases"][str(path.resolve())]
+
+
+def test_in_place_update_tables_cover_every_upserted_owner_table():
+    upserted = {*_STANDARD_ODDS_CONFIG_BY_OWNER, *_STANDARD_VOTE_CONFIG_BY_OWNER, "NL_CK"}
+
+    assert IN_PLACE_UPDATE_TABLES == upserted
@@ -158,6 +158,41 @@ class TestSQLiteDatabase:
         finally:
             db.disconnect()
 
+    def test_connect_applies_configured_pragmas(self, temp_db_path):
+        """databases.sqlite.pragma overrides the default connection pragmas."""
+        db = SQLiteDatabase({"path": str(temp_db_path), "pragma": {"cache_size": -2000}})
+        with db:
+            assert db.fetch_one("PRAGMA cache_size")["cache_size"] == -2000
+            assert db.fetch_one("PRAGMA journal_mode")["journal_mode"] == "wal"
+
+        with pytest.raises(DatabaseError, match="Invalid value"):
+            SQLiteDatabase({"path": str(temp_db_path), "pragma": {"cache_size": "1; DROP"}})
+
+    def test_bulk_load_restores_pragmas_and_checks_the_database(self, db):
+        """The bulk-load session is undone on exit and ends with a clean check."""
+        with db:
+            db.create_table("test", "CREATE TABLE test (id INTEGER PRIMARY KEY)")
+            db.commit()
+            with db.bulk_load():
+                assert db.fetch_one("PRAGMA synchronous")["synchronous"] == 0
+                assert db.fetch_one("PRAGMA locking_mode")["locking_mode"] == "exclusive"
+                db.insert_many("test", [{"id": i} for i in range(100)])
+                db.commit()
+
+            assert db.fetch_one("PRAGMA synchronous")["synchronous"] == 1
+            assert db.fetch_one("PRAGMA locking_mode")["locking_mode"] == "normal"
+            assert db.fetch_one("PRAGMA cache_size")["cache_size"] == -64000
+            assert db.fetch_one("SELECT COUNT(*) AS n FROM test")["n"] == 100
+
+    def test_bulk_load_restores_pragmas_when_the_import_fails(self, db):
+        """A failing import still leaves the connection with its safe pragmas."""
+        with db:
+            with pytest.raises(RuntimeError):
+                with db.bulk_load():
+                    raise RuntimeError("import failed")
+
+            assert db.fetch_one("PRAGMA synchronous")["synchronous"] == 1
+
     def test_get_table_info(self, db):
         """Test getting table info."""
         with db:
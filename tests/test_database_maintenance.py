@@ -0,0 +1,83 @@
+"""Scheduled WAL checkpoints, vacuum and statistics maintenance."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.base import DatabaseError
+from src.database.maintenance import SQLiteMaintenanceScheduler, analyze_loaded_tables
+from src.database.sqlite_handler import SQLiteDatabase
+
+RACE_DAY_AFTERNOON = datetime(2026, 10, 18, 14, 0)
+
+
+@pytest.fixture
+def writer(tmp_path):
+    database = SQLiteDatabase({"path": str(tmp_path / "keiba.db")})
+    database.connect()
+    database.execute("CREATE TABLE RT_O1 (RaceKey TEXT, Umaban TEXT, Odds INTEGER)")
+    database.execute("CREATE INDEX IX_RT_O1 ON RT_O1 (RaceKey)")
+    database.executemany(
+        "INSERT INTO RT_O1 VALUES (?, ?, ?)",
+        [(f"2026101805{n % 12:02d}", f"{n % 18:02d}", n) for n in range(2000)],
+    )
+    database.commit()
+    # The writer stays open: closing the last connection removes the WAL.
+    yield database
+    database.disconnect()
+
+
+def test_race_day_checkpoints_passively_on_an_interval(writer):
+    scheduler = SQLiteMaintenanceScheduler(writer.db_path)
+    assert scheduler.wal_size() > 0
+
+    assert scheduler.run_due(race_day=True, now=RACE_DAY_AFTERNOON) == ["checkpoint_passive"]
+    assert scheduler.run_due(race_day=True, now=RACE_DAY_AFTERNOON + timedelta(minutes=5)) == []
+    assert scheduler.due_tasks(True, RACE_DAY_AFTERNOON + timedelta(minutes=10)) == [
+        "checkpoint_passive"
+    ]
+
+
+def test_large_wal_is_truncated(writer):
+    scheduler = SQLiteMaintenanceScheduler(writer.db_path, truncate_wal_bytes=1)
+
+    assert scheduler.run_due(race_day=True, now=RACE_DAY_AFTERNOON) == ["checkpoint_truncate"]
+    assert scheduler.wal_size() == 0
+    assert scheduler.run_due(race_day=True, now=RACE_DAY_AFTERNOON) == []
+
+
+def test_quiet_time_optimizes_once_per_interval(writer):
+    scheduler = SQLiteMaintenanceScheduler(writer.db_path)
+    night = datetime(2026, 10, 18, 3, 0)
+
+    # auto_vacuum is off, so there is nothing to vacuum incrementally.
+    assert scheduler.run_due(race_day=True, now=night) == ["optimize", "checkpoint_truncate"]
+    assert writer.table_exists("sqlite_stat1")
+    assert scheduler.wal_size() == 0
+    assert scheduler.due_tasks(False, night + timedelta(hours=1)) == []
+    assert "optimize" in scheduler.due_tasks(False, night + timedelta(hours=24))
+
+
+def test_checkpoint_rejects_unknown_modes(writer):
+    with pytest.raises(DatabaseError):
+        writer.checkpoint("EVERYTHING")
+
+
+def test_only_postgresql_tables_with_bulk_loads_are_analyzed():
+    database = MagicMock()
+    database.get_db_type.return_value = "postgresql"
+
+    analyzed = analyze_loaded_tables(
+        database, {"NL_SE": 50000, "NL_RA": 3000, "NL_WE": 12, "bad; name": 9999}
+    )
+
+    assert analyzed == ["NL_RA", "NL_SE"]
+    assert [c.args[0] for c in database.execute.call_args_list] == [
+        "ANALYZE NL_RA",
+        "ANALYZE NL_SE",
+    ]
+    assert database.commit.call_count == 2
+
+    database.get_db_type.return_value = "sqlite"
+    assert analyze_loaded_tables(database, {"NL_SE": 50000}) == []
@@ -0,0 +1,231 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.base import DatabaseError
+from src.database.dual_handler import DualDatabase
+from src.database.mirror import (
+    MIRROR_LOG_TABLE,
+    MIRROR_STATE_TABLE,
+    MirrorEntry,
+    MirrorLog,
+    MirrorState,
+    apply_entries,
+)
+from src.database.sqlite_handler import SQLiteDatabase
+from src.utils.config import ConfigError, _validate_config
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS NL_TEST (id INTEGER PRIMARY KEY, name TEXT)"
+
+
+def _async_dual(tmp_path, **kwargs):
+    primary = SQLiteDatabase({"path": str(tmp_path / "primary.db")})
+    secondary = SQLiteDatabase({"path": str(tmp_path / "secondary.db")})
+    kwargs.setdefault("poll_interval", 0.05)
+    return DualDatabase(primary, secondary, mirror="async", **kwargs)
+
+
+def _secondary_rows(tmp_path):
+    with SQLiteDatabase({"path": str(tmp_path / "secondary.db")}) as db:
+        return db.fetch_all("SELECT id, name FROM NL_TEST ORDER BY id")
+
+
+def test_async_mirror_replays_committed_writes(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        database.create_table("NL_TEST", SCHEMA)
+        database.insert_many("NL_TEST", [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+        database.insert("NL_TEST", {"id": 2, "name": "b2"})
+        database.execute("DELETE FROM NL_TEST WHERE id = ?", (1,))
+        database.commit()
+
+        assert database.wait_for_mirror(timeout=10)
+        assert database.secondary_in_sync
+        status = database.mirror_status()
+        assert status["lag_entries"] == 0
+        assert status["head_lsn"] == 4
+
+    assert _secondary_rows(tmp_path) == [{"id": 2, "name": "b2"}]
+
+
+def test_async_mirror_skips_rolled_back_writes(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        database.create_table("NL_TEST", SCHEMA)
+        database.commit()
+        database.begin_transaction()
+        database.insert("NL_TEST", {"id": 1, "name": "discarded"})
+        assert not database.secondary_in_sync
+        database.rollback()
+        database.insert("NL_TEST", {"id": 2, "name": "kept"})
+        database.commit()
+        assert database.wait_for_mirror(timeout=10)
+
+    assert _secondary_rows(tmp_path) == [{"id": 2, "name": "kept"}]
+
+
+def test_async_mirror_recovers_after_secondary_failure(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        # The table only exists on the primary, so replay fails until the
+        # secondary is repaired; the primary write is never blocked.
+        database._primary.execute(SCHEMA)
+        database.insert("NL_TEST", {"id": 1, "name": "a"})
+        database.commit()
+        worker = database._mirror_worker
+        worker.stop()
+        worker.log_reader.connect()
+
+        with pytest.raises(DatabaseError):
+            worker.replay_once()
+        assert database.mirror_status()["lag_entries"] == 1
+        assert not database.secondary_in_sync
+
+        with SQLiteDatabase({"path": str(tmp_path / "secondary.db")}) as repair:
+            repair.execute(SCHEMA)
+        assert worker.replay_once() == 1
+        assert database.secondary_in_sync
+
+
+def test_async_mirror_resumes_from_durable_log(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        database.create_table("NL_TEST", SCHEMA)
+        database.commit()
+        assert database.wait_for_mirror(timeout=10)
+        database._mirror_worker.stop()
+        database.insert("NL_TEST", {"id": 7, "name": "late"})
+        database.commit()
+
+    restarted = _async_dual(tmp_path)
+    with restarted:
+        assert restarted.wait_for_mirror(timeout=10)
+
+    assert _secondary_rows(tmp_path) == [{"id": 7, "name": "late"}]
+
+
+def _primary_log_lsns(tmp_path):
+    with SQLiteDatabase({"path": str(tmp_path / "primary.db")}) as db:
+        return [row["lsn"] for row in db.fetch_all(f"SELECT lsn FROM {MIRROR_LOG_TABLE}")]
+
+
+def test_replay_keeps_its_watermark_on_the_secondary(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        database.create_table("NL_TEST", SCHEMA)
+        database.insert("NL_TEST", {"id": 1, "name": "a"})
+        database.commit()
+        worker = database._mirror_worker
+        worker.stop()
+        worker.log_reader.connect()
+
+        assert worker.replay_once() == 2
+        # 反映済みの記録はセカンダリ側に書き、プライマリには書き込まない。
+        assert _primary_log_lsns(tmp_path) == [1, 2]
+        with SQLiteDatabase({"path": str(tmp_path / "primary.db")}) as primary:
+            assert not primary.table_exists(MIRROR_STATE_TABLE)
+        with SQLiteDatabase({"path": str(tmp_path / "secondary.db")}) as secondary:
+            assert MirrorState(secondary).applied_lsn() == 2
+
+        assert worker.prune() == 2
+        assert _primary_log_lsns(tmp_path) == []
+        assert worker.prune() == 0
+
+
+def test_idle_worker_prunes_the_log_in_bulk(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        database.create_table("NL_TEST", SCHEMA)
+        database.insert_many("NL_TEST", [{"id": 1, "name": "a"}])
+        database.commit()
+        assert database.wait_for_mirror(timeout=10)
+
+        deadline = time.monotonic() + 10
+        while _primary_log_lsns(tmp_path) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert _primary_log_lsns(tmp_path) == []
+        assert database.mirror_status()["head_lsn"] == 2
+
+
+def test_uncommitted_log_entries_are_not_reported_as_lag(tmp_path):
+    database = _async_dual(tmp_path)
+    with database:
+        database.create_table("NL_TEST", SCHEMA)
+        database.commit()
+        assert database.wait_for_mirror(timeout=10)
+
+        database.begin_transaction()
+        database.insert("NL_TEST", {"id": 1, "name": "pending"})
+        status = database.mirror_status()
+        assert (status["head_lsn"], status["lag_entries"]) == (1, 0)
+        assert database.wait_for_mirror(timeout=1)
+        database.commit()
+
+        assert database.wait_for_mirror(timeout=10)
+        assert database.mirror_status()["head_lsn"] == 2
+
+
+def test_watermark_kept_in_the_primary_by_older_releases_is_honoured(tmp_path):
+    with SQLiteDatabase({"path": str(tmp_path / "primary.db")}) as primary:
+        MirrorLog(primary).ensure_schema()
+        primary.execute(SCHEMA)
+        for name in ("old", "new"):
+            primary.execute(
+                f"INSERT INTO {MIRROR_LOG_TABLE} (op, table_name, payload, created_at) "
+                "VALUES ('insert', 'NL_TEST', ?, '')",
+                (json.dumps({"data": {"id": 1, "name": name}}),),
+            )
+        primary.execute(
+            f"CREATE TABLE {MIRROR_STATE_TABLE} (name TEXT PRIMARY KEY, lsn INTEGER, "
+            "updated_at TEXT)"
+        )
+        primary.execute(f"INSERT INTO {MIRROR_STATE_TABLE} VALUES ('secondary', 1, '')")
+        primary.commit()
+    with SQLiteDatabase({"path": str(tmp_path / "secondary.db")}) as secondary:
+        secondary.execute(SCHEMA)
+        secondary.insert("NL_TEST", {"id": 1, "name": "old"})
+        secondary.commit()
+
+    database = _async_dual(tmp_path)
+    with database:
+        assert database.wait_for_mirror(timeout=10)
+        assert database._mirror_worker.applied_lsn == 2
+
+    assert _secondary_rows(tmp_path) == [{"id": 1, "name": "new"}]
+
+
+def test_apply_entries_merges_consecutive_row_writes():
+    secondary = MagicMock()
+    entries = [
+        MirrorEntry(1, "insert", "NL_A", {"data": {"k": 1}, "use_replace": True}, ""),
+        MirrorEntry(2, "insert_many", "NL_A", {"rows": [{"k": 2}], "use_replace": True}, ""),
+        MirrorEntry(3, "insert", "NL_B", {"data": {"k": 3}, "use_replace": True}, ""),
+        MirrorEntry(4, "execute", None, {"sql": "DELETE FROM NL_A", "parameters": None}, ""),
+    ]
+
+    assert apply_entries(secondary, entries) == 3
+    assert secondary.insert_many.call_args_list[0].args == (
+        "NL_A", [{"k": 1}, {"k": 2}], True
+    )
+    assert secondary.insert_many.call_args_list[1].args == ("NL_B", [{"k": 3}], True)
+    secondary.execute.assert_called_once_with("DELETE FROM NL_A", None)
+
+
+def test_async_mirror_requires_sqlite_primary():
+    primary = MagicMock()
+    primary.get_db_type.return_value = "postgresql"
+    with pytest.raises(DatabaseError, match="SQLite primary"):
+        DualDatabase(primary, MagicMock(), mirror="async")
+
+
+def test_config_rejects_unknown_mirror_mode():
+    config = {
+        "jvlink": {},
+        "database": {"type": "sqlite", "dual": {"mirror": "eventual"}},
+        "databases": {"sqlite": {"enabled": True, "path": "data/keiba.db"}},
+    }
+    with pytest.raises(ConfigError, match="database.dual.mirror"):
+        _validate_config(config)
@@ -0,0 +1,85 @@
+"""Fixed-stride decoding of repeated odds and vote regions."""
+
+import pytest
+
+from src.parser.fixed_region import FixedStrideRegion, accepting, unset_key
+
+REGION = FixedStrideRegion(start=4, count=3, widths=(2, 3, 1))
+
+
+def _per_field(data: bytes):
+    entries = []
+    for index in range(REGION.count):
+        position = REGION.start + index * REGION.stride
+        if position + REGION.stride > len(data):
+            break
+        fields = []
+        for width in REGION.widths:
+            fields.append(data[position:position + width].decode("cp932").strip())
+            position += width
+        entries.append(tuple(fields))
+    return entries
+
+
+def test_ascii_region_matches_per_field_decoding():
+    data = b"HEAD" + b"01 12" + b"3" + b"02----" + b"  *** " + b"\r\n"
+
+    assert list(REGION.stripped(data)) == _per_field(data)
+    assert list(REGION.entries(data))[2] == ("  ", "***", " ")
+    assert REGION.end == 4 + 3 * 6
+
+
+def test_truncated_region_yields_only_complete_entries():
+    data = b"HEAD" + b"01 123" + b"02 4"
+
+    assert list(REGION.stripped(data)) == [("01", "12", "3")]
+    assert list(REGION.stripped(b"HE")) == []
+
+
+def test_non_ascii_region_falls_back_to_cp932_per_field():
+    data = b"HEAD" + "あ".encode("cp932") + b"123" + b"4" + b"02 56" + b"7"
+
+    assert list(REGION.stripped(data)) == _per_field(data)
+
+    broken = b"HEAD" + b"01 123" + b"\x81\x20" + b"4567"
+    entries = REGION.stripped(broken)
+    # Entries before the malformed one are still produced, as field by field.
+    assert next(entries) == ("01", "12", "3")
+    with pytest.raises(UnicodeDecodeError):
+        next(entries)
+
+
+def test_skipped_slots_are_not_decoded_past_their_key():
+    region = FixedStrideRegion(start=4, count=3, widths=(2, 3, 1), skip=unset_key)
+    # 未使用スロット（組番 00）の後半に、境界で分断された2バイト文字が残っている。
+    data = b"HEAD" + b"01 123" + b"0012\x82\xa0" + b"02 456"
+
+    with pytest.raises(UnicodeDecodeError):
+        list(REGION.stripped(data))
+    assert list(region.stripped(data)) == [("01", "12", "3"), ("02", "45", "6")]
+    assert list(region.stripped(b"HEAD" + b"01 123" + b"00 456" + b"   789")) == [
+        ("01", "12", "3")
+    ]
+
+
+def test_unaccepted_yields_only_entries_outside_the_pattern():
+    region = FixedStrideRegion(start=4, count=4, widths=(2, 3, 1), skip=unset_key)
+    accept = accepting("00....|[0-9]{6}")
+    data = b"HEAD" + b"011234" + b"02*** " + b"00abc " + b"04x567"
+
+    assert list(region.unaccepted(data, accept)) == [("02", "***", ""), ("04", "x56", "7")]
+    assert list(region.unaccepted(b"HEAD" + b"011234" + b"00    ", accept)) == []
+    # 未使用スロットは pattern に合わなくても返さない。
+    assert list(region.unaccepted(b"HEAD" + b"  ab c", accept)) == []
+
+
+def test_unaccepted_falls_back_to_every_entry_outside_ascii():
+    accept = accepting("[0-9]{6}")
+    data = b"HEAD" + b"011234" + "あ".encode("cp932") + b"1234"
+
+    assert list(REGION.unaccepted(data, accept)) == _per_field(data)
+
+
+def test_region_needs_two_fields_per_entry():
+    with pytest.raises(ValueError):
+        FixedStrideRegion(start=0, count=1, widths=(4,))
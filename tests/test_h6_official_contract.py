@@ -303,6 +303,19 @@ def test_h6_records_without_a_sold_combination_keep_the_official_totals() -> Non
     assert validate_h6_record(row, "NL_H6") is True
 
 
+def test_h6_unregistered_slots_are_not_decoded() -> None:
+    """未登録スロットに残ったバイトは、レコード全体が CP932 として正しい限り拒否しない。"""
+
+    data = bytearray(h6_raw(entries=1))
+    offset = ENTRY_BASE + ENTRY_WIDTH
+    # 票数と人気順の境界で分断された2バイト文字。組番が空白なので読まない。
+    data[offset + 16 : offset + 18] = "あ".encode("cp932")
+
+    rows = H6Parser().parse(bytes(data))
+
+    assert [row["SanrentanKumi"] for row in rows] == ["010203"]
+
+
 @pytest.mark.parametrize("use_standard", (False, True), ids=("native", "standard"))
 def test_h6_blank_refund_span_is_stored_without_failing(
     tmp_path: Path,
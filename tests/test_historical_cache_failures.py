@@ -51,7 +51,8 @@ def test_cache_replay_counts_each_parsed_list_item():
     records = list(fetcher.fetch_with_cache(cache, "RACE", "20260714", "20260714"))
 
     assert len(records) == 2
-    assert all(record["_raw"] == b"valid" for record in records)
+    assert records[0]["_source"] is records[1]["_source"]
+    assert "_raw" not in records[0]
     stats = fetcher.get_statistics()
     assert stats["records_fetched"] == 1
     assert stats["records_parsed"] == 2
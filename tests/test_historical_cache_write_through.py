@@ -1,15 +1,15 @@
 """write-through キャッシュは jv_read バッファ 1 個につき 1 回だけ書くこと.
 
 フルストラクト系パーサは 1 バッファを多数の行へ展開し（H1: 28,955B → 1,485 行、
-H6: 102,890B → 4,896 行）、その全行が同じ `_raw` を持つ。行ごとに書くと同じ
-blob が行数ぶん重複する。
+H6: 102,890B → 4,896 行）、その全行が同じバッファ由来になる。行ごとに書くと同じ
+blob が行数ぶん重複する。行はバッファ自体ではなく共有の `_source` だけを持つ。
 """
 
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.fetcher.base import FetcherError
+from src.fetcher.base import FetcherError, RecordSource
 from src.fetcher.historical import HistoricalFetcher
 
 H1_BYTES, H1_ROWS = 28_955, 1_485
@@ -85,6 +85,21 @@ def test_each_jv_read_buffer_is_cached_separately():
     assert _written(cache) == [a, b]
 
 
+def test_rows_share_one_source_instead_of_the_buffer():
+    """展開行は raw バイト列を持たず、1 個の RecordSource を共有すること."""
+    a, b = b"A" * 1000, b"B" * 1000
+    cache = MagicMock()
+    f = _fetcher(cache, [(1000, a, "f1"), (1000, b, "f2"), (JV_READ_COMPLETE, None, None)])
+    f.parser_factory.parse.side_effect = [[_row(0), _row(1)], [_row(2)]]
+
+    rows = _run(f)
+
+    assert not any("_raw" in row for row in rows)
+    assert rows[0]["_source"] is rows[1]["_source"]
+    assert isinstance(rows[2]["_source"], RecordSource)
+    assert (rows[2]["_source"].file, rows[2]["_source"].index) == ("f2", 2)
+
+
 def test_single_record_parser_is_unaffected():
     """RA/SE のような 1 バッファ = 1 レコードのパーサは従来どおり."""
     buff = b"R" * 1300
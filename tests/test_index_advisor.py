@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the query-workload-driven index advisor."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.cli.main import cli
+from src.database.index_advisor import IndexAdvisor
+from src.database.indexes import IndexManager
+from src.database.schema import SchemaManager
+from src.database.sqlite_handler import SQLiteDatabase
+
+
+RACE_SUMMARY = """
+SELECT r.Hondai, s.Umaban FROM NL_RA r JOIN NL_SE s
+  ON s.Year = r.Year AND s.MonthDay = r.MonthDay
+ AND s.JyoCD = r.JyoCD AND s.RaceNum = r.RaceNum
+ WHERE r.Kyori = 2400
+"""
+
+
+class TestSplitStatements(unittest.TestCase):
+    """Workload files are split like a SQL script."""
+
+    def test_comments_and_literal_semicolons(self):
+        statements = IndexAdvisor.split_statements(
+            "-- weekly report; not a statement\n"
+            "SELECT * FROM NL_RA WHERE Hondai = 'a;b';\n"
+            "SELECT 1;  \n"
+        )
+        self.assertEqual(
+            statements,
+            ["SELECT * FROM NL_RA WHERE Hondai = 'a;b'", "SELECT 1"],
+        )
+
+
+class TestIndexAdvisorSQLite(unittest.TestCase):
+    """Plan capture and recommendations against a real SQLite schema."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = SQLiteDatabase({"path": str(Path(self.temp_dir.name) / "test.db")})
+        self.db.connect()
+        schema_manager = SchemaManager(self.db)
+        for table in ("NL_RA", "NL_SE", "NL_HR"):
+            schema_manager.create_table(table)
+        self.index_manager = IndexManager(self.db)
+        self.index_manager.create_indexes("NL_RA")
+        self.index_manager.create_indexes("NL_SE")
+        self.advisor = IndexAdvisor(self.db)
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_full_scan_recommends_filter_columns(self):
+        advice = self.advisor.advise(
+            ["SELECT * FROM NL_SE WHERE Bamei = 'X' AND Futan > 550"]
+        )
+
+        self.assertEqual(advice.statements_analyzed, 1)
+        self.assertEqual(len(advice.missing), 1)
+        missing = advice.missing[0]
+        self.assertEqual(missing.table, "NL_SE")
+        self.assertEqual(missing.columns, ("Bamei", "Futan"))
+        self.assertEqual(missing.reason, "full_scan")
+        self.assertIn("ON NL_SE(Bamei, Futan)", missing.create_sql)
+
+    def test_race_key_join_is_recommended(self):
+        advice = self.advisor.advise([RACE_SUMMARY])
+
+        race_keys = [
+            index.columns for index in advice.missing if index.table == "NL_SE"
+        ]
+        self.assertIn(("Year", "MonthDay", "JyoCD", "RaceNum"), race_keys)
+
+    def test_apply_creates_index_and_clears_advice(self):
+        workload = ["SELECT * FROM NL_SE WHERE Bamei = 'X'"]
+        advice = self.advisor.advise(workload)
+
+        applied = self.advisor.apply(advice, self.index_manager)
+
+        self.assertEqual(applied, {"created": 1, "dropped": 0})
+        again = IndexAdvisor(self.db).advise(workload)
+        self.assertEqual(again.missing, [])
+        self.assertIn(advice.missing[0].name, again.used_indexes)
+
+    def test_unused_indexes_only_for_workload_tables(self):
+        advice = self.advisor.advise(["SELECT * FROM NL_SE WHERE KettoNum = '1'"])
+
+        unused = {index.name for index in advice.unused}
+        self.assertIn("idx_nl_se_race", unused)
+        self.assertNotIn("idx_nl_se_horse", unused)
+        self.assertFalse(any(index.table == "NL_RA" for index in advice.unused))
+        # Primary-key autoindexes are never reported as droppable.
+        self.assertFalse(any(name.startswith("sqlite_autoindex") for name in unused))
+
+    def test_apply_drop_unused(self):
+        advice = self.advisor.advise(["SELECT * FROM NL_SE WHERE KettoNum = '1'"])
+
+        applied = self.advisor.apply(advice, self.index_manager, drop_unused=True)
+
+        self.assertEqual(applied["dropped"], len(advice.unused))
+        remaining = self.db.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name = 'idx_nl_se_race'"
+        )
+        self.assertEqual(remaining, [])
+
+    def test_non_select_and_invalid_statements_are_reported(self):
+        advice = self.advisor.advise(
+            ["DELETE FROM NL_RA", "SELECT * FROM NO_SUCH_TABLE WHERE x = 1"]
+        )
+
+        self.assertEqual(advice.statements_analyzed, 0)
+        self.assertEqual(len(advice.errors), 2)
+
+
+class TestIndexesAdviseCommand(unittest.TestCase):
+    """CLI wiring for ``jltsql indexes advise``."""
+
+    def setUp(self):
+        self.runner = CliRunner()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.db_path = root / "keiba.db"
+        self.config_path = root / "config.yaml"
+        self.config_path.write_text(
+            "database:\n"
+            "  type: sqlite\n"
+            "databases:\n"
+            "  sqlite:\n"
+            "    enabled: true\n"
+            f"    path: {self.db_path.as_posix()}\n"
+            "jvlink: {}\n"
+            "auto_update_check: false\n",
+            encoding="utf-8",
+        )
+        self.workload = root / "queries.sql"
+        self.workload.write_text("SELECT * FROM NL_SE WHERE Bamei = 'X';\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_json_report_and_apply(self):
+        db = SQLiteDatabase({"path": str(self.db_path)})
+        with db:
+            SchemaManager(db).create_table("NL_SE")
+
+        result = self.runner.invoke(
+            cli,
+            ["--config", str(self.config_path), "indexes", "advise",
+             "--workload", str(self.workload), "--json", "--apply"],
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        report = json.loads(result.output)
+        self.assertEqual(report["applied"], {"created": 1, "dropped": 0})
+        self.assertEqual(report["missing"][0]["columns"], ["Bamei"])
+
+    def test_drop_unused_requires_apply(self):
+        result = self.runner.invoke(
+            cli,
+            ["--config", str(self.config_path), "indexes", "advise",
+             "--workload", str(self.workload), "--drop-unused"],
+        )
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("--drop-unused requires --apply", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
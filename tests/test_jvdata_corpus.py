@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the synthetic JV-Data corpus and the benchmark baseline check."""
+
+import json
+import sys
+
+import pytest
+
+from scripts.official_jvdata_oracle import load_manifest
+from src.database.schema import create_all_tables
+from src.database.sqlite_handler import SQLiteDatabase
+from src.importer.importer import DataImporter
+from src.parser.factory import ParserFactory
+from tests.benchmarks.harness import (
+    Measurement,
+    check_regression,
+    load_baseline,
+    runner_label,
+    save_baseline,
+)
+from tests.fixtures.jvdata_corpus import MANIFEST_PATH, CorpusGenerator, record_types
+
+
+def _measurement(name="bench::parse[RA]", records_per_second=100.0):
+    return Measurement(
+        name=name,
+        records=10,
+        rounds=1,
+        best_seconds=0.1,
+        median_seconds=0.1,
+        records_per_second=records_per_second,
+    )
+
+
+def test_corpus_covers_every_manifest_record_type():
+    manifest = load_manifest(MANIFEST_PATH)
+    generator = CorpusGenerator()
+
+    assert len(record_types()) == 38
+    for record_type in record_types():
+        raw = generator.record(record_type)
+        assert len(raw) == manifest["root_records"][record_type]["length"]
+        assert raw[:2] == record_type.encode("ascii")
+        assert raw.endswith(b"\r\n")
+        raw.decode("cp932")
+
+
+def test_corpus_records_vary_the_race_key():
+    raws = CorpusGenerator().records("RA", 60)
+    parsed = [ParserFactory().parse(raw) for raw in raws]
+
+    keys = {
+        (row["Year"], row["MonthDay"], row["JyoCD"], row["RaceNum"]) for row in parsed
+    }
+    assert len(keys) == 60
+    assert parsed[48]["MonthDay"] == "0105"
+
+
+def test_every_record_type_parses_and_imports(tmp_path):
+    factory = ParserFactory()
+    database = SQLiteDatabase({"path": str(tmp_path / "corpus.db")})
+    with database:
+        create_all_tables(database)
+        importer = DataImporter(database)
+        for record_type, raws in CorpusGenerator().corpus(per_type=2).items():
+            rows = []
+            for raw in raws:
+                parsed = factory.parse(raw)
+                assert parsed, record_type
+                rows.extend(parsed if isinstance(parsed, list) else [parsed])
+
+            stats = importer.import_records(iter(rows))
+            database.commit()
+
+            assert stats["records_failed"] == 0, record_type
+            table_name = importer._get_table_name(record_type)
+            count = database.fetch_one(f"SELECT COUNT(*) AS cnt FROM {table_name}")["cnt"]
+            assert count > 0, record_type
+
+
+@pytest.mark.parametrize(
+    ("records_per_second", "failed"),
+    ((80.0, False), (74.9, True)),
+)
+def test_check_regression_uses_the_entry_tolerance(records_per_second, failed):
+    baseline = {
+        "default_tolerance": 0.1,
+        "runners": {
+            "ci": {"bench::parse[RA]": {"records_per_second": 100.0, "tolerance": 0.25}},
+        },
+    }
+
+    message = check_regression(_measurement(records_per_second=records_per_second), baseline, "ci")
+
+    assert (message is not None) is failed
+    if failed:
+        assert "regressed -25.1% on ci" in message
+    # Another machine's results never gate this one.
+    assert check_regression(_measurement(records_per_second=1.0), baseline, "laptop") is None
+
+
+def test_unknown_benchmark_passes_and_save_keeps_tolerance(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(
+        json.dumps(
+            {
+                "default_tolerance": 0.25,
+                "runners": {
+                    "ci": {"bench::parse[RA]": {"records_per_second": 1.0, "tolerance": 0.4}},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert check_regression(_measurement(name="bench::new"), load_baseline(path), "ci") is None
+    save_baseline(
+        [_measurement(), _measurement(name="bench::new", records_per_second=5.0)], "ci", path
+    )
+    save_baseline([_measurement(records_per_second=7.0)], "laptop", path)
+
+    saved = load_baseline(path)["runners"]
+    assert saved["ci"]["bench::parse[RA]"] == {"records_per_second": 100.0, "tolerance": 0.4}
+    assert saved["ci"]["bench::new"] == {"records_per_second": 5.0}
+    assert saved["laptop"] == {"bench::parse[RA]": {"records_per_second": 7.0}}
+
+
+def test_runner_label_prefers_the_configured_runner(monkeypatch):
+    monkeypatch.setenv("JLTSQL_BENCHMARK_RUNNER", "ci-ubuntu-py3.12")
+    assert runner_label() == "ci-ubuntu-py3.12"
+
+    monkeypatch.delenv("JLTSQL_BENCHMARK_RUNNER")
+    assert runner_label().endswith(f"-py{sys.version_info[0]}.{sys.version_info[1]}")
+
+
+def test_committed_baseline_covers_the_benchmark_suites():
+    for runner, names in load_baseline()["runners"].items():
+        assert {f"test_bench_parse::test_parse_throughput[{rt}]" for rt in record_types()} <= set(
+            names
+        ), runner
+        assert any(name.startswith("test_bench_realtime::") for name in names), runner
+        assert any(name.startswith("test_bench_cache::") for name in names), runner
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the JV-Link replay stand-in and session recorder."""
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from src.cache import CacheManager
+from src.cli.main import cli
+from src.database.sqlite_handler import SQLiteDatabase
+from src.fetcher.base import BaseFetcher
+from src.fetcher.realtime import RealtimeFetcher
+from src.jvlink.replay import (
+    JVLinkRecorder,
+    JVLinkReplay,
+    configure_jvlink,
+    create_replay_client,
+)
+from src.jvlink.wrapper import JVLinkError
+from src.utils.config import ConfigError, _validate_config
+from tests.fixtures.jvdata_corpus import CorpusGenerator
+
+
+def _replay_cache(directory: Path) -> CacheManager:
+    """RA records for two race days (48 races each) and O1 for the first."""
+    generator = CorpusGenerator()
+    cache = CacheManager(directory)
+    for raw in generator.records("RA", 96):
+        cache.write_nl_record("RACE", raw[11:19].decode("ascii"), raw)
+    for raw in generator.records("O1", 24):
+        cache.write_rt_record("O1", "20260104", raw)
+    return cache
+
+
+def _read_all(client) -> list:
+    results = []
+    while True:
+        ret_code, buff, _ = client.jv_read()
+        if ret_code == 0:
+            return results
+        results.append((ret_code, buff))
+
+
+class TestJVLinkReplay(unittest.TestCase):
+    """Cache-backed replay of the JV-Link call surface."""
+
+    def setUp(self):
+        self._temp = TemporaryDirectory()
+        self.source = Path(self._temp.name) / "replay"
+        _replay_cache(self.source)
+
+    def tearDown(self):
+        configure_jvlink(None)
+        self._temp.cleanup()
+
+    def test_jv_open_serves_cached_dates_after_the_start_point(self):
+        replay = JVLinkReplay("TEST", str(self.source))
+        replay.jv_init()
+
+        result, read_count, download_count, last = replay.jv_open("RACE", "20260104235959", 1)
+        results = _read_all(replay)
+        replay.jv_close()
+
+        self.assertEqual((result, read_count, download_count, last), (0, 1, 0, "20260105235959"))
+        self.assertEqual(len(results), 48)
+        self.assertTrue(all(code > 0 for code, _ in results))
+        self.assertTrue(all(buff[11:19] == b"20260105" for _, buff in results))
+
+    def test_jv_open_signals_file_switch_and_no_data(self):
+        replay = JVLinkReplay("TEST", str(self.source))
+        replay.jv_init()
+
+        self.assertEqual(replay.jv_open("RACE", "20260103235959", 1)[:2], (0, 2))
+        codes = [code for code, _ in _read_all(replay)]
+        replay.jv_close()
+
+        self.assertEqual(codes.count(-1), 1)
+        self.assertEqual(len(codes), 97)
+        self.assertEqual(replay.jv_open("RACE", "20260201000000", 1), (-1, 0, 0, ""))
+
+    def test_jv_open_requires_jv_init(self):
+        replay = JVLinkReplay("TEST", str(self.source))
+
+        with self.assertRaises(JVLinkError) as raised:
+            replay.jv_open("RACE", "20260103235959", 1)
+        self.assertEqual(raised.exception.error_code, -201)
+
+    def test_realtime_fetcher_filters_by_race_key(self):
+        configure_jvlink({"replay": {"enabled": True, "source": str(self.source)}})
+        fetcher = RealtimeFetcher(sid="TEST")
+
+        race = list(fetcher.fetch(data_spec="0B31", key="202601040501"))
+        day = list(fetcher.fetch(data_spec="0B31", key="20260104"))
+        missing = list(fetcher.fetch(data_spec="0B31", key="20260105"))
+
+        self.assertIsInstance(fetcher.jvlink, JVLinkReplay)
+        self.assertEqual({(row["JyoCD"], row["RaceNum"]) for row in race}, {("05", "01")})
+        self.assertEqual(len({(row["JyoCD"], row["RaceNum"]) for row in day}), 24)
+        self.assertEqual(missing, [])
+
+    def test_burst_pacing_pauses_between_bursts(self):
+        replay = JVLinkReplay(
+            "TEST", str(self.source), pacing="burst", speed=2.0, burst_size=10, burst_interval=4.0
+        )
+        clock = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("src.jvlink.replay.time") as fake_time:
+            fake_time.monotonic.side_effect = lambda: clock[0]
+            fake_time.sleep.side_effect = sleep
+            replay.jv_init()
+            replay.jv_rt_open("0B31", "20260104")
+            self.assertEqual(len(_read_all(replay)), 24)
+
+        self.assertEqual(sleeps, [2.0, 2.0])
+
+    def test_session_log_round_trip(self):
+        session = Path(self._temp.name) / "session.jsonl"
+        recorder = JVLinkRecorder(JVLinkReplay("TEST", str(self.source)), str(session))
+        recorder.jv_init()
+        opened = recorder.jv_rt_open("0B31", "20260104")
+        recorded = _read_all(recorder)
+        recorder.jv_close()
+        recorder.cleanup()
+
+        replay = JVLinkReplay("TEST", str(session), pacing="realtime", speed=1000.0)
+        replay.jv_init()
+
+        self.assertEqual(replay.jv_rt_open("0B31", "20260104"), opened)
+        self.assertEqual(_read_all(replay), recorded)
+        replay.jv_close()
+        self.assertEqual(replay.jv_rt_open("0B32", "20260104"), (-1, 0))
+
+
+class TestReplaySelection(unittest.TestCase):
+    """Replay is selected by config or environment before COM or the bridge."""
+
+    def tearDown(self):
+        configure_jvlink(None)
+
+    def test_environment_selects_replay_for_fetchers(self):
+        with TemporaryDirectory() as temp_dir:
+            environment = {"JVLINK_REPLAY_SOURCE": temp_dir, "JVLINK_REPLAY_PACING": "realtime"}
+            with patch.dict("os.environ", environment):
+                client = BaseFetcher._create_jvlink("TEST")
+
+        self.assertIsInstance(client, JVLinkReplay)
+        self.assertEqual(client.pacing, "realtime")
+
+    def test_disabled_config_overrides_environment(self):
+        configure_jvlink({"replay": {"enabled": False, "source": "unused"}})
+        with patch.dict("os.environ", {"JVLINK_REPLAY_SOURCE": "unused"}):
+            self.assertIsNone(create_replay_client("TEST"))
+
+    def test_config_validation_rejects_unknown_pacing(self):
+        config = {
+            "jvlink": {"replay": {"enabled": True, "source": "data/replay", "pacing": "fast"}},
+            "databases": {"sqlite": {"enabled": True}},
+        }
+        with self.assertRaisesRegex(ConfigError, "jvlink.replay.pacing"):
+            _validate_config(config)
+
+    def test_cli_fetch_runs_against_replay(self):
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _replay_cache(Path("replay"))
+            Path("config.yaml").write_text(
+                "jvlink:\n  replay:\n    enabled: true\n    source: replay\n"
+                "databases:\n  sqlite:\n    enabled: true\n    path: data/test.db\n"
+                "cache:\n  directory: data/cache\n",
+                encoding="utf-8",
+            )
+
+            result = runner.invoke(
+                cli,
+                [
+                    "--config", "config.yaml", "fetch",
+                    "--from", "20260104", "--to", "20260105", "--spec", "RACE",
+                    "--db", "sqlite", "--no-progress", "--no-cache",
+                ],
+            )
+            with SQLiteDatabase({"path": "data/test.db"}) as database:
+                count = database.fetch_one("SELECT COUNT(*) AS cnt FROM NL_RA")["cnt"]
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(count, 96)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the incrementally maintained MV_ summary tables."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.database.changelog import ChangeCaptureDatabase
+from src.database.materialized import (
+    MV_HORSE_FORM,
+    MV_RACE_SUMMARY,
+    MaterializedViewManager,
+)
+from src.database.schema import SchemaManager
+from src.database.schema_types import get_table_column_nullability
+from src.database.sqlite_handler import SQLiteDatabase
+
+RACE = {"Year": 2026, "MonthDay": 418, "JyoCD": "05", "Kaiji": 2, "Nichiji": 1, "RaceNum": 11}
+OTHER_RACE = {**RACE, "RaceNum": 12}
+
+
+def _row(table_name, **values):
+    """Return a row with every NOT NULL column of ``table_name`` filled."""
+    row = {
+        column: "0"
+        for column, nullable in get_table_column_nullability(table_name).items()
+        if not nullable
+    }
+    row.update(values)
+    return row
+
+
+def _runner(race, umaban, ketto_num, jyuni, ninki, odds, ijyo="0"):
+    return _row(
+        "NL_SE", **race, Umaban=umaban, KettoNum=ketto_num, Bamei=f"Horse{umaban}",
+        KakuteiJyuni=jyuni, Ninki=ninki, Odds=odds, Time=93.5 + umaban, IJyoCD=ijyo,
+    )
+
+
+class TestMaterializedViews(unittest.TestCase):
+    """Summary rows follow the writes made through the capture wrapper."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.inner = SQLiteDatabase({"path": str(Path(self.temp_dir.name) / "test.db")})
+        self.manager = MaterializedViewManager(self.inner)
+        self.db = ChangeCaptureDatabase(self.inner, record_log=False, listeners=[self.manager])
+        self.db.connect()
+        schema_manager = SchemaManager(self.db)
+        for prefix in ("NL", "RT"):
+            for suffix in ("RA", "SE", "HR", "O1"):
+                schema_manager.create_table(f"{prefix}_{suffix}")
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def _load_race(self, race, prefix="NL"):
+        self.db.insert(f"{prefix}_RA", _row("NL_RA", **race, Hondai="Stakes", Kyori=1600))
+        self.db.insert_many(
+            f"{prefix}_SE",
+            [
+                _runner(race, 1, "H1", 2, 1, 2.4),
+                _runner(race, 2, "H2", 1, 2, 5.1),
+                _runner(race, 3, "H3", 0, 0, 0, ijyo="1"),
+            ],
+        )
+        self.db.insert(f"{prefix}_HR", _row("NL_HR", **race, TanPay=510))
+
+    def _summary(self, race=RACE):
+        where = " AND ".join(f"{column} = ?" for column in race)
+        return self.db.fetch_one(
+            f"SELECT * FROM {MV_RACE_SUMMARY} WHERE {where}", tuple(race.values())
+        )
+
+    def _form(self, ketto_num):
+        return self.db.fetch_one(
+            f"SELECT * FROM {MV_HORSE_FORM} WHERE KettoNum = ?", (ketto_num,)
+        )
+
+    def test_commit_materializes_race_summary_and_horse_form(self):
+        self._load_race(RACE)
+        self.db.commit()
+
+        summary = self._summary()
+        self.assertEqual(summary["Source"], "NL")
+        self.assertEqual(summary["FieldSize"], 2)
+        self.assertEqual(summary["WinnerUmaban"], 2)
+        self.assertEqual(summary["WinnerKettoNum"], "H2")
+        self.assertEqual(summary["WinningTime"], 95.5)
+        self.assertEqual(summary["FavoriteUmaban"], 1)
+        self.assertEqual(summary["FavoriteOdds"], 2.4)
+        self.assertEqual(summary["TanPay"], 510)
+
+        self.assertEqual(
+            (self._form("H2")["Starts"], self._form("H2")["Wins"], self._form("H2")["Top3"]),
+            (1, 1, 1),
+        )
+        self.assertIsNone(self._form("H3"), "scratched horses have no start")
+
+    def test_only_touched_races_are_refreshed(self):
+        self._load_race(RACE)
+        self._load_race(OTHER_RACE)
+        self.db.commit()
+
+        self.db.execute(
+            "UPDATE NL_SE SET KakuteiJyuni = ? WHERE Year = ? AND MonthDay = ? AND JyoCD = ? "
+            "AND Kaiji = ? AND Nichiji = ? AND RaceNum = ? AND Umaban = ? AND KettoNum = ?",
+            (1, *RACE.values(), 1, "H1"),
+        )
+        self.assertEqual(self.manager.pending, {"races": 1, "horses": 1})
+        counts = self.manager.refresh()
+
+        self.assertEqual(counts, {MV_RACE_SUMMARY: 1, MV_HORSE_FORM: 1})
+        self.assertEqual(self._summary()["WinnerUmaban"], 1)
+        self.assertEqual(self._summary(OTHER_RACE)["WinnerUmaban"], 2)
+
+    def test_date_snapshot_delete_refreshes_removed_horses(self):
+        self._load_race(RACE)
+        self.db.commit()
+        self.assertEqual(self._form("H1")["Starts"], 1)
+
+        self.db.execute(
+            "DELETE FROM NL_SE WHERE Year = ? AND MonthDay = ?", (RACE["Year"], RACE["MonthDay"])
+        )
+        self.db.commit()
+
+        self.assertIsNone(self._form("H1"))
+        self.assertEqual(self._summary()["FieldSize"], 0)
+        self.assertIsNone(self._summary()["WinnerUmaban"])
+
+    def test_realtime_race_is_replaced_by_confirmed_data(self):
+        self._load_race(RACE, prefix="RT")
+        self.db.commit()
+        self.assertEqual(self._summary()["Source"], "RT")
+
+        self._load_race(RACE, prefix="NL")
+        self.db.commit()
+        self.assertEqual(self._summary()["Source"], "NL")
+
+    def test_rollback_discards_pending_refresh(self):
+        self.db.begin_transaction()
+        self._load_race(RACE)
+        self.db.rollback()
+
+        self.assertEqual(self.manager.pending, {"races": 0, "horses": 0})
+        self.db.commit()
+        self.assertIsNone(self._summary())
+
+    def test_rebuild_matches_incremental_result(self):
+        self._load_race(RACE)
+        self._load_race(OTHER_RACE, prefix="RT")
+        self.db.commit()
+        incremental = self.db.fetch_all(
+            f"SELECT * FROM {MV_RACE_SUMMARY} ORDER BY RaceNum"
+        )
+
+        counts = MaterializedViewManager(self.inner).rebuild()
+
+        self.assertEqual(counts, {MV_RACE_SUMMARY: 2, MV_HORSE_FORM: 2})
+        rebuilt = self.db.fetch_all(f"SELECT * FROM {MV_RACE_SUMMARY} ORDER BY RaceNum")
+        strip = lambda rows: [{k: v for k, v in row.items() if k != "RefreshedAt"} for row in rows]
+        self.assertEqual(strip(rebuilt), strip(incremental))
+
+
+if __name__ == "__main__":
+    unittest.main()
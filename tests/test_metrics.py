@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the in-process metrics registry and its pipeline wiring."""
+
+import json
+import sys
+import tempfile
+import unittest
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import click
+from click.testing import CliRunner
+
+from src.cli.main import _export_metrics_on_close, cli, fetch
+from src.database.schema import SchemaManager
+from src.database.sqlite_handler import SQLiteDatabase
+from src.importer.importer import DataImporter
+from src.parser.factory import PARSE_SAMPLE_RECORDS, ParserFactory
+from src.parser.odds_domain import attach_snapshot_metadata
+from src.realtime.updater import REALTIME_LAG_SECONDS, observe_happyo_lag
+from src.utils.metrics import (
+    METRICS_EXPORT_ENV,
+    REGISTRY,
+    MetricsError,
+    MetricsRegistry,
+    load_snapshot,
+)
+from tests.test_av_official_contract import build_av_record
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Counters, gauges and histograms render for Prometheus and JSON."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_prometheus_text_format(self):
+        rows = self.registry.counter("rows_total", "Rows written", ["table"])
+        rows.labels("NL_RA").inc(3)
+        rows.labels("NL_RA").inc()
+        latency = self.registry.histogram("read_seconds", "Read latency", buckets=(0.01, 0.1))
+        latency.observe(0.005)
+        latency.observe(0.05)
+        latency.observe(5)
+
+        text = self.registry.render_prometheus()
+
+        self.assertIn("# TYPE rows_total counter", text)
+        self.assertIn('rows_total{table="NL_RA"} 4', text)
+        self.assertIn('read_seconds_bucket{le="0.01"} 1', text)
+        self.assertIn('read_seconds_bucket{le="0.1"} 2', text)
+        self.assertIn('read_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("read_seconds_count 3", text)
+
+    def test_snapshot_summarizes_histograms(self):
+        latency = self.registry.histogram("flush_seconds", "Flush", ["table"], buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 0.5):
+            latency.labels("NL_SE").observe(value)
+        self.registry.gauge("lag_seconds", "Lag").set(12)
+
+        metrics = self.registry.snapshot()["metrics"]
+
+        sample = metrics["flush_seconds"]["samples"][0]
+        self.assertEqual(sample["labels"], {"table": "NL_SE"})
+        self.assertEqual((sample["count"], sample["p50"], sample["p95"]), (4, 0.1, 1.0))
+        self.assertEqual(metrics["lag_seconds"]["samples"][0]["value"], 12)
+
+    def test_redeclaring_with_other_labels_fails(self):
+        self.registry.counter("x_total", "X", ["table"])
+        self.assertIs(self.registry.counter("x_total", "X", ["table"]), self.registry.get("x_total"))
+        with self.assertRaises(MetricsError):
+            self.registry.gauge("x_total", "X", ["table"])
+
+    def test_snapshot_file_round_trip(self):
+        self.registry.counter("n_total", "N").inc(2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "data" / "metrics.json"
+            self.registry.write_snapshot(path)
+            self.assertEqual(
+                load_snapshot(path)["metrics"]["n_total"]["samples"][0]["value"], 2
+            )
+            self.assertIsNone(load_snapshot(Path(temp_dir) / "missing.json"))
+
+    def test_child_process_state_is_merged(self):
+        child = MetricsRegistry()
+        child.counter("rows_total", "Rows written", ["table"]).labels("NL_RA").inc(5)
+        child.histogram("read_seconds", "Read", buckets=(0.01, 0.1)).observe(0.05, count=3)
+        child.gauge("lag_seconds", "Lag").set(7)
+        child.counter("other_total", "Declared differently here").inc()
+        self.registry.counter("rows_total", "Rows written", ["table"]).labels("NL_RA").inc(2)
+        self.registry.gauge("other_total", "Declared differently here").set(1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "child.json"
+            child.write_state(path)
+            self.assertTrue(self.registry.merge_state_file(path))
+            self.assertFalse(path.exists())
+            self.assertFalse(self.registry.merge_state_file(path))
+
+        self.assertEqual(self.registry.get("rows_total").labels("NL_RA").value, 7)
+        latency = self.registry.get("read_seconds")
+        self.assertEqual((latency.buckets, latency._default.counts), ((0.01, 0.1), [0, 3, 0]))
+        self.assertEqual(self.registry.get("lag_seconds")._default.value, 7)
+        self.assertEqual(self.registry.get("other_total")._default.value, 1)
+
+    def test_fetch_exports_its_metrics_when_it_exits(self):
+        self.registry.counter("n_total", "N").inc(3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "child.json"
+            with patch.dict("os.environ", {METRICS_EXPORT_ENV: str(path)}), patch(
+                "src.utils.metrics.REGISTRY", self.registry
+            ):
+                with self.assertRaises(SystemExit):
+                    with click.Context(fetch) as ctx:
+                        _export_metrics_on_close(ctx)
+                        sys.exit(1)
+
+            exported = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(exported["metrics"]["n_total"]["samples"][0]["value"], 3)
+
+
+class TestPipelineMetrics(unittest.TestCase):
+    """The importer and realtime updater feed the shared registry."""
+
+    def _value(self, name, **labels):
+        metric = REGISTRY.get(name)
+        for sample_labels, child in metric.samples():
+            if sample_labels == labels:
+                return getattr(child, "count", None) or getattr(child, "value", 0)
+        return 0
+
+    def test_parse_import_and_commit_are_measured(self):
+        rows_before = self._value("jltsql_rows_written_total", table="NL_AV")
+        flushes_before = self._value("jltsql_batch_flush_seconds", table="NL_AV")
+        commits_before = self._value("jltsql_commit_seconds", backend="sqlite")
+        parses_before = self._value("jltsql_parse_seconds", record_type="AV")
+
+        record = ParserFactory().parse(build_av_record())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with SQLiteDatabase({"path": str(Path(temp_dir) / "test.db")}) as db:
+                SchemaManager(db).create_table("NL_AV")
+                DataImporter(db).import_records(iter([record]))
+
+        self.assertEqual(self._value("jltsql_rows_written_total", table="NL_AV"), rows_before + 1)
+        self.assertEqual(
+            self._value("jltsql_batch_flush_seconds", table="NL_AV"), flushes_before + 1
+        )
+        self.assertGreater(self._value("jltsql_commit_seconds", backend="sqlite"), commits_before)
+        self.assertEqual(self._value("jltsql_parse_seconds", record_type="AV"), parses_before + 1)
+
+    def test_parse_latency_is_sampled_but_counted_exactly(self):
+        factory = ParserFactory()
+        record = build_av_record()
+        parses = PARSE_SAMPLE_RECORDS + 10
+        parses_before = self._value("jltsql_parse_seconds", record_type="AV")
+
+        with patch("src.parser.factory.time.perf_counter", return_value=0.0) as clock:
+            for _ in range(parses):
+                factory.parse(record)
+            # 1件目と、その後 PARSE_SAMPLE_RECORDS 件ごとに1件だけ計時する。
+            self.assertEqual(clock.call_count, 4)
+            self.assertEqual(
+                self._value("jltsql_parse_seconds", record_type="AV"),
+                parses_before + 1 + PARSE_SAMPLE_RECORDS,
+            )
+
+            factory.flush_metrics()
+
+        self.assertEqual(
+            self._value("jltsql_parse_seconds", record_type="AV"), parses_before + parses
+        )
+
+    def test_realtime_lag_uses_newest_happyo_time(self):
+        lags = observe_happyo_lag(
+            [
+                {"RecordSpec": "O1", "Year": 2026, "HappyoTime": "04181530"},
+                {"RecordSpec": "O1", "Year": 2026, "HappyoTime": "04181540"},
+                {"RecordSpec": "WH", "HappyoTime": "bad"},
+            ],
+            now=datetime(2026, 4, 18, 15, 41, 30),
+        )
+
+        self.assertEqual(lags, {"O1": 90.0})
+        self.assertEqual(REALTIME_LAG_SECONDS.labels("O1").value, 90.0)
+
+    def test_realtime_lag_reads_one_row_per_odds_snapshot(self):
+        rows = attach_snapshot_metadata(
+            [
+                {"RecordSpec": "O6", "Year": "2026", "HappyoTime": "04181530", "Kumi": "010203"},
+                # 展開行は先頭行と同じヘッダを持つため、先頭行以外は読まない。
+                {"RecordSpec": "O6", "Year": "2026", "HappyoTime": "04181540", "Kumi": "010204"},
+            ]
+        )
+
+        lags = observe_happyo_lag(rows, now=datetime(2026, 4, 18, 15, 31))
+
+        self.assertEqual(lags, {"O6": 60.0})
+
+
+class TestMetricsExposure(unittest.TestCase):
+    """``/metrics`` and ``jltsql status --json`` expose the registry."""
+
+    def test_background_updater_serves_prometheus_text(self):
+        from scripts.background_updater import TriggerAPIServer
+
+        REGISTRY.counter("jltsql_records_fetched_total", "Records returned by JVRead").inc(0)
+        server = TriggerAPIServer(updater=None, port=0, enable_rate_limit=False)
+        self.assertTrue(server.start())
+        try:
+            port = server.server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.stop()
+
+        self.assertTrue(content_type.startswith("text/plain"))
+        self.assertIn("# TYPE jltsql_records_fetched_total counter", body)
+
+    def test_status_json_includes_snapshot(self):
+        registry = MetricsRegistry()
+        registry.histogram("jltsql_jv_read_seconds", "JVRead call latency").observe(0.002)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "metrics.json"
+            registry.write_snapshot(path)
+
+            result = CliRunner().invoke(cli, ["status", "--json", "--metrics-file", str(path)])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        status = json.loads(result.output)
+        self.assertEqual(
+            status["metrics"]["metrics"]["jltsql_jv_read_seconds"]["samples"][0]["count"], 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Mapping
 from uuid import uuid4
@@ -33,6 +34,7 @@ from src.parser.o3_parser import O3Parser
 from src.parser.o4_parser import O4Parser
 from src.parser.o5_parser import O5Parser
 from src.parser.o6_parser import O6Parser
+from src.parser.odds_domain import SNAPSHOT_ROWS_KEY
 
 OFFICIAL_DATA_KUBUN = ("1", "2", "3", "4", "5", "9")
 OFFICIAL_SALE_FLAGS = ("0", "1", "3", "7")
@@ -328,6 +330,25 @@ def test_short_odds_values_are_rejected(record_type: str) -> None:
             layout.parser_class.validate_current_fields(row)
 
 
+@pytest.mark.parametrize("record_type", ALL_RECORD_TYPES)
+def test_combination_region_is_validated_in_one_pass(record_type: str) -> None:
+    layout = LAYOUTS[record_type]
+    (odds_field, width), *_ = layout.odds_fields
+    markers = {odds_field: b"-" * width}
+    rows = layout.rows(odds=markers)
+    assert rows[0][SNAPSHOT_ROWS_KEY].entries_checked
+    layout.parser_class.validate_entries(layout.raw(odds=markers))
+
+    raw = layout.raw(odds={odds_field: b"-" * (width - 1) + b"1"})
+    rows = layout.parser_class().parse(raw)
+    assert not rows[0][SNAPSHOT_ROWS_KEY].entries_checked
+    with pytest.raises(ValueError) as per_row:
+        layout.parser_class.validate_current_fields(rows[0])
+    # 領域単位の検証も、行単位と同じ項目・同じ理由で棄却する。
+    with pytest.raises(ValueError, match=f"^{re.escape(str(per_row.value))}$"):
+        layout.parser_class.validate_entries(raw)
+
+
 @pytest.mark.parametrize("record_type", ALL_RECORD_TYPES)
 def test_erase_rows_only_need_the_official_key(record_type: str) -> None:
     """データ区分0（該当レコード削除）は本文を持たない。"""
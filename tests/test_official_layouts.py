@@ -0,0 +1,124 @@
+"""Extractors compiled from the official layout manifest."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from scripts.generate_official_layouts import (
+    DEFAULT_MANIFEST,
+    DEFAULT_OUTPUT,
+    GENERATED_RECORD_TYPES,
+    render_module,
+)
+from scripts.official_jvdata_oracle import load_manifest
+from src.parser.factory import ALL_RECORD_TYPES, ParserFactory
+from src.parser.layout_compiler import CompiledLayout, RecordLayout, RegionLayout, official_layout
+from src.parser.official_layouts import OFFICIAL_LAYOUTS
+from tests.fixtures.parser_golden import (
+    GOLDEN_RECORD_TYPES,
+    canonical_rows,
+    golden_cases,
+    load_golden,
+    output_digest,
+)
+
+def _spans(layout: RecordLayout) -> list[tuple[int, int]]:
+    spans = [(start, start + width) for _, start, width in layout.fields]
+    for region in layout.regions:
+        stride = sum(width for _, width in region.fields)
+        spans.append((region.start, region.start + region.count * stride))
+    return sorted(spans)
+
+
+def _record(layout: RecordLayout, seed: int, text: bytes = b"") -> bytes:
+    rng = random.Random(seed)
+    data = bytearray(rng.choice(b"0123456789 -*") for _ in range(layout.length))
+    if text:
+        _, start, _ = max(layout.fields, key=lambda field: field[2])
+        data[start:start + len(text)] = text
+    return bytes(data)
+
+
+def test_generated_module_is_up_to_date():
+    expected = render_module(load_manifest(DEFAULT_MANIFEST))
+
+    assert Path(DEFAULT_OUTPUT).read_text(encoding="utf-8") == expected
+
+
+def test_every_generated_layout_tiles_the_record():
+    assert list(OFFICIAL_LAYOUTS) == list(GENERATED_RECORD_TYPES)
+    for record_type, layout in OFFICIAL_LAYOUTS.items():
+        position = 0
+        for start, end in _spans(layout):
+            assert start == position, (record_type, start)
+            position = end
+        assert position == layout.length, record_type
+
+
+@pytest.mark.parametrize("record_type", sorted(OFFICIAL_LAYOUTS))
+def test_compiled_extractor_matches_per_field_decoding(record_type):
+    layout = OFFICIAL_LAYOUTS[record_type]
+    compiled = official_layout(record_type)
+
+    for data in (_record(layout, 1), _record(layout, 2, "馬名ｱｲ".encode("cp932"))):
+        assert compiled.extract(data) == tuple(
+            data[start:start + width].decode("cp932").strip()
+            for _, start, width in layout.fields
+        )
+        for region in layout.regions:
+            stride = sum(width for _, width in region.fields)
+            rows = compiled.region_rows(region.name, data)
+            assert len(rows) == region.count
+            offset = region.start + (region.count - 1) * stride
+            for name, width in region.fields:
+                assert rows[-1][name] == data[offset:offset + width].decode("cp932").strip()
+                offset += width
+
+
+def test_split_multibyte_field_is_rejected():
+    layout = RecordLayout(length=6, fields=(("A", 0, 3), ("B", 3, 3)))
+    compiled = CompiledLayout("ZZ", layout)
+
+    assert compiled.as_dict("ア".encode("cp932") + b"1 2  ") == {"A": "ア1", "B": "2"}
+    with pytest.raises(UnicodeDecodeError):
+        compiled.extract(b"12" + "ア".encode("cp932") + b"34")
+
+
+def test_golden_outputs_cover_every_generated_layout():
+    assert sorted(load_golden()) == sorted(GOLDEN_RECORD_TYPES) == sorted(OFFICIAL_LAYOUTS)
+
+
+@pytest.mark.parametrize("record_type", GOLDEN_RECORD_TYPES)
+def test_compiled_layout_parsers_match_the_hand_written_parsers(record_type):
+    golden = load_golden()[record_type]
+    parser = ParserFactory().get_parser(record_type)
+    outputs = {name: parser.parse(raw) for name, raw in golden_cases(record_type)}
+
+    first = canonical_rows(outputs["corpus-0"])
+    assert first is not None and first[0] == golden["sample"]
+    assert {name: output_digest(parsed) for name, parsed in outputs.items()} == golden["cases"]
+
+
+def test_layouts_are_generated_only_for_parsers_that_read_them():
+    factory = ParserFactory()
+
+    for record_type in ALL_RECORD_TYPES:
+        parser = factory.get_parser(record_type)
+        uses_layout = getattr(parser, "LAYOUT", None) is not None
+        assert uses_layout == (record_type in OFFICIAL_LAYOUTS), record_type
+        if uses_layout:
+            assert parser.LAYOUT is official_layout(record_type)
+
+
+def test_region_reader_drops_the_entries_skip_matches():
+    region = RegionLayout("E", 2, 2, (("K", 2), ("V", 2)))
+    layout = RecordLayout(length=10, fields=(("A", 0, 2),), regions=(region,))
+    compiled = CompiledLayout("ZZ", layout)
+    data = b"AA0012" + b"0734"
+
+    assert list(compiled.region("E").stripped(data)) == [("00", "12"), ("07", "34")]
+    skipped = compiled.region("E", skip=lambda key: key == "00")
+    assert list(skipped.stripped(data)) == [("07", "34")]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the parallel NL cache import engine (``jltsql cache import``)."""
+
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cache import CacheManager
+from src.cli.main import cli
+from src.database.sqlite_handler import SQLiteDatabase
+from src.importer.parallel import ParallelCacheImporter, plan_shards
+from src.utils.config import Config
+from tests.fixtures.jvdata_corpus import CorpusGenerator
+
+DATES = ("20260104", "20260105", "20260106")
+TABLES = ("NL_RA", "NL_SE", "NL_HR", "NL_O1")
+
+
+def _race_cache(directory: Path) -> CacheManager:
+    """RACE cache with RA/SE/HR/O1 for two race days and an empty third day."""
+    generator = CorpusGenerator()
+    cache = CacheManager(directory)
+    for record_type, count in (("RA", 96), ("SE", 96), ("HR", 96), ("O1", 96)):
+        for raw in generator.records(record_type, count):
+            cache.write_nl_record("RACE", raw[11:19].decode("ascii"), raw)
+    cache.mark_nl_range_complete("RACE", DATES)
+    return cache
+
+
+def _sqlite_config(path: Path) -> Config:
+    return Config({"databases": {"sqlite": {"enabled": True, "path": str(path)}}})
+
+
+def _table_rows(path: Path) -> dict:
+    with SQLiteDatabase({"path": str(path)}) as database:
+        return {
+            table: database.fetch_all(f"SELECT * FROM {table} ORDER BY 1, 2, 3, 4, 5, 6, 7")
+            for table in TABLES
+        }
+
+
+@pytest.fixture
+def race_cache(tmp_path):
+    return _race_cache(tmp_path / "cache")
+
+
+def test_plan_skips_empty_dates_and_rejects_incomplete_ranges(race_cache):
+    assert plan_shards(race_cache, ["RACE"], *DATES[::2]) == [
+        ("RACE", "20260104"),
+        ("RACE", "20260105"),
+    ]
+    with pytest.raises(ValueError, match="RACE is not completely cached .* first 20260107"):
+        plan_shards(race_cache, ["RACE"], "20260104", "20260108")
+
+
+def test_parallel_sqlite_import_matches_the_serial_import(race_cache, tmp_path):
+    serial = ParallelCacheImporter(
+        _sqlite_config(tmp_path / "serial.db"), race_cache, db_type="sqlite", workers=1
+    ).run(["RACE"], DATES[0], DATES[-1])
+    parallel = ParallelCacheImporter(
+        _sqlite_config(tmp_path / "parallel.db"), race_cache, db_type="sqlite", workers=2
+    ).run(["RACE"], DATES[0], DATES[-1])
+
+    assert serial["records_failed"] == parallel["records_failed"] == 0
+    assert serial["records_imported"] == parallel["records_imported"] > 0
+    assert parallel["shards"] == 2
+    serial_rows = _table_rows(tmp_path / "serial.db")
+    assert len(serial_rows["NL_RA"]) == 96
+    assert serial_rows == _table_rows(tmp_path / "parallel.db")
+
+
+def test_failed_shard_is_rolled_back_and_reported(race_cache, tmp_path):
+    race_cache.write_nl_record("RACE", "20260105", b"RA" + b"x" * 40)
+    importer = ParallelCacheImporter(
+        _sqlite_config(tmp_path / "keiba.db"), race_cache, db_type="sqlite", workers=2
+    )
+
+    stats = importer.run(["RACE"], DATES[0], DATES[-1])
+
+    assert stats["failed_shards"] == ["RACE/20260105"]
+    with SQLiteDatabase({"path": str(tmp_path / "keiba.db")}) as database:
+        days = database.fetch_all("SELECT DISTINCT MonthDay FROM NL_RA")
+    assert [row["MonthDay"] for row in days] == [104]
+
+
+def test_cli_cache_import(tmp_path):
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        _race_cache(Path("data/cache"))
+        Path("config.yaml").write_text(
+            "jvlink: {}\ndatabases:\n  sqlite:\n    enabled: true\n    path: data/keiba.db\n",
+            encoding="utf-8",
+        )
+
+        result = runner.invoke(
+            cli,
+            [
+                "--config", "config.yaml", "cache", "import", "--spec", "race",
+                "--from", DATES[0], "--to", DATES[-1], "--workers", "2",
+            ],
+        )
+        incomplete = runner.invoke(
+            cli,
+            [
+                "--config", "config.yaml", "cache", "import", "--spec", "DIFN",
+                "--from", DATES[0], "--to", DATES[-1],
+            ],
+        )
+        rows = _table_rows(Path("data/keiba.db"))
+
+    assert result.exit_code == 0, result.output
+    assert "from 2 shard(s)" in result.output
+    assert len(rows["NL_RA"]) == 96
+    assert incomplete.exit_code == 1
+    assert "DIFN is not completely cached" in incomplete.output
+
+
+def test_parallel_postgresql_workers_write_on_their_own_connections(race_cache):
+    if os.getenv("JLTSQL_RUN_POSTGRESQL_INTEGRATION") != "1":
+        pytest.skip("Set JLTSQL_RUN_POSTGRESQL_INTEGRATION=1 to run PostgreSQL tests")
+
+    from scripts.setup_pg_test_db import postgresql_test_config
+    from src.database.postgresql_handler import PostgreSQLDatabase
+
+    config = Config({"databases": {"postgresql": postgresql_test_config()}})
+    race_filter = "Year = 2026 AND MonthDay IN (104, 105)"
+    database = PostgreSQLDatabase(postgresql_test_config())
+    try:
+        stats = ParallelCacheImporter(
+            config, race_cache, db_type="postgresql", workers=2
+        ).run(["RACE"], DATES[0], DATES[-1])
+        with database:
+            count = database.fetch_one(f"SELECT COUNT(*) AS n FROM NL_RA WHERE {race_filter}")
+
+        assert stats["failed_shards"] == []
+        assert count["n"] == 96
+    finally:
+        with database:
+            for table in TABLES:
+                database.execute(f"DELETE FROM {table} WHERE {race_filter}")
+            database.commit()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.parser.base import BaseParser, FieldDef
+from src.parser.base import BaseParser, FieldDef, decode_jvdata
 from src.parser.factory import ParserFactory, get_parser_factory
 from src.parser.hr_parser import HRParser
 from src.parser.ra_parser import RAParser
@@ -70,6 +70,33 @@ class TestBaseParser:
         assert result["Tail"] == "42"
         assert result["Name"] == expected_name
 
+    @pytest.mark.parametrize(
+        ("count", "expected"),
+        [(b"0042", 42), (b"  42", 42), (b"    ", None), (b"4-2 ", None)],
+    )
+    def test_integer_fields_convert_like_the_text_converter(self, count, expected):
+        class CountParser(BaseParser):
+            record_type = "ZZ"
+
+            def _define_fields(self):
+                return [
+                    FieldDef("RecordSpec", 0, 2),
+                    FieldDef("Count", 2, 4, convert_type="SMALLINT"),
+                    FieldDef("Legacy", 2, 4, type="int"),
+                ]
+
+        result = CountParser().parse(b"ZZ" + count)
+
+        assert result["Count"] == expected
+        assert result["Legacy"] == expected
+        assert result["RecordSpec"] == "ZZ"
+
+    def test_decode_jvdata_uses_strict_cp932_for_non_ascii(self):
+        assert decode_jvdata(b"0101") == "0101"
+        assert decode_jvdata("ｱｲ馬\\~".encode("cp932")) == "ｱｲ馬\\~"
+        with pytest.raises(UnicodeDecodeError):
+            decode_jvdata("馬".encode("cp932")[:1])
+
 
 class TestRAParser:
     """Test cases for RA (Race) parser."""
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for Year range partitioning of the large PostgreSQL tables."""
+
+import os
+import re
+import unittest
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.database.indexes import INDEXES, IndexManager
+from src.database.partitioning import (
+    PARTITIONED_TABLES,
+    PartitionManager,
+    partitioned_ddl,
+    partitioning_handler,
+)
+from src.database.postgresql_handler import PostgreSQLDatabase
+from src.database.schema import SCHEMAS, SchemaManager
+from src.database.schema_types import get_table_column_nullability
+from src.database.sqlite_handler import SQLiteDatabase
+
+
+class _CatalogPostgreSQL(PostgreSQLDatabase):
+    """PostgreSQL handler that records SQL and answers catalog queries."""
+
+    def __init__(self, partitioning=True):
+        super().__init__({"partitioning": {"enabled": partitioning}})
+        self.statements = []
+        self.parents = set()
+        self.children = {}
+
+    def execute(self, sql, parameters=None):
+        self.statements.append(" ".join(sql.split()))
+        match = re.search(r"CREATE TABLE IF NOT EXISTS (\w+) PARTITION OF (\w+) FOR VALUES FROM \((\d+)\)", sql)
+        if match:
+            self.children.setdefault(match.group(2), {})[match.group(1)] = int(match.group(3))
+        elif "PARTITION BY RANGE" in sql:
+            self.parents.add(re.search(r"EXISTS (\w+)", sql).group(1).lower())
+        match = re.match(r"DROP TABLE IF EXISTS (\w+)", sql)
+        if match:
+            for children in self.children.values():
+                children.pop(match.group(1), None)
+        return 0
+
+    def fetch_one(self, sql, parameters=None):
+        if "pg_partitioned_table" in sql:
+            return {"n": int(parameters[0] in self.parents)}
+        return None
+
+    def fetch_all(self, sql, parameters=None):
+        if "pg_inherits" in sql:
+            return [
+                {"name": name, "bound": f"FOR VALUES FROM ({year}) TO ({year + 1})"}
+                for name, year in self.children.get(parameters[0], {}).items()
+            ]
+        return []
+
+    def table_exists_strict(self, table_name):
+        return table_name.lower() in self.parents
+
+
+class TestPartitionManager(unittest.TestCase):
+    """Partition creation, routing and retention issue the expected DDL."""
+
+    def setUp(self):
+        self.db = _CatalogPostgreSQL()
+        self.db.parents.add("nl_se")
+        self.manager = PartitionManager(self.db)
+
+    def test_partitioned_ddl_keeps_primary_key(self):
+        ddl = partitioned_ddl(SCHEMAS["NL_SE"])
+        self.assertTrue(ddl.endswith("PARTITION BY RANGE (Year)"))
+        self.assertIn("PRIMARY KEY", ddl)
+        for table_name in PARTITIONED_TABLES:
+            self.assertRegex(SCHEMAS[table_name], r"PRIMARY KEY\s*\(\s*Year,")
+
+    def test_ensure_partitions_creates_missing_years_once(self):
+        self.assertEqual(self.manager.ensure_partitions("NL_SE", [2025, 2026]), 2)
+        self.assertEqual(self.manager.ensure_partitions("NL_SE", [2026]), 0)
+
+        self.assertEqual(
+            self.db.statements,
+            [
+                "CREATE TABLE IF NOT EXISTS nl_se_y2025 PARTITION OF nl_se FOR VALUES FROM (2025) TO (2026)",
+                "CREATE TABLE IF NOT EXISTS nl_se_y2026 PARTITION OF nl_se FOR VALUES FROM (2026) TO (2027)",
+            ],
+        )
+
+    def test_heap_tables_are_left_alone(self):
+        self.assertEqual(self.manager.ensure_partitions("NL_O1", [2026]), 0)
+        self.assertEqual(self.db.statements, [])
+
+    def test_insert_many_creates_partitions_before_upsert(self):
+        rows = [
+            {"Year": 2025, "MonthDay": 1228, "KettoNum": "1"},
+            {"Year": 2026, "MonthDay": 105, "KettoNum": "2"},
+        ]
+        self.db._get_primary_key_columns = lambda table_name: ["year", "monthday", "kettonum"]
+
+        self.db.insert_many("NL_SE", rows)
+
+        self.assertEqual(sorted(self.db.children["nl_se"].values()), [2025, 2026])
+        self.assertTrue(self.db.statements[-1].startswith("INSERT INTO NL_SE"))
+        self.assertIn("ON CONFLICT (year, monthday, kettonum)", self.db.statements[-1])
+
+    def test_rollback_forgets_partitions(self):
+        self.manager.ensure_partitions("NL_SE", [2026])
+        self.db.children.clear()
+
+        self.manager.clear_cache()
+
+        self.assertEqual(self.manager.ensure_partitions("NL_SE", [2026]), 1)
+
+    def test_retention_drops_only_whole_old_years(self):
+        self.manager.ensure_partitions("NL_SE", [2014, 2015, 2016, 2026])
+
+        dropped = self.manager.apply_retention(11, today=date(2026, 4, 18))
+
+        self.assertEqual(dropped, {"NL_SE": ["nl_se_y2014", "nl_se_y2015"]})
+        self.assertEqual(sorted(self.db.children["nl_se"].values()), [2016, 2026])
+
+    def test_indexes_are_built_per_partition_and_attached(self):
+        self.manager.ensure_partitions("NL_SE", [2025, 2026])
+        self.db.statements.clear()
+
+        self.assertTrue(IndexManager(self.db).create_indexes("NL_SE"))
+
+        self.assertEqual(
+            self.db.statements[:3],
+            [
+                "CREATE INDEX IF NOT EXISTS idx_nl_se_date ON ONLY nl_se (Year, MonthDay)",
+                "CREATE INDEX IF NOT EXISTS nl_se_y2025_idx_nl_se_date ON nl_se_y2025 (Year, MonthDay)",
+                "ALTER INDEX idx_nl_se_date ATTACH PARTITION nl_se_y2025_idx_nl_se_date",
+            ],
+        )
+        self.assertEqual(len(self.db.statements), len(INDEXES["NL_SE"]) * 5)
+
+
+class TestSchemaManagerPartitioning(unittest.TestCase):
+    """``create_table`` only partitions new tables on enabled PostgreSQL."""
+
+    def _create(self, db, table_name):
+        SchemaManager(db)._execute_create(table_name, SCHEMAS[table_name])
+
+    def test_new_table_is_created_partitioned_with_current_year(self):
+        db = _CatalogPostgreSQL()
+        self._create(db, "TS_SOKUHO_O6")
+
+        self.assertTrue(db.statements[0].endswith("PARTITION BY RANGE (Year)"))
+        self.assertEqual(
+            list(db.children["ts_sokuho_o6"].values()), [date.today().year]
+        )
+
+    def test_existing_or_unlisted_tables_use_plain_ddl(self):
+        db = _CatalogPostgreSQL()
+        db.parents.add("nl_se")
+        self._create(db, "NL_SE")
+        self._create(db, "NL_RA")
+
+        self.assertFalse(any("PARTITION" in sql for sql in db.statements))
+
+    def test_disabled_or_sqlite_is_not_partitioned(self):
+        self.assertIsNone(partitioning_handler(_CatalogPostgreSQL(partitioning=False)))
+        self.assertIsNone(partitioning_handler(SQLiteDatabase({"path": ":memory:"})))
+
+
+@pytest.fixture
+def postgresql_db():
+    if os.getenv("JLTSQL_RUN_POSTGRESQL_INTEGRATION") != "1":
+        pytest.skip("Set JLTSQL_RUN_POSTGRESQL_INTEGRATION=1 to run PostgreSQL tests")
+
+    from scripts.setup_pg_test_db import postgresql_test_config
+
+    database = PostgreSQLDatabase(
+        {**postgresql_test_config(), "partitioning": {"enabled": True}}
+    )
+    schema_name = f"jlt_part_{uuid4().hex[:12]}"
+    database.connect()
+    try:
+        database.execute(f"CREATE SCHEMA {schema_name}")
+        database.execute(f"SET search_path TO {schema_name}")
+        database.commit()
+        yield database
+    finally:
+        try:
+            database.rollback()
+            database.execute(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE")
+            database.commit()
+        finally:
+            database.disconnect()
+
+
+def test_postgresql_upserts_route_to_year_partitions(postgresql_db):
+    assert SchemaManager(postgresql_db).create_table("NL_O1")
+    row = {
+        column: "0"
+        for column, nullable in get_table_column_nullability("NL_O1").items()
+        if not nullable
+    }
+    row.update(
+        Year=2025, MonthDay=1228, JyoCD="06", Kaiji=5, Nichiji=9, RaceNum=11,
+        Umaban=1, Kumi="01",
+    )
+    postgresql_db.insert_many("NL_O1", [row, {**row, "Year": 2024}])
+    postgresql_db.insert_many("NL_O1", [row])
+    postgresql_db.commit()
+
+    partitions = PartitionManager(postgresql_db).list_partitions("NL_O1")
+    assert {p["year_from"] for p in partitions} >= {2024, 2025}
+    assert postgresql_db.fetch_one("SELECT COUNT(*) AS n FROM nl_o1_y2025")["n"] == 1
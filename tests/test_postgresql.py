@@ -675,3 +675,27 @@ def test_table_exists_and_column_lookups_respect_search_path():
         db.execute("SET search_path TO public")
         db.commit()
         db.disconnect()
+
+
+def test_insert_many_binds_normalized_deduped_value_tuples(monkeypatch):
+    """One flattened VALUES statement: numeric blanks to NULL, last row per key."""
+    from src.database.postgresql_handler import PostgreSQLDatabase
+
+    database = PostgreSQLDatabase({})
+    executed = []
+    monkeypatch.setattr(database, "_get_primary_key_columns", lambda table: ["year", "kumi"])
+    monkeypatch.setattr(database, "execute", lambda sql, params: executed.append((sql, params)))
+
+    inserted = database.insert_many(
+        "TS_O2",
+        [
+            {"Year": "2026", "Kumi": "0102", "Odds": "******"},
+            {"Year": "2026", "Kumi": "0103", "Odds": "123"},
+            {"Year": "2026", "Kumi": "0102", "Odds": "45"},
+        ],
+    )
+
+    assert inserted == 2
+    [(sql, params)] = executed
+    assert sql.count("(?, ?, ?)") == 2
+    assert params == (2026, "0102", 45.0, 2026, "0103", 123.0)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the pipeline stage profiler and ``--profile``."""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.cache import CacheManager
+from src.cli.main import cli
+from src.database.sqlite_handler import SQLiteDatabase
+from src.importer.batch import BatchProcessor
+from src.utils.profiler import STAGES, StageProfiler, current_profiler, profile_iter
+from tests.test_av_official_contract import build_av_record
+
+
+def _busy(seconds: float) -> None:
+    # conftest replaces time.sleep for every test.
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _cache_with_av_record(cache_dir: Path) -> CacheManager:
+    cache = CacheManager(cache_dir)
+    cache.write_nl_record("RACE", "20260818", build_av_record())
+    cache.mark_nl_complete("RACE", "20260818")
+    return cache
+
+
+class TestStageProfiler(unittest.TestCase):
+    """Timers, nesting and the collapsed-stack output."""
+
+    def test_nested_stage_time_is_exclusive(self):
+        profiler = StageProfiler()
+        with profiler.activate():
+            with profiler.stage("flush", "NL_RA"):
+                with profiler.stage("convert", "NL_RA"):
+                    _busy(0.02)
+
+        rows = {(row["stage"], row["key"]): row for row in profiler.report()["by_key"]}
+        self.assertGreaterEqual(rows[("convert", "NL_RA")]["seconds"], 0.02)
+        self.assertLess(rows[("flush", "NL_RA")]["seconds"], 0.02)
+        self.assertIsNone(current_profiler())
+
+    def test_report_orders_stages_and_adds_other(self):
+        profiler = StageProfiler()
+        profiler.record("flush", "NL_SE", 0.5)
+        profiler.record("parse", "SE", 0.25, count=10)
+        profiler.wall_seconds = 1.0
+
+        report = profiler.report()
+
+        self.assertEqual(
+            [(row["stage"], row["seconds"]) for row in report["stages"]],
+            [("parse", 0.25), ("flush", 0.5), ("other", 0.25)],
+        )
+        self.assertEqual(report["by_key"][1]["mean_us"], 25000.0)
+        self.assertEqual(profiler.collapsed_stacks(), ["flush;NL_SE 500000", "parse;SE 250000"])
+
+    def test_profile_iter_is_a_no_op_without_profiler(self):
+        items = [1, 2]
+        self.assertIs(profile_iter(items, "fetch"), items)
+
+        profiler = StageProfiler()
+        with profiler.activate():
+            self.assertEqual(list(profile_iter(items, "fetch")), items)
+        self.assertEqual(profiler.report()["by_key"][0]["count"], 2)
+
+    def test_sampler_writes_stacks_rooted_at_stage(self):
+        def busy_convert():
+            _busy(0.1)
+
+        profiler = StageProfiler(sample_interval=0.002)
+        with profiler.activate():
+            with profiler.stage("convert", "NL_RA"):
+                busy_convert()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path, folded_path = profiler.write(Path(temp_dir) / "profile" / "run")
+            lines = folded_path.read_text(encoding="utf-8").splitlines()
+            self.assertGreater(json.loads(json_path.read_text(encoding="utf-8"))["samples"], 0)
+
+        self.assertTrue(any(line.startswith("convert;") and "busy_convert" in line for line in lines))
+
+
+class TestProfiledCacheReplay(unittest.TestCase):
+    """A cache replay is profiled end to end without JV-Link."""
+
+    def test_process_date_range_reports_every_stage(self):
+        profiler = StageProfiler()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = _cache_with_av_record(Path(temp_dir) / "cache")
+            database = SQLiteDatabase({"path": str(Path(temp_dir) / "test.db")})
+            with database:
+                processor = BatchProcessor(database, show_progress=False, cache_manager=cache)
+                stats = processor.process_date_range(
+                    "RACE", "20260818", "20260818", profiler=profiler
+                )
+
+        self.assertEqual(stats["records_imported"], 1)
+        report = profiler.report()
+        self.assertEqual([row["stage"] for row in report["stages"]], list(STAGES) + ["other"])
+        keys = {(row["stage"], row["key"]) for row in report["by_key"]}
+        self.assertLessEqual(
+            {("fetch", "-"), ("parse", "AV"), ("validate", "AV"), ("flush", "NL_AV")}, keys
+        )
+
+    def test_fetch_profile_writes_report_and_flamegraph(self):
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            _cache_with_av_record(Path("data") / "cache")
+            Path("config.yaml").write_text(
+                "jvlink:\n  sid: JLTSQL\n"
+                "databases:\n  sqlite:\n    enabled: true\n    path: data/test.db\n"
+                "cache:\n  directory: data/cache\n",
+                encoding="utf-8",
+            )
+
+            result = runner.invoke(
+                cli,
+                [
+                    "--config", "config.yaml", "fetch",
+                    "--from", "20260818", "--to", "20260818", "--spec", "RACE",
+                    "--db", "sqlite", "--no-progress",
+                    "--profile", "--profile-output", "prof/fetch",
+                ],
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            report = json.loads(Path("prof/fetch.json").read_text(encoding="utf-8"))
+            folded = Path("prof/fetch.folded").read_text(encoding="utf-8")
+
+        self.assertIn("Flamegraph:", result.output)
+        self.assertIn("parse", [row["stage"] for row in report["stages"]])
+        self.assertIn("parse;AV ", folded)
+
+
+if __name__ == "__main__":
+    unittest.main()
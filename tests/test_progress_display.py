@@ -0,0 +1,162 @@
+"""Headless progress displays and sampled progress checks of the fetcher."""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.fetcher.base import JV_READ_SECONDS, PROGRESS_SAMPLE_RECORDS, RECORDS_FETCHED
+from src.fetcher.historical import HistoricalFetcher
+from src.utils.progress import (
+    JsonLinesProgressDisplay,
+    JVLinkProgressDisplay,
+    NullProgressDisplay,
+    create_progress_display,
+)
+
+
+def _events(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def _fetcher(reads):
+    fetcher = HistoricalFetcher.__new__(HistoricalFetcher)
+    fetcher.jvlink = MagicMock()
+    fetcher.jvlink.jv_read.side_effect = reads
+    fetcher.parser_factory = MagicMock()
+    fetcher.parser_factory.parse.return_value = {"RecordSpec": "RA"}
+    fetcher.progress_display = MagicMock()
+    fetcher._records_fetched = 0
+    fetcher._records_parsed = 0
+    fetcher._records_failed = 0
+    fetcher._files_processed = 0
+    fetcher._total_files = 2
+    return fetcher
+
+
+def test_json_lines_display_writes_one_event_per_line():
+    stream = io.StringIO()
+
+    with JsonLinesProgressDisplay(stream=stream) as display:
+        display.print_spec_header("RACE", "20260101", "20260131")
+        task_id = display.add_task("RACE", total=4)
+        display.update(task_id, completed=1, status="ファイル 1/4")
+        display.update(task_id, advance=2)
+        display.update_stats(fetched=10, parsed=9, failed=1, speed=12.345)
+        display.print_warning("注意")
+
+    events = _events(stream)
+    assert [event["event"] for event in events] == [
+        "start", "spec", "task", "progress", "progress", "stats", "message", "stop",
+    ]
+    assert events[1]["description"] == "レース詳細"
+    assert events[2] == {**events[2], "task": 0, "kind": "fetch", "total": 4}
+    assert events[3]["status"] == "ファイル 1/4"
+    assert (events[4]["completed"], events[4]["total"]) == (3, 4)
+    assert events[5]["speed"] == 12.3
+    assert events[6] == {**events[6], "level": "warning", "message": "注意"}
+
+
+def test_json_lines_display_appends_to_a_file(tmp_path):
+    path = tmp_path / "progress.jsonl"
+
+    for _ in range(2):
+        with JsonLinesProgressDisplay(path=str(path)):
+            pass
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["start", "stop", "start", "stop"]
+
+
+def test_create_progress_display_by_name_and_environment(monkeypatch):
+    monkeypatch.delenv("JLTSQL_PROGRESS", raising=False)
+    assert isinstance(create_progress_display(), JVLinkProgressDisplay)
+    assert type(create_progress_display("none")) is NullProgressDisplay
+
+    monkeypatch.setenv("JLTSQL_PROGRESS", "jsonl")
+    assert isinstance(create_progress_display(), JsonLinesProgressDisplay)
+    assert type(create_progress_display("none")) is NullProgressDisplay
+
+    with pytest.raises(ValueError, match="plain"):
+        create_progress_display("plain")
+
+
+def test_null_display_accepts_the_fetcher_calls():
+    with NullProgressDisplay() as display:
+        with display.task_context("RACE", total=2) as task_id:
+            display.update(task_id, completed=1, status="ファイル 1/2")
+        display.update_download(display.add_download_task("DL"), completed=5)
+        display.update_stats(fetched=1)
+        display.print_error("error")
+
+
+def test_fetch_loop_reads_the_clock_once_per_sample():
+    records = PROGRESS_SAMPLE_RECORDS * 2 + 1
+    fetcher = _fetcher([(1, b"A", "a.jvd")] * records + [(0, None, None)])
+
+    with patch("src.fetcher.base.time") as fetcher_time:
+        fetcher_time.time.return_value = 0.0
+        assert len(list(fetcher._fetch_and_parse())) == records
+
+    # Start, then records 1, 257 and 513.
+    assert fetcher_time.time.call_count == 4
+
+
+def test_fetch_loop_times_one_read_per_sample_and_publishes_exact_counts():
+    records = PROGRESS_SAMPLE_RECORDS * 2 + 1
+    fetcher = _fetcher([(1, b"A", "a.jvd")] * records + [(0, None, None)])
+    reads_before = JV_READ_SECONDS._default.count
+    fetched_before = RECORDS_FETCHED._default.value
+
+    with patch("src.fetcher.base.perf_counter", return_value=0.0) as clock:
+        for _ in fetcher._fetch_and_parse():
+            pass
+
+    # Reads 1, 257 and 513 are timed; the final (0) read is counted at the end.
+    assert clock.call_count == 6
+    assert JV_READ_SECONDS._default.count - reads_before == records + 1
+    assert RECORDS_FETCHED._default.value - fetched_before == records
+    fetcher.parser_factory.flush_metrics.assert_called_once_with()
+
+
+def test_fetch_loop_publishes_counts_when_the_consumer_stops_early():
+    fetcher = _fetcher([(1, b"A", "a.jvd")] * 10 + [(0, None, None)])
+    fetched_before = RECORDS_FETCHED._default.value
+
+    records = fetcher._fetch_and_parse()
+    for _ in range(3):
+        next(records)
+    records.close()
+
+    assert RECORDS_FETCHED._default.value - fetched_before == 3
+    fetcher.parser_factory.flush_metrics.assert_called_once_with()
+
+
+def test_file_switch_forces_a_progress_check():
+    fetcher = _fetcher([
+        (1, b"A", "a.jvd"),
+        (1, b"A", "a.jvd"),
+        (-1, None, "a.jvd"),
+        (1, b"B", "b.jvd"),
+        (0, None, None),
+    ])
+
+    with (
+        patch("src.fetcher.base.time") as fetcher_time,
+        patch("src.fetcher.base.logger.info") as info,
+    ):
+        fetcher_time.time.side_effect = [0.0, 0.5, 3.0, 3.0]
+        list(fetcher._fetch_and_parse(task_id=0))
+
+    info.assert_any_call(
+        "Processing records",
+        records_fetched=3,
+        records_parsed=3,
+        files_processed=1,
+        total_files=2,
+        speed="1",
+    )
+    fetcher.progress_display.update_stats.assert_any_call(
+        fetched=3, parsed=3, failed=0, speed=1.0,
+    )
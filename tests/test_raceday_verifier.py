@@ -0,0 +1,133 @@
+"""Tests for the grouped, state-backed race-day verification engine."""
+
+import os
+
+import pytest
+
+from src.database.raceday import RACE_TABLES, RaceDayVerifier
+from src.database.schema import SCHEMAS
+from src.database.sqlite_handler import SQLiteDatabase
+
+RACE_DATE = "20260815"
+RACE_1 = "2026081505030101"
+RACE_2 = "2026081505030102"
+KEY_COLUMNS = "Year, MonthDay, JyoCD, Kaiji, Nichiji, RaceNum"
+
+
+def _insert(database, table, race_num, extra=None):
+    values = {"Year": 2026, "MonthDay": 815, "JyoCD": "05", "Kaiji": 3, "Nichiji": 1, "RaceNum": race_num}
+    values.update(extra or {})
+    columns = ", ".join(values)
+    placeholders = ", ".join("?" for _ in values)
+    database.execute(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", tuple(values.values()))
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SQLiteDatabase({"path": str(tmp_path / "keiba.db")})
+    with database:
+        for table in ("NL_RA", "RT_RA", "NL_SE", "NL_H1", "TS_SOKUHO_O1"):
+            database.create_table(table, SCHEMAS[table])
+        for race_num in (1, 2):
+            _insert(database, "NL_RA", race_num)
+            for umaban in range(1, 4):
+                _insert(database, "NL_SE", race_num, {"Umaban": umaban, "KettoNum": f"H{race_num}{umaban}"})
+        _insert(database, "NL_SE", 1, {"Umaban": 9, "KettoNum": "W1", "KakuteiJyuni": 1})
+        _insert(database, "NL_H1", 1, {"BetType": "1", "Kumi": "09"})
+        for hasso_time in ("08151000", "08151010"):
+            _insert(
+                database,
+                "TS_SOKUHO_O1",
+                2,
+                {"Umaban": 1, "Kumi": "01", "HassoTime": hasso_time, "SourceSpec": "0B31", "CollectedAt": hasso_time},
+            )
+        database.commit()
+        yield database
+
+
+def test_collects_per_race_figures_in_one_query(database):
+    result = RaceDayVerifier(database, RACE_DATE).run()
+
+    assert sorted(result.races) == [RACE_1, RACE_2]
+    assert result.races[RACE_1]["tables"] == {
+        "NL_RA": {"rows": 1},
+        "NL_SE": {"rows": 4, "winners": 1},
+        "NL_H1": {"rows": 1},
+    }
+    assert result.races[RACE_2]["tables"]["TS_SOKUHO_O1"] == {
+        "rows": 2,
+        "snapshots": 2,
+        "latest": "08151010",
+    }
+    assert result.changed == [RACE_1, RACE_2]
+    assert result.count("NL_SE") == 7
+    assert result.races_with("NL_H1") == 1
+    assert result.venues("NL_RA") == {"05": 2}
+    assert result.duplicate_race_keys("NL_RA") == 0
+    assert "NL_O1" in result.missing_tables
+    assert len(result.missing_tables) == len(RACE_TABLES) - 5
+
+
+def test_rereads_only_tables_written_since_the_last_run(database, tmp_path):
+    state_path = str(tmp_path / "raceday_state.json")
+    RaceDayVerifier(database, RACE_DATE, state_path=state_path).run()
+
+    unchanged = RaceDayVerifier(database, RACE_DATE, state_path=state_path).run()
+    _insert(database, "NL_SE", 2, {"Umaban": 9, "KettoNum": "W2", "KakuteiJyuni": 1})
+    database.commit()
+    written = RaceDayVerifier(database, RACE_DATE, state_path=state_path).run()
+
+    assert unchanged.queried_tables == []
+    assert unchanged.changed == []
+    assert unchanged.races[RACE_1]["tables"]["NL_SE"] == {"rows": 4, "winners": 1}
+    assert written.queried_tables == ["NL_SE"]
+    assert written.changed == [RACE_2]
+    assert written.races[RACE_2]["tables"]["NL_SE"] == {"rows": 4, "winners": 1}
+    assert written.races[RACE_2]["tables"]["TS_SOKUHO_O1"]["snapshots"] == 2
+    assert written.count("NL_SE", "winners") == 2
+
+
+def test_state_of_another_day_is_ignored(database, tmp_path):
+    state_path = str(tmp_path / "raceday_state.json")
+    RaceDayVerifier(database, "20260816", state_path=state_path).run()
+
+    result = RaceDayVerifier(database, RACE_DATE, state_path=state_path).run()
+
+    assert len(result.queried_tables) == 5
+    assert result.changed == [RACE_1, RACE_2]
+
+
+def test_duplicate_race_keys_are_detected(database):
+    _insert(database, "NL_RA", 1, {"Nichiji": 2})
+    database.commit()
+
+    result = RaceDayVerifier(database, RACE_DATE).run()
+
+    assert result.duplicate_race_keys("NL_RA") == 1
+
+
+def test_postgresql_figures_match_and_use_write_counters():
+    if os.getenv("JLTSQL_RUN_POSTGRESQL_INTEGRATION") != "1":
+        pytest.skip("Set JLTSQL_RUN_POSTGRESQL_INTEGRATION=1 to run PostgreSQL tests")
+
+    from scripts.setup_pg_test_db import postgresql_test_config
+    from src.database.postgresql_handler import PostgreSQLDatabase
+    from src.database.schema import create_all_tables
+
+    database = PostgreSQLDatabase(postgresql_test_config())
+    race_filter = "Year = 2026 AND MonthDay = 815 AND JyoCD = '05'"
+    with database:
+        create_all_tables(database)
+        try:
+            _insert(database, "NL_RA", 1)
+            _insert(database, "NL_SE", 1, {"Umaban": 9, "KettoNum": "W1", "KakuteiJyuni": 1})
+            database.commit()
+
+            result = RaceDayVerifier(database, RACE_DATE).run()
+
+            assert result.races[RACE_1]["tables"]["NL_SE"] == {"rows": 1, "winners": 1}
+            assert result.missing_tables == []
+        finally:
+            for table in ("NL_RA", "NL_SE"):
+                database.execute(f"DELETE FROM {table} WHERE {race_filter}")
+            database.commit()
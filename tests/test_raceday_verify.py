@@ -6,6 +6,7 @@ from types import SimpleNamespace
 import pytest
 
 from scripts import raceday_verify
+from src.database.raceday import RaceDayResult
 
 
 def _master_connection(
@@ -85,10 +86,27 @@ def _master_connection(
     return connection
 
 
+def _races(*, winners: int, races: int = 12) -> RaceDayResult:
+    return RaceDayResult(
+        race_date="20260815",
+        races={
+            f"20260815050301{race_num:02d}": {
+                "JyoCD": "05",
+                "Kaiji": 3,
+                "Nichiji": 1,
+                "RaceNum": race_num,
+                "tables": {
+                    "NL_RA": {"rows": 1},
+                    "NL_SE": {"rows": 16, "winners": int(race_num <= winners)},
+                },
+            }
+            for race_num in range(1, races + 1)
+        },
+    )
+
+
 def test_result_completion_issue_recommends_race_fetch(monkeypatch):
     """Missing central results must direct operators to the RACE data spec."""
-    counts = iter((12, 0, 0))
-    monkeypatch.setattr(raceday_verify, "q", lambda *args, **kwargs: next(counts))
     monkeypatch.setattr(
         raceday_verify,
         "datetime",
@@ -96,13 +114,12 @@ def test_result_completion_issue_recommends_race_fetch(monkeypatch):
     )
     issues = []
 
-    raceday_verify.check_se_results(None, "2026", "0815", issues)
+    raceday_verify.check_se_results(_races(winners=0), issues)
 
     assert issues == ["Race results only 0% complete after 17:00 -- fetch RACE"]
 
-    counts = iter((12, 12, 0))
     issues = []
-    raceday_verify.check_se_results(None, "2026", "0815", issues)
+    raceday_verify.check_se_results(_races(winners=12), issues)
 
     assert issues == []
 
@@ -873,6 +873,19 @@ class TestRealtimeUpdater(unittest.TestCase):
         self.assertEqual(self.updater.database, self.mock_db)
         self.assertIsNotNone(self.updater.parser_factory)
 
+    def test_rejections_are_throttled_per_record_type_and_error_class(self):
+        """Unrelated rejection reasons do not share one suppressed group."""
+        aliases = MagicMock(side_effect=ValueError("not an official code"))
+        with patch.object(self.updater, "_canonicalize_strict_record_aliases", aliases), patch(
+            "src.realtime.updater.record_log"
+        ) as record_log:
+            for record_type in ("SE", "HR"):
+                with self.assertRaises(ValueError):
+                    self.updater._process_single_record({"RecordSpec": record_type})
+
+        keys = [logged.kwargs["key"] for logged in record_log.error.call_args_list]
+        self.assertEqual(keys, [("SE", "ValueError"), ("HR", "ValueError")])
+
     def test_record_type_table_mapping(self):
         """Test RECORD_TYPE_TABLE mapping includes all expected types."""
         expected_mappings = {
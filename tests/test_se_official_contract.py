@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import ast
 import json
 import os
 from collections.abc import Iterator
@@ -47,48 +46,95 @@ OFFICIAL_MANIFEST = json.loads(
 )
 
 
+# (name, 1-based position, width) of every SE field, transcribed from the
+# JV-Data 4.9.0.1 specification in the hand-written parser. It is kept here
+# so the compiled layout is checked against a source independent of the
+# manifest it is generated from.
+TRANSCRIBED_SE_SLICES = (
+    ("RecordSpec", 1, 2),
+    ("DataKubun", 3, 1),
+    ("MakeDate", 4, 8),
+    ("Year", 12, 4),
+    ("MonthDay", 16, 4),
+    ("JyoCD", 20, 2),
+    ("Kaiji", 22, 2),
+    ("Nichiji", 24, 2),
+    ("RaceNum", 26, 2),
+    ("Wakuban", 28, 1),
+    ("Umaban", 29, 2),
+    ("KettoNum", 31, 10),
+    ("Bamei", 41, 36),
+    ("UmaKigoCD", 77, 2),
+    ("SexCD", 79, 1),
+    ("HinsyuCD", 80, 1),
+    ("KeiroCD", 81, 2),
+    ("Barei", 83, 2),
+    ("TozaiCD", 85, 1),
+    ("ChokyosiCode", 86, 5),
+    ("ChokyosiRyakusyo", 91, 8),
+    ("BanusiCode", 99, 6),
+    ("BanusiName", 105, 64),
+    ("Fukusyoku", 169, 60),
+    ("Reserved_229", 229, 60),
+    ("Futan", 289, 3),
+    ("FutanBefore", 292, 3),
+    ("Blinker", 295, 1),
+    ("Reserved_296", 296, 1),
+    ("KisyuCode", 297, 5),
+    ("KisyuCodeBefore", 302, 5),
+    ("KisyuRyakusyo", 307, 8),
+    ("KisyuRyakusyoBefore", 315, 8),
+    ("MinaraiCD", 323, 1),
+    ("MinaraiCDBefore", 324, 1),
+    ("BaTaijyu", 325, 3),
+    ("ZogenFugo", 328, 1),
+    ("ZogenSa", 329, 3),
+    ("IJyoCD", 332, 1),
+    ("NyusenJyuni", 333, 2),
+    ("KakuteiJyuni", 335, 2),
+    ("DochakuKubun", 337, 1),
+    ("DochakuTosu", 338, 1),
+    ("Time", 339, 4),
+    ("ChakusaCD", 343, 3),
+    ("ChakusaCDP", 346, 3),
+    ("ChakusaCDPP", 349, 3),
+    ("Jyuni1c", 352, 2),
+    ("Jyuni2c", 354, 2),
+    ("Jyuni3c", 356, 2),
+    ("Jyuni4c", 358, 2),
+    ("Odds", 360, 4),
+    ("Ninki", 364, 2),
+    ("Honsyokin", 366, 8),
+    ("Fukasyokin", 374, 8),
+    ("Reserved_382", 382, 3),
+    ("Reserved_385", 385, 3),
+    ("HaronTimeL4", 388, 3),
+    ("HaronTimeL3", 391, 3),
+    ("KettoNum1", 394, 10),
+    ("Bamei1", 404, 36),
+    ("KettoNum2", 440, 10),
+    ("Bamei2", 450, 36),
+    ("KettoNum3", 486, 10),
+    ("Bamei3", 496, 36),
+    ("TimeDiff", 532, 4),
+    ("RecordUpKubun", 536, 1),
+    ("DMKubun", 537, 1),
+    ("DMTime", 538, 5),
+    ("DMGosaP", 543, 4),
+    ("DMGosaM", 547, 4),
+    ("DMJyuni", 551, 2),
+    ("KyakusituKubun", 553, 1),
+    ("RecordSeparator", 554, 2),
+)
+
+
 def _se_parser_slices() -> list[tuple[str, int, int]]:
-    """Read every named fixed slice from the production SE parse method."""
+    """Return every named fixed slice the production SE parser extracts."""
 
-    parser_source = Path(__file__).resolve().parents[1] / "src/parser/se_parser.py"
-    tree = ast.parse(parser_source.read_text(encoding="utf-8-sig"))
-    parser_class = next(
-        node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "SEParser"
-    )
-    parse_method = next(
-        node
-        for node in parser_class.body
-        if isinstance(node, ast.FunctionDef) and node.name == "parse"
-    )
     slices = []
-    for node in ast.walk(parse_method):
-        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
-            continue
-        target = node.targets[0]
-        if not (
-            isinstance(target, ast.Subscript)
-            and isinstance(target.value, ast.Name)
-            and target.value.id == "result"
-            and isinstance(target.slice, ast.Constant)
-            and isinstance(target.slice.value, str)
-        ):
-            continue
-        value = node.value
-        if not isinstance(value, ast.Call) or not value.args:
-            continue
-        data_slice = value.args[0]
-        if not (
-            isinstance(data_slice, ast.Subscript)
-            and isinstance(data_slice.value, ast.Name)
-            and data_slice.value.id == "data"
-            and isinstance(data_slice.slice, ast.Slice)
-            and isinstance(data_slice.slice.lower, ast.Constant)
-            and isinstance(data_slice.slice.upper, ast.Constant)
-        ):
-            continue
-        start = int(data_slice.slice.lower.value)
-        stop = int(data_slice.slice.upper.value)
-        slices.append((target.slice.value, start + 1, stop - start))
+    for column, name in zip(SEParser.FIELD_NAMES, SEParser.LAYOUT.names):
+        start, stop = SEParser.LAYOUT.span(name)
+        slices.append((column, start + 1, stop - start))
     return sorted(slices, key=lambda item: item[1])
 
 
@@ -237,9 +283,10 @@ def test_se_current_fixture_is_provider_shaped_and_old_length_is_rejected() -> N
 
 
 def test_every_se_parser_slice_is_bound_to_the_pinned_sdk_manifest() -> None:
-    expected = _official_se_slices()
+    expected = list(TRANSCRIBED_SE_SLICES)
     actual = _se_parser_slices()
 
+    assert _official_se_slices() == expected
     assert actual == expected
     covered = [False] * SEParser.RECORD_LENGTH
     for _, start, width in actual:
@@ -0,0 +1,88 @@
+"""Read-only SQLite reader connections."""
+
+import threading
+
+import pytest
+
+from src.database import create_database_from_config
+from src.database.base import DatabaseError
+from src.database.readers import ReaderPool, open_reader
+from src.database.sqlite_handler import SQLiteDatabase
+
+
+@pytest.fixture
+def writer(tmp_path):
+    database = SQLiteDatabase({"path": str(tmp_path / "keiba.db"), "timeout": 0.1})
+    database.connect()
+    database.execute("CREATE TABLE NL_RA (Year TEXT, RaceNum TEXT)")
+    database.execute("INSERT INTO NL_RA VALUES ('2026', '01')")
+    database.commit()
+    yield database
+    database.disconnect()
+
+
+def test_reader_does_not_block_the_writer(writer):
+    reader = open_reader(writer.db_path, timeout=0.1)
+    try:
+        cursor = reader.execute("SELECT Year FROM NL_RA")
+        cursor.fetchone()
+
+        writer.begin_transaction()
+        writer.execute("INSERT INTO NL_RA VALUES ('2026', '02')")
+        # The uncommitted row is invisible, and reading takes no write lock.
+        assert reader.execute("SELECT COUNT(*) FROM NL_RA").fetchone()[0] == 1
+        writer.commit()
+
+        assert reader.execute("SELECT COUNT(*) FROM NL_RA").fetchone()[0] == 2
+        assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert reader.execute("PRAGMA mmap_size").fetchone()[0] > 0
+    finally:
+        reader.close()
+
+
+def test_read_only_handler_rejects_writes_and_missing_files(writer, tmp_path):
+    with SQLiteDatabase({"path": str(writer.db_path), "read_only": True}) as database:
+        assert database.fetch_one("SELECT RaceNum FROM NL_RA")["RaceNum"] == "01"
+        with pytest.raises(DatabaseError):
+            database.execute("DELETE FROM NL_RA")
+
+    missing = tmp_path / "missing.db"
+    with pytest.raises(DatabaseError, match="not found"):
+        SQLiteDatabase({"path": str(missing), "read_only": True}).connect()
+    assert not missing.exists()
+
+
+def test_pool_keeps_one_reader_per_thread(writer):
+    pool = ReaderPool(writer.db_path)
+    seen = []
+
+    def read():
+        seen.append(pool.connection())
+        seen.append(pool.connection())
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    thread.join()
+    try:
+        assert seen[0] is seen[1]
+        assert pool.connection() is pool.connection() is not seen[0]
+    finally:
+        pool.close()
+    assert pool.connection() is not seen[0]
+    pool.close()
+
+
+def test_read_only_factory_skips_write_wrappers(writer):
+    class Config(dict):
+        def get(self, key, default=None):
+            return super().get(key, default)
+
+    config = Config({
+        "databases.sqlite": {"path": str(writer.db_path)},
+        "change_log.enabled": True,
+    })
+
+    database = create_database_from_config(config, db_type_override="sqlite", read_only=True)
+
+    assert isinstance(database, SQLiteDatabase)
+    assert database.read_only
@@ -0,0 +1,125 @@
+"""Rate-limited per-record logging and the queue-backed log writer."""
+
+import logging
+import logging.handlers
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils import logger as logger_module
+from src.utils.logger import (
+    get_logger,
+    get_rotation_info,
+    get_throttled_logger,
+    setup_logging,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(logger_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def throttled():
+    logging.getLogger("tests.throttled").setLevel(logging.INFO)
+    throttled = get_throttled_logger("tests.throttled", interval=60.0)
+    throttled._logger = MagicMock()
+    yield throttled
+    throttled.flush()
+    logging.getLogger("tests.throttled").setLevel(logging.NOTSET)
+
+
+@pytest.fixture
+def restore_logging():
+    yield
+    setup_logging(log_to_file=False)
+
+
+def test_repeats_are_counted_until_the_interval_has_passed(throttled, clock):
+    for _ in range(12345):
+        throttled.warning("Failed to convert field", key="Kyori", field="Kyori")
+    throttled.warning("Failed to convert field", key="Hondai", field="Hondai")
+    clock[0] += 61
+    throttled.warning("Failed to convert field", key="Kyori", field="Kyori")
+
+    calls = throttled._logger.warning.call_args_list
+    assert [call.kwargs for call in calls] == [
+        {"field": "Kyori"},
+        {"field": "Hondai"},
+        {"field": "Kyori", "suppressed": 12344, "window_seconds": 61},
+    ]
+
+
+def test_flush_logs_pending_counts_once(throttled, clock):
+    for _ in range(3):
+        throttled.error("Failed to insert record", key="RT_SE", table="RT_SE")
+    clock[0] += 5
+
+    throttled.flush()
+    throttled.flush()
+
+    assert throttled._logger.error.call_args_list[-1].kwargs == {
+        "table": "RT_SE",
+        "suppressed": 2,
+        "window_seconds": 5,
+    }
+    assert throttled._logger.error.call_count == 2
+
+
+def test_suppressed_counts_are_flushed_by_a_timer(throttled):
+    flushed = threading.Event()
+    throttled._logger.error.side_effect = lambda *args, **fields: (
+        "suppressed" in fields and flushed.set()
+    )
+    throttled.interval = 0.05
+
+    for _ in range(3):
+        throttled.error("Rejected realtime record", key=("SE", "ValueError"))
+
+    # 同じストリームに次のメッセージが来なくても、保留中の件数は出力される。
+    assert flushed.wait(timeout=5)
+    assert throttled._logger.error.call_args.kwargs["suppressed"] == 2
+    assert throttled._flush_timer is None
+
+
+def test_flush_cancels_the_pending_timer(throttled, clock):
+    throttled.error("Rejected realtime record", key="SE")
+    throttled.error("Rejected realtime record", key="SE")
+    timer = throttled._flush_timer
+    assert timer is not None
+
+    throttled.flush()
+
+    assert throttled._flush_timer is None
+    assert timer.finished.is_set()
+
+
+def test_disabled_levels_and_callable_fields_are_lazy(throttled, clock):
+    expensive = MagicMock(return_value="decoded")
+
+    throttled.debug("Parsed record", value=expensive)
+    throttled.info("Parsed record", value=expensive)
+
+    throttled._logger.debug.assert_not_called()
+    throttled._logger.info.assert_called_once_with("Parsed record", value="decoded")
+    expensive.assert_called_once_with()
+
+
+def test_queue_writer_thread_renders_structured_records(tmp_path, restore_logging):
+    log_file = tmp_path / "queued.log"
+    setup_logging(level="INFO", log_file=str(log_file), log_to_console=False, use_queue=True)
+
+    root_handlers = logging.getLogger().handlers
+    assert [type(handler).__name__ for handler in root_handlers] == ["_InProcessQueueHandler"]
+    assert "RotatingFileHandler" in get_rotation_info()
+
+    get_logger("tests.queued").info("Queued message", records=3)
+    logger_module._stop_listener()
+
+    text = log_file.read_text(encoding="utf-8")
+    assert "Queued message" in text
+    assert "records" in text
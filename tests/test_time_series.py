@@ -829,3 +829,113 @@ def test_postgres_table_probe_failure_is_a_fetcher_error(monkeypatch):
     monkeypatch.setattr("psycopg.connect", _explode, raising=False)
     with pytest.raises(FetcherError):
         RealtimeFetcher._postgres_table_exists({}, "rt_ra")
+
+
+def test_checkpoint_refetches_success_keys_fetched_before_the_race_settled(tmp_path):
+    """確定前に取得したレースは、冷却期間後に確定後の再取得が行われるまで再取得する。"""
+    from datetime import datetime, timedelta
+
+    from src.database.sqlite_handler import SQLiteDatabase
+    from src.fetcher.checkpoint import TS_CHECKPOINT_TABLE, TimeSeriesCheckpoint
+
+    fetched = {
+        "202610170501": "2026-10-17T15:00:00",  # レース当日（確定前）
+        "202610100501": "2026-10-17T15:00:00",  # 7日後（確定済み）
+        "202610180501": "2026-10-18T23:00:00",  # 当日・冷却期間内
+    }
+    with SQLiteDatabase({"path": str(tmp_path / "keiba.db")}) as database:
+        checkpoint = TimeSeriesCheckpoint(database, no_data_cooldown=timedelta(hours=24))
+        checkpoint.ensure_schema()
+        checkpoint.record_many("0B41", [(key, "success", 3) for key in fetched])
+        database.executemany(
+            f"UPDATE {TS_CHECKPOINT_TABLE} SET fetched_at = ? WHERE race_key = ?",
+            [(at, key) for key, at in fetched.items()],
+        )
+        now = datetime(2026, 10, 19, 9, 0)
+        resumed = TimeSeriesCheckpoint(database, no_data_cooldown=timedelta(hours=24))
+
+        assert resumed.should_fetch("0B41", "202610170501", now=now) is True
+        assert resumed.should_fetch("0B41", "202610100501", now=now) is False
+        assert resumed.should_fetch("0B41", "202610180501", now=now) is False
+        assert resumed.should_fetch("0B41", "202610180501", now=now + timedelta(days=1)) is True
+        # 確定後に取得したレースは、以後いつ再開しても再取得しない。
+        assert resumed.should_fetch("0B41", "202610100501", now=now + timedelta(days=365)) is False
+
+
+def test_fetch_time_series_batch_from_db_resumes_from_checkpoints():
+    """完了済みキーと冷却期間内のno-dataキーは再取得しない。"""
+    from contextlib import closing
+    from datetime import datetime, timedelta
+    import sqlite3
+    import tempfile
+    import types
+
+    from src.database.sqlite_handler import SQLiteDatabase
+    from src.fetcher.checkpoint import TS_CHECKPOINT_TABLE, TimeSeriesCheckpoint
+    from src.fetcher.realtime import RealtimeFetcher
+
+    with tempfile.TemporaryDirectory(dir="/tmp") as temp_dir:
+        db_path = Path(temp_dir) / "keiba.db"
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.execute(
+                "CREATE TABLE NL_RA (Year INTEGER, MonthDay INTEGER, JyoCD TEXT, "
+                "Kaiji INTEGER, Nichiji INTEGER, RaceNum INTEGER)"
+            )
+            conn.executemany(
+                "INSERT INTO NL_RA VALUES (2025, 1201, '05', 5, 8, ?)",
+                [(race_num,) for race_num in range(1, 5)],
+            )
+            conn.commit()
+
+        class FakeJVLink:
+            def __init__(self):
+                self.opened = []
+
+            def jv_init(self):
+                return 0
+
+            def jv_rt_open(self, data_spec, key):
+                self.opened.append(key)
+                return 0, 1
+
+            def jv_close(self):
+                pass
+
+        with SQLiteDatabase({"path": str(db_path)}) as database:
+            checkpoint = TimeSeriesCheckpoint(database, no_data_cooldown=timedelta(hours=24))
+            checkpoint.ensure_schema()
+            checkpoint.record_many("0B41", [
+                ("202512010501", "success", 3),
+                ("202512010502", "no_data", 0),
+                ("202512010503", "no_data", 0),
+                ("202512010504", "error:-502", 0),
+            ])
+            stale = (datetime.now() - timedelta(hours=25)).isoformat(timespec="seconds")
+            database.execute(
+                f"UPDATE {TS_CHECKPOINT_TABLE} SET fetched_at = ? WHERE race_key = ?",
+                (stale, "202512010503"),
+            )
+            database.commit()
+
+            fetcher = object.__new__(RealtimeFetcher)
+            fetcher.jvlink = FakeJVLink()
+
+            def fake_fetch_and_parse(self):
+                yield {"RecordSpec": "O1"}
+
+            fetcher._fetch_and_parse = types.MethodType(fake_fetch_and_parse, fetcher)
+            progress = []
+
+            records = list(
+                fetcher.fetch_time_series_batch_from_db(
+                    data_spec="0B41",
+                    db_path=str(db_path),
+                    progress_callback=progress.append,
+                    checkpoint=TimeSeriesCheckpoint(database),
+                )
+            )
+
+    assert fetcher.jvlink.opened == ["202512010503", "202512010504"]
+    assert len(records) == 2
+    assert [item["status"] for item in progress] == ["skipped", "skipped", "success", "success"]
+    assert progress[-1]["skipped_keys"] == 2